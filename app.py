@@ -5,6 +5,7 @@ from flask import jsonify
 
 from config import create_app
 from db import db
+from utils.db_routing import is_read_only
 
 # Set up basic logging configuration
 logging.basicConfig(
@@ -18,6 +19,10 @@ app = create_app(environment)
 @app.teardown_request
 def commit_transaction_on_teardown(exception=None):
     """Commit the transaction if there's no exception."""
+    if exception is None and is_read_only(db.session()):
+        # Read requests run in a read-only (or autocommit) session: there is
+        # nothing to commit and closing the session ends the transaction.
+        return
     if exception is None:
         try:
             db.session.commit()
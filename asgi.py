@@ -0,0 +1,87 @@
+"""
+ASGI entrypoint. Every request is passed to the Flask app. With ASYNC_READS
+enabled, the read-heavy endpoints (catalog profiles, provider listing and
+available slots) are served by async views on an asyncpg engine instead, so a
+request waiting for the database does not hold a worker thread.
+
+The async views bypass the Flask request pipeline: replica routing, read-only
+transactions, the response and working hours caches, brotli, metrics and
+profiling do not apply to them, which is why they are opt-in.
+
+    uvicorn asgi:application --workers 4
+"""
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from a2wsgi import WSGIMiddleware
+from decouple import config
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Mount, Route
+from werkzeug.exceptions import HTTPException
+
+from app import app
+from resources.async_resources import async_routes, handle_http_exception
+from utils.async_db import async_read_sessionmaker, create_async_read_engine
+
+
+def create_asgi_app(flask_app, async_reads: Optional[bool] = None) -> Starlette:
+    """
+    Wraps the Flask app, optionally with the async read routes.
+
+    :param flask_app: The Flask application serving everything else.
+    :param async_reads: Whether to serve the read endpoints with the async views;
+                        read from ASYNC_READS (default off) when None.
+    :return: The ASGI application.
+    """
+    if async_reads is None:
+        async_reads = config("ASYNC_READS", default=False, cast=bool)
+
+    @asynccontextmanager
+    async def lifespan(application: Starlette):
+        engine = create_async_read_engine(flask_app.config["SQLALCHEMY_DATABASE_URI"])
+        application.state.sessionmaker = async_read_sessionmaker(engine)
+        application.state.flask_app = flask_app
+        yield
+        await engine.dispose()
+
+    middleware = [
+        # Matches CORS(app) of the Flask app for the async routes.
+        Middleware(
+            CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+        )
+    ]
+    if flask_app.config.get("COMPRESSION"):
+        # Responses the Flask app compressed already are passed through as is.
+        middleware.append(
+            Middleware(
+                GZipMiddleware,
+                minimum_size=flask_app.config.get("COMPRESSION_MIN_SIZE", 1024),
+            )
+        )
+
+    routes = []
+    if async_reads:
+        routes += [
+            Route(path, endpoint, methods=["GET"]) for endpoint, path in async_routes
+        ]
+    routes.append(
+        Mount(
+            "/",
+            app=WSGIMiddleware(
+                flask_app, workers=config("ASGI_WSGI_THREADS", default=10, cast=int)
+            ),
+        )
+    )
+
+    return Starlette(
+        routes=routes,
+        middleware=middleware,
+        lifespan=lifespan,
+        exception_handlers={HTTPException: handle_http_exception},
+    )
+
+
+application = create_asgi_app(app)
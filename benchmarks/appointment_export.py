@@ -0,0 +1,86 @@
+"""
+Peak Python memory and time to the first chunk when exporting a provider's
+appointment history: loading it with AppointmentManager.get_all() and dumping
+it in one piece (the previous option) against the streamed NDJSON export.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.common import benchmark_database, seed
+from db import db
+from managers.appointment_manager import AppointmentManager
+from models import AppointmentModel, UserModel, owner_service_provider_association
+from schemas.response.appointment_response_schema import (
+    CustomerAppointmentResponseSchema,
+)
+from utils.streaming import ndjson_chunks
+
+
+def profile(func) -> tuple:
+    """
+    :return: Seconds to the first chunk, total seconds and peak traced MiB.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_chunk = None
+    for _ in func():
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    db.session.remove()
+    return first_chunk, total, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--appointments", type=int, default=100000)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        seed(10)
+        start = datetime(2020, 1, 1, 9)
+        db.session.execute(
+            insert(AppointmentModel),
+            [
+                {
+                    "service_id": 1,
+                    "staff_id": 1,
+                    "customer_id": 11,
+                    "appointment_time": start + timedelta(minutes=30 * i),
+                }
+                for i in range(args.appointments)
+            ],
+        )
+        db.session.execute(
+            insert(owner_service_provider_association),
+            [{"owner_id": 21, "service_provider_id": 1}],
+        )
+        db.session.commit()
+
+        def load_all():
+            records = AppointmentManager.get_all()
+            yield json.dumps(
+                CustomerAppointmentResponseSchema().dump(records, many=True)
+            )
+
+        def stream():
+            owner = db.session.get(UserModel, 21)
+            batches = AppointmentManager.export_provider_appointments(1, owner)
+            yield from ndjson_chunks(AppointmentManager.export_columns(), batches)
+
+        print(f"\n{args.appointments} appointments")
+        print(f"{'':10}  {'first chunk s':>13} {'total s':>9} {'peak MiB':>9}")
+        for name, func in (("get_all", load_all), ("streamed", stream)):
+            first_chunk, total, peak = profile(func)
+            print(f"{name:10}  {first_chunk:13.3f} {total:9.3f} {peak:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
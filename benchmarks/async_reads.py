@@ -0,0 +1,134 @@
+"""
+Requests per second and latency of the read endpoints under many concurrent
+clients, served by the ASGI entrypoint with the async views (ASYNC_READS=True)
+and with the same requests passed to the Flask app on its thread pool
+(ASYNC_READS=False).
+
+Each mode runs in a uvicorn subprocess on the benchmark database; the clients
+are asyncio tasks in this process sharing one HTTP connection pool, so at
+high request rates the client itself can become the limit.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+import httpx
+
+from app import app
+from benchmarks.common import benchmark_database, seed
+from db import db
+from managers.auth_manager import AuthManager
+from models import UserModel
+
+
+def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"uvicorn did not start on port {port}")
+
+
+async def load(url: str, headers: dict, concurrency: int, seconds: float) -> dict:
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        deadline = time.monotonic() + seconds
+
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    resp = await client.get(url, headers=headers)
+                    ok = resp.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "per_second": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) if latencies else 0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        with app.app_context():
+            client_token = AuthManager.encode_token(
+                db.session.get(UserModel, args.size + 1)
+            )
+        date = (data["date"] + timedelta(days=1)).isoformat()
+        cases = {
+            "/categories/profile": {"Authorization": f"Bearer {data['token']}"},
+            f"/appointments/available_slots/{data['staff_id']}/"
+            f"{data['service_id']}/{date}": {"Authorization": f"Bearer {client_token}"},
+        }
+
+        for path, headers in cases.items():
+            print(f"\nGET {path}, {args.concurrency} concurrent clients")
+            print(f"{'':8}  {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+            for mode, async_reads in (("flask", "False"), ("async", "True")):
+                server = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-m",
+                        "uvicorn",
+                        "asgi:application",
+                        "--port",
+                        str(args.port),
+                        "--log-level",
+                        "warning",
+                        "--no-access-log",
+                    ],
+                    env={**os.environ, "ASYNC_READS": async_reads},
+                )
+                try:
+                    wait_for_port(args.port)
+                    result = asyncio.run(
+                        load(
+                            f"http://127.0.0.1:{args.port}{path}",
+                            headers,
+                            args.concurrency,
+                            args.seconds,
+                        )
+                    )
+                finally:
+                    server.terminate()
+                    server.wait()
+                print(
+                    f"{mode:8}  {result['per_second']:9.0f} {result['p50_ms']:9.1f} "
+                    f"{result['p95_ms']:9.1f} {result['errors']:7d}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-call cost of the hot lookups with the statement built inline on every call
+(the previous code) against the module-level statements with bound parameters.
+
+"python" rows measure what SQLAlchemy does before it can reuse compiled SQL:
+building the statement and generating its cache key (memoized on the
+module-level statements). "execute" rows include the database round trip.
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from db import db
+from managers.appointment_manager import OVERLAPPING_APPOINTMENT
+from managers.auth_manager import ACTIVE_USER_BY_ID
+from managers.service_manager import SERVICE_DURATION_BY_ID
+from managers.working_hours_manager import WORKING_HOURS_BY_EMPLOYEE
+from models import AppointmentModel, ServiceModel, UserModel, WorkingHoursModel
+
+USER_ID = SERVICE_ID = STAFF_ID = 1
+DURATION = 30
+
+
+def build_cases(appointment_time: datetime) -> dict:
+    """
+    :return: For each lookup, a function building the inline statement and a
+             function returning the cached statement with its parameters.
+    """
+    window = timedelta(minutes=DURATION)
+    return {
+        "verify_token": (
+            lambda: db.select(UserModel).filter_by(id=USER_ID, is_active=True),
+            lambda: (ACTIVE_USER_BY_ID, {"user_id": USER_ID}),
+        ),
+        "get_service_duration": (
+            lambda: db.select(ServiceModel).filter(ServiceModel.id == SERVICE_ID),
+            lambda: (SERVICE_DURATION_BY_ID, {"service_id": SERVICE_ID}),
+        ),
+        "is_slot_booked": (
+            lambda: db.select(AppointmentModel).filter(
+                AppointmentModel.staff_id == STAFF_ID,
+                AppointmentModel.appointment_time < appointment_time + window,
+                AppointmentModel.appointment_time + window > appointment_time,
+            ),
+            lambda: (
+                OVERLAPPING_APPOINTMENT,
+                {
+                    "staff_id": STAFF_ID,
+                    "end_time": appointment_time + window,
+                    "earliest_start": appointment_time - window,
+                },
+            ),
+        ),
+        "get_working_hours": (
+            lambda: db.select(WorkingHoursModel).where(
+                WorkingHoursModel.employee_id == STAFF_ID
+            ),
+            lambda: (WORKING_HOURS_BY_EMPLOYEE, {"employee_id": STAFF_ID}),
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(50)
+        appointment_time = datetime.combine(data["date"], datetime.min.time())
+        appointment_time = appointment_time.replace(hour=10)
+
+        for name, (inline, cached) in build_cases(appointment_time).items():
+
+            def inline_python():
+                inline()._generate_cache_key()
+
+            def cached_python():
+                statement, params = cached()
+                statement._generate_cache_key()
+
+            def inline_execute():
+                db.session.execute(inline()).all()
+
+            def cached_execute():
+                db.session.execute(*cached()).all()
+
+            print_results(
+                name,
+                {
+                    "python inline": measure(inline_python, args.iterations),
+                    "python cached": measure(cached_python, args.iterations),
+                    "execute inline": measure(inline_execute, args.iterations),
+                    "execute cached": measure(cached_execute, args.iterations),
+                },
+            )
+            db.session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Type-ahead search over a large seeded catalog: SearchManager.search for
+prefixes of one to three characters and for several words, and the full
+/search request.
+
+Names are drawn from small word lists, so short prefixes match a large share
+of the catalog, as they do in a real one. Prints the plan of the service query
+for a one-character prefix.
+"""
+import argparse
+import random
+
+from sqlalchemy import event, insert
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results
+from db import db
+from managers.auth_manager import AuthManager
+from managers.search_manager import SearchManager
+from models import (
+    RoleType,
+    ServiceCategoryModel,
+    ServiceModel,
+    ServiceProviderModel,
+    ServiceSubcategoryModel,
+    UserModel,
+)
+
+NAME_WORDS = (
+    "beauty", "bella", "bliss", "bloom", "body", "brow", "chic", "city", "color",
+    "crown", "curl", "diamond", "elite", "essence", "glam", "glow", "gold", "grace",
+    "hair", "harmony", "lash", "lotus", "luxe", "magic", "mirror", "nail", "nova",
+    "pearl", "pure", "queen", "radiance", "rose", "royal", "silk", "spa", "star",
+    "studio", "style", "sun", "touch", "urban", "velvet", "vita", "zen",
+)
+SERVICE_WORDS = (
+    "balayage", "blowout", "braid", "classic", "color", "cut", "deep", "detox",
+    "express", "extension", "facial", "gel", "hot", "keratin", "lift", "long",
+    "manicure", "massage", "mask", "men", "peel", "pedicure", "perm", "quick",
+    "relax", "scrub", "short", "signature", "stone", "styling", "tint", "trim",
+    "updo", "wax", "women", "wrap",
+)
+QUERIES = ("h", "ha", "hai", "ma", "gel man", "hair cut sho")
+
+
+def seed_catalog(
+    providers: int, services: int, categories: int, subcategories: int
+) -> str:
+    generator = random.Random(1)
+
+    def name(words, count):
+        return " ".join(generator.choice(words) for _ in range(count)).title()
+
+    def insert_rows(model, rows):
+        for start in range(0, len(rows), 10000):
+            db.session.execute(insert(model), rows[start : start + 10000])
+
+    insert_rows(
+        ServiceCategoryModel,
+        [
+            {"id": i, "name": f"{name(SERVICE_WORDS, 2)} {i}"}
+            for i in range(1, categories + 1)
+        ],
+    )
+    insert_rows(
+        ServiceSubcategoryModel,
+        [
+            {
+                "id": i,
+                "name": f"{name(SERVICE_WORDS, 2)} {i}",
+                "category_id": generator.randint(1, categories),
+            }
+            for i in range(1, subcategories + 1)
+        ],
+    )
+    insert_rows(
+        ServiceProviderModel,
+        [
+            {
+                "id": i,
+                "company_name": f"{name(NAME_WORDS, 2)} {i} Ltd",
+                "trade_name": name(NAME_WORDS, 2),
+                "uic": f"UIC{i:08}",
+                "photo_url": f"https://example.com/{i}.jpg",
+                "country": "BG",
+                "city": "Sofia",
+                "street": "Vitosha",
+                "street_number": str(i),
+                "postal_code": "1000",
+                "is_active": i % 20 != 0,
+            }
+            for i in range(1, providers + 1)
+        ],
+    )
+    # The services trigger computes the search document of every row.
+    insert_rows(
+        ServiceModel,
+        [
+            {
+                "id": i,
+                "name": name(SERVICE_WORDS, generator.randint(1, 3)),
+                "duration": 30,
+                "price": 50,
+                "service_subcategory_id": generator.randint(1, subcategories),
+                "service_provider_id": generator.randint(1, providers),
+                "is_active": i % 10 != 0,
+            }
+            for i in range(1, services + 1)
+        ],
+    )
+    client = UserModel(
+        email="client@example.com",
+        first_name="Client",
+        last_name="Bench",
+        phone="0899999998",
+        password="x",
+        role=RoleType.CLIENT,
+    )
+    db.session.add(client)
+    db.session.commit()
+    db.session.execute(
+        db.text("ANALYZE categories, subcategories, service_providers, services")
+    )
+    db.session.commit()
+    return AuthManager.encode_token(client)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--providers", type=int, default=50000)
+    parser.add_argument("--services", type=int, default=200000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--subcategories", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        token = seed_catalog(
+            args.providers, args.services, args.categories, args.subcategories
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        client = app.test_client()
+
+        with app.app_context():
+            print_results(
+                f"SearchManager.search, {args.limit} of each type",
+                {
+                    repr(text): measure(
+                        lambda: SearchManager.search(text, args.limit), args.iterations
+                    )
+                    for text in QUERIES
+                },
+            )
+
+        def request():
+            resp = client.get("/search", headers=headers, query_string={"q": "ha"})
+            assert resp.status_code == 200, resp.json
+
+        print_results("GET /search?q=ha", {"request": measure(request, args.iterations)})
+        print_plan(args.limit)
+
+
+def print_plan(limit: int) -> None:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            SearchManager.search("h", limit)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+        statement, parameters = next(
+            (statement, parameters)
+            for statement, parameters in statements
+            if "FROM services" in statement
+        )
+        print("\nPlan of the service query, 'h':")
+        for (line,) in db.session.connection().exec_driver_sql(
+            f"EXPLAIN ANALYZE {statement}", parameters
+        ):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
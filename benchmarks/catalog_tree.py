@@ -0,0 +1,57 @@
+"""
+Compares building the browse menu from the three catalog list endpoints, as
+clients did, against one /catalog/tree request: with a full body, answered
+with 304 Not Modified, and served from the response cache.
+"""
+import argparse
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from config import create_app
+
+MENU_ENDPOINTS = ("/categories/profile", "/subcategories/profile", "/services/profile")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+        client = app.test_client()
+        cached_config = {**app.config, "RESPONSE_CACHE": True}
+        cached_client = create_app(type("CachedConfig", (), cached_config)).test_client()
+
+        def three_requests():
+            for endpoint in MENU_ENDPOINTS:
+                assert client.get(endpoint, headers=headers).status_code == 200
+
+        def tree(test_client, request_headers, status=200):
+            def request():
+                resp = test_client.get("/catalog/tree", headers=request_headers)
+                assert resp.status_code == status, resp.status_code
+
+            return request
+
+        etag = client.get("/catalog/tree", headers=headers).headers["ETag"]
+        conditional = {**headers, "If-None-Match": etag}
+        print_results(
+            f"Browse menu ({args.size} categories, subcategories and services)",
+            {
+                "3 list requests": measure(three_requests, args.iterations),
+                "/catalog/tree": measure(tree(client, headers), args.iterations),
+                "/catalog/tree 304": measure(
+                    tree(client, conditional, 304), args.iterations
+                ),
+                "/catalog/tree cached": measure(
+                    tree(cached_client, headers), args.iterations
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The benchmarks run against the database configured through CONFIG_ENV and the
+DB_* variables. They create the tables, seed their own data and drop every
+table afterwards, so point them at a throwaway database, e.g.:
+
+    CONFIG_ENV=config.TestingConfig DB_NAME=bench TEST_DB_NAME=bench \\
+        python -m benchmarks.read_only_requests
+"""
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, time as day_time, timedelta
+
+from sqlalchemy import insert
+
+from app import app
+from db import db
+from managers.auth_manager import AuthManager
+from models import (
+    AppointmentModel,
+    InquiryModel,
+    ProviderRegistrationState,
+    RoleType,
+    ServiceCategoryModel,
+    ServiceModel,
+    ServiceProviderModel,
+    ServiceSubcategoryModel,
+    UserModel,
+    WorkingHoursModel,
+)
+
+LIST_ENDPOINTS = (
+    "/categories/profile",
+    "/subcategories/profile",
+    "/services/profile",
+    "/providers/profile",
+    "/approver/inquiries",
+)
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Creates the schema for the duration of a benchmark and drops it afterwards.
+    """
+    with app.app_context():
+        db.create_all()
+        try:
+            yield
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def seed(size: int = 200) -> dict:
+    """
+    Inserts a connected data set: ``size`` categories, subcategories, providers,
+    services and inquiries, with staff, customers, working hours and appointments.
+
+    :param size: The number of rows per catalog table.
+    :return: A dictionary with an approver token and the IDs benchmarks need.
+    """
+    providers = [
+        {
+            "id": i,
+            "company_name": f"Company {i}",
+            "trade_name": f"Trade {i}",
+            "uic": f"UIC{i:06}",
+            "photo_url": f"https://example.com/{i}.jpg",
+            "country": "BG",
+            "city": "Sofia",
+            "street": "Vitosha",
+            "street_number": str(i),
+            "postal_code": "1000",
+        }
+        for i in range(1, size + 1)
+    ]
+    users = [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first_name": "First",
+            "last_name": "Last",
+            "phone": f"08{i:08}",
+            "password": "x",
+            "role": RoleType.STAFF if i <= size else RoleType.CLIENT,
+            "service_provider_id": i if i <= size else None,
+        }
+        for i in range(1, 2 * size + 1)
+    ]
+    users.append(
+        {
+            "id": 2 * size + 1,
+            "email": "approver@example.com",
+            "first_name": "Approver",
+            "last_name": "Bench",
+            "phone": "0899999999",
+            "password": "x",
+            "role": RoleType.APPROVER,
+        }
+    )
+    categories = [{"id": i, "name": f"Category {i}"} for i in range(1, size + 1)]
+    subcategories = [
+        {"id": i, "name": f"Subcategory {i}", "category_id": i}
+        for i in range(1, size + 1)
+    ]
+    services = [
+        {
+            "id": i,
+            "name": f"Service {i}",
+            "duration": 30,
+            "price": 50,
+            "service_subcategory_id": i,
+            "service_provider_id": i,
+            "staff_id": i,
+        }
+        for i in range(1, size + 1)
+    ]
+    working_hours = [
+        {
+            "day_of_week": day,
+            "start_time": day_time(9),
+            "end_time": day_time(17),
+            "provider_id": i,
+            "employee_id": i,
+        }
+        for i in range(1, size + 1)
+        for day in range(7)
+    ]
+    start = datetime.combine(datetime.utcnow().date() + timedelta(days=1), day_time(9))
+    appointments = [
+        {
+            "service_id": i % size + 1,
+            "staff_id": i % size + 1,
+            "customer_id": size + i % size + 1,
+            "appointment_time": start + timedelta(minutes=30 * (i // size)),
+        }
+        for i in range(size * 4)
+    ]
+    inquiries = [
+        {
+            "salon_name": f"Salon {i}",
+            "city": "Sofia",
+            "email": f"inquiry{i}@example.com",
+            "first_name": "First",
+            "last_name": "Last",
+            "phone": f"09{i:08}",
+            "status": ProviderRegistrationState.PENDING,
+        }
+        for i in range(1, size + 1)
+    ]
+
+    for model, rows in (
+        (ServiceProviderModel, providers),
+        (UserModel, users),
+        (ServiceCategoryModel, categories),
+        (ServiceSubcategoryModel, subcategories),
+        (ServiceModel, services),
+        (WorkingHoursModel, working_hours),
+        (AppointmentModel, appointments),
+        (InquiryModel, inquiries),
+    ):
+        db.session.execute(insert(model), rows)
+    db.session.commit()
+
+    approver = db.session.get(UserModel, 2 * size + 1)
+    token = AuthManager.encode_token(approver)
+    db.session.remove()
+
+    return {"token": token, "staff_id": 1, "service_id": 1, "date": start.date()}
+
+
+def measure(func, iterations: int, warmup: int = 20) -> dict:
+    """
+    Calls ``func`` repeatedly and summarizes the wall-clock time per call.
+
+    :param func: A callable without arguments.
+    :param iterations: The number of measured calls.
+    :param warmup: The number of calls made before measuring.
+    :return: Mean, median and 95th percentile in milliseconds and calls per second.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    mean = statistics.fmean(timings)
+    return {
+        "mean_ms": mean,
+        "p50_ms": timings[len(timings) // 2],
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "per_second": 1000 / mean,
+    }
+
+
+def print_results(title: str, results: dict) -> None:
+    """
+    Prints one line per measured case.
+
+    :param title: A heading for the table.
+    :param results: A dictionary mapping case names to ``measure`` results.
+    """
+    print(f"\n{title}")
+    width = max(len(name) for name in results)
+    print(f"{'':{width}}  {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'per sec':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:{width}}  {result['mean_ms']:9.3f} {result['p50_ms']:9.3f} "
+            f"{result['p95_ms']:9.3f} {result['per_second']:10.0f}"
+        )
@@ -0,0 +1,66 @@
+"""
+Response sizes and server time of the list endpoints without compression,
+with gzip and with brotli, and the resulting time to download them over
+typical mobile links (one round trip plus the transfer at the link's
+bandwidth, ignoring TCP slow start).
+"""
+import argparse
+
+from app import app
+from benchmarks.common import (
+    LIST_ENDPOINTS,
+    benchmark_database,
+    measure,
+    print_results,
+    seed,
+)
+
+# name: (downlink bits per second, round trip seconds)
+LINKS = {
+    "3G": (1.6e6, 0.3),
+    "4G": (12e6, 0.07),
+}
+ENCODINGS = ("identity", "gzip", "br")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        client = app.test_client()
+        headers = {"Authorization": f"Bearer {data['token']}"}
+
+        for endpoint in LIST_ENDPOINTS:
+            results = {}
+            sizes = {}
+            for encoding in ENCODINGS:
+                encoded_headers = {**headers, "Accept-Encoding": encoding}
+                sizes[encoding] = len(
+                    client.get(endpoint, headers=encoded_headers).data
+                )
+                results[encoding] = measure(
+                    lambda: client.get(endpoint, headers=encoded_headers),
+                    args.iterations,
+                )
+            print_results(f"GET {endpoint} ({args.size} rows) server time", results)
+
+            links = "".join(f" {name + ' ms':>9}" for name in LINKS)
+            print(f"{'':8}  {'bytes':>9}{links}")
+            for encoding in ENCODINGS:
+                server_ms = results[encoding]["mean_ms"]
+                download = [
+                    server_ms + (rtt + sizes[encoding] * 8 / bandwidth) * 1000
+                    for bandwidth, rtt in LINKS.values()
+                ]
+                print(
+                    f"{encoding:8}  {sizes[encoding]:9d}"
+                    + "".join(f" {ms:9.0f}" for ms in download)
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares full responses of the catalog endpoints against conditional GETs
+answered with 304 Not Modified from the ETag aggregate query.
+"""
+import argparse
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results, seed
+
+CATALOG_ENDPOINTS = (
+    "/categories/profile",
+    "/subcategories/profile",
+    "/services/profile",
+    "/providers/profile",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+        client = app.test_client()
+
+        for endpoint in CATALOG_ENDPOINTS:
+            etag = client.get(endpoint, headers=headers).headers["ETag"]
+            conditional = {**headers, "If-None-Match": etag}
+            print_results(
+                f"GET {endpoint} ({args.size} rows)",
+                {
+                    "200 full body": measure(
+                        lambda: client.get(endpoint, headers=headers), args.iterations
+                    ),
+                    "304 not modified": measure(
+                        lambda: client.get(endpoint, headers=conditional),
+                        args.iterations,
+                    ),
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
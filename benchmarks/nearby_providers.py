@@ -0,0 +1,164 @@
+"""
+Proximity search over a large seeded set of providers spread across Bulgaria:
+the widening geohash-indexed search of ProviderManager.nearby_providers against
+the same distance filter and sort evaluated on every row, and the full
+/providers/nearby request.
+
+Prints the plan of the indexed query to show the geohash index range scans.
+"""
+import argparse
+import random
+
+from sqlalchemy import event, insert
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results
+from db import db
+from managers.auth_manager import AuthManager
+from managers.provider_manager import NEARBY_COLUMNS, ProviderManager, _distance_km
+from models import RoleType, ServiceProviderModel, UserModel
+from utils.geo import encode
+
+SOFIA = (42.6977, 23.3219)
+# A location outside the cluster, where the search widens several times.
+RURAL = (43.5, 27.0)
+# Latitude and longitude ranges of the seeded providers.
+AREA = ((41.2, 44.2), (22.4, 28.6))
+
+
+def seed_providers(size: int) -> str:
+    generator = random.Random(1)
+    providers = []
+    for i in range(1, size + 1):
+        # A third of the providers cluster around the capital, like real salons.
+        if i % 3 == 0:
+            latitude = SOFIA[0] + generator.gauss(0, 0.05)
+            longitude = SOFIA[1] + generator.gauss(0, 0.07)
+        else:
+            latitude = generator.uniform(*AREA[0])
+            longitude = generator.uniform(*AREA[1])
+        providers.append(
+            {
+                "id": i,
+                "company_name": f"Company {i}",
+                "trade_name": f"Trade {i}",
+                "uic": f"UIC{i:08}",
+                "photo_url": f"https://example.com/{i}.jpg",
+                "country": "BG",
+                "city": "Sofia",
+                "street": "Vitosha",
+                "street_number": str(i),
+                "postal_code": "1000",
+                "latitude": latitude,
+                "longitude": longitude,
+                # Bulk inserts skip the ORM event that sets the geohash.
+                "geohash": encode(latitude, longitude),
+            }
+        )
+    for start in range(0, size, 10000):
+        db.session.execute(insert(ServiceProviderModel), providers[start : start + 10000])
+    client = UserModel(
+        email="client@example.com",
+        first_name="Client",
+        last_name="Bench",
+        phone="0899999998",
+        password="x",
+        role=RoleType.CLIENT,
+    )
+    db.session.add(client)
+    db.session.commit()
+    db.session.execute(db.text("ANALYZE service_providers"))
+    db.session.commit()
+    return AuthManager.encode_token(client)
+
+
+def scan_all(location: tuple, radius_km: float, per_page: int) -> list:
+    distance = _distance_km(*location)
+    return db.session.execute(
+        db.select(*NEARBY_COLUMNS, distance.label("distance"))
+        .where(ServiceProviderModel.is_active == True, distance <= radius_km)
+        .order_by(distance, ServiceProviderModel.id)
+        .limit(per_page)
+    ).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        token = seed_providers(args.size)
+        headers = {"Authorization": f"Bearer {token}"}
+        client = app.test_client()
+
+        with app.app_context():
+            for name, location, radius in (
+                ("Sofia", SOFIA, 2),
+                ("Sofia", SOFIA, 10),
+                ("Sofia", SOFIA, 50),
+                ("rural", RURAL, 10),
+                ("rural", RURAL, 50),
+            ):
+                matching = db.session.scalar(
+                    db.select(db.func.count())
+                    .select_from(ServiceProviderModel)
+                    .where(_distance_km(*location) <= radius)
+                )
+                results = {
+                    "full scan": measure(
+                        lambda: scan_all(location, radius, args.per_page),
+                        args.iterations // 4,
+                    ),
+                    "geohash index": measure(
+                        lambda: ProviderManager.nearby_providers(
+                            *location, radius_km=radius, per_page=args.per_page
+                        ),
+                        args.iterations,
+                    ),
+                }
+                print_results(
+                    f"{name}: nearest {args.per_page} of {matching} providers "
+                    f"within {radius} km",
+                    results,
+                )
+
+        def request():
+            resp = client.get(
+                "/providers/nearby",
+                headers=headers,
+                query_string={"latitude": SOFIA[0], "longitude": SOFIA[1], "radius": 10},
+            )
+            assert resp.status_code == 200, resp.json
+
+        print_results(
+            "GET /providers/nearby, 10 km",
+            {"request": measure(request, args.iterations)},
+        )
+        print_plan(args.per_page)
+
+
+def print_plan(per_page: int) -> None:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            ProviderManager.nearby_providers(*SOFIA, radius_km=10, per_page=per_page)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+        statement, parameters = statements[-1]
+        print("\nPlan of the indexed query, 10 km:")
+        for (line,) in db.session.connection().exec_driver_sql(
+            f"EXPLAIN ANALYZE {statement}", parameters
+        ):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
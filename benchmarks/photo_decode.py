@@ -0,0 +1,61 @@
+"""
+Time and peak Python memory to turn a base64 photo into an upload body: the
+former path (decode the whole string, write it to a temporary file, read the
+file back as upload_file does) against the chunked decode into a spooled
+buffer.
+
+Needs neither a database nor S3; the upload is simulated by reading the body.
+"""
+import argparse
+import base64
+import os
+import tempfile
+import tracemalloc
+
+from benchmarks.common import measure, print_results
+from utils.helpers import decode_photo
+
+
+def via_temp_file(encoded: str, directory: str) -> int:
+    path = os.path.join(directory, "photo.jpg")
+    with open(path, "wb") as f:
+        f.write(base64.b64decode(encoded.encode("utf-8")))
+    with open(path, "rb") as f:
+        return len(f.read())
+
+
+def via_spooled_buffer(encoded: str) -> int:
+    with decode_photo(encoded, max_bytes=len(encoded)) as photo:
+        return len(photo.read())
+
+
+def peak_memory(func) -> float:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    encoded = base64.b64encode(os.urandom(int(args.megabytes * 1024 * 1024))).decode()
+    with tempfile.TemporaryDirectory() as directory:
+        cases = {
+            "temp file": lambda: via_temp_file(encoded, directory),
+            "spooled buffer": lambda: via_spooled_buffer(encoded),
+        }
+        results = {name: measure(func, args.iterations, warmup=3) for name, func in cases.items()}
+        print_results(f"{args.megabytes:g} MB photo", results)
+
+        print(f"\n{'':14}  {'peak MB':>9}")
+        for name, func in cases.items():
+            print(f"{name:14}  {peak_memory(func):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
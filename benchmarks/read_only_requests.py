@@ -0,0 +1,41 @@
+"""
+Compares the list endpoints with GET requests in read-write transactions
+committed at teardown (DB_READ_ONLY_MODE=off, the previous behavior) against
+read-only transactions and autocommit sessions.
+"""
+import argparse
+
+from app import app
+from benchmarks.common import (
+    LIST_ENDPOINTS,
+    benchmark_database,
+    measure,
+    print_results,
+    seed,
+)
+from utils import db_routing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+        client = app.test_client()
+
+        for endpoint in LIST_ENDPOINTS:
+            results = {}
+            for mode in ("off", "readonly", "autocommit"):
+                db_routing.READ_ONLY_MODE = mode
+                results[mode] = measure(
+                    lambda: client.get(endpoint, headers=headers), args.iterations
+                )
+            print_results(f"GET {endpoint} ({args.size} rows)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Booking a weekly series one appointment at a time (a conflict check, an
+insert and an email each) against a single recurring booking (one set-based
+conflict check, one multi-row INSERT and one summary email).
+
+SES is replaced by a stub that sleeps for --email-ms to stand in for the API
+round trip. Every run is rolled back, so all runs book the same times.
+"""
+import argparse
+import time
+from datetime import datetime, time as day_time, timedelta
+from unittest.mock import patch
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from db import db
+from managers.appointment_manager import AppointmentManager
+from models import UserModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--occurrences", type=int, default=12)
+    parser.add_argument("--email-ms", type=float, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    def send_email(*_):
+        time.sleep(args.email_ms / 1000)
+
+    with benchmark_database():
+        data = seed(args.size)
+        first = datetime.combine(data["date"] + timedelta(days=14), day_time(12))
+        times = [first + timedelta(weeks=week) for week in range(args.occurrences)]
+        request = {"service_id": data["service_id"], "staff_id": data["staff_id"]}
+
+        with app.test_request_context(), patch(
+            "services.ses.SESService.send_email", side_effect=send_email
+        ):
+            customer = db.session.get(UserModel, args.size + 1)
+
+            def one_by_one():
+                for appointment_time in times:
+                    AppointmentManager.create(
+                        {**request, "appointment_time": appointment_time}, customer
+                    )
+                db.session.rollback()
+
+            def recurring():
+                AppointmentManager.create_recurring(
+                    {**request, "appointment_times": times}, customer
+                )
+                db.session.rollback()
+
+            results = {
+                "one by one": measure(one_by_one, args.iterations, warmup=2),
+                "recurring": measure(recurring, args.iterations, warmup=2),
+            }
+        print_results(
+            f"Booking {args.occurrences} weekly occurrences "
+            f"({args.email_ms:g} ms per email)",
+            results,
+        )
+
+
+if __name__ == "__main__":
+    main()
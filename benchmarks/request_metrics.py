@@ -0,0 +1,47 @@
+"""
+Per-request cost of the metrics hooks: the same requests to an app without
+metrics and to one recording them, for a cheap endpoint (category detail, one
+row) where the overhead is most visible, and for a list endpoint.
+"""
+import argparse
+
+from werkzeug.utils import import_string
+
+from app import app, environment
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from config import create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    class WithoutMetrics(import_string(environment)):
+        METRICS = False
+
+    class WithMetrics(import_string(environment)):
+        METRICS = True
+
+    apps = {
+        "without metrics": create_app(WithoutMetrics),
+        "with metrics": create_app(WithMetrics),
+    }
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+
+        for endpoint in ("/categories/profile/1", "/categories/profile"):
+            results = {}
+            for name, flask_app in apps.items():
+                client = flask_app.test_client()
+                results[name] = measure(
+                    lambda: client.get(endpoint, headers=headers), args.iterations
+                )
+            print_results(f"GET {endpoint}", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-request schema work of ``validate_schema``: the former path (a new schema
+per request, ``validate`` and the manager parsing the raw strings again)
+against a cached schema instance and a single ``load``.
+
+Needs no database; it times the decorated views inside a request context.
+"""
+import argparse
+from datetime import time
+
+from app import app
+from benchmarks.common import measure, print_results
+from schemas.request.working_hour_request_schema import WorkingHourBatchSchema
+from utils.decorators import validate_schema
+
+
+def batch_payload(employees: int, days: int) -> dict:
+    return {
+        "provider_id": 1,
+        "employees": [
+            {
+                "employee_id": employee_id,
+                "working_hours": [
+                    {
+                        "day_of_week": day,
+                        "start_time": "09:00:00",
+                        "end_time": "17:00:00",
+                        "provider_id": 1,
+                        "employee_id": employee_id,
+                    }
+                    for day in range(days)
+                ],
+            }
+            for employee_id in range(employees)
+        ],
+    }
+
+
+def validate_then_parse(payload: dict) -> list:
+    errors = WorkingHourBatchSchema().validate(payload)
+    assert not errors
+    return [
+        (time.fromisoformat(hours["start_time"]), time.fromisoformat(hours["end_time"]))
+        for employee in payload["employees"]
+        for hours in employee["working_hours"]
+    ]
+
+
+@validate_schema(WorkingHourBatchSchema)
+def load_once(data: dict) -> list:
+    return [
+        (hours["start_time"], hours["end_time"])
+        for employee in data["employees"]
+        for hours in employee["working_hours"]
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    payload = batch_payload(args.employees, 7)
+    with app.test_request_context(json=payload):
+        results = {
+            "validate + parse": measure(
+                lambda: validate_then_parse(payload), args.iterations
+            ),
+            "cached load": measure(load_once, args.iterations),
+        }
+    print_results(f"Working hours batch, {args.employees * 7} entries", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares the catalog endpoints without the response cache against repeated
+reads served from the in-process response cache (RESPONSE_CACHE=True).
+"""
+import argparse
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from benchmarks.conditional_get import CATALOG_ENDPOINTS
+from config import create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+        cached_config = {**app.config, "RESPONSE_CACHE": True}
+        cached_app = create_app(type("CachedConfig", (), cached_config))
+        clients = {
+            "RESPONSE_CACHE off": app.test_client(),
+            "RESPONSE_CACHE on": cached_app.test_client(),
+        }
+
+        for endpoint in CATALOG_ENDPOINTS:
+            print_results(
+                f"GET {endpoint} ({args.size} rows)",
+                {
+                    label: measure(
+                        lambda: client.get(endpoint, headers=headers), args.iterations
+                    )
+                    for label, client in clients.items()
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares list responses built with marshmallow and the standard JSON encoder
+(FAST_SERIALIZATION off, the previous behavior) against row projections
+encoded with orjson.
+
+"serialize" rows time the query plus the conversion to dictionaries and the
+JSON encoding, "GET" rows time the full request through the test client.
+"""
+import argparse
+import json
+
+from app import app
+from benchmarks.common import (
+    LIST_ENDPOINTS,
+    benchmark_database,
+    measure,
+    print_results,
+    seed,
+)
+from config import create_app
+from db import db
+from managers.category_manager import CategoryManager
+from managers.inquiry_manager import InquiryManager
+from managers.provider_manager import ProviderManager
+from managers.service_manager import ServiceManager
+from managers.subcategory_manager import SubCategoryManager
+from schemas.response.category_response_schema import CategoryResponseSchema
+from schemas.response.inquiry_response_schema import InquiryResponseSchema
+from schemas.response.provider_response_schema import ProviderResponseSchema
+from schemas.response.service_response_schema import ServiceResponseSchema
+from schemas.response.subcategory_response_schema import SubCategoryResponseSchema
+from utils.serializers import get_projection, orjson
+
+STATEMENTS = {
+    "categories": (CategoryManager.records_statement, CategoryResponseSchema),
+    "subcategories": (SubCategoryManager.records_statement, SubCategoryResponseSchema),
+    "services": (ServiceManager.records_statement, ServiceResponseSchema),
+    "providers": (ProviderManager.records_statement, ProviderResponseSchema),
+    "inquiries": (InquiryManager.inquiries_statement, InquiryResponseSchema),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    if orjson is None:
+        parser.error("orjson is not installed.")
+
+    with benchmark_database():
+        data = seed(args.size)
+        headers = {"Authorization": f"Bearer {data['token']}"}
+
+        for name, (build_statement, schema_cls) in STATEMENTS.items():
+            statement = build_statement()
+            model = statement.column_descriptions[0]["entity"]
+            projection = get_projection(schema_cls, model)
+
+            def marshmallow():
+                records = db.session.execute(statement).scalars().all()
+                json.dumps(schema_cls().dump(records, many=True))
+                db.session.expunge_all()
+
+            def projected():
+                orjson.dumps(projection.execute(statement))
+
+            print_results(
+                f"serialize {name} ({args.size} rows)",
+                {
+                    "marshmallow + json": measure(marshmallow, args.iterations),
+                    "projection + orjson": measure(projected, args.iterations),
+                },
+            )
+            db.session.rollback()
+
+        fast_config = {**app.config, "FAST_SERIALIZATION": True}
+        fast_app = create_app(type("FastConfig", (), fast_config))
+        clients = {
+            "FAST_SERIALIZATION off": app.test_client(),
+            "FAST_SERIALIZATION on": fast_app.test_client(),
+        }
+        for endpoint in LIST_ENDPOINTS:
+            print_results(
+                f"GET {endpoint} ({args.size} rows)",
+                {
+                    label: measure(
+                        lambda: client.get(endpoint, headers=headers), args.iterations
+                    )
+                    for label, client in clients.items()
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
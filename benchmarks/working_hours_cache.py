@@ -0,0 +1,57 @@
+"""
+Working hours check of a booking request: the former lookup of every working
+hour entry of the staff member against the cached per-weekday lookup, cold
+(one indexed query) and warm (no query).
+"""
+import argparse
+from datetime import datetime, time, timedelta
+
+from app import app
+from benchmarks.common import benchmark_database, measure, print_results, seed
+from managers.working_hours_manager import WorkingHoursManager
+from services.cache import working_hours_cache
+
+
+def all_entries(staff_id: int, moment: datetime) -> bool:
+    return any(
+        hours.start_time <= moment.time() <= hours.end_time
+        for hours in WorkingHoursManager.get_working_hours(staff_id=staff_id)
+        if hours.day_of_week == moment.weekday()
+    )
+
+
+def cold(staff_id: int, moment: datetime) -> bool:
+    working_hours_cache.clear()
+    return WorkingHoursManager.is_within_working_hours(staff_id, moment)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        data = seed(args.size)
+        moment = datetime.combine(data["date"] + timedelta(days=1), time(10))
+        staff_id = data["staff_id"]
+
+        app.config["WORKING_HOURS_CACHE"] = True
+        with app.test_request_context():
+            results = {
+                "all entries": measure(
+                    lambda: all_entries(staff_id, moment), args.iterations
+                ),
+                "cache cold": measure(lambda: cold(staff_id, moment), args.iterations),
+                "cache warm": measure(
+                    lambda: WorkingHoursManager.is_within_working_hours(
+                        staff_id, moment
+                    ),
+                    args.iterations,
+                ),
+            }
+        print_results("Booking working hours check", results)
+
+
+if __name__ == "__main__":
+    main()
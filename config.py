@@ -7,6 +7,32 @@ from flask_swagger_ui import get_swaggerui_blueprint
 
 from db import db
 from resources.routes import routes
+from utils.compression import init_compression
+from utils.db_pool import build_engine_options, init_statement_timeout
+from utils.db_routing import REPLICA_BIND_KEY, init_db_routing
+from utils.metrics import init_metrics
+from utils.profiling import init_profiling
+from utils.serializers import init_fast_json
+
+
+def build_replica_binds() -> dict:
+    """
+    Registers the read replica bind when DB_REPLICA_HOST is configured. The
+    replica uses the same credentials as the primary.
+
+    :return: A SQLALCHEMY_BINDS dictionary, empty when no replica is configured.
+    """
+    replica_host = config("DB_REPLICA_HOST", default=None)
+    if not replica_host:
+        return {}
+
+    return {
+        REPLICA_BIND_KEY: (
+            f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
+            f"@{replica_host}:{config('DB_REPLICA_PORT', default=config('DB_PORT'))}"
+            f"/{config('DB_REPLICA_NAME', default=config('DB_NAME'))}"
+        )
+    }
 
 
 class ProductionConfig:
@@ -17,6 +43,16 @@ class ProductionConfig:
         f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
         f"@{config('DB_HOST')}:{config('DB_PORT')}/{config('DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options()
+    SQLALCHEMY_BINDS = build_replica_binds()
+    FAST_SERIALIZATION = config("FAST_SERIALIZATION", default=False, cast=bool)
+    RESPONSE_CACHE = config("RESPONSE_CACHE", default=False, cast=bool)
+    WORKING_HOURS_CACHE = config("WORKING_HOURS_CACHE", default=False, cast=bool)
+    COMPRESSION = config("COMPRESSION", default=True, cast=bool)
+    COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+    METRICS = config("METRICS", default=True, cast=bool)
+    PROFILING = config("PROFILING", default=True, cast=bool)
+    PHOTO_DERIVATIVES = config("PHOTO_DERIVATIVES", default=True, cast=bool)
 
 
 class DevelopmentConfig:
@@ -27,6 +63,16 @@ class DevelopmentConfig:
         f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
         f"@{config('DB_HOST')}:{config('DB_PORT')}/{config('DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options()
+    SQLALCHEMY_BINDS = build_replica_binds()
+    FAST_SERIALIZATION = config("FAST_SERIALIZATION", default=False, cast=bool)
+    RESPONSE_CACHE = config("RESPONSE_CACHE", default=False, cast=bool)
+    WORKING_HOURS_CACHE = config("WORKING_HOURS_CACHE", default=False, cast=bool)
+    COMPRESSION = config("COMPRESSION", default=True, cast=bool)
+    COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+    METRICS = config("METRICS", default=True, cast=bool)
+    PROFILING = config("PROFILING", default=True, cast=bool)
+    PHOTO_DERIVATIVES = config("PHOTO_DERIVATIVES", default=True, cast=bool)
 
 
 class TestingConfig:
@@ -37,17 +83,39 @@ class TestingConfig:
         f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
         f"@localhost:{config('DB_PORT')}/{config('TEST_DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options()
+    FAST_SERIALIZATION = config("FAST_SERIALIZATION", default=False, cast=bool)
+    RESPONSE_CACHE = config("RESPONSE_CACHE", default=False, cast=bool)
+    WORKING_HOURS_CACHE = config("WORKING_HOURS_CACHE", default=False, cast=bool)
+    COMPRESSION = config("COMPRESSION", default=True, cast=bool)
+    COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+    METRICS = config("METRICS", default=True, cast=bool)
+    PROFILING = config("PROFILING", default=True, cast=bool)
+    # Tests run without a Celery broker.
+    PHOTO_DERIVATIVES = config("PHOTO_DERIVATIVES", default=False, cast=bool)
 
 
 def create_app(environment):
     app = Flask(__name__)
     app.config.from_object(environment)
     db.init_app(app)
+    with app.app_context():
+        [init_statement_timeout(engine) for engine in db.engines.values()]
+    init_db_routing(app, db)
     migrate = Migrate(app, db)
     api = Api(app)
 
     CORS(app)
     [api.add_resource(*route) for route in routes]
+    if app.config.get("METRICS"):
+        # Registered before compression so the latency includes it.
+        init_metrics(app)
+    if app.config.get("PROFILING"):
+        init_profiling(app)
+    if app.config.get("FAST_SERIALIZATION"):
+        init_fast_json(app, api)
+    if app.config.get("COMPRESSION"):
+        init_compression(app)
 
     # Define the Swagger UI blueprint
     SWAGGER_URL = '/swagger'
@@ -2,3 +2,24 @@ import os
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMP_FILE_FOLDER = os.path.join(ROOT_DIR, "temp_files")
+
+# Key prefix of provider photos uploaded directly to the bucket.
+PHOTO_UPLOAD_PREFIX = "providers/"
+PHOTO_EXTENSIONS = ("jpg", "jpeg", "png", "webp")
+# Key prefix of the resized copies of provider photos.
+PHOTO_DERIVATIVE_PREFIX = "derivatives/"
+
+# Provider proximity search, in kilometres.
+NEARBY_DEFAULT_RADIUS_KM = 10
+# Radius the search starts from before widening; see nearby_providers.
+NEARBY_INITIAL_RADIUS_KM = 1
+NEARBY_MAX_RADIUS_KM = 50
+NEARBY_MAX_PER_PAGE = 100
+
+# Catalog full-text search; see managers.search_manager.
+SEARCH_DEFAULT_LIMIT = 5
+SEARCH_MAX_LIMIT = 20
+# Words of a query beyond this are ignored.
+SEARCH_MAX_TERMS = 8
+# Matches of each type ranked per search; see SearchManager._ranked.
+SEARCH_RANK_CANDIDATES = 200
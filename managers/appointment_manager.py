@@ -1,18 +1,76 @@
 import logging
-from datetime import timedelta, datetime
+from datetime import timedelta, datetime, time
+from typing import Iterator, List, Sequence, Tuple
 
 from botocore.exceptions import ClientError
+from decouple import config
+from sqlalchemy import DateTime, Select, bindparam, column, exists, insert, values
+from sqlalchemy.orm import aliased
 from werkzeug.exceptions import NotFound, Conflict, Forbidden, BadRequest
 
 from db import db
 from managers.service_manager import ServiceManager
 from managers.working_hours_manager import WorkingHoursManager
-from models import AppointmentModel, AppointmentState, UserModel
+from models import AppointmentModel, AppointmentState, ServiceModel, UserModel
 from services.ses import SESService
+from utils.db_routing import REPLICA_BIND_KEY
 from utils.email_templates import EmailTemplates
 
 ses_service = SESService()
 
+ALL_APPOINTMENTS = db.select(AppointmentModel)
+
+# An existing appointment overlaps [start, end) when it starts before `end`
+# and ends after `start`. With every appointment lasting the requested
+# duration, the second condition becomes `appointment_time > start - duration`,
+# which keeps both bounds on the indexed column.
+OVERLAPPING_APPOINTMENT = (
+    db.select(AppointmentModel.id)
+    .where(
+        AppointmentModel.staff_id == bindparam("staff_id"),
+        AppointmentModel.appointment_time < bindparam("end_time"),
+        AppointmentModel.appointment_time > bindparam("earliest_start"),
+    )
+    .limit(1)
+)
+
+# Start times of a staff member's appointments on one day, for available slots.
+STAFF_APPOINTMENT_TIMES_ON_DAY = db.select(AppointmentModel.appointment_time).where(
+    AppointmentModel.staff_id == bindparam("staff_id"),
+    AppointmentModel.appointment_time >= bindparam("day_start"),
+    AppointmentModel.appointment_time < bindparam("day_end"),
+)
+
+EXPORT_BATCH_SIZE = config("EXPORT_BATCH_SIZE", default=1000, cast=int)
+
+_export_staff = aliased(UserModel, name="staff")
+_export_customer = aliased(UserModel, name="customer")
+
+# A provider's appointment history, flattened for export.
+PROVIDER_APPOINTMENTS_EXPORT = (
+    db.select(
+        AppointmentModel.id,
+        AppointmentModel.appointment_time,
+        AppointmentModel.status,
+        AppointmentModel.service_id,
+        ServiceModel.name.label("service_name"),
+        AppointmentModel.staff_id,
+        _export_staff.first_name.label("staff_first_name"),
+        _export_staff.last_name.label("staff_last_name"),
+        AppointmentModel.customer_id,
+        _export_customer.first_name.label("customer_first_name"),
+        _export_customer.last_name.label("customer_last_name"),
+        _export_customer.email.label("customer_email"),
+        _export_customer.phone.label("customer_phone"),
+        AppointmentModel.created_on,
+    )
+    .join(ServiceModel, AppointmentModel.service_id == ServiceModel.id)
+    .join(_export_staff, AppointmentModel.staff_id == _export_staff.id)
+    .join(_export_customer, AppointmentModel.customer_id == _export_customer.id)
+    .where(ServiceModel.service_provider_id == bindparam("provider_id"))
+    .order_by(AppointmentModel.id)
+)
+
 
 class AppointmentManager:
     ONE_DAY_BEFORE = timedelta(days=1)
@@ -30,51 +88,78 @@ class AppointmentManager:
         :return: A list of available time slots with start and end times.
         :raises ValueError: If the date format is invalid.
         """
-        try:
-            date = datetime.fromisoformat(date_str)
-        except ValueError:
-            raise ValueError("Invalid date format. Please use ISO format.")
-
-        day_of_week = date.weekday()
-
-        working_hours = WorkingHoursManager.get_working_hours(staff_id=staff_id)
-
-        daily_working_hours = [
-            wh for wh in working_hours if wh.day_of_week == day_of_week
-        ]
+        date = AppointmentManager.parse_slot_date(date_str)
 
-        existing_appointments = (
-            (
-                db.session.execute(
-                    db.select(AppointmentModel).filter(
-                        AppointmentModel.staff_id == staff_id,
-                        AppointmentModel.appointment_time >= date,
-                        AppointmentModel.appointment_time < date + timedelta(days=1),
-                    )
-                )
+        daily_working_hours = WorkingHoursManager.get_day_intervals(
+            staff_id, date.weekday()
+        )
+        booked_times = (
+            db.session.execute(
+                STAFF_APPOINTMENT_TIMES_ON_DAY,
+                AppointmentManager.day_params(staff_id, date),
             )
             .scalars()
             .all()
         )
 
+        return AppointmentManager.build_available_slots(
+            date, daily_working_hours, booked_times, service_duration
+        )
+
+    @staticmethod
+    def parse_slot_date(date_str: str) -> datetime:
+        """
+        Parses the date of an available slots request
+        :param date_str: The date in ISO format.
+        :return: The parsed date.
+        :raises ValueError: If the date format is invalid.
+        """
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            raise ValueError("Invalid date format. Please use ISO format.")
+
+    @staticmethod
+    def day_params(staff_id: int, date: datetime) -> dict:
+        """
+        :return: The parameters of STAFF_APPOINTMENT_TIMES_ON_DAY for the date.
+        """
+        return {
+            "staff_id": staff_id,
+            "day_start": date,
+            "day_end": date + timedelta(days=1),
+        }
+
+    @staticmethod
+    def build_available_slots(
+        date: datetime,
+        working_hours: Sequence[Tuple[time, time]],
+        booked_times: Sequence[datetime],
+        service_duration: int,
+    ) -> list:
+        """
+        Splits the working hours of a day into slots of the service duration and
+        keeps the ones that do not overlap a booked appointment
+        :param date: The day of the slots.
+        :param working_hours: (start_time, end_time) pairs of the staff member on that day.
+        :param booked_times: Start times of the appointments of the staff member on that day.
+        :param service_duration: The duration of the service in minutes.
+        :return: A list of available time slots with start and end times.
+        """
+        duration = timedelta(minutes=service_duration)
         available_slots = []
 
-        for hours in daily_working_hours:
-            start_time = datetime.combine(date.date(), hours.start_time)
-            end_time = datetime.combine(date.date(), hours.end_time)
+        for hours_start, hours_end in working_hours:
+            start_time = datetime.combine(date.date(), hours_start)
+            end_time = datetime.combine(date.date(), hours_end)
 
-            while start_time + timedelta(minutes=service_duration) <= end_time:
+            while start_time + duration <= end_time:
                 slot_start = start_time
-                slot_end = start_time + timedelta(minutes=service_duration)
+                slot_end = start_time + duration
 
                 if not any(
-                    (
-                        slot_start
-                        < appointment.appointment_time
-                        + timedelta(minutes=service_duration)
-                        and slot_end > appointment.appointment_time
-                    )
-                    for appointment in existing_appointments
+                    slot_start < booked_time + duration and slot_end > booked_time
+                    for booked_time in booked_times
                 ):
                     available_slots.append(
                         {
@@ -83,7 +168,7 @@ class AppointmentManager:
                         }
                     )
 
-                start_time += timedelta(minutes=service_duration)
+                start_time += duration
 
         return available_slots
 
@@ -93,27 +178,72 @@ class AppointmentManager:
         Retrieves all appointment records from the database
         :return: A list of all appointments.
         """
-        return db.session.execute(db.select(AppointmentModel)).scalars().all()
+        return db.session.execute(ALL_APPOINTMENTS).scalars().all()
+
+    @staticmethod
+    def appointments_statement() -> Select:
+        """
+        Returns the select statement used by get_all.
+        :return: The select statement for all appointments.
+        """
+        return ALL_APPOINTMENTS
+
+    @staticmethod
+    def export_columns() -> Sequence[str]:
+        """
+        :return: The column names of the rows yielded by export_provider_appointments.
+        """
+        return PROVIDER_APPOINTMENTS_EXPORT.selected_columns.keys()
+
+    @staticmethod
+    def export_provider_appointments(
+        provider_id: int, current_user: UserModel, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Sequence]:
+        """
+        Streams the appointment history of a service provider in batches through
+        a server-side cursor, so memory use does not grow with the history.
+
+        The rows are read over a dedicated read-only connection (from the
+        replica when the request reads from it) that is opened on the first
+        iteration and released when the iterator is exhausted or closed; the
+        iterator can outlive the request's session, e.g. in a streamed response.
+
+        :param provider_id: The ID of the service provider.
+        :param current_user: The owner requesting the export.
+        :param batch_size: The number of rows fetched from the cursor at a time.
+        :return: A lazy iterator of row batches.
+        :raises Forbidden: If the user does not own the service provider.
+        """
+        if provider_id not in {company.id for company in current_user.owned_companies}:
+            raise Forbidden(
+                "You can only export appointments of your own service provider."
+            )
+
+        if db.session.info.get("use_replica"):
+            engine = db.engines[REPLICA_BIND_KEY]
+        else:
+            engine = db.engine
+
+        def batches():
+            with engine.connect() as connection:
+                result = connection.execution_options(
+                    postgresql_readonly=True, yield_per=batch_size
+                ).execute(PROVIDER_APPOINTMENTS_EXPORT, {"provider_id": provider_id})
+                yield from result.partitions()
+
+        return batches()
 
     @staticmethod
     def create(data: dict, current_user: UserModel) -> AppointmentModel:
         """
         Creates a new appointment record in the database
-        :param data: A dictionary containing appointment details such as staff_id, appointment_time, etc.
+        :param data: The deserialized appointment details such as staff_id, appointment_time, etc.
         :param current_user: The user creating the appointment.
         :return: The created AppointmentModel instance.
-        :raises ValueError: If the appointment time format is invalid.
         :raises Conflict: If the selected time slot is already booked or if the service ID is invalid.
         """
         staff_id = data.get("staff_id")
-        appointment_time_str = data.get("appointment_time")
-
-        try:
-            appointment_time = datetime.fromisoformat(appointment_time_str)
-        except ValueError:
-            logging.error("Invalid appointment time format.")
-            raise ValueError("Invalid appointment time format. Please use ISO format.")
-
+        appointment_time = data.get("appointment_time")
         service_id = data.get("service_id")
 
         try:
@@ -122,9 +252,7 @@ class AppointmentManager:
             logging.error(f"Error retrieving service duration: {e}")
             raise Conflict("Invalid service ID provided.")
 
-        data["staff_id"] = staff_id
         data["customer_id"] = current_user.id
-        data["appointment_time"] = appointment_time
 
         if AppointmentManager.is_slot_booked(
             staff_id, appointment_time, service_duration
@@ -145,6 +273,163 @@ class AppointmentManager:
 
         return appointment
 
+    @staticmethod
+    def create_recurring(
+        data: dict, current_user: UserModel
+    ) -> Tuple[List[AppointmentModel], List[dict]]:
+        """
+        Books several occurrences with the same staff member and service in one
+        transaction: working hours are read once per weekday, one query checks every
+        occurrence against existing bookings, one multi-row INSERT creates them and
+        the staff member gets one summary email.
+        :param data: The deserialized request, see RecurringAppointmentRequestSchema.
+        :param current_user: The client booking the appointments.
+        :return: The created appointments and the occurrences that were skipped,
+                 each with its time and the reason.
+        :raises Conflict: If the service ID is invalid, or if any occurrence cannot
+                          be booked and skip_conflicts is not set; the response then
+                          lists the failed occurrences.
+        :raises BadRequest: If staff information is missing.
+        """
+        staff_id = data["staff_id"]
+
+        try:
+            service = ServiceManager.get_by_id(data["service_id"])
+        except Exception as e:
+            logging.error(f"Error retrieving service: {e}")
+            raise Conflict("Invalid service ID provided.")
+
+        staff = db.session.get(UserModel, staff_id)
+        if staff is None or not staff.email:
+            raise BadRequest("Staff information is missing for the appointment.")
+
+        duration = timedelta(minutes=service.duration)
+        times = AppointmentManager.occurrence_times(data)
+
+        day_intervals = {
+            weekday: WorkingHoursManager.get_day_intervals(staff_id, weekday)
+            for weekday in {moment.weekday() for moment in times}
+        }
+
+        conflicts = {}
+        previous = None
+        for appointment_time in times:
+            if not WorkingHoursManager.covers(
+                day_intervals[appointment_time.weekday()], appointment_time
+            ):
+                conflicts[appointment_time] = "Outside of working hours."
+            elif previous is not None and appointment_time < previous + duration:
+                conflicts[appointment_time] = "Overlaps another requested time."
+            else:
+                previous = appointment_time
+
+        candidates = [moment for moment in times if moment not in conflicts]
+        if candidates:
+            for booked_time in AppointmentManager.find_booked_times(
+                staff_id, candidates, service.duration
+            ):
+                conflicts[booked_time] = "The time slot is already booked."
+
+        failed = [
+            {"appointment_time": moment.isoformat(), "reason": reason}
+            for moment, reason in sorted(conflicts.items())
+        ]
+        to_book = [moment for moment in times if moment not in conflicts]
+        if not to_book or (conflicts and not data.get("skip_conflicts")):
+            error = Conflict("Some of the requested times cannot be booked.")
+            error.data = {"message": error.description, "conflicts": failed}
+            raise error
+
+        appointments = (
+            db.session.execute(
+                insert(AppointmentModel).returning(AppointmentModel),
+                [
+                    {
+                        "service_id": service.id,
+                        "staff_id": staff_id,
+                        "customer_id": current_user.id,
+                        "appointment_time": moment,
+                    }
+                    for moment in to_book
+                ],
+            )
+            .scalars()
+            .all()
+        )
+
+        content = EmailTemplates.CONTENT_RECURRING_APPOINTMENTS_NOTIFIED.format(
+            employee_name=f"{staff.first_name} {staff.last_name}",
+            client_name=f"{current_user.first_name} {current_user.last_name}",
+            service_name=service.name,
+            appointment_times="\n".join(
+                f"    - {appointment.appointment_time.isoformat()}"
+                for appointment in appointments
+            ),
+        )
+        try:
+            AppointmentManager.send_notification_email(
+                staff.email,
+                EmailTemplates.SUBJECT_RECURRING_APPOINTMENTS_BOOKED,
+                content,
+                appointments[0].id,
+            )
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Error occurred while creating appointments: {e}")
+            raise
+
+        return appointments, failed
+
+    @staticmethod
+    def occurrence_times(data: dict) -> List[datetime]:
+        """
+        Expands a recurring booking request into its appointment times
+        :param data: The deserialized request, either with appointment_times or with
+                     appointment_time, occurrences and interval_weeks.
+        :return: The distinct appointment times in chronological order.
+        """
+        if "appointment_times" in data:
+            return sorted(set(data["appointment_times"]))
+
+        step = timedelta(weeks=data.get("interval_weeks", 1))
+        return [
+            data["appointment_time"] + step * occurrence
+            for occurrence in range(data["occurrences"])
+        ]
+
+    @staticmethod
+    def find_booked_times(
+        staff_id: int, times: List[datetime], service_duration: int
+    ) -> List[datetime]:
+        """
+        Finds which of the given times overlap an existing appointment of the staff
+        member, with a single query over all of them
+        :param staff_id: The ID of the staff member.
+        :param times: The requested appointment times.
+        :param service_duration: The duration of the service in minutes.
+        :return: The requested times that are already booked.
+        """
+        requested = values(
+            column("appointment_time", DateTime), name="requested"
+        ).data([(moment,) for moment in times])
+        duration = timedelta(minutes=service_duration)
+
+        # The same overlap condition as OVERLAPPING_APPOINTMENT, per requested time.
+        overlapping = exists().where(
+            AppointmentModel.staff_id == staff_id,
+            AppointmentModel.appointment_time
+            < requested.c.appointment_time + duration,
+            AppointmentModel.appointment_time
+            > requested.c.appointment_time - duration,
+        )
+        return (
+            db.session.execute(
+                db.select(requested.c.appointment_time).where(overlapping)
+            )
+            .scalars()
+            .all()
+        )
+
     @staticmethod
     def update(
         appointment_id: int, data: dict, current_user: UserModel
@@ -152,16 +437,14 @@ class AppointmentManager:
         """
         Updates an existing appointment record in the database
         :param appointment_id: The ID of the appointment to update.
-        :param data: A dictionary containing updated appointment details.
+        :param data: The deserialized appointment details to update.
         :param current_user: The user performing the update.
         :return: The updated AppointmentModel instance.
         :raises NotFound: If the appointment does not exist.
         :raises Forbidden: If the appointment cannot be edited due to its current status.
-        :raises BadRequest: If the update fails.
+        :raises BadRequest: If the new time is outside of working hours or the update fails.
         """
-        appointment = db.session.execute(
-            db.select(AppointmentModel).filter(AppointmentModel.id == appointment_id)
-        ).scalar_one_or_none()
+        appointment = db.session.get(AppointmentModel, appointment_id)
 
         if appointment is None:
             raise NotFound("Appointment not found.")
@@ -178,10 +461,15 @@ class AppointmentManager:
         staff_id = appointment.staff_id
         duration = appointment.service.duration
 
+        if not WorkingHoursManager.is_within_working_hours(
+            staff_id, new_appointment_time
+        ):
+            raise BadRequest("Appointment time is outside of working hours.")
+
         if AppointmentManager.is_slot_booked(staff_id, new_appointment_time, duration):
             raise Conflict("The selected time slot is already booked.")
 
-        appointment.appointment_time = datetime.fromisoformat(new_appointment_time)
+        appointment.appointment_time = new_appointment_time
 
         appointment.status = AppointmentState.PENDING.value
 
@@ -215,7 +503,7 @@ class AppointmentManager:
         :param appointment_id: The ID of the appointment to delete.
         :raises NotFound: If the appointment does not exist.
         """
-        appointment = db.session.query(AppointmentModel).get(appointment_id)
+        appointment = db.session.get(AppointmentModel, appointment_id)
         if appointment is None:
             raise NotFound("Appointment not found.")
 
@@ -237,9 +525,7 @@ class AppointmentManager:
         """
         staff_id = current_user.id
 
-        appointment = db.session.execute(
-            db.select(AppointmentModel).filter_by(id=appointment_id)
-        ).scalar_one_or_none()
+        appointment = db.session.get(AppointmentModel, appointment_id)
 
         if appointment is None:
             raise NotFound(f"Appointment with id {appointment_id} does not exist")
@@ -482,7 +768,7 @@ class AppointmentManager:
     @staticmethod
     def is_slot_booked(
         staff_id: int, appointment_time: datetime, service_duration: int
-    ) -> int:
+    ) -> bool:
         """
         Checks if a time slot is already booked for a given staff member
         :param staff_id: The ID of the staff member.
@@ -493,20 +779,15 @@ class AppointmentManager:
         if isinstance(appointment_time, str):
             appointment_time = datetime.fromisoformat(appointment_time)
 
-        end_time = appointment_time + timedelta(minutes=service_duration)
+        duration = timedelta(minutes=service_duration)
 
-        overlapping_appointments = (
-            db.session.execute(
-                db.select(AppointmentModel).filter(
-                    AppointmentModel.staff_id == staff_id,
-                    AppointmentModel.appointment_time < end_time,
-                    AppointmentModel.appointment_time
-                    + timedelta(minutes=service_duration)
-                    > appointment_time,
-                )
-            )
-            .scalars()
-            .all()
-        )
+        overlapping_appointment = db.session.execute(
+            OVERLAPPING_APPOINTMENT,
+            {
+                "staff_id": staff_id,
+                "end_time": appointment_time + duration,
+                "earliest_start": appointment_time - duration,
+            },
+        ).scalar()
 
-        return len(overlapping_appointments) > 0
+        return overlapping_appointment is not None
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import jwt
 from decouple import config
 from flask_httpauth import HTTPTokenAuth
+from sqlalchemy import bindparam
 from werkzeug.exceptions import Unauthorized
 
 from db import db
@@ -61,6 +62,12 @@ class AuthManager:
 
 auth = HTTPTokenAuth(scheme="Bearer")
 
+# Built once: every authenticated request reuses the statement, its memoized
+# cache key and the compiled SQL.
+ACTIVE_USER_BY_ID = db.select(UserModel).where(
+    UserModel.id == bindparam("user_id"), UserModel.is_active == True
+)
+
 
 @auth.verify_token
 def verify_token(token: str) -> UserModel:
@@ -77,9 +84,7 @@ def verify_token(token: str) -> UserModel:
         user_role = decoded_token["role"]
 
         # Fetch the user and ensure they are active
-        user = db.session.execute(
-            db.select(UserModel).filter_by(id=user_id, is_active=True)
-        ).scalar()
+        user = db.session.execute(ACTIVE_USER_BY_ID, {"user_id": user_id}).scalar()
         if user is None:
             raise Unauthorized(AuthManager.INVALID_OR_MISSING_TOKEN_MESSAGE)
 
@@ -1,7 +1,8 @@
 from typing import Optional, List, TypeVar, Generic, Dict, Any
 
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
-from werkzeug.exceptions import Conflict
+from werkzeug.exceptions import Conflict, NotFound
 
 from db import db
 
@@ -22,10 +23,27 @@ class BaseManager(Generic[ModelType]):
         :raises NotImplementedError: If the model is not specified for the manager.
         :raises ValueError: If an invalid status is provided.
         """
+        stmt = cls.records_statement(status=status, record_id=record_id)
+        records = db.session.execute(stmt).scalars().all()
+        return records
+
+    @classmethod
+    def records_statement(
+        cls, status: Optional[str] = None, record_id: Optional[int] = None
+    ) -> Select:
+        """
+        Builds the select statement used by get_records, for callers that execute
+        or serialize it themselves.
+
+        :param status: The status to filter records by (e.g., "active"). If None, all records are selected.
+        :param record_id: The specific record ID to select. If None, all records are selected.
+        :return: The select statement.
+        :raises NotImplementedError: If the model is not specified for the manager.
+        """
         if not cls.model:
             raise NotImplementedError("Model not specified for the manager.")
 
-        stmt = db.select(cls.model).distinct()
+        stmt = db.select(cls.model)
 
         if record_id:
             stmt = stmt.where(cls.model.id == record_id)
@@ -34,8 +52,29 @@ class BaseManager(Generic[ModelType]):
             is_active = status.lower() == "active"
             stmt = stmt.where(cls.model.is_active == is_active)
 
-        records = db.session.execute(stmt).scalars().all()
-        return records
+        return stmt
+
+    @classmethod
+    def get_by_id(cls, item_id: int, active_only: bool = True) -> ModelType:
+        """
+        Retrieves a single record by its primary key. Records already loaded in
+        the current session are returned from the identity map without a query.
+
+        :param item_id: The ID of the record to retrieve.
+        :param active_only: Whether inactive (soft-deleted) records count as missing.
+        :return: The matching record.
+        :raises NotImplementedError: If the model is not specified for the manager.
+        :raises NotFound: If no (active) record with the given ID exists.
+        """
+        if not cls.model:
+            raise NotImplementedError("Model not specified for the manager.")
+
+        item = db.session.get(cls.model, item_id)
+
+        if item is None or (active_only and not item.is_active):
+            raise NotFound(f"{cls.model.__name__} with id {item_id} not found.")
+
+        return item
 
     @classmethod
     def create(cls, data: Dict[str, Any]) -> ModelType:
@@ -62,10 +101,10 @@ class BaseManager(Generic[ModelType]):
         Updates an existing record in the database
         :param item_id: The ID of the record to update.
         :param data: A dictionary containing the updated data.
-        :return: The updated record or None if not found.
+        :raises NotFound: If no active record with the given ID exists.
         :raises Conflict: If the update fails due to integrity constraints.
         """
-        item = cls.get_records(record_id=item_id, status="active")[0]
+        item = cls.get_by_id(item_id)
         for key, value in data.items():
             if hasattr(item, key):
                 setattr(item, key, value)
@@ -82,10 +121,8 @@ class BaseManager(Generic[ModelType]):
         """
         Deactivates a record by setting its is_active attribute to False
         :param item_id: The ID of the record to deactivate.
-        :return: The deactivated record or None if not found.
+        :raises NotFound: If no active record with the given ID exists.
         """
-
-        item = cls.get_records(record_id=item_id, status="active")[0]
+        item = cls.get_by_id(item_id)
         item.is_active = False
-        db.session.add(item)
         db.session.flush()
@@ -1,6 +1,131 @@
+from typing import List
+
+from sqlalchemy import and_, func
+
+from db import db
 from managers.base_manager import BaseManager
-from models import ServiceCategoryModel
+from models import (
+    ServiceCategoryModel,
+    ServiceModel,
+    ServiceProviderModel,
+    ServiceSubcategoryModel,
+)
+
+# The tables the catalog tree is read from.
+CATALOG_TABLES = ("categories", "subcategories", "services", "service_providers")
+
+# Active categories with their active subcategories and, under those, their
+# active services of active providers, one row per service, as a single query.
+# The outer joins keep categories and subcategories without services.
+CATALOG_TREE = (
+    db.select(
+        ServiceCategoryModel.id,
+        ServiceCategoryModel.name,
+        ServiceSubcategoryModel.id,
+        ServiceSubcategoryModel.name,
+        ServiceModel.id,
+        ServiceModel.name,
+        ServiceModel.price,
+        ServiceModel.duration,
+        ServiceModel.service_provider_id,
+    )
+    .outerjoin(
+        ServiceSubcategoryModel,
+        and_(
+            ServiceSubcategoryModel.category_id == ServiceCategoryModel.id,
+            ServiceSubcategoryModel.is_active == True,
+        ),
+    )
+    .outerjoin(
+        db.join(
+            ServiceModel,
+            ServiceProviderModel,
+            and_(
+                ServiceProviderModel.id == ServiceModel.service_provider_id,
+                ServiceProviderModel.is_active == True,
+            ),
+        ),
+        and_(
+            ServiceModel.service_subcategory_id == ServiceSubcategoryModel.id,
+            ServiceModel.is_active == True,
+        ),
+    )
+    .where(ServiceCategoryModel.is_active == True)
+    .order_by(ServiceCategoryModel.id, ServiceSubcategoryModel.id, ServiceModel.id)
+)
+
+# Row counts and the latest update of every catalog table. Deactivating a row
+# updates it, so any change to the tree changes one of these.
+CATALOG_VERSION = db.select(
+    *(
+        db.select(aggregate).scalar_subquery()
+        for model in (
+            ServiceCategoryModel,
+            ServiceSubcategoryModel,
+            ServiceModel,
+            ServiceProviderModel,
+        )
+        for aggregate in (func.count(model.id), func.max(model.updated_on))
+    )
+)
 
 
 class CategoryManager(BaseManager):
     model = ServiceCategoryModel
+
+    @staticmethod
+    def get_catalog_tree() -> List[dict]:
+        """
+        Retrieves the active catalog for browsing with one query, without
+        loading ORM objects.
+
+        :return: The active categories ordered by ID, each with its active
+                 ``subcategories`` and each of those with the active ``services``
+                 of active providers.
+        """
+        categories = []
+        category = subcategory = None
+        for (
+            category_id,
+            category_name,
+            subcategory_id,
+            subcategory_name,
+            service_id,
+            name,
+            price,
+            duration,
+            provider_id,
+        ) in db.session.execute(CATALOG_TREE):
+            if category is None or category["id"] != category_id:
+                category = {"id": category_id, "name": category_name, "subcategories": []}
+                categories.append(category)
+                subcategory = None
+            if subcategory_id is None:
+                continue
+            if subcategory is None or subcategory["id"] != subcategory_id:
+                subcategory = {
+                    "id": subcategory_id,
+                    "name": subcategory_name,
+                    "services": [],
+                }
+                category["subcategories"].append(subcategory)
+            if service_id is not None:
+                subcategory["services"].append(
+                    {
+                        "id": service_id,
+                        "name": name,
+                        "price": price,
+                        "duration": duration,
+                        "provider_id": provider_id,
+                    }
+                )
+        return categories
+
+    @staticmethod
+    def get_catalog_version() -> tuple:
+        """
+        Retrieves a version of the catalog tree without loading it, for its ETag.
+
+        :return: The row count and latest ``updated_on`` of each catalog table.
+        """
+        return tuple(db.session.execute(CATALOG_VERSION).one())
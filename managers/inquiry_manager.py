@@ -1,5 +1,6 @@
 from typing import Optional, List
 
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from werkzeug.exceptions import NotFound, BadRequest, Forbidden
 
@@ -42,17 +43,26 @@ class InquiryManager:
         :raises BadRequest: If the status is invalid.
         """
 
+        stmt = InquiryManager.inquiries_statement(status)
+        return db.session.execute(stmt).scalars().all()
+
+    @staticmethod
+    def inquiries_statement(status: Optional[str] = None) -> Select:
+        """
+        Builds the select statement used by get_inquiries.
+
+        :param status: The status to filter inquiries (e.g., PENDING, APPROVED).
+                       If None, all inquiries are selected.
+        :return: The select statement.
+        :raises BadRequest: If the status is invalid.
+        """
+        stmt = db.select(InquiryModel)
+
         if status:
             status_enum = InquiryManager._validate_inquiry_status(status)
-            return (
-                db.session.execute(
-                    db.select(InquiryModel).filter_by(status=status_enum)
-                )
-                .scalars()
-                .all()
-            )
+            stmt = stmt.filter_by(status=status_enum)
 
-        return db.session.execute(db.select(InquiryModel)).scalars().all()
+        return stmt
 
     @staticmethod
     def _validate_inquiry_status(status: str) -> ProviderRegistrationState:
@@ -1,20 +1,81 @@
-import os
+import logging
+import re
 import uuid
-from typing import Optional, List
+from datetime import datetime
+from functools import partial
+from typing import Callable, Optional, List, Tuple
 
+from botocore.exceptions import BotoCoreError, ClientError
+from decouple import config
+from flask import current_app
+from PIL import Image, UnidentifiedImageError
 from sqlalchemy.exc import IntegrityError
-from werkzeug.exceptions import NotFound, Conflict, Forbidden
+from sqlalchemy.orm import Session
+from werkzeug.exceptions import (
+    BadRequest,
+    Conflict,
+    Forbidden,
+    NotFound,
+    RequestEntityTooLarge,
+)
 
-from constants import TEMP_FILE_FOLDER
+from constants import (
+    NEARBY_DEFAULT_RADIUS_KM,
+    NEARBY_INITIAL_RADIUS_KM,
+    PHOTO_DERIVATIVE_PREFIX,
+    PHOTO_UPLOAD_PREFIX,
+)
 from db import db
 from managers.base_manager import BaseManager
 from models import ServiceProviderModel, InquiryModel, ProviderRegistrationState
 from services import s3
+from services.images import DERIVATIVE_FORMATS, render_derivatives
 from services.s3 import S3Service
-from utils.helpers import decode_photo
+from tasks.photo_derivatives import generate_photo_derivatives
+from utils.geo import (
+    EARTH_RADIUS_KM,
+    BoundingBox,
+    bounding_box,
+    box_size_km,
+    covering_cells,
+    distance_km,
+    longitude_ranges,
+)
+from utils.helpers import PHOTO_MAX_BYTES, decode_photo
+from utils.transactions import on_rollback
+from worker import enqueue_after_commit
+
+logger = logging.getLogger(__name__)
 
 s3 = S3Service()
 
+PHOTO_UPLOAD_EXPIRES_SECONDS = config(
+    "PHOTO_UPLOAD_EXPIRES_SECONDS", default=600, cast=int
+)
+
+# The object key at the end of a stored photo URL, whichever bucket URL or
+# endpoint the photo was stored with. Issued keys contain no further slash.
+PHOTO_URL_KEY = db.func.substring(
+    ServiceProviderModel.photo_url, rf"/({re.escape(PHOTO_UPLOAD_PREFIX)}[^/]+)$"
+)
+
+# Columns returned by the proximity search, with the computed distance.
+NEARBY_COLUMNS = (
+    ServiceProviderModel.id,
+    ServiceProviderModel.trade_name,
+    ServiceProviderModel.photo_url,
+    ServiceProviderModel.photo_derivatives,
+    ServiceProviderModel.country,
+    ServiceProviderModel.district,
+    ServiceProviderModel.city,
+    ServiceProviderModel.neighborhood,
+    ServiceProviderModel.street,
+    ServiceProviderModel.street_number,
+    ServiceProviderModel.postal_code,
+    ServiceProviderModel.latitude,
+    ServiceProviderModel.longitude,
+)
+
 
 class ProviderManager(BaseManager):
     model = ServiceProviderModel
@@ -37,30 +98,330 @@ class ProviderManager(BaseManager):
         """
         Creates a new service provider from the provided data.
 
-        :param data: A dictionary containing provider data, including an inquiry ID and photo.
+        The checks run cheapest first so that a rejected registration never
+        uploads anything: the inquiry, then the photo (decoding a base64 photo
+        or looking up an uploaded one), then the insert in a savepoint, which
+        catches a duplicate UIC or inquiry. A base64 photo is uploaded only
+        after the insert. If the upload fails the savepoint is rolled back, and
+        if the transaction is rolled back later the photo is deleted again.
+
+        :param data: A dictionary containing provider data, including an inquiry ID
+                     and either a base64 photo or the key of an uploaded photo.
         :return: The created ServiceProviderModel instance.
         :raises Forbidden: If the associated inquiry is not approved.
+        :raises BadRequest: If the photo is not valid base64 or was not uploaded.
+        :raises RequestEntityTooLarge: If the photo exceeds PHOTO_MAX_BYTES.
         :raises Conflict: If a provider with the same UIC or Inquiry ID already exists.
         """
-        inquiry_id = data.get("inquiry_id")
-        inquiry = cls._get_inquiry(inquiry_id)
-        encoded_photo = data.pop("photo")
-        extension = data.pop("photo_extension")
-        name = f"{str(uuid.uuid4())}.{extension}"
-        path = os.path.join(TEMP_FILE_FOLDER, f"{name}")
-        decode_photo(path, encoded_photo)
-        url = s3.upload_photo(path, name, extension)
-        data["photo_url"] = url
-
+        inquiry = cls._get_inquiry(data.get("inquiry_id"))
         if inquiry.status != ProviderRegistrationState.APPROVED:
             raise Forbidden("Inquiry must be approved before registering a provider.")
 
+        if "photo_key" in data:
+            data["photo_url"] = cls._uploaded_photo_url(data.pop("photo_key"))
+            provider = cls._insert_provider(data)
+        else:
+            extension = data.pop("photo_extension")
+            key = f"{PHOTO_UPLOAD_PREFIX}{uuid.uuid4()}.{extension}"
+            with decode_photo(data.pop("photo")) as photo:
+                data["photo_url"] = s3.object_url(key)
+                provider = cls._insert_provider(
+                    data, lambda: s3.upload_photo(photo, key, extension)
+                )
+            _delete_photo_on_rollback(db.session, key)
+
+        if current_app.config.get("PHOTO_DERIVATIVES"):
+            enqueue_after_commit(
+                db.session, generate_photo_derivatives, provider.id, provider.photo_url
+            )
+        return provider
+
+    @classmethod
+    def _insert_provider(
+        cls, data: dict, upload: Optional[Callable[[], object]] = None
+    ) -> ServiceProviderModel:
+        """
+        Inserts the provider in a savepoint, so that a conflict or a failed
+        upload rolls back only this insert.
+
+        :param data: The provider's columns.
+        :param upload: Uploads the photo once the insert succeeded.
+        :return: The inserted ServiceProviderModel instance.
+        :raises Conflict: If a provider with the same UIC or Inquiry ID already exists.
+        """
+        savepoint = db.session.begin_nested()
         try:
-            provider = cls.create(data)
-            return provider
+            provider = cls.model(**data)
+            db.session.add(provider)
+            db.session.flush()
         except IntegrityError:
-            db.session.rollback()
+            savepoint.rollback()
             raise Conflict("A provider with the same UIC or Inquiry ID already exists.")
+        try:
+            if upload is not None:
+                upload()
+        except Exception:
+            savepoint.rollback()
+            raise
+        savepoint.commit()
+        return provider
+
+    @staticmethod
+    def create_photo_upload(extension: str) -> dict:
+        """
+        Issues a presigned POST that uploads a provider photo straight to the
+        bucket, so the photo does not pass through the API. The returned key
+        is then sent as ``photo_key`` when registering the provider.
+
+        :param extension: The photo's file extension, e.g. ``png``.
+        :return: A dictionary with the key, the URL to post to, the form fields
+                 to send with the file and the validity in seconds.
+        """
+        key = f"{PHOTO_UPLOAD_PREFIX}{uuid.uuid4()}.{extension}"
+        upload = s3.create_photo_upload(
+            key, extension, PHOTO_MAX_BYTES, PHOTO_UPLOAD_EXPIRES_SECONDS
+        )
+        return {
+            "key": key,
+            "url": upload["url"],
+            "fields": upload["fields"],
+            "expires_in": PHOTO_UPLOAD_EXPIRES_SECONDS,
+        }
+
+    @staticmethod
+    def _uploaded_photo_url(key: str) -> str:
+        """
+        Verifies that a photo was uploaded under the key.
+
+        :param key: The key issued by create_photo_upload.
+        :return: The URL of the photo.
+        :raises BadRequest: If nothing was uploaded or the object is not an image.
+        :raises RequestEntityTooLarge: If the object exceeds PHOTO_MAX_BYTES.
+        """
+        head = s3.head_photo(key)
+        if head is None:
+            raise BadRequest("The photo has not been uploaded.")
+        # The stored object is checked as well: not every S3-compatible store
+        # enforces the conditions of the presigned POST.
+        if head["ContentLength"] > PHOTO_MAX_BYTES:
+            raise RequestEntityTooLarge(
+                f"The photo must not be larger than {PHOTO_MAX_BYTES} bytes."
+            )
+        if not head.get("ContentType", "").startswith("image/"):
+            raise BadRequest("The uploaded photo is not an image.")
+        return s3.object_url(key)
+
+    @staticmethod
+    def store_photo_derivatives(provider_id: int, photo_url: str) -> None:
+        """
+        Renders the derivatives of a provider's photo (services.images), uploads
+        them next to each other under PHOTO_DERIVATIVE_PREFIX and records their
+        keys on the provider. Runs in the background task; the caller commits.
+
+        The provider is skipped when it no longer exists, its photo changed
+        since the task was sent, or its derivatives were already stored. Photos
+        outside the bucket and unreadable images are recorded with no sizes so
+        that the backfill does not pick them up again.
+
+        :param provider_id: The ID of the provider.
+        :param photo_url: The photo URL the provider had when the task was sent.
+        """
+        provider = db.session.get(ServiceProviderModel, provider_id)
+        if provider is None or provider.photo_url != photo_url:
+            return
+        if (provider.photo_derivatives or {}).get("source") == photo_url:
+            return
+
+        sizes = {}
+        key = s3.key_from_url(photo_url)
+        if key is not None:
+            try:
+                rendered = render_derivatives(s3.download(key))
+            except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+                logger.warning(f"Cannot render the photo of provider {provider_id}: {e}")
+                rendered = {}
+            stem = key.rsplit(".", 1)[0]
+            for (size, format_name), body in rendered.items():
+                _, extension, content_type, _ = DERIVATIVE_FORMATS[format_name]
+                derivative_key = f"{PHOTO_DERIVATIVE_PREFIX}{stem}/{size}.{extension}"
+                s3.upload_bytes(body, derivative_key, content_type)
+                sizes.setdefault(size, {})[format_name] = derivative_key
+
+        # Conditional on the photo, in case it was replaced meanwhile.
+        db.session.execute(
+            db.update(ServiceProviderModel)
+            .where(
+                ServiceProviderModel.id == provider_id,
+                ServiceProviderModel.photo_url == photo_url,
+            )
+            .values(photo_derivatives={"source": photo_url, "sizes": sizes})
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def photos_without_derivatives(limit: int) -> List[tuple]:
+        """
+        :param limit: The largest number of providers to return.
+        :return: (ID, photo URL) of providers whose current photo has no
+                 derivatives stored.
+        """
+        return db.session.execute(
+            db.select(ServiceProviderModel.id, ServiceProviderModel.photo_url)
+            .where(
+                db.or_(
+                    ServiceProviderModel.photo_derivatives.is_(None),
+                    ServiceProviderModel.photo_derivatives["source"].astext
+                    != ServiceProviderModel.photo_url,
+                )
+            )
+            .order_by(ServiceProviderModel.id)
+            .limit(limit)
+        ).all()
+
+    @staticmethod
+    def sweep_orphaned_photos(uploaded_before: datetime, page_size: int = 1000) -> int:
+        """
+        Deletes uploaded provider photos that no provider refers to, such as
+        presigned uploads of registrations that were never completed. The
+        bucket is listed in pages under PHOTO_UPLOAD_PREFIX and each page is
+        checked against the database with a single query. Stored URLs are
+        matched on their key, so photos stored before a change of the bucket
+        URL (e.g. a new endpoint) still count as referenced.
+
+        :param uploaded_before: Only objects last modified before this time are
+                                deleted, leaving registrations in progress alone.
+        :param page_size: The number of objects listed per request, at most 1000.
+        :return: The number of deleted objects.
+        """
+        deleted = 0
+        for objects in s3.list_objects(PHOTO_UPLOAD_PREFIX, page_size):
+            candidates = [
+                obj["Key"] for obj in objects if obj["LastModified"] < uploaded_before
+            ]
+            if not candidates:
+                continue
+            referenced = set(
+                db.session.scalars(
+                    db.select(PHOTO_URL_KEY).where(PHOTO_URL_KEY.in_(candidates))
+                )
+            )
+            orphaned = [key for key in candidates if key not in referenced]
+            if orphaned:
+                s3.delete_objects(orphaned)
+                deleted += len(orphaned)
+        return deleted
+
+    @classmethod
+    def nearby_providers(
+        cls,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        box: Optional[BoundingBox] = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Tuple[list, bool]:
+        """
+        Finds active providers within a radius of a location and/or inside a
+        bounding box, nearest first.
+
+        Sorting every provider of a dense area by distance would read all of
+        them, so the search starts at NEARBY_INITIAL_RADIUS_KM around the
+        location and widens until it holds the requested page. Each step reads
+        the geohash cells covering its area with range scans of the geohash
+        index.
+
+        :param latitude: The latitude distances are measured from. Defaults
+                         to the center of the box.
+        :param longitude: The longitude distances are measured from.
+        :param radius_km: The search radius. Defaults to NEARBY_DEFAULT_RADIUS_KM
+                          when no box is given.
+        :param box: (min_latitude, min_longitude, max_latitude, max_longitude).
+        :param page: The 1-based page number.
+        :param per_page: The number of providers per page.
+        :return: The page of rows with NEARBY_COLUMNS and ``distance`` in
+                 kilometres, and whether there are more pages.
+        """
+        if latitude is None:
+            latitude, longitude = _box_center(box)
+        if box is None:
+            radius_km = radius_km or NEARBY_DEFAULT_RADIUS_KM
+            outer_km = radius_km
+        else:
+            # The farthest point of a box is one of its corners.
+            outer_km = max(
+                distance_km(latitude, longitude, corner_latitude, corner_longitude)
+                for corner_latitude in (box[0], box[2])
+                for corner_longitude in (box[1], box[3])
+            )
+            if radius_km is not None:
+                outer_km = min(outer_km, radius_km)
+
+        wanted = page * per_page + 1
+        search_km = min(NEARBY_INITIAL_RADIUS_KM, outer_km)
+        while True:
+            # Every provider outside the searched radius is farther than the
+            # ones inside it, so once it holds enough rows they are the nearest.
+            is_last = search_km >= outer_km
+            within_km = radius_km if is_last else search_km
+            rows = cls._nearest_providers(latitude, longitude, within_km, box, wanted)
+            if is_last or len(rows) == wanted:
+                break
+            search_km = min(search_km * 4, outer_km)
+
+        return rows[(page - 1) * per_page : page * per_page], len(rows) == wanted
+
+    @staticmethod
+    def _nearest_providers(
+        latitude: float,
+        longitude: float,
+        within_km: Optional[float],
+        box: Optional[BoundingBox],
+        limit: int,
+    ) -> list:
+        """
+        :param within_km: The largest distance from the location, if any.
+        :param box: The box the providers must be in, if any.
+        :param limit: The largest number of rows to return.
+        :return: The rows of the nearest matching providers, nearest first.
+        """
+        area = box
+        if within_km is not None:
+            radius_box = bounding_box(latitude, longitude, within_km)
+            if area is None or _box_area(radius_box) < _box_area(area):
+                area = radius_box
+
+        distance = _distance_km(latitude, longitude)
+        geohash = ServiceProviderModel.geohash
+        filters = [
+            ServiceProviderModel.is_active == True,
+            # "~" sorts after every geohash character in the C collation.
+            db.or_(
+                *(
+                    db.and_(geohash >= cell, geohash < cell + "~")
+                    for cell in covering_cells(area)
+                )
+            ),
+        ]
+        if box is not None:
+            filters += [
+                ServiceProviderModel.latitude.between(box[0], box[2]),
+                db.or_(
+                    *(
+                        ServiceProviderModel.longitude.between(low, high)
+                        for low, high in longitude_ranges(box)
+                    )
+                ),
+            ]
+        if within_km is not None:
+            filters.append(distance <= within_km)
+
+        return db.session.execute(
+            db.select(*NEARBY_COLUMNS, distance.label("distance"))
+            .where(*filters)
+            .order_by(distance, ServiceProviderModel.id)
+            .limit(limit)
+        ).all()
 
     @classmethod
     def update_provider(cls, provider_id: int, data: dict) -> None:
@@ -82,7 +443,7 @@ class ProviderManager(BaseManager):
         :return: The deactivated ServiceProviderModel instance.
         :raises NotFound: If the provider does not exist.
         """
-        provider = cls.get_records(record_id=provider_id)[0]
+        provider = cls.get_by_id(provider_id, active_only=False)
         cls._deactivate_provider(provider)
 
     @staticmethod
@@ -114,3 +475,51 @@ class ProviderManager(BaseManager):
         if not inquiry:
             raise NotFound(f"Inquiry with ID {inquiry_id} not found.")
         return inquiry
+
+
+def _distance_km(latitude: float, longitude: float):
+    """
+    :return: The SQL expression of a provider's great-circle distance from the
+             point (haversine formula, as utils.geo.distance_km).
+    """
+    half_delta_latitude = db.func.radians(ServiceProviderModel.latitude - latitude) / 2
+    half_delta_longitude = db.func.radians(ServiceProviderModel.longitude - longitude) / 2
+    a = db.func.power(db.func.sin(half_delta_latitude), 2) + db.func.cos(
+        db.func.radians(latitude)
+    ) * db.func.cos(db.func.radians(ServiceProviderModel.latitude)) * db.func.power(
+        db.func.sin(half_delta_longitude), 2
+    )
+    return 2 * EARTH_RADIUS_KM * db.func.asin(db.func.least(1.0, db.func.sqrt(a)))
+
+
+def _box_area(box: BoundingBox) -> float:
+    height, width = box_size_km(box)
+    return height * width
+
+
+def _box_center(box: BoundingBox) -> Tuple[float, float]:
+    min_latitude, min_longitude, max_latitude, _ = box
+    width = sum(high - low for low, high in longitude_ranges(box))
+    longitude = min_longitude + width / 2
+    if longitude > 180:
+        longitude -= 360
+    return (min_latitude + max_latitude) / 2, longitude
+
+
+def _delete_photo_on_rollback(session: Session, key: str) -> None:
+    """
+    Deletes the uploaded photo if the session's transaction is rolled back,
+    so that it is not left without a provider.
+
+    :param session: The session the provider was inserted in.
+    :param key: The key of the uploaded photo.
+    """
+    on_rollback(session, partial(_delete_photos, [key]))
+
+
+def _delete_photos(keys: List[str]) -> None:
+    try:
+        s3.delete_objects(keys)
+    except (BotoCoreError, ClientError) as e:
+        # The orphaned photo sweeper removes them later.
+        logger.error(f"Failed to delete the photos {keys}: {e}")
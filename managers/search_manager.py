@@ -0,0 +1,149 @@
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, literal_column, union
+
+from constants import SEARCH_MAX_TERMS, SEARCH_RANK_CANDIDATES
+from db import db
+from models import (
+    ServiceCategoryModel,
+    ServiceModel,
+    ServiceProviderModel,
+    ServiceSubcategoryModel,
+)
+
+
+def prefix_query(text: str) -> Optional[str]:
+    """
+    Builds a tsquery that matches documents containing every word of the text,
+    each as a prefix, so that a partly typed word already matches.
+
+    Only letters and digits are kept, which leaves nothing for to_tsquery to
+    parse as an operator.
+
+    :param text: The text typed by the user.
+    :return: The query, e.g. ``'hair':* & 'cu':*``, or None if the text has no words.
+    """
+    terms = re.findall(r"[^\W_]+", text.lower())[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+class SearchManager:
+    @classmethod
+    def search(cls, text: str, limit: int) -> Dict[str, List]:
+        """
+        Searches active providers, services, categories and subcategories by
+        name. Like the catalog tree, services are only found if their provider,
+        subcategory and category are active, and subcategories if their category
+        is. Each row type is ranked on its own search_vector, where a match in a
+        more important name weighs more: the trade name over the company name of
+        a provider, and the service name over its subcategory and category.
+
+        :param text: The text typed by the user; every word must match as a prefix.
+        :param limit: The maximum number of rows of each type.
+        :return: The best matching rows of each type, best first.
+        """
+        results = {"providers": [], "services": [], "categories": [], "subcategories": []}
+        query = prefix_query(text)
+        if query is None:
+            return results
+        query = func.to_tsquery("simple", query)
+
+        results["providers"] = cls._ranked(
+            ServiceProviderModel,
+            query,
+            limit,
+            ServiceProviderModel.id,
+            ServiceProviderModel.trade_name,
+            ServiceProviderModel.company_name,
+            ServiceProviderModel.city,
+            ServiceProviderModel.photo_url,
+            name=ServiceProviderModel.trade_name,
+        )
+        results["services"] = cls._ranked(
+            ServiceModel,
+            query,
+            limit,
+            ServiceModel.id,
+            ServiceModel.name,
+            ServiceModel.price,
+            ServiceModel.duration,
+            ServiceModel.service_subcategory_id.label("subcategory_id"),
+            ServiceProviderModel.id.label("provider_id"),
+            ServiceProviderModel.trade_name.label("provider_trade_name"),
+            name=ServiceModel.name,
+            joins=(
+                ServiceModel.service_provider,
+                ServiceModel.service_subcategory,
+                ServiceSubcategoryModel.service_category,
+            ),
+            where=(
+                ServiceProviderModel.is_active == True,
+                ServiceSubcategoryModel.is_active == True,
+                ServiceCategoryModel.is_active == True,
+            ),
+        )
+        results["categories"] = cls._ranked(
+            ServiceCategoryModel,
+            query,
+            limit,
+            ServiceCategoryModel.id,
+            ServiceCategoryModel.name,
+        )
+        results["subcategories"] = cls._ranked(
+            ServiceSubcategoryModel,
+            query,
+            limit,
+            ServiceSubcategoryModel.id,
+            ServiceSubcategoryModel.name,
+            ServiceSubcategoryModel.category_id,
+            joins=(ServiceSubcategoryModel.service_category,),
+            where=(ServiceCategoryModel.is_active == True,),
+        )
+        return results
+
+    @staticmethod
+    def _ranked(model, query, limit, *columns, name=None, joins=(), where=()) -> List:
+        """
+        Ranks the active rows of a model that match the query.
+
+        A prefix of one or two letters can match most of a large catalog, and
+        ranking every match would read all of their documents. Only a bounded
+        set of candidates is ranked instead: up to SEARCH_RANK_CANDIDATES rows
+        whose main name matches, which weighs most and ranks them first, and as
+        many matching anywhere. The ranking is exact whenever fewer rows match.
+
+        :param model: The model, with search_vector and is_active columns.
+        :param query: The tsquery.
+        :param limit: The maximum number of rows.
+        :param columns: The columns to return.
+        :param name: The main name, weighted A in search_vector and indexed as
+                     to_tsvector('simple', name), if the document has other parts.
+        :param joins: The relationships to join, in order, for the columns or the
+                      conditions.
+        :param where: Additional conditions on the rows.
+        :return: The best matching rows, best first.
+        """
+
+        def matches(document):
+            statement = db.select(model.id)
+            for relationship in joins:
+                statement = statement.join(relationship)
+            return statement.where(
+                document.op("@@")(query), model.is_active == True, *where
+            ).limit(SEARCH_RANK_CANDIDATES)
+
+        documents = [model.search_vector]
+        if name is not None:
+            documents.append(func.to_tsvector(literal_column("'simple'"), name))
+        candidates = union(*map(matches, documents)).subquery()
+        statement = db.select(*columns).select_from(model)
+        for relationship in joins:
+            statement = statement.join(relationship)
+        statement = statement.join(candidates, candidates.c.id == model.id)
+        rank = func.ts_rank(model.search_vector, query)
+        return db.session.execute(
+            statement.order_by(rank.desc(), model.id).limit(limit)
+        ).all()
@@ -1,11 +1,16 @@
 from typing import Optional
 
+from sqlalchemy import bindparam
 from werkzeug.exceptions import NotFound
 
 from db import db
 from managers.base_manager import BaseManager
 from models import ServiceModel
 
+SERVICE_DURATION_BY_ID = db.select(ServiceModel.duration).where(
+    ServiceModel.id == bindparam("service_id")
+)
+
 
 class ServiceManager(BaseManager):
     model = ServiceModel
@@ -19,13 +24,11 @@ class ServiceManager(BaseManager):
         :return: The duration of the service in minutes.
         :raises NotFound: If the service with the given ID does not exist.
         """
-        service = db.session.execute(
-            db.select(ServiceModel).filter(ServiceModel.id == service_id)
+        duration = db.session.execute(
+            SERVICE_DURATION_BY_ID, {"service_id": service_id}
         ).scalar_one_or_none()
 
-        if service is None:
+        if duration is None:
             raise NotFound(f"Service with ID {service_id} not found.")
 
-        return (
-            service.duration
-        )
+        return duration
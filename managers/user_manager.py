@@ -255,9 +255,7 @@ class UserManager:
         :param user_id: ID of the user to be updated.
         :raises NotFound: If the user with the given ID is not found.
         """
-        user = db.session.execute(
-            db.select(UserModel).filter_by(id=user_id)
-        ).scalar_one_or_none()
+        user = db.session.get(UserModel, user_id)
 
         if not user:
             raise NotFound(f"User with id {user_id} not found.")
@@ -272,9 +270,7 @@ class UserManager:
         :param user_id: The ID of the user to deactivate.
         :raises NotFound: If the user with the given ID is not found.
         """
-        user = db.session.execute(
-            db.select(UserModel).filter_by(id=user_id)
-        ).scalar_one_or_none()
+        user = db.session.get(UserModel, user_id)
 
         if not user:
             raise NotFound(f"User with id {user_id} not found.")
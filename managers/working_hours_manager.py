@@ -1,9 +1,36 @@
-from sqlite3 import IntegrityError
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from datetime import datetime, time
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from werkzeug.exceptions import BadRequest, Conflict, NotFound
 
 from db import db
 from managers.base_manager import BaseManager
 from models.working_hours import WorkingHoursModel
+from services.cache import has_pending_changes, working_hours_cache
+
+ALL_WORKING_HOURS = db.select(WorkingHoursModel)
+WORKING_HOURS_BY_PROVIDER = ALL_WORKING_HOURS.where(
+    WorkingHoursModel.provider_id == bindparam("provider_id")
+)
+WORKING_HOURS_BY_EMPLOYEE = ALL_WORKING_HOURS.where(
+    WorkingHoursModel.employee_id == bindparam("employee_id")
+)
+
+# Served by the (employee_id, day_of_week, start_time) unique index.
+WORKING_HOURS_BY_EMPLOYEE_DAY = (
+    db.select(WorkingHoursModel.start_time, WorkingHoursModel.end_time)
+    .where(
+        WorkingHoursModel.employee_id == bindparam("employee_id"),
+        WorkingHoursModel.day_of_week == bindparam("day_of_week"),
+        WorkingHoursModel.is_active.is_(True),
+    )
+    .order_by(WorkingHoursModel.start_time)
+)
 
 
 class WorkingHoursManager(BaseManager):
@@ -20,43 +47,292 @@ class WorkingHoursManager(BaseManager):
         :param staff_id: The ID of the staff member to filter working hours by (optional).
         :return: A list of WorkingHoursModel instances that match the criteria.
         """
-        query = db.select(cls.model)
         if provider_id:
-            query = query.where(cls.model.provider_id == provider_id)
+            result = db.session.execute(
+                WORKING_HOURS_BY_PROVIDER, {"provider_id": provider_id}
+            )
         elif staff_id:
-            query = query.where(cls.model.employee_id == staff_id)
+            result = db.session.execute(
+                WORKING_HOURS_BY_EMPLOYEE, {"employee_id": staff_id}
+            )
+        else:
+            result = db.session.execute(ALL_WORKING_HOURS)
+
+        return result.scalars().all()
+
+    @classmethod
+    def get_day_intervals(
+        cls, staff_id: int, day_of_week: int
+    ) -> List[Tuple[time, time]]:
+        """
+        Retrieves the active working hours of a staff member on a weekday. With
+        WORKING_HOURS_CACHE enabled they are served from the working hours cache,
+        which committed working hour changes invalidate.
 
-        return db.session.execute(query).scalars().all()
+        :param staff_id: The ID of the staff member.
+        :param day_of_week: The weekday, 0 = Monday to 6 = Sunday.
+        :return: (start_time, end_time) pairs ordered by start time.
+        """
+        params = {"employee_id": staff_id, "day_of_week": day_of_week}
+        if not current_app.config.get("WORKING_HOURS_CACHE") or has_pending_changes(
+            db.session, cls.model.__tablename__
+        ):
+            return db.session.execute(WORKING_HOURS_BY_EMPLOYEE_DAY, params).all()
+
+        intervals = working_hours_cache.get_or_set(
+            f"working_hours:{staff_id}:{day_of_week}",
+            [cls.model.__tablename__],
+            lambda: [
+                [start.isoformat(), end.isoformat()]
+                for start, end in db.session.execute(
+                    WORKING_HOURS_BY_EMPLOYEE_DAY, params
+                )
+            ],
+        )
+        return [
+            (time.fromisoformat(start), time.fromisoformat(end))
+            for start, end in intervals
+        ]
+
+    @classmethod
+    def is_within_working_hours(cls, staff_id: int, moment: datetime) -> bool:
+        """
+        Checks whether a moment falls within the working hours of a staff member.
+
+        :param staff_id: The ID of the staff member.
+        :param moment: The date and time to check.
+        :return: True if an active working hour entry of that weekday covers it.
+        """
+        return cls.covers(cls.get_day_intervals(staff_id, moment.weekday()), moment)
+
+    @staticmethod
+    def covers(intervals: List[Tuple[time, time]], moment: datetime) -> bool:
+        """
+        Checks whether one of a day's working hour intervals covers a moment.
+
+        :param intervals: (start_time, end_time) pairs, see get_day_intervals.
+        :param moment: The date and time to check.
+        :return: True if an interval covers the time of day of the moment.
+        """
+        moment_time = moment.time()
+        return any(start <= moment_time <= end for start, end in intervals)
 
     @classmethod
     def create_batch(
         cls, provider_id: int, employees_data: List[Dict[str, Any]]
     ) -> List[WorkingHoursModel]:
         """
-        Creates multiple working hour entries for the specified provider.
+        Creates or replaces multiple working hour entries for the specified provider
+        with a single INSERT ... ON CONFLICT statement. An entry with the same
+        employee, day and start time as an existing active one replaces it.
 
         :param provider_id: The ID of the provider for whom to create working hours.
         :param employees_data: A list of dictionaries containing employee working hour details.
-        :return: A list of created WorkingHoursModel instances.
-        """
-        entries = []
-        for employee_data in employees_data:
-            employee_id = employee_data["employee_id"]
-            for hours in employee_data["working_hours"]:
-                working_hour_data = {
-                    "day_of_week": hours["day_of_week"],
-                    "start_time": hours["start_time"],
-                    "end_time": hours["end_time"],
-                    "provider_id": provider_id,
-                    "employee_id": employee_id,
+        :return: A list of created or updated WorkingHoursModel instances.
+        :raises BadRequest: If an entry ends before it starts.
+        :raises Conflict: If entries overlap for the same employee and day.
+        """
+        rows = [
+            {
+                "day_of_week": hours["day_of_week"],
+                "start_time": cls._to_time(hours["start_time"]),
+                "end_time": cls._to_time(hours["end_time"]),
+                "provider_id": provider_id,
+                "employee_id": employee_data["employee_id"],
+                "is_active": True,
+            }
+            for employee_data in employees_data
+            for hours in employee_data["working_hours"]
+        ]
+        cls._validate_schedule(rows)
+
+        stmt = insert(cls.model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                cls.model.employee_id,
+                cls.model.day_of_week,
+                cls.model.start_time,
+            ],
+            # Must match the index predicate for Postgres to infer the index.
+            index_where=cls.model.is_active == True,
+            set_={
+                "end_time": stmt.excluded.end_time,
+                "provider_id": stmt.excluded.provider_id,
+            },
+        ).returning(cls.model)
+
+        try:
+            return (
+                db.session.execute(
+                    stmt, execution_options={"populate_existing": True}
+                )
+                .scalars()
+                .all()
+            )
+        except IntegrityError:
+            db.session.rollback()
+            raise Conflict("Failed to create working hours with the provided data.")
+
+    @classmethod
+    def update_batch(cls, entries: List[Dict[str, Any]]) -> List[int]:
+        """
+        Updates multiple working hour entries with one executemany UPDATE.
+
+        :param entries: A list of dictionaries with the ID of each entry and the
+                        fields to change (day_of_week, start_time, end_time).
+        :return: The IDs of the updated entries.
+        :raises NotFound: If any of the entries does not exist or is inactive.
+        :raises BadRequest: If an entry ends before it starts.
+        :raises Conflict: If the result overlaps other working hours of the employee.
+        """
+        ids = [entry["id"] for entry in entries]
+        existing = cls._get_active_by_ids(ids)
+
+        params = []
+        for entry in entries:
+            current = existing[entry["id"]]
+            params.append(
+                {
+                    "id": current.id,
+                    "day_of_week": entry.get("day_of_week", current.day_of_week),
+                    "start_time": cls._to_time(
+                        entry.get("start_time", current.start_time)
+                    ),
+                    "end_time": cls._to_time(entry.get("end_time", current.end_time)),
                 }
-                try:
-                    entry = cls.model(**working_hour_data)
-                    db.session.add(entry)
-                    db.session.flush()
-                    entries.append(entry)
-                except IntegrityError as e:
-                    db.session.rollback()
-        return entries
-
-    # TODO: Batch editing
+            )
+
+        rows = [
+            {**row, "employee_id": existing[row["id"]].employee_id} for row in params
+        ]
+        cls._validate_schedule(rows, replaced_ids=set(ids))
+
+        try:
+            db.session.execute(db.update(cls.model), params)
+        except IntegrityError:
+            db.session.rollback()
+            raise Conflict("Failed to update working hours with the provided data.")
+
+        # Bulk UPDATE by primary key does not refresh objects already in the session.
+        for item in existing.values():
+            db.session.expire(item)
+
+        return ids
+
+    @classmethod
+    def deactivate_batch(cls, ids: List[int]) -> None:
+        """
+        Deactivates multiple working hour entries with a single UPDATE.
+
+        :param ids: The IDs of the entries to deactivate.
+        :raises NotFound: If any of the entries does not exist or is already inactive.
+        """
+        cls._get_active_by_ids(ids)
+
+        db.session.execute(
+            db.update(cls.model)
+            .where(cls.model.id.in_(ids))
+            .values(is_active=False)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    @classmethod
+    def _get_active_by_ids(cls, ids: List[int]) -> Dict[int, WorkingHoursModel]:
+        """
+        Loads active working hour entries by ID in one query.
+
+        :param ids: The IDs of the entries to load.
+        :return: A dictionary mapping each ID to its entry.
+        :raises NotFound: If any of the entries does not exist or is inactive.
+        """
+        found = {
+            item.id: item
+            for item in db.session.execute(
+                db.select(cls.model).where(
+                    cls.model.id.in_(ids), cls.model.is_active == True
+                )
+            ).scalars()
+        }
+
+        missing = sorted(set(ids) - found.keys())
+        if missing:
+            raise NotFound(
+                f"Working hours with id {', '.join(map(str, missing))} not found."
+            )
+
+        return found
+
+    @classmethod
+    def _validate_schedule(
+        cls, rows: List[Dict[str, Any]], replaced_ids: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Checks new working hour entries against each other and against the active
+        entries already stored for the same employees, using a single query.
+
+        :param rows: The new entries, each with employee_id, day_of_week,
+                     start_time and end_time.
+        :param replaced_ids: IDs of stored entries that the new entries replace.
+                             When omitted, stored entries with the same employee,
+                             day and start time as a new entry are replaced (upsert).
+        :raises BadRequest: If an entry ends before it starts.
+        :raises Conflict: If two entries of the same employee and day overlap.
+        """
+        invalid = [row for row in rows if row["start_time"] >= row["end_time"]]
+        if invalid:
+            raise BadRequest(
+                "Start time must be before end time: "
+                + ", ".join(
+                    f"employee {row['employee_id']} day {row['day_of_week']} "
+                    f"{row['start_time']:%H:%M}-{row['end_time']:%H:%M}"
+                    for row in invalid
+                )
+            )
+
+        intervals = defaultdict(list)
+        for row in rows:
+            key = (row["employee_id"], row["day_of_week"])
+            intervals[key].append((row["start_time"], row["end_time"]))
+
+        stored = db.session.execute(
+            db.select(
+                cls.model.id,
+                cls.model.employee_id,
+                cls.model.day_of_week,
+                cls.model.start_time,
+                cls.model.end_time,
+            ).where(
+                cls.model.employee_id.in_({row["employee_id"] for row in rows}),
+                cls.model.is_active == True,
+            )
+        )
+        for item_id, employee_id, day_of_week, start_time, end_time in stored:
+            key = (employee_id, day_of_week)
+            if key not in intervals:
+                continue
+            if replaced_ids is None:
+                if any(start == start_time for start, _ in intervals[key]):
+                    continue
+            elif item_id in replaced_ids:
+                continue
+            intervals[key].append((start_time, end_time))
+
+        overlaps = []
+        for (employee_id, day_of_week), day_intervals in intervals.items():
+            day_intervals.sort()
+            for (start, end), (next_start, next_end) in zip(
+                day_intervals, day_intervals[1:]
+            ):
+                if next_start < end:
+                    overlaps.append(
+                        f"employee {employee_id} day {day_of_week} "
+                        f"{start:%H:%M}-{end:%H:%M} and "
+                        f"{next_start:%H:%M}-{next_end:%H:%M}"
+                    )
+
+        if overlaps:
+            raise Conflict("Overlapping working hours: " + ", ".join(overlaps))
+
+    @staticmethod
+    def _to_time(value) -> time:
+        return value if isinstance(value, time) else time.fromisoformat(value)
@@ -0,0 +1,99 @@
+"""Add indexes for hot query predicates
+
+Revision ID: 3c8e1f4a9d27
+Revises: 7a9b60078eab
+Create Date: 2026-10-19 09:12:40.518203
+
+Postgres only indexes primary keys and unique constraints on its own, so every
+foreign key and filter column used by the managers was served by a sequential
+scan. The indexes below follow the WHERE clauses the managers actually build:
+
+* appointments(staff_id, appointment_time): AppointmentManager.is_slot_booked
+  and the available-slots lookup filter on one staff member and a time range.
+  Equality column first, range column second, so one index range scan answers
+  both the exact-slot check and the per-day listing.
+* appointments(customer_id): a customer's appointment list
+  (AppointmentManager.get_appointments for CUSTOMER).
+* working_hours(employee_id, day_of_week): WorkingHoursManager fetches the
+  hours of one employee for one weekday on every slot calculation.
+* services(service_provider_id), services(service_subcategory_id): services
+  are listed per provider and per subcategory, and both columns are the
+  child side of joins from service_providers / subcategories.
+* users(service_provider_id): staff of a provider are loaded through the
+  ServiceProviderModel.users relationship and the staff endpoints.
+* inquiries(status): the approver lists pending inquiries; the PENDING rows are
+  a small fraction of the table, which is where a status index pays off.
+* Partial indexes ON (id) WHERE is_active = true for the soft-delete tables:
+  BaseManager.get_records(status="active") lists only active rows. Once rows
+  accumulate soft deletes the partial index holds only the live rows, stays
+  small and returns them already ordered by id.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8e1f4a9d27'
+down_revision = '7a9b60078eab'
+branch_labels = None
+depends_on = None
+
+
+SOFT_DELETE_TABLES = (
+    'categories',
+    'subcategories',
+    'services',
+    'service_providers',
+    'users',
+    'working_hours',
+)
+
+
+def upgrade():
+    with op.batch_alter_table('appointments', schema=None) as batch_op:
+        batch_op.create_index('ix_appointments_staff_id_appointment_time', ['staff_id', 'appointment_time'], unique=False)
+        batch_op.create_index(batch_op.f('ix_appointments_customer_id'), ['customer_id'], unique=False)
+
+    with op.batch_alter_table('working_hours', schema=None) as batch_op:
+        batch_op.create_index('ix_working_hours_employee_id_day_of_week', ['employee_id', 'day_of_week'], unique=False)
+
+    with op.batch_alter_table('services', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_services_service_provider_id'), ['service_provider_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_services_service_subcategory_id'), ['service_subcategory_id'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_service_provider_id'), ['service_provider_id'], unique=False)
+
+    with op.batch_alter_table('inquiries', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_inquiries_status'), ['status'], unique=False)
+
+    for table in SOFT_DELETE_TABLES:
+        op.create_index(
+            f'ix_{table}_active',
+            table,
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text('is_active = true'),
+        )
+
+
+def downgrade():
+    for table in reversed(SOFT_DELETE_TABLES):
+        op.drop_index(f'ix_{table}_active', table_name=table)
+
+    with op.batch_alter_table('inquiries', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_inquiries_status'))
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_service_provider_id'))
+
+    with op.batch_alter_table('services', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_services_service_subcategory_id'))
+        batch_op.drop_index(batch_op.f('ix_services_service_provider_id'))
+
+    with op.batch_alter_table('working_hours', schema=None) as batch_op:
+        batch_op.drop_index('ix_working_hours_employee_id_day_of_week')
+
+    with op.batch_alter_table('appointments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_appointments_customer_id'))
+        batch_op.drop_index('ix_appointments_staff_id_appointment_time')
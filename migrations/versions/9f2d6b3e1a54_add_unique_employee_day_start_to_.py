@@ -0,0 +1,53 @@
+"""Add unique employee/day/start index on active WorkingHoursModel rows
+
+Revision ID: 9f2d6b3e1a54
+Revises: 3c8e1f4a9d27
+Create Date: 2026-10-19 11:03:17.244861
+
+The partial unique index is the ON CONFLICT target of the batch working hours
+upsert. It only covers active entries, so a soft-deleted entry keeps its
+history without blocking a new entry at the same employee, day and start.
+The (employee_id, day_of_week) index stays for lookups that include inactive
+entries.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f2d6b3e1a54'
+down_revision = '3c8e1f4a9d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Duplicate active entries could be created by the row-by-row batch
+    # registration; keep the most recent active one of each employee/day/start.
+    # Soft-deleted entries are history and are left alone.
+    op.execute(
+        """
+        DELETE FROM working_hours
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY employee_id, day_of_week, start_time
+                           ORDER BY id DESC
+                       ) AS position
+                FROM working_hours
+                WHERE is_active = true
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+
+    with op.batch_alter_table('working_hours', schema=None) as batch_op:
+        batch_op.create_index('uq_working_hours_employee_day_start', ['employee_id', 'day_of_week', 'start_time'], unique=True, postgresql_where=sa.text('is_active = true'))
+
+
+def downgrade():
+    with op.batch_alter_table('working_hours', schema=None) as batch_op:
+        batch_op.drop_index('uq_working_hours_employee_day_start', postgresql_where=sa.text('is_active = true'))
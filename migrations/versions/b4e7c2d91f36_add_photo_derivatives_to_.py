@@ -0,0 +1,28 @@
+"""Add photo_derivatives to ServiceProviderModel
+
+Revision ID: b4e7c2d91f36
+Revises: 9f2d6b3e1a54
+Create Date: 2026-10-19 16:12:40.518203
+
+Existing providers keep NULL until the backfill task renders their photos.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e7c2d91f36'
+down_revision = '9f2d6b3e1a54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('service_providers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('photo_derivatives', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('service_providers', schema=None) as batch_op:
+        batch_op.drop_column('photo_derivatives')
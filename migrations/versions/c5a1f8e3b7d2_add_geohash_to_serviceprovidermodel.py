@@ -0,0 +1,58 @@
+"""Add geohash to ServiceProviderModel
+
+Revision ID: c5a1f8e3b7d2
+Revises: b4e7c2d91f36
+Create Date: 2026-10-19 18:27:05.913344
+
+Backs the proximity search. Existing providers with coordinates are hashed
+here; afterwards the model keeps the column in sync.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from utils.geo import encode
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a1f8e3b7d2'
+down_revision = 'b4e7c2d91f36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('service_providers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('geohash', sa.String(length=12, collation='C'), nullable=True))
+
+    connection = op.get_bind()
+    providers = sa.table(
+        'service_providers',
+        sa.column('id', sa.Integer),
+        sa.column('latitude', sa.Float),
+        sa.column('longitude', sa.Float),
+        sa.column('geohash', sa.String),
+    )
+    rows = connection.execute(
+        sa.select(providers.c.id, providers.c.latitude, providers.c.longitude).where(
+            providers.c.latitude.is_not(None), providers.c.longitude.is_not(None)
+        )
+    ).all()
+    if rows:
+        connection.execute(
+            providers.update()
+            .where(providers.c.id == sa.bindparam('provider_id'))
+            .values(geohash=sa.bindparam('hash')),
+            [
+                {'provider_id': row.id, 'hash': encode(row.latitude, row.longitude)}
+                for row in rows
+            ],
+        )
+
+    with op.batch_alter_table('service_providers', schema=None) as batch_op:
+        batch_op.create_index('ix_service_providers_geohash', ['geohash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('service_providers', schema=None) as batch_op:
+        batch_op.drop_index('ix_service_providers_geohash')
+        batch_op.drop_column('geohash')
@@ -0,0 +1,154 @@
+"""Add full-text search vectors to the catalog
+
+Revision ID: d7b3e9a1c4f6
+Revises: c5a1f8e3b7d2
+Create Date: 2026-10-19 21:04:37.218406
+
+Providers, categories and subcategories get generated columns. The document
+of a service includes the names of its subcategory and category, so triggers
+maintain it; they are copied from models/service.py. Existing services are
+indexed here.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b3e9a1c4f6'
+down_revision = 'c5a1f8e3b7d2'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_DDL = """
+CREATE OR REPLACE FUNCTION services_search_document(text, integer)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('simple', coalesce($1, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(min(subcategories.name), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(min(categories.name), '')), 'C')
+    FROM subcategories
+    LEFT JOIN categories ON categories.id = subcategories.category_id
+    WHERE subcategories.id = $2
+$$;
+
+CREATE OR REPLACE FUNCTION services_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := services_search_document(NEW.name, NEW.service_subcategory_id);
+    RETURN NEW;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION subcategories_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE services
+    SET search_vector = services_search_document(name, service_subcategory_id)
+    WHERE service_subcategory_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION categories_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE services
+    SET search_vector = services_search_document(
+        services.name, services.service_subcategory_id
+    )
+    FROM subcategories
+    WHERE subcategories.id = services.service_subcategory_id
+        AND subcategories.category_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER services_search_vector
+BEFORE INSERT OR UPDATE OF name, service_subcategory_id ON services
+FOR EACH ROW EXECUTE FUNCTION services_search_vector_update();
+
+CREATE TRIGGER subcategories_search_vector
+AFTER UPDATE OF name, category_id ON subcategories
+FOR EACH ROW
+WHEN (
+    OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.category_id IS DISTINCT FROM NEW.category_id
+)
+EXECUTE FUNCTION subcategories_search_vector_update();
+
+CREATE TRIGGER categories_search_vector
+AFTER UPDATE OF name ON categories
+FOR EACH ROW
+WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION categories_search_vector_update();
+"""
+
+DROP_SEARCH_VECTOR_DDL = """
+DROP FUNCTION IF EXISTS categories_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS subcategories_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS services_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS services_search_document(text, integer);
+"""
+
+GENERATED_VECTORS = {
+    'service_providers': (
+        "setweight(to_tsvector('simple', coalesce(trade_name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(company_name, '')), 'B')"
+    ),
+    'categories': "setweight(to_tsvector('simple', name), 'A')",
+    'subcategories': "setweight(to_tsvector('simple', name), 'A')",
+}
+
+GIN_INDEXES = (
+    ('ix_service_providers_search_vector', 'service_providers', 'search_vector'),
+    (
+        'ix_service_providers_trade_name_search',
+        'service_providers',
+        sa.text("to_tsvector('simple', trade_name)"),
+    ),
+    ('ix_categories_search_vector', 'categories', 'search_vector'),
+    ('ix_subcategories_search_vector', 'subcategories', 'search_vector'),
+    ('ix_services_search_vector', 'services', 'search_vector'),
+    ('ix_services_name_search', 'services', sa.text("to_tsvector('simple', name)")),
+)
+
+
+def upgrade():
+    for table, expression in GENERATED_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+    op.add_column(
+        'services', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+
+    op.execute(SEARCH_VECTOR_DDL)
+    op.execute(
+        "UPDATE services "
+        "SET search_vector = services_search_document(name, service_subcategory_id)"
+    )
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_with={'fastupdate': 'off'},
+        )
+
+
+def downgrade():
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
+    op.execute(DROP_SEARCH_VECTOR_DDL)
+    op.drop_column('services', 'search_vector')
+    for table in reversed(list(GENERATED_VECTORS)):
+        op.drop_column(table, 'search_vector')
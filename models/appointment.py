@@ -10,6 +10,11 @@ from utils.mixins import TimestampMixin
 
 class AppointmentModel(db.Model, TimestampMixin):
     __tablename__ = "appointments"
+    __table_args__ = (
+        db.Index(
+            "ix_appointments_staff_id_appointment_time", "staff_id", "appointment_time"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     service_id: Mapped[int] = mapped_column(
@@ -19,7 +24,7 @@ class AppointmentModel(db.Model, TimestampMixin):
         Integer, ForeignKey("users.id"), nullable=False
     )
     customer_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id"), nullable=False
+        Integer, ForeignKey("users.id"), nullable=False, index=True
     )
     appointment_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     status: Mapped[str] = mapped_column(
@@ -15,6 +15,7 @@ class InquiryModel(db.Model, PersonalInfoMixin, TimestampMixin):
         db.Enum(ProviderRegistrationState),
         nullable=False,
         default=ProviderRegistrationState.PENDING.name,
+        index=True,
     )
 
     # Relationship to ServiceProviderModel
@@ -1,3 +1,5 @@
+from sqlalchemy import DDL, FetchedValue, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import db
@@ -6,18 +8,46 @@ from utils.mixins import TimestampMixin
 
 class ServiceModel(db.Model, TimestampMixin):
     __tablename__ = "services"
+    __table_args__ = (
+        db.Index("ix_services_active", "id", postgresql_where=text("is_active = true")),
+        # Searches read far more often than the catalog changes, so the GIN
+        # indexes skip the pending list, which every search would scan.
+        db.Index(
+            "ix_services_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+        # Matches on the service name alone; see SearchManager._ranked.
+        db.Index(
+            "ix_services_name_search",
+            text("to_tsvector('simple', name)"),
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(db.String(50), nullable=False)
     duration: Mapped[int] = mapped_column(db.Integer, nullable=False)
     price: Mapped[float] = mapped_column(db.Numeric(10, 2), nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Full-text search document (managers.search_manager) over the service name
+    # and the names of its subcategory and category, kept current by the
+    # triggers below.
+    search_vector = mapped_column(
+        TSVECTOR,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        deferred=True,
+    )
 
     # Foreign key linking to the service subcategory
     service_subcategory_id: Mapped[int] = mapped_column(
         db.Integer,
         db.ForeignKey("subcategories.id", name="fk_services_subcategories"),
         nullable=False,
+        index=True,
     )
 
     # Foreign key linking to the service provider offering this service
@@ -25,6 +55,7 @@ class ServiceModel(db.Model, TimestampMixin):
         db.Integer,
         db.ForeignKey("service_providers.id", name="fk_services_service_providers"),
         nullable=False,
+        index=True,
     )
 
     # Foreign key to link the staff member (employee) responsible for the service
@@ -47,3 +78,89 @@ class ServiceModel(db.Model, TimestampMixin):
 
     # Relationship with AppointmentModel
     appointments = relationship("AppointmentModel", back_populates="service")
+
+
+# The search document of a service spans three tables, which a generated
+# column cannot reference, so triggers maintain it: on the service itself and
+# when its subcategory or category is renamed. Copied into migration d7b3e9a1c4f6.
+SEARCH_VECTOR_DDL = """
+CREATE OR REPLACE FUNCTION services_search_document(text, integer)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('simple', coalesce($1, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(min(subcategories.name), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(min(categories.name), '')), 'C')
+    FROM subcategories
+    LEFT JOIN categories ON categories.id = subcategories.category_id
+    WHERE subcategories.id = $2
+$$;
+
+CREATE OR REPLACE FUNCTION services_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := services_search_document(NEW.name, NEW.service_subcategory_id);
+    RETURN NEW;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION subcategories_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE services
+    SET search_vector = services_search_document(name, service_subcategory_id)
+    WHERE service_subcategory_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION categories_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE services
+    SET search_vector = services_search_document(
+        services.name, services.service_subcategory_id
+    )
+    FROM subcategories
+    WHERE subcategories.id = services.service_subcategory_id
+        AND subcategories.category_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER services_search_vector
+BEFORE INSERT OR UPDATE OF name, service_subcategory_id ON services
+FOR EACH ROW EXECUTE FUNCTION services_search_vector_update();
+
+CREATE TRIGGER subcategories_search_vector
+AFTER UPDATE OF name, category_id ON subcategories
+FOR EACH ROW
+WHEN (
+    OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.category_id IS DISTINCT FROM NEW.category_id
+)
+EXECUTE FUNCTION subcategories_search_vector_update();
+
+CREATE TRIGGER categories_search_vector
+AFTER UPDATE OF name ON categories
+FOR EACH ROW
+WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION categories_search_vector_update();
+"""
+
+# Dropping the functions also drops the triggers on the remaining tables.
+DROP_SEARCH_VECTOR_DDL = """
+DROP FUNCTION IF EXISTS categories_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS subcategories_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS services_search_vector_update() CASCADE;
+DROP FUNCTION IF EXISTS services_search_document(text, integer);
+"""
+
+event.listen(
+    ServiceModel.__table__,
+    "after_create",
+    DDL(SEARCH_VECTOR_DDL).execute_if(dialect="postgresql"),
+)
+event.listen(
+    ServiceModel.__table__,
+    "after_drop",
+    DDL(DROP_SEARCH_VECTOR_DDL).execute_if(dialect="postgresql"),
+)
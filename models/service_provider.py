@@ -1,18 +1,65 @@
+from typing import Optional
+
+from sqlalchemy import Computed, event, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import db
 from models import owner_service_provider_association
+from utils.geo import GEOHASH_PRECISION, encode
 from utils.mixins import AddressMixin, TimestampMixin
 
 
 class ServiceProviderModel(db.Model, AddressMixin, TimestampMixin):
     __tablename__ = "service_providers"
+    __table_args__ = (
+        db.Index(
+            "ix_service_providers_active",
+            "id",
+            postgresql_where=text("is_active = true"),
+        ),
+        db.Index("ix_service_providers_geohash", "geohash"),
+        # Without the pending list; see ServiceModel.
+        db.Index(
+            "ix_service_providers_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+        # Matches on the trade name alone; see SearchManager._ranked.
+        db.Index(
+            "ix_service_providers_trade_name_search",
+            text("to_tsvector('simple', trade_name)"),
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(db.Integer, primary_key=True)
     company_name: Mapped[str] = mapped_column(db.String(100), nullable=False)
     trade_name: Mapped[str] = mapped_column(db.String(100), nullable=False)
     uic: Mapped[str] = mapped_column(db.String(20), unique=True, nullable=False)
     photo_url: Mapped[str] = mapped_column(db.String(255), nullable=False)
+    # Resized copies of the photo, written by the background task
+    # tasks.photo_derivatives: {"source": photo_url, "sizes": {size: {format: key}}}.
+    # The source URL tells whether they still belong to the current photo.
+    photo_derivatives: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Geohash of latitude/longitude for the proximity search, kept in sync by
+    # _set_geohash. The C collation makes the index order match the cell prefixes.
+    geohash: Mapped[Optional[str]] = mapped_column(
+        db.String(GEOHASH_PRECISION, collation="C"), nullable=True
+    )
+
+    # Full-text search document (managers.search_manager).
+    search_vector = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(trade_name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(company_name, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     is_active: Mapped[bool] = mapped_column(default=True)  # Soft delete flag
 
@@ -48,3 +95,12 @@ class ServiceProviderModel(db.Model, AddressMixin, TimestampMixin):
     working_hours = relationship(
         "WorkingHoursModel", back_populates="provider", lazy="select"
     )
+
+
+@event.listens_for(ServiceProviderModel, "before_insert")
+@event.listens_for(ServiceProviderModel, "before_update")
+def _set_geohash(mapper, connection, target):
+    if target.latitude is None or target.longitude is None:
+        target.geohash = None
+    else:
+        target.geohash = encode(target.latitude, target.longitude)
@@ -1,3 +1,5 @@
+from sqlalchemy import Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import db
@@ -7,10 +9,27 @@ from utils.mixins import TimestampMixin
 class ServiceSubcategoryModel(db.Model, TimestampMixin):
 
     __tablename__ = "subcategories"
+    __table_args__ = (
+        db.Index(
+            "ix_subcategories_active", "id", postgresql_where=text("is_active = true")
+        ),
+        db.Index(
+            "ix_subcategories_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(db.Integer, primary_key=True)
     name: Mapped[str] = mapped_column(db.String(100), nullable=False, unique=True)
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Full-text search document (managers.search_manager).
+    search_vector = mapped_column(
+        TSVECTOR,
+        Computed("setweight(to_tsvector('simple', name), 'A')", persisted=True),
+        deferred=True,
+    )
 
     # Foreign key to link the subcategory to a category
     category_id: Mapped[int] = mapped_column(
@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import db
@@ -8,6 +9,9 @@ from utils.mixins import PersonalInfoMixin, TimestampMixin
 
 class UserModel(db.Model, PersonalInfoMixin, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index("ix_users_active", "id", postgresql_where=text("is_active = true")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     password: Mapped[str] = mapped_column(db.String(255), nullable=False)
@@ -24,6 +28,7 @@ class UserModel(db.Model, PersonalInfoMixin, TimestampMixin):
             name="fk_users_service_provider",
         ),
         nullable=True,
+        index=True,
     )
 
     # Many-to-Many relationship to service providers for owners
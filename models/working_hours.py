@@ -1,5 +1,6 @@
 from datetime import time
 
+from sqlalchemy import text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import db
@@ -7,6 +8,24 @@ from db import db
 
 class WorkingHoursModel(db.Model):
     __tablename__ = "working_hours"
+    __table_args__ = (
+        db.Index(
+            "ix_working_hours_employee_id_day_of_week", "employee_id", "day_of_week"
+        ),
+        # Upsert target for batch registration. Only active entries are unique,
+        # so a soft-deleted entry does not block a new one at the same start.
+        db.Index(
+            "uq_working_hours_employee_day_start",
+            "employee_id",
+            "day_of_week",
+            "start_time",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+        db.Index(
+            "ix_working_hours_active", "id", postgresql_where=text("is_active = true")
+        ),
+    )
 
     id: Mapped[int] = mapped_column(db.Integer, primary_key=True)
     day_of_week: Mapped[int] = mapped_column(
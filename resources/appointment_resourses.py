@@ -1,5 +1,6 @@
-from flask import request
+from flask import Response, request
 from flask_restful import Resource
+from werkzeug.exceptions import BadRequest
 
 from managers.appointment_manager import AppointmentManager
 from managers.auth_manager import auth
@@ -8,11 +9,14 @@ from models import RoleType
 from schemas.request.appointment_request_schema import (
     CustomerAppointmentRequestSchema,
     CustomerAppointmentEditingRequestSchema,
+    RecurringAppointmentRequestSchema,
 )
 from schemas.response.appointment_response_schema import (
     CustomerAppointmentResponseSchema,
 )
 from utils.decorators import validate_schema, permission_required
+from utils.serializers import serialize
+from utils.streaming import EXPORT_ENCODERS, EXPORT_MIMETYPES
 
 
 class AvailableSlots(Resource):
@@ -43,38 +47,94 @@ class CustomerAppointments(Resource):
 
         :return: A tuple containing the appointment data and a 200 status code.
         """
-        appointments = AppointmentManager.get_all()
-        return CustomerAppointmentResponseSchema(many=True).dump(appointments), 200
+        stmt = AppointmentManager.appointments_statement()
+        return serialize(stmt, CustomerAppointmentResponseSchema), 200
+
+
+class ProviderAppointmentsExport(Resource):
+    @auth.login_required
+    @permission_required(RoleType.OWNER)
+    def get(self, provider_id: int) -> Response:
+        """
+        Streams the appointment history of the owner's service provider as
+        NDJSON (default) or CSV, selected with the ``format`` query argument.
+
+        :param provider_id: The ID of the service provider.
+        :return: A streamed response with one appointment per line.
+        """
+        export_format = request.args.get("format", "ndjson").lower()
+        if export_format not in EXPORT_ENCODERS:
+            raise BadRequest(
+                f"Unsupported export format. Use one of: {', '.join(EXPORT_ENCODERS)}."
+            )
+
+        batches = AppointmentManager.export_provider_appointments(
+            provider_id, auth.current_user()
+        )
+        chunks = EXPORT_ENCODERS[export_format](
+            AppointmentManager.export_columns(), batches
+        )
+        filename = f"appointments-provider-{provider_id}.{export_format}"
+        return Response(
+            chunks,
+            mimetype=EXPORT_MIMETYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
 
 class CustomerAppointmentBooking(Resource):
     @auth.login_required
     @validate_schema(CustomerAppointmentRequestSchema)
     @permission_required(RoleType.CLIENT)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Books a new appointment for the logged-in client.
 
+        :param data: The deserialized request payload.
         :return: A tuple containing the created appointment data and a 201 status code.
         """
-        data = request.get_json()
         current_user = auth.current_user()
         created_appointment = AppointmentManager.create(data, current_user)
         return CustomerAppointmentResponseSchema().dump(created_appointment), 201
 
 
+class CustomerRecurringAppointmentBooking(Resource):
+    @auth.login_required
+    @validate_schema(RecurringAppointmentRequestSchema)
+    @permission_required(RoleType.CLIENT)
+    def post(self, data: dict) -> tuple:
+        """
+        Books a weekly series or a list of appointments for the logged-in client in
+        one transaction.
+
+        :param data: The deserialized request payload.
+        :return: A tuple containing the created appointments, the skipped occurrences
+                 and a 201 status code.
+        """
+        current_user = auth.current_user()
+        appointments, conflicts = AppointmentManager.create_recurring(
+            data, current_user
+        )
+        return {
+            "appointments": CustomerAppointmentResponseSchema().dump(
+                appointments, many=True
+            ),
+            "conflicts": conflicts,
+        }, 201
+
+
 class CustomerAppointmentEditing(Resource):
     @auth.login_required
     @validate_schema(CustomerAppointmentEditingRequestSchema)
     @permission_required(RoleType.CLIENT)
-    def put(self, appointment_id: int) -> tuple:
+    def put(self, appointment_id: int, data: dict) -> tuple:
         """
         Edits an existing appointment for the logged-in client.
 
         :param appointment_id: The ID of the appointment to edit.
+        :param data: The deserialized request payload.
         :return: A tuple with a success message and a 200 status code.
         """
-        data = request.get_json()
         current_user = auth.current_user()
         AppointmentManager.update(appointment_id, data, current_user)
         return {"message": "Appointment updated successfully"}, 200
@@ -0,0 +1,205 @@
+from functools import wraps
+from typing import Optional, Type
+
+from marshmallow import Schema
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from werkzeug.exceptions import BadRequest, Forbidden, HTTPException, NotFound, Unauthorized
+from werkzeug.http import parse_etags, quote_etag
+
+from managers.appointment_manager import (
+    STAFF_APPOINTMENT_TIMES_ON_DAY,
+    AppointmentManager,
+)
+from managers.auth_manager import ACTIVE_USER_BY_ID, AuthManager
+from managers.base_manager import BaseManager
+from managers.category_manager import CategoryManager
+from managers.provider_manager import ProviderManager
+from managers.service_manager import SERVICE_DURATION_BY_ID, ServiceManager
+from managers.subcategory_manager import SubCategoryManager
+from managers.working_hours_manager import WORKING_HOURS_BY_EMPLOYEE_DAY
+from models import RoleType
+from schemas.response.category_response_schema import CategoryResponseSchema
+from schemas.response.provider_response_schema import ProviderResponseSchema
+from schemas.response.service_response_schema import ServiceResponseSchema
+from schemas.response.subcategory_response_schema import SubCategoryResponseSchema
+from utils.etag import CACHE_CONTROL, collection_etag
+from utils.serializers import serialize
+
+
+def login_required(*required_roles):
+    """
+    Async counterpart of ``auth.login_required`` with ``permission_required``:
+    opens the request's database session, authenticates the bearer token and
+    checks the user's role. The view is called with the request, the session
+    and the user.
+    :param required_roles: Roles that are allowed to access the decorated view.
+    :raises Unauthorized: If the token is missing, invalid or of an inactive user.
+    :raises Forbidden: If the user does not have the required role.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(request: Request) -> Response:
+            scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                raise Unauthorized(AuthManager.INVALID_OR_MISSING_TOKEN_MESSAGE)
+            user_id = AuthManager.decode_token(token)["id"]
+
+            async with request.app.state.sessionmaker() as session:
+                user = (
+                    await session.execute(ACTIVE_USER_BY_ID, {"user_id": user_id})
+                ).scalar()
+                if user is None:
+                    raise Unauthorized(AuthManager.INVALID_OR_MISSING_TOKEN_MESSAGE)
+                if user.role not in required_roles:
+                    raise Forbidden(
+                        "You do not have permissions to access this resource"
+                    )
+                # Config lookups (FAST_SERIALIZATION) read the Flask app's config.
+                with request.app.state.flask_app.app_context():
+                    return await func(request, session, user)
+
+        return wrapper
+
+    return decorator
+
+
+async def serialize_conditional(
+    request: Request,
+    session,
+    statement,
+    schema_cls: Type[Schema],
+    envelope: Optional[str] = None,
+) -> Response:
+    """
+    Async counterpart of ``utils.etag.serialize_conditional``. The ETag query
+    and the serialization run as sync code on the async session (``run_sync``),
+    so the event loop serves other requests while they wait for the database.
+    The response cache is not consulted: its single-flight locks would block
+    the event loop.
+    """
+    if_none_match = parse_etags(request.headers.get("If-None-Match"))
+
+    def load(sync_session):
+        etag = collection_etag(statement, schema_cls, session=sync_session)
+        if if_none_match.contains_weak(etag):
+            return etag, None
+        return etag, serialize(statement, schema_cls, session=sync_session)
+
+    etag, data = await session.run_sync(load)
+    headers = {"ETag": quote_etag(etag), "Cache-Control": CACHE_CONTROL}
+    if data is None:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({envelope: data} if envelope else data, headers=headers)
+
+
+def catalog_profile(
+    manager: Type[BaseManager],
+    schema_cls: Type[Schema],
+    id_param: str,
+    id_arg: Optional[str] = None,
+    envelope: Optional[str] = None,
+):
+    """
+    Builds the async view of a catalog profile endpoint, e.g. ``CategoryProfile.get``.
+    :param manager: The manager whose ``records_statement`` selects the records.
+    :param schema_cls: The marshmallow response schema class.
+    :param id_param: The name of the record ID path parameter.
+    :param id_arg: The query argument the Flask resource also reads the ID from.
+    :param envelope: Optional key to wrap the serialized list in.
+    :return: The async view.
+    """
+
+    @login_required(RoleType.APPROVER)
+    async def get(request: Request, session, user) -> Response:
+        status = request.path_params.get("status") or request.query_params.get(
+            "status"
+        )
+        record_id = request.path_params.get(id_param)
+        if record_id is None and id_arg:
+            record_id = request.query_params.get(id_arg)
+        statement = manager.records_statement(status=status, record_id=record_id)
+        return await serialize_conditional(
+            request, session, statement, schema_cls, envelope
+        )
+
+    return get
+
+
+@login_required(RoleType.CLIENT)
+async def available_slots(request: Request, session, user) -> Response:
+    """
+    Async counterpart of ``AvailableSlots.get``.
+    """
+    staff_id = request.path_params["staff_id"]
+    service_id = request.path_params["service_id"]
+    try:
+        date = AppointmentManager.parse_slot_date(request.path_params["date"])
+    except ValueError as e:
+        raise BadRequest(str(e))
+
+    service_duration = (
+        await session.execute(SERVICE_DURATION_BY_ID, {"service_id": service_id})
+    ).scalar_one_or_none()
+    if service_duration is None:
+        raise NotFound(f"Service with ID {service_id} not found.")
+
+    working_hours = (
+        await session.execute(
+            WORKING_HOURS_BY_EMPLOYEE_DAY,
+            {"employee_id": staff_id, "day_of_week": date.weekday()},
+        )
+    ).all()
+    booked_times = (
+        await session.execute(
+            STAFF_APPOINTMENT_TIMES_ON_DAY,
+            AppointmentManager.day_params(staff_id, date),
+        )
+    ).scalars().all()
+
+    slots = AppointmentManager.build_available_slots(
+        date, working_hours, booked_times, service_duration
+    )
+    return JSONResponse({"available_slots": slots})
+
+
+async def handle_http_exception(request: Request, exc: HTTPException) -> Response:
+    """
+    Renders werkzeug HTTP errors the way flask_restful does.
+    """
+    return JSONResponse({"message": exc.description}, status_code=exc.code)
+
+
+category_profile = catalog_profile(
+    CategoryManager, CategoryResponseSchema, "category_id"
+)
+subcategory_profile = catalog_profile(
+    SubCategoryManager, SubCategoryResponseSchema, "subcategory_id", "subcategory_id"
+)
+service_profile = catalog_profile(
+    ServiceManager, ServiceResponseSchema, "service_id", "service_id"
+)
+provider_profile = catalog_profile(
+    ProviderManager, ProviderResponseSchema, "provider_id", envelope="providers"
+)
+
+# The same paths as in resources/routes.py, with Starlette path converters.
+async_routes = (
+    (category_profile, "/categories/profile"),
+    (category_profile, "/categories/profile/{category_id:int}"),
+    (category_profile, "/categories/profile/{status}"),
+    (subcategory_profile, "/subcategories/profile"),
+    (subcategory_profile, "/subcategories/profile/{subcategory_id:int}"),
+    (subcategory_profile, "/subcategories/profile/{status}"),
+    (service_profile, "/services/profile"),
+    (service_profile, "/services/profile/{service_id:int}"),
+    (service_profile, "/services/profile/{status}"),
+    (provider_profile, "/providers/profile"),
+    (provider_profile, "/providers/profile/{provider_id:int}"),
+    (provider_profile, "/providers/profile/{status}"),
+    (
+        available_slots,
+        "/appointments/available_slots/{staff_id:int}/{service_id:int}/{date}",
+    ),
+)
@@ -26,27 +26,27 @@ from utils.decorators import (
 
 class ClientRegistration(Resource):
     @validate_schema(ClientRegistrationRequestSchema)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Registers a new client and returns a token.
 
+        :param data: The deserialized request payload.
         :return: A tuple containing the token and a 201 status code.
         """
-        data = request.get_json()
         token = UserManager.register(data)
         return {"token": token}, 201
 
 
 class Login(Resource):
     @validate_schema(UserLoginRequestSchema)
-    def post(self) -> dict[str, str]:
+    def post(self, data: dict) -> dict[str, str]:
         """
         Authenticates a user and returns a token.
 
+        :param data: The deserialized request payload.
         :return: A tuple containing the token.
         :raises Unauthorized: If the email or password is incorrect.
         """
-        data = request.get_json()
         token = UserManager.login(data)
         return {"token": token}
 
@@ -56,13 +56,13 @@ class Login(Resource):
 class ChangePassword(Resource):
     @auth.login_required
     @validate_schema(PasswordChangeSchema)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Changes the password for the authenticated user.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful password change and a 200 status code.
         """
-        data = request.get_json()
         UserManager.change_password(data)
         return {"message": "Password changed successfully"}, 200
 
@@ -85,13 +85,13 @@ class ClientEditing(Resource):
     @auth.login_required
     @validate_schema(UserEditRequestSchema)
     @permission_required(RoleType.CLIENT)
-    def put(self) -> tuple:
+    def put(self, data: dict) -> tuple:
         """
         Edits the profile of the authenticated client.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful account edit and a 200 status code.
         """
-        data = request.get_json()
         current_user = auth.current_user()
         UserManager.edit_client_profile(current_user, data)
         return {"message": "Account edited successfully."}, 200
@@ -115,15 +115,15 @@ class UserRegistration(Resource):
     @auth.login_required
     @validate_schema(UserRegistrationRequestSchema)
     @role_based_access_control("create")
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Registers a new user (staff or owner).
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful user registration and a 201 status code.
         """
         current_user = auth.current_user()
-        user_data = request.get_json()
-        role = UserManager.register_user(current_user, user_data)
+        role = UserManager.register_user(current_user, data)
         return {
             "message": f"A user with the role of {role} has been registered successfully."
         }, 201
@@ -153,15 +153,15 @@ class UserEditing(Resource):
     @auth.login_required
     @validate_schema(UserEditRequestSchema)
     @role_based_access_control("edit")
-    def put(self, user_id: int) -> tuple:
+    def put(self, user_id: int, data: dict) -> tuple:
         """
         Edits the profile of a user with the given user ID.
 
         :param user_id: The ID of the user to be updated.
+        :param data: The deserialized request payload.
         :return: A message indicating successful account edit and a 200 status code.
         :raises NotFound: If the user with the given ID is not found.
         """
-        data = request.get_json()
         UserManager.edit_user_profile(data, user_id)
         return {"message": "Account edited successfully."}, 200
 
@@ -2,14 +2,16 @@ from flask import request
 from flask_restful import Resource
 
 from managers.auth_manager import auth
-from managers.category_manager import CategoryManager
+from managers.category_manager import CATALOG_TABLES, CategoryManager
 from models import RoleType
 from schemas.request.category_request_schema import (
     CategoryRequestSchema,
     CategoryEditRequestSchema,
 )
+from schemas.response.catalog_response_schema import CatalogTreeSchema
 from schemas.response.category_response_schema import CategoryResponseSchema
 from utils.decorators import validate_schema, permission_required
+from utils.etag import conditional_response, serialize_conditional, version_etag
 
 
 class CategoryProfile(Resource):
@@ -21,25 +23,48 @@ class CategoryProfile(Resource):
 
         :param status: Optional status to filter categories.
         :param category_id: Optional ID of a specific category to retrieve.
-        :return: A tuple containing the serialized category data and a 200 status code.
+        :return: A tuple containing the serialized category data, a 200 status code and
+                 the ETag, or an empty 304 response if If-None-Match matches it.
         """
         status = status or request.args.get("status", None)
         category_number = category_id or request.args.get("category_number", None)
-        categories = CategoryManager.get_records(status=status, record_id=category_id)
-        return CategoryResponseSchema().dump(categories, many=True), 200
+        stmt = CategoryManager.records_statement(status=status, record_id=category_id)
+        return serialize_conditional(stmt, CategoryResponseSchema)
+
+
+class CatalogTree(Resource):
+    schema = CatalogTreeSchema(many=True)
+
+    @auth.login_required
+    def get(self) -> tuple:
+        """
+        Retrieves the active catalog as a tree: categories, their subcategories
+        and the services of those, for the browse menu.
+
+        :return: A tuple containing the serialized tree, a 200 status code and the
+                 ETag, or an empty 304 response if If-None-Match matches it.
+        """
+
+        def etag():
+            return version_etag(CatalogTreeSchema, CategoryManager.get_catalog_version())
+
+        def dump():
+            return {"categories": self.schema.dump(CategoryManager.get_catalog_tree())}
+
+        return conditional_response(CatalogTreeSchema, CATALOG_TABLES, etag, dump)
 
 
 class CategoryRegistration(Resource):
     @auth.login_required
     @validate_schema(CategoryRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Creates a new service category.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful creation and a 201 status code.
         """
-        data = request.get_json()
         CategoryManager.create(data)
         return {"message": "Service Category created successfully"}, 201
 
@@ -48,14 +73,14 @@ class CategoryEditing(Resource):
     @auth.login_required
     @validate_schema(CategoryEditRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def put(self, category_id: int) -> tuple:
+    def put(self, category_id: int, data: dict) -> tuple:
         """
         Edits an existing service category.
 
         :param category_id: The ID of the category to edit.
+        :param data: The deserialized request payload.
         :return: A message indicating successful update and a 200 status code.
         """
-        data = request.get_json()
         CategoryManager.update(category_id, data)
         return {"message": "Service Category updated successfully"}, 200
 
@@ -1,4 +1,3 @@
-from flask import request
 from flask_restful import Resource
 from werkzeug.exceptions import BadRequest
 
@@ -8,6 +7,7 @@ from models import RoleType
 from schemas.request.inquiry_request_schema import InquiryRegistrationRequestSchema
 from schemas.response.inquiry_response_schema import InquiryResponseSchema
 from utils.decorators import permission_required, validate_schema
+from utils.serializers import serialize
 
 
 class Inquiries(Resource):
@@ -20,22 +20,22 @@ class Inquiries(Resource):
         :param status: Optional status to filter inquiries (e.g., PENDING, APPROVED).
         :return: A tuple containing the list of inquiries and a 200 status code.
         """
-        inquiries = InquiryManager.get_inquiries(status)
-        return {"inquiries": InquiryResponseSchema().dump(inquiries, many=True)}, 200
+        stmt = InquiryManager.inquiries_statement(status)
+        return {"inquiries": serialize(stmt, InquiryResponseSchema)}, 200
 
 
 class InquiryRegistration(Resource):
     @staticmethod
     @validate_schema(InquiryRegistrationRequestSchema)
-    def post() -> tuple:
+    def post(data: dict) -> tuple:
         """
         Registers a new inquiry.
 
+        :param data: The deserialized request payload.
         :return: A tuple containing a success message and the ID of the registered inquiry, with a 201 status code.
         :raises BadRequest: If there is a validation error in the incoming data.
         """
         try:
-            data = request.get_json()
             inquiry_id = InquiryManager.register_inquiry(data)
             return {
                 "message": "Inquiry registered successfully",
@@ -0,0 +1,75 @@
+import json
+import os
+
+from flask import Response, current_app, request, send_file
+from flask_restful import Resource
+from werkzeug.exceptions import Forbidden, NotFound
+
+from db import db
+from managers.auth_manager import auth
+from models import RoleType
+from utils.db_pool import get_pool_status
+from utils.decorators import permission_required
+from utils.metrics import is_allowed_scraper, render_metrics
+from utils.profiling import profile_path
+
+
+class DatabasePoolStatus(Resource):
+    @auth.login_required
+    @permission_required(RoleType.ADMIN)
+    def get(self) -> tuple:
+        """
+        Retrieves the connection pool usage of every configured database bind.
+
+        :return: A tuple containing the pool status per bind and a 200 status code.
+        """
+        pools = {
+            bind_key or "default": get_pool_status(engine)
+            for bind_key, engine in db.engines.items()
+        }
+        return {"pools": pools}, 200
+
+
+class RequestProfile(Resource):
+    @auth.login_required
+    @permission_required(RoleType.ADMIN)
+    def get(self, profile_id: str):
+        """
+        Retrieves a request profile recorded with the X-Profile header: the
+        functions with the highest cumulative time and the SQL timeline, or
+        the raw pstats dump with ``?format=prof``.
+
+        :param profile_id: The ID from the X-Profile-Id response header.
+        :return: A tuple containing the profile summary and a 200 status code,
+                 or the pstats file.
+        :raises NotFound: If the profile does not exist (or was pruned).
+        """
+        raw = request.args.get("format") == "prof"
+        path = profile_path(profile_id, "prof" if raw else "json")
+        if not os.path.exists(path):
+            raise NotFound(f"Profile {profile_id} not found.")
+        if raw:
+            return send_file(
+                path, mimetype="application/octet-stream", as_attachment=True
+            )
+        with open(path) as f:
+            return json.load(f), 200
+
+
+class Metrics(Resource):
+    def get(self) -> Response:
+        """
+        Exposes the request, database pool and cache metrics in the Prometheus
+        text format. Only clients within METRICS_ALLOWED_NETWORKS may scrape it.
+
+        :return: The metrics response.
+        :raises NotFound: If metrics are disabled.
+        :raises Forbidden: If the client address is not allowed.
+        """
+        if "metrics_sampler" not in current_app.extensions:
+            raise NotFound("Metrics are not enabled.")
+        if not is_allowed_scraper(request.remote_addr):
+            raise Forbidden("You do not have permissions to access this resource")
+
+        body, content_type = render_metrics(current_app)
+        return Response(body, content_type=content_type)
@@ -5,14 +5,22 @@ from managers.auth_manager import auth
 from managers.provider_manager import ProviderManager
 from models import RoleType
 from schemas.request.provider_request_schema import (
+    BOUNDING_BOX_FIELDS,
+    NearbyProvidersRequestSchema,
+    PhotoUploadRequestSchema,
     ProviderRegistrationRequestSchema,
     ProviderEditRequestSchema,
 )
-from schemas.response.provider_response_schema import ProviderResponseSchema
+from schemas.response.provider_response_schema import (
+    NearbyProviderResponseSchema,
+    ProviderResponseSchema,
+)
 from utils.decorators import (
     permission_required,
+    validate_query,
     validate_schema,
 )
+from utils.etag import serialize_conditional
 
 
 class ProviderProfile(Resource):
@@ -24,41 +32,93 @@ class ProviderProfile(Resource):
 
         :param status: Optional status to filter providers.
         :param provider_id: Optional ID of a specific provider to retrieve.
-        :return: A tuple containing the serialized provider data and a 200 status code.
+        :return: A tuple containing the serialized provider data, a 200 status code and
+                 the ETag, or an empty 304 response if If-None-Match matches it.
         """
         status = status or request.args.get("status", None)
         provider_number = provider_id or request.args.get("provider_number", None)
-        providers = ProviderManager.get_records(status=status, record_id=provider_id)
-        return {"providers": ProviderResponseSchema().dump(providers, many=True)}, 200
+        stmt = ProviderManager.records_statement(status=status, record_id=provider_id)
+        return serialize_conditional(
+            stmt, ProviderResponseSchema, envelope="providers"
+        )
+
+
+class NearbyProviders(Resource):
+    schema = NearbyProviderResponseSchema(many=True)
+
+    @auth.login_required
+    @validate_query(NearbyProvidersRequestSchema)
+    @permission_required(RoleType.CLIENT)
+    def get(self, data: dict) -> tuple:
+        """
+        Retrieves active providers near a location or inside a bounding box,
+        nearest first.
+
+        :param data: The deserialized query arguments.
+        :return: A tuple containing a page of providers with their distance in
+                 kilometres, the paging details and a 200 status code.
+        """
+        box = None
+        if "min_latitude" in data:
+            box = tuple(data[name] for name in BOUNDING_BOX_FIELDS)
+        rows, has_more = ProviderManager.nearby_providers(
+            latitude=data.get("latitude"),
+            longitude=data.get("longitude"),
+            radius_km=data.get("radius"),
+            box=box,
+            page=data["page"],
+            per_page=data["per_page"],
+        )
+        return {
+            "providers": self.schema.dump([row._mapping for row in rows]),
+            "page": data["page"],
+            "per_page": data["per_page"],
+            "has_more": has_more,
+        }, 200
 
 
 class ProviderRegistration(Resource):
     @auth.login_required
     @validate_schema(ProviderRegistrationRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Creates a new service provider.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful creation and a 201 status code.
         """
-        data = request.get_json()
         ProviderManager.create_provider(data)
         return {"message": "Service Provider created successfully"}, 201
 
 
+class ProviderPhotoUpload(Resource):
+    @auth.login_required
+    @validate_schema(PhotoUploadRequestSchema)
+    @permission_required(RoleType.APPROVER)
+    def post(self, data: dict) -> tuple:
+        """
+        Issues a presigned upload for a provider photo.
+
+        :param data: The deserialized request payload.
+        :return: A tuple containing the photo key, the upload URL and form fields,
+                 and a 201 status code.
+        """
+        return ProviderManager.create_photo_upload(data["photo_extension"]), 201
+
+
 class ProviderEditing(Resource):
     @auth.login_required
     @validate_schema(ProviderEditRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def put(self, provider_id: int) -> tuple:
+    def put(self, provider_id: int, data: dict) -> tuple:
         """
         Edits an existing service provider.
 
         :param provider_id: The ID of the provider to edit.
+        :param data: The deserialized request payload.
         :return: A message indicating successful update and a 200 status code.
         """
-        data = request.get_json()
         ProviderManager.update(provider_id, data)
         return {"message": "Service Provider updated successfully"}, 200
 
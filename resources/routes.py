@@ -4,6 +4,7 @@ from resources.appointment_resourses import (
     CustomerAppointmentCancellation,
     CustomerAppointments, AvailableSlots, StaffAppointmentConfirmation, StaffAppointmentRejection,
     StaffAppointmentNoShow, StaffAppointmentCancellation, StaffAppointmentCompletion,
+    ProviderAppointmentsExport, CustomerRecurringAppointmentBooking,
 )
 from resources.auth_resources import (
     ClientRegistration,
@@ -18,11 +19,17 @@ from resources.auth_resources import (
     UserProfile,
 )
 from resources.categories_resources import (
+    CatalogTree,
     CategoryRegistration,
     CategoryProfile,
     CategoryEditing,
     CategoryDeactivate,
 )
+from resources.monitoring_resources import (
+    DatabasePoolStatus,
+    Metrics,
+    RequestProfile,
+)
 from resources.inquiry_resources import (
     InquiryRegistration,
     InquiryApproval,
@@ -31,11 +38,14 @@ from resources.inquiry_resources import (
     Inquiries,
 )
 from resources.providers_resources import (
+    NearbyProviders,
     ProviderRegistration,
+    ProviderPhotoUpload,
     ProviderEditing,
     ProviderProfile,
     ProviderDeactivate,
 )
+from resources.search_resources import CatalogSearch
 from resources.services_resources import (
     ServiceRegistration,
     ServiceProfile,
@@ -53,6 +63,8 @@ from resources.working_hours_resources import (
     WorkingHourRegistration,
     WorkingHourEditing,
     WorkingHourDeactivate,
+    WorkingHourBatchEditing,
+    WorkingHourBatchDeactivate,
 )
 from static.swagger import SwaggerJson
 
@@ -143,6 +155,11 @@ routes = (
         ProviderRegistration,
         "/provider",
     ),
+    (
+        # POST to get a presigned upload for a provider photo by the approver
+        ProviderPhotoUpload,
+        "/provider/photo",
+    ),
     (
         # GET to view provider profile by the approver
         ProviderProfile,
@@ -150,6 +167,11 @@ routes = (
         "/providers/profile/<string:status>",
         "/providers/profile/<int:provider_id>",
     ),
+    (
+        # GET to find providers near a location by the client
+        NearbyProviders,
+        "/providers/nearby",
+    ),
     (
         # PUT to edit provider profile by the approver
         ProviderEditing,
@@ -183,6 +205,17 @@ routes = (
         ServiceDeactivate,
         "/services/<int:service_id>/deactivate",
     ),
+    # Catalog API
+    (
+        # GET to search providers, services, categories and subcategories by name
+        CatalogSearch,
+        "/search",
+    ),
+    (
+        # GET to view the active categories, subcategories and services as a tree
+        CatalogTree,
+        "/catalog/tree",
+    ),
     # ServiceCategoryManagement API
     (
         # POST to register a service category by the approver
@@ -252,6 +285,16 @@ routes = (
         WorkingHourDeactivate,
         "/working_hours/<int:working_hours_id>/deactivate",
     ),
+    (
+        # PUT to edit multiple working hours
+        WorkingHourBatchEditing,
+        "/working_hours/batch/edit",
+    ),
+    (
+        # PUT to deactivate multiple working hours
+        WorkingHourBatchDeactivate,
+        "/working_hours/batch/deactivate",
+    ),
     # AppointmentManagement API
     (
         AvailableSlots,
@@ -261,6 +304,11 @@ routes = (
         CustomerAppointmentBooking,
         "/appointments"
     ),
+    (
+        # POST to book a weekly series or a list of appointments at once by the client
+        CustomerRecurringAppointmentBooking,
+        "/appointments/recurring"
+    ),
     (
         CustomerAppointments,
         "/appointments/info"
@@ -296,6 +344,28 @@ routes = (
         StaffAppointmentCompletion,
         "/appointments/<int:appointment_id>/complete"
     ),
+    (
+        # GET to stream a provider's appointment history (NDJSON or CSV) by the owner
+        ProviderAppointmentsExport,
+        "/providers/<int:provider_id>/appointments/export"
+    ),
+
+    # Monitoring API
+    (
+        # GET to view database connection pool usage by the admin
+        DatabasePoolStatus,
+        "/admin/db/pool"
+    ),
+    (
+        # GET to view a request profiled with the X-Profile header by the admin
+        RequestProfile,
+        "/admin/profiles/<string:profile_id>"
+    ),
+    (
+        # GET to scrape request, database pool and cache metrics (Prometheus format)
+        Metrics,
+        "/metrics"
+    ),
 
     # Swagger
     (
@@ -0,0 +1,37 @@
+from flask_restful import Resource
+
+from managers.auth_manager import auth
+from managers.search_manager import SearchManager
+from schemas.request.search_request_schema import SearchRequestSchema
+from schemas.response.search_response_schema import (
+    CategorySearchResultSchema,
+    ProviderSearchResultSchema,
+    ServiceSearchResultSchema,
+    SubcategorySearchResultSchema,
+)
+from utils.decorators import validate_query
+
+
+class CatalogSearch(Resource):
+    schemas = {
+        "providers": ProviderSearchResultSchema(many=True),
+        "services": ServiceSearchResultSchema(many=True),
+        "categories": CategorySearchResultSchema(many=True),
+        "subcategories": SubcategorySearchResultSchema(many=True),
+    }
+
+    @auth.login_required
+    @validate_query(SearchRequestSchema)
+    def get(self, data: dict) -> tuple:
+        """
+        Searches the catalog by name as the user types.
+
+        :param data: The deserialized query arguments.
+        :return: A tuple containing the best matching providers, services,
+                 categories and subcategories, and a 200 status code.
+        """
+        results = SearchManager.search(data["q"], data["limit"])
+        return {
+            name: self.schemas[name].dump([row._mapping for row in rows])
+            for name, rows in results.items()
+        }, 200
@@ -10,6 +10,7 @@ from schemas.request.service_request_schema import (
 )
 from schemas.response.service_response_schema import ServiceResponseSchema
 from utils.decorators import validate_schema, permission_required
+from utils.etag import serialize_conditional
 
 
 class ServiceProfile(Resource):
@@ -21,25 +22,26 @@ class ServiceProfile(Resource):
 
         :param status: Optional status to filter services.
         :param service_id: Optional ID of a specific service to retrieve.
-        :return: A tuple containing the serialized service data and a 200 status code.
+        :return: A tuple containing the serialized service data, a 200 status code and
+                 the ETag, or an empty 304 response if If-None-Match matches it.
         """
         status = status or request.args.get("status", None)
         service_id = service_id or request.args.get("service_id", None)
-        services = ServiceManager.get_records(status=status, record_id=service_id)
-        return ServiceResponseSchema().dump(services, many=True), 200
+        stmt = ServiceManager.records_statement(status=status, record_id=service_id)
+        return serialize_conditional(stmt, ServiceResponseSchema)
 
 
 class ServiceRegistration(Resource):
     @auth.login_required
     @validate_schema(ServiceRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Creates a new service.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful creation and a 201 status code.
         """
-        data = request.get_json()
         ServiceManager.create(data)
         return {"message": "Service created successfully"}, 201
 
@@ -48,14 +50,14 @@ class ServiceEditing(Resource):
     @auth.login_required
     @validate_schema(ServiceEditRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def put(self, service_id: int) -> tuple:
+    def put(self, service_id: int, data: dict) -> tuple:
         """
         Edits an existing service.
 
         :param service_id: The ID of the service to edit.
+        :param data: The deserialized request payload.
         :return: A message indicating successful update and a 200 status code.
         """
-        data = request.get_json()
         ServiceManager.update(service_id, data)
         return {"message": "Service updated successfully"}, 200
 
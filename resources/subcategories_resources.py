@@ -12,6 +12,7 @@ from schemas.request.subcategory_request_schema import (
 )
 from schemas.response.subcategory_response_schema import SubCategoryResponseSchema
 from utils.decorators import validate_schema, permission_required
+from utils.etag import serialize_conditional
 
 
 class SubCategoryProfile(Resource):
@@ -25,27 +26,28 @@ class SubCategoryProfile(Resource):
 
         :param status: Optional status to filter subcategories.
         :param subcategory_id: Optional ID of a specific subcategory to retrieve.
-        :return: A tuple containing the serialized subcategory data and a 200 status code.
+        :return: A tuple containing the serialized subcategory data, a 200 status code and
+                 the ETag, or an empty 304 response if If-None-Match matches it.
         """
         status = status or request.args.get("status", None)
         subcategory_id = subcategory_id or request.args.get("subcategory_id", None)
-        subcategories = SubCategoryManager.get_records(
+        stmt = SubCategoryManager.records_statement(
             status=status, record_id=subcategory_id
         )
-        return SubCategoryResponseSchema().dump(subcategories, many=True), 200
+        return serialize_conditional(stmt, SubCategoryResponseSchema)
 
 
 class SubCategoryRegistration(Resource):
     @auth.login_required
     @validate_schema(SubCategoryRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Creates a new service subcategory.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful creation and a 201 status code.
         """
-        data = request.get_json()
         SubCategoryManager.create(data)
         return {"message": "Service Subcategory created successfully"}, 201
 
@@ -54,14 +56,14 @@ class SubCategoryEditing(Resource):
     @auth.login_required
     @validate_schema(SubCategoryEditRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def put(self, subcategory_id: int) -> tuple:
+    def put(self, subcategory_id: int, data: dict) -> tuple:
         """
         Edits an existing service subcategory.
 
         :param subcategory_id: The ID of the subcategory to edit.
+        :param data: The deserialized request payload.
         :return: A message indicating successful update and a 200 status code.
         """
-        data = request.get_json()
         SubCategoryManager.update(subcategory_id, data)
         return {"message": "Service Subcategory updated successfully"}, 200
 
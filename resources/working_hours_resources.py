@@ -9,6 +9,8 @@ from models import RoleType
 from schemas.request.working_hour_request_schema import (
     WorkingHourEditRequestSchema,
     WorkingHourBatchSchema,
+    WorkingHourBatchEditRequestSchema,
+    WorkingHourBatchDeactivateRequestSchema,
 )
 from schemas.response.working_hour_response_schema import WorkingHourResponseSchema
 from utils.decorators import validate_schema, permission_required
@@ -31,7 +33,7 @@ class WorkingHourProfile(Resource):
         employee_id = employee_id or request.args.get("employee_id")
 
         working_hours = WorkingHoursManager.get_working_hours(
-            provider_id=provider_id, employee_id=employee_id
+            provider_id=provider_id, staff_id=employee_id
         )
         return WorkingHourResponseSchema().dump(working_hours, many=True), 200
 
@@ -42,13 +44,13 @@ class WorkingHourRegistration(Resource):
     @auth.login_required
     @permission_required(RoleType.APPROVER)
     @validate_schema(WorkingHourBatchSchema)
-    def post(self) -> tuple:
+    def post(self, data: dict) -> tuple:
         """
         Registers new working hours, either in batch or single.
 
+        :param data: The deserialized request payload.
         :return: A message indicating successful creation and a 201 status code.
         """
-        data = request.get_json()
 
         provider_id = data["provider_id"]
 
@@ -74,18 +76,34 @@ class WorkingHourEditing(Resource):
     @auth.login_required
     @validate_schema(WorkingHourEditRequestSchema)
     @permission_required(RoleType.APPROVER)
-    def put(self, working_hours_id: int) -> tuple:
+    def put(self, working_hours_id: int, data: dict) -> tuple:
         """
         Edits existing working hours.
 
         :param working_hours_id: The ID of the working hours to edit.
+        :param data: The deserialized request payload.
         :return: A message indicating successful update and a 200 status code.
         """
-        data = request.get_json()
         WorkingHoursManager.update(working_hours_id, data)
         return {"message": "Working hours updated successfully"}, 200
 
-    # TODO: Batch editing
+
+class WorkingHourBatchEditing(Resource):
+    @auth.login_required
+    @validate_schema(WorkingHourBatchEditRequestSchema)
+    @permission_required(RoleType.APPROVER)
+    def put(self, data: dict) -> tuple:
+        """
+        Edits multiple working hour entries at once.
+
+        :param data: The deserialized request payload.
+        :return: A message with the IDs of the updated entries and a 200 status code.
+        """
+        updated_ids = WorkingHoursManager.update_batch(data["working_hours"])
+        return {
+            "message": "Batch working hours updated successfully",
+            "working_hour_ids": updated_ids,
+        }, 200
 
 
 class WorkingHourDeactivate(Resource):
@@ -100,3 +118,18 @@ class WorkingHourDeactivate(Resource):
         """
         WorkingHoursManager.deactivate(working_hours_id)
         return {"message": "Working hours deactivated successfully"}, 200
+
+
+class WorkingHourBatchDeactivate(Resource):
+    @auth.login_required
+    @validate_schema(WorkingHourBatchDeactivateRequestSchema)
+    @permission_required(RoleType.APPROVER)
+    def put(self, data: dict) -> tuple:
+        """
+        Deactivates multiple working hour entries at once.
+
+        :param data: The deserialized request payload.
+        :return: A message indicating successful deactivation and a 200 status code.
+        """
+        WorkingHoursManager.deactivate_batch(data["working_hour_ids"])
+        return {"message": "Batch working hours deactivated successfully"}, 200
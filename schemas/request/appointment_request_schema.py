@@ -1,4 +1,11 @@
-from marshmallow import Schema, fields, validate, ValidationError, validates
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+    ValidationError,
+    validates,
+    validates_schema,
+)
 from datetime import datetime
 
 from managers.working_hours_manager import WorkingHoursManager
@@ -32,21 +39,25 @@ class AppointmentBaseSchema(Schema):
         if appointment_time < datetime.now():
             raise ValidationError("Appointment time must be in the future.")
 
-        staff_id = self.context.get("staff_id")
-        working_hours = WorkingHoursManager.get_working_hours(staff_id)
+    @validates_schema(skip_on_field_errors=True)
+    def validate_working_hours(self, data: dict, **kwargs) -> None:
+        # Edits may omit the staff member; the manager checks those against
+        # the staff member of the stored appointment.
+        if "staff_id" not in data or "appointment_time" not in data:
+            return
 
-        if not working_hours:
-            raise ValidationError("This staff member has no working hours defined.")
-
-        valid = False
-        for hours in working_hours:
-            start_time = datetime.combine(appointment_time.date(), hours.start_time)
-            end_time = datetime.combine(appointment_time.date(), hours.end_time)
-            if start_time <= appointment_time <= end_time:
-                valid = True
-                break
-        if not valid:
-            raise ValidationError("Appointment time is outside of working hours.")
+        appointment_time = data["appointment_time"]
+        intervals = WorkingHoursManager.get_day_intervals(
+            data["staff_id"], appointment_time.weekday()
+        )
+        if not intervals:
+            raise ValidationError(
+                "This staff member has no working hours defined.", "appointment_time"
+            )
+        if not WorkingHoursManager.covers(intervals, appointment_time):
+            raise ValidationError(
+                "Appointment time is outside of working hours.", "appointment_time"
+            )
 
 
 class CustomerAppointmentRequestSchema(AppointmentBaseSchema):
@@ -56,3 +67,49 @@ class CustomerAppointmentRequestSchema(AppointmentBaseSchema):
 class CustomerAppointmentEditingRequestSchema(AppointmentBaseSchema):
     service_id = fields.Int(required=False)
     staff_id = fields.Int(required=False)
+
+
+class RecurringAppointmentRequestSchema(Schema):
+    MAX_OCCURRENCES = 52
+
+    service_id = fields.Int(
+        required=True,
+        error_messages={
+            "required": "Service ID is required.",
+            "invalid": "Service ID must be an integer.",
+        },
+    )
+    staff_id = fields.Int(
+        required=True,
+        error_messages={
+            "required": "Staff ID is required.",
+            "invalid": "Staff ID must be an integer.",
+        },
+    )
+    # Either a weekly series starting at appointment_time...
+    appointment_time = fields.DateTime()
+    occurrences = fields.Int(validate=validate.Range(min=1, max=MAX_OCCURRENCES))
+    interval_weeks = fields.Int(load_default=1, validate=validate.Range(min=1, max=4))
+    # ...or an explicit list of times.
+    appointment_times = fields.List(
+        fields.DateTime(),
+        validate=validate.Length(min=1, max=MAX_OCCURRENCES),
+    )
+    skip_conflicts = fields.Bool(load_default=False)
+
+    @validates_schema(skip_on_field_errors=True)
+    def validate_occurrences(self, data: dict, **kwargs) -> None:
+        series = "appointment_time" in data or "occurrences" in data
+        if series == ("appointment_times" in data):
+            raise ValidationError(
+                "Provide either appointment_time with occurrences or appointment_times."
+            )
+        if series and not ("appointment_time" in data and "occurrences" in data):
+            raise ValidationError(
+                "A recurring booking needs both appointment_time and occurrences."
+            )
+
+        now = datetime.now()
+        times = data.get("appointment_times") or [data["appointment_time"]]
+        if any(appointment_time < now for appointment_time in times):
+            raise ValidationError("Appointment times must be in the future.")
@@ -1,7 +1,19 @@
-from marshmallow import fields, validate, validates_schema, ValidationError
+import re
 
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
+
+from constants import (
+    NEARBY_MAX_PER_PAGE,
+    NEARBY_MAX_RADIUS_KM,
+    PHOTO_EXTENSIONS,
+    PHOTO_UPLOAD_PREFIX,
+)
 from schemas.mixins_schemas import AddressSchema
+from utils.custom_validators import AddressFieldValidator
 from utils.decorators import make_optional
+from utils.geo import box_size_km
+
+BOUNDING_BOX_FIELDS = ("min_latitude", "min_longitude", "max_latitude", "max_longitude")
 
 
 class ProviderRegistrationRequestSchema(AddressSchema):
@@ -29,8 +41,16 @@ class ProviderRegistrationRequestSchema(AddressSchema):
         error_messages={"required": "UIC is required."},
     )
 
-    photo = fields.String(required=True)
-    photo_extension = fields.String(required=True)
+    # Either the base64 photo with its extension or the key of a photo
+    # uploaded through a presigned upload (see PhotoUploadRequestSchema).
+    photo = fields.String()
+    photo_extension = fields.String()
+    photo_key = fields.String(
+        validate=validate.Regexp(
+            rf"^{re.escape(PHOTO_UPLOAD_PREFIX)}[0-9a-f-]{{36}}\.({'|'.join(PHOTO_EXTENSIONS)})$",
+            error="Photo key must be a key issued for a photo upload.",
+        )
+    )
 
     inquiry_id = fields.Int(
         required=True,
@@ -40,6 +60,72 @@ class ProviderRegistrationRequestSchema(AddressSchema):
         },
     )
 
+    @validates_schema
+    def validate_photo(self, data: dict, **kwargs) -> None:
+        if "photo_key" in data:
+            if "photo" in data or "photo_extension" in data:
+                raise ValidationError(
+                    "Send either photo_key or photo with photo_extension, not both."
+                )
+        elif "photo" not in data or "photo_extension" not in data:
+            raise ValidationError("photo_key or photo and photo_extension are required.")
+
+
+class PhotoUploadRequestSchema(Schema):
+    photo_extension = fields.Str(
+        required=True,
+        validate=validate.OneOf(PHOTO_EXTENSIONS),
+        error_messages={"required": "Photo extension is required."},
+    )
+
+
+class NearbyProvidersRequestSchema(Schema):
+    # The location results are sorted by distance from.
+    latitude = AddressFieldValidator.latitude()
+    longitude = AddressFieldValidator.longitude()
+    radius = fields.Float(
+        validate=validate.Range(
+            min=0,
+            max=NEARBY_MAX_RADIUS_KM,
+            min_inclusive=False,
+            error=f"Radius must be above 0 and at most {NEARBY_MAX_RADIUS_KM} km.",
+        )
+    )
+
+    # Optional area to search instead of, or in addition to, the radius.
+    # min_longitude > max_longitude crosses the antimeridian.
+    min_latitude = AddressFieldValidator.latitude()
+    min_longitude = AddressFieldValidator.longitude()
+    max_latitude = AddressFieldValidator.latitude()
+    max_longitude = AddressFieldValidator.longitude()
+
+    page = fields.Int(load_default=1, validate=validate.Range(min=1))
+    per_page = fields.Int(
+        load_default=20, validate=validate.Range(min=1, max=NEARBY_MAX_PER_PAGE)
+    )
+
+    @validates_schema
+    def validate_area(self, data: dict, **kwargs) -> None:
+        if ("latitude" in data) != ("longitude" in data):
+            raise ValidationError("Send latitude and longitude together.")
+        box = [data[name] for name in BOUNDING_BOX_FIELDS if name in data]
+        if not box:
+            if "latitude" not in data:
+                raise ValidationError(
+                    "latitude and longitude or a bounding box are required."
+                )
+            return
+        if len(box) != len(BOUNDING_BOX_FIELDS):
+            raise ValidationError(
+                f"A bounding box needs {', '.join(BOUNDING_BOX_FIELDS)}."
+            )
+        if data["min_latitude"] > data["max_latitude"]:
+            raise ValidationError("min_latitude must not be above max_latitude.")
+        if max(box_size_km(tuple(box))) > 2 * NEARBY_MAX_RADIUS_KM:
+            raise ValidationError(
+                f"The bounding box must not exceed {2 * NEARBY_MAX_RADIUS_KM} km per side."
+            )
+
 
 @make_optional
 class ProviderEditRequestSchema(AddressSchema):
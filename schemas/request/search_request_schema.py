@@ -0,0 +1,15 @@
+from marshmallow import Schema, fields, validate
+
+from constants import SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT
+
+
+class SearchRequestSchema(Schema):
+    q = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, max=100),
+        error_messages={"required": "A search text is required."},
+    )
+    limit = fields.Int(
+        load_default=SEARCH_DEFAULT_LIMIT,
+        validate=validate.Range(min=1, max=SEARCH_MAX_LIMIT),
+    )
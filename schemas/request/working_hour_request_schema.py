@@ -59,3 +59,26 @@ class WorkingHourBatchSchema(Schema):
 class WorkingHourEditRequestSchema(WorkingHourBaseSchema):
     provider_id = fields.Int(required=False)
     employee_id = fields.Int(required=False)
+
+
+class WorkingHourBatchEditItemSchema(Schema):
+    # Batch edits only move entries in time; provider_id and employee_id are
+    # not declared, so sending them is rejected as unknown fields.
+    id = fields.Int(required=True)
+    day_of_week = fields.Int(validate=validate.Range(min=0, max=6))
+    start_time = fields.Time()
+    end_time = fields.Time()
+
+
+class WorkingHourBatchEditRequestSchema(Schema):
+    working_hours = fields.List(
+        fields.Nested(WorkingHourBatchEditItemSchema),
+        required=True,
+        validate=validate.Length(min=1),
+    )
+
+
+class WorkingHourBatchDeactivateRequestSchema(Schema):
+    working_hour_ids = fields.List(
+        fields.Int(), required=True, validate=validate.Length(min=1)
+    )
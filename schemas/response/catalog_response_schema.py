@@ -0,0 +1,21 @@
+from marshmallow import Schema, fields
+
+
+class CatalogServiceSchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+    price = fields.Float(dump_only=True)
+    duration = fields.Int(dump_only=True)
+    provider_id = fields.Int(dump_only=True)
+
+
+class CatalogSubcategorySchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+    services = fields.List(fields.Nested(CatalogServiceSchema), dump_only=True)
+
+
+class CatalogTreeSchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+    subcategories = fields.List(fields.Nested(CatalogSubcategorySchema), dump_only=True)
@@ -1,6 +1,32 @@
+from decouple import config
 from marshmallow import Schema, fields
 
 from schemas.response.user_response_schemas import UserResponseSchema
+from services.s3 import bucket_url
+
+PHOTO_BASE_URL = bucket_url(
+    config("AWS_BUCKET"),
+    config("AWS_REGION"),
+    config("AWS_S3_ENDPOINT_URL", default=None),
+)
+
+
+class PhotoDerivativesField(fields.Field):
+    """
+    Dumps the stored derivative keys of a photo as URLs by size and format,
+    e.g. ``{"thumbnail": {"webp": url, "jpeg": url}}``; None until they exist.
+    """
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if not value or not value.get("sizes"):
+            return None
+        return {
+            size: {
+                format_name: f"{PHOTO_BASE_URL}/{key}"
+                for format_name, key in formats.items()
+            }
+            for size, formats in value["sizes"].items()
+        }
 
 
 class ProviderResponseSchema(Schema):
@@ -10,6 +36,7 @@ class ProviderResponseSchema(Schema):
     trade_name = fields.Str(dump_only=True)
     uic = fields.Str(dump_only=True)
     photo_url = fields.URL(required=True)
+    photo_derivatives = PhotoDerivativesField(dump_only=True)
     created_on = fields.DateTime(dump_only=True)
     inquiry_id = fields.Int(dump_only=True)
     employees = fields.List(fields.Nested(UserResponseSchema), dump_only=True)
@@ -17,3 +44,21 @@ class ProviderResponseSchema(Schema):
 
     # TODO: Extend the fields.
     # services = fields.List(fields.Nested("ServiceResponseSchema"), dump_only=True)
+
+
+class NearbyProviderResponseSchema(Schema):
+    id = fields.Int(dump_only=True)
+    trade_name = fields.Str(dump_only=True)
+    photo_url = fields.URL(dump_only=True)
+    photo_derivatives = PhotoDerivativesField(dump_only=True)
+    country = fields.Str(dump_only=True)
+    district = fields.Str(dump_only=True)
+    city = fields.Str(dump_only=True)
+    neighborhood = fields.Str(dump_only=True)
+    street = fields.Str(dump_only=True)
+    street_number = fields.Str(dump_only=True)
+    postal_code = fields.Str(dump_only=True)
+    latitude = fields.Float(dump_only=True)
+    longitude = fields.Float(dump_only=True)
+    # Kilometres from the searched location.
+    distance = fields.Float(dump_only=True)
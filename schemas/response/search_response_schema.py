@@ -0,0 +1,30 @@
+from marshmallow import Schema, fields
+
+
+class ProviderSearchResultSchema(Schema):
+    id = fields.Int(dump_only=True)
+    trade_name = fields.Str(dump_only=True)
+    company_name = fields.Str(dump_only=True)
+    city = fields.Str(dump_only=True)
+    photo_url = fields.Str(dump_only=True)
+
+
+class ServiceSearchResultSchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+    price = fields.Float(dump_only=True)
+    duration = fields.Int(dump_only=True)
+    subcategory_id = fields.Int(dump_only=True)
+    provider_id = fields.Int(dump_only=True)
+    provider_trade_name = fields.Str(dump_only=True)
+
+
+class CategorySearchResultSchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+
+
+class SubcategorySearchResultSchema(Schema):
+    id = fields.Int(dump_only=True)
+    name = fields.Str(dump_only=True)
+    category_id = fields.Int(dump_only=True)
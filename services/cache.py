@@ -0,0 +1,281 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
+
+from decouple import config
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from utils.transactions import on_commit, on_rollback
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for read responses: a size-bounded LRU dictionary per worker
+    process, optionally backed by Redis so all workers share entries.
+
+    Entries are keyed by the caller's key plus the current generation of every
+    table the response depends on. Committing a change to one of those tables
+    bumps its generation (in Redis when configured, so every worker sees it),
+    which makes all dependent entries unreachable; they age out through the
+    LRU bound and the TTL. Concurrent misses for the same key are collapsed
+    into one computation (single flight), per process and, with Redis, across
+    processes.
+
+    Without Redis a commit only invalidates the entries of its own process, so
+    the TTL is capped at local_ttl_seconds to bound how long other workers
+    serve stale values.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300,
+        redis_url: Optional[str] = None,
+        lock_seconds: float = 5,
+        local_ttl_seconds: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.redis = None
+        if redis_url:
+            if redis is None:
+                logger.warning("RESPONSE_CACHE_REDIS_URL is set but redis is not installed.")
+            else:
+                self.redis = redis.Redis.from_url(redis_url)
+        if self.redis is None and local_ttl_seconds is not None:
+            self.ttl_seconds = min(ttl_seconds, local_ttl_seconds)
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._flights = {}
+        # Plain counters for metrics; an increment lost to a thread switch
+        # now and then is cheaper than taking the lock on every lookup.
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_set(self, key: str, tables: Iterable[str], compute: Callable[[], Any]):
+        """
+        Returns the cached value for the key, computing and storing it on a miss.
+
+        :param key: Identifies the response, e.g. route, query args and schema.
+        :param tables: Names of the tables the value is derived from.
+        :param compute: Builds the value; it must be JSON serializable.
+        :return: The cached or freshly computed value.
+        """
+        key = f"{key}@{self._generation_tag(tables)}"
+        value = self._get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+
+        with self._lock:
+            flight = self._flights.setdefault(key, threading.Lock())
+        try:
+            with flight:
+                value = self._get(key)
+                if value is MISSING:
+                    value = self._compute_shared(key, compute)
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight and not flight.locked():
+                    del self._flights[key]
+        return value
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """
+        Bumps the generation of the given tables, dropping every entry that
+        depends on one of them.
+
+        :param tables: Names of the changed tables.
+        """
+        tables = sorted(set(tables))
+        if not tables:
+            return
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+        if self.redis is not None:
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for table in tables:
+                    pipeline.incr(f"cache:generation:{table}")
+                pipeline.execute()
+            except redis.RedisError as e:
+                logger.error(f"Failed to invalidate cached responses: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        :return: The number of local entries and the lookups of this process
+                 that were served from the cache (hits) or computed (misses).
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _generation_tag(self, tables: Iterable[str]) -> str:
+        tables = sorted(set(tables))
+        if self.redis is not None:
+            try:
+                values = self.redis.mget([f"cache:generation:{t}" for t in tables])
+                return ".".join(
+                    f"{table}:{int(value or 0)}" for table, value in zip(tables, values)
+                )
+            except redis.RedisError as e:
+                logger.error(f"Failed to read cache generations: {e}")
+        return ".".join(f"{table}:{self._generations.get(table, 0)}" for table in tables)
+
+    def _get(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        if self.redis is not None:
+            try:
+                payload = self.redis.get(f"cache:entry:{key}")
+            except redis.RedisError as e:
+                logger.error(f"Failed to read a cached response: {e}")
+                payload = None
+            if payload is not None:
+                value = json.loads(payload)
+                self._set_local(key, value)
+                return value
+        return MISSING
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _compute_shared(self, key: str, compute: Callable[[], Any]):
+        if self.redis is None:
+            value = compute()
+            self._set_local(key, value)
+            return value
+
+        lock_key = f"cache:lock:{key}"
+        try:
+            owner = bool(
+                self.redis.set(lock_key, 1, nx=True, px=int(self.lock_seconds * 1000))
+            )
+            wait = not owner
+        except redis.RedisError as e:
+            logger.error(f"Failed to lock a cached response: {e}")
+            owner = wait = False
+
+        if wait:
+            # Another worker is computing the value: wait for it, up to the
+            # lock timeout, before computing it here as well.
+            deadline = time.monotonic() + self.lock_seconds
+            while time.monotonic() < deadline:
+                time.sleep(0.02)
+                value = self._get(key)
+                if value is not MISSING:
+                    return value
+
+        value = compute()
+        self._set_local(key, value)
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.set(
+                f"cache:entry:{key}", json.dumps(value), px=int(self.ttl_seconds * 1000)
+            )
+            if owner:
+                pipeline.delete(lock_key)
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.error(f"Failed to store a cached response: {e}")
+        return value
+
+
+LOCAL_TTL_SECONDS = config("RESPONSE_CACHE_LOCAL_TTL_SECONDS", default=5, cast=float)
+
+response_cache = ResponseCache(
+    max_entries=config("RESPONSE_CACHE_MAX_ENTRIES", default=1024, cast=int),
+    ttl_seconds=config("RESPONSE_CACHE_TTL_SECONDS", default=300, cast=float),
+    redis_url=config("RESPONSE_CACHE_REDIS_URL", default=None),
+    local_ttl_seconds=LOCAL_TTL_SECONDS,
+)
+
+# Per staff member and weekday working hours, read by every booking request.
+# Shares the Redis tier and table generations with the response cache.
+working_hours_cache = ResponseCache(
+    max_entries=config("WORKING_HOURS_CACHE_MAX_ENTRIES", default=4096, cast=int),
+    ttl_seconds=config("WORKING_HOURS_CACHE_TTL_SECONDS", default=60, cast=float),
+    redis_url=config("RESPONSE_CACHE_REDIS_URL", default=None),
+    local_ttl_seconds=LOCAL_TTL_SECONDS,
+)
+
+
+def has_pending_changes(session: Session, table: str) -> bool:
+    """
+    Tells whether the session's transaction has changed a table. Cached values
+    only reflect committed data, so such a transaction has to read the table.
+
+    :param session: The session to check.
+    :param table: The name of the table.
+    :return: True if the table was written in the current transaction.
+    """
+    return table in session.info.get("cache_changed_tables", ())
+
+
+def _changed_tables(session: Session) -> set:
+    changed = session.info.get("cache_changed_tables")
+    if changed is None:
+        changed = session.info["cache_changed_tables"] = set()
+        on_commit(session, partial(_invalidate_committed_tables, session))
+        on_rollback(session, partial(session.info.pop, "cache_changed_tables", None))
+    return changed
+
+
+def _invalidate_committed_tables(session: Session) -> None:
+    changed = session.info.pop("cache_changed_tables", None)
+    if changed:
+        response_cache.invalidate(changed)
+        working_hours_cache.invalidate(changed)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    changed = _changed_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        changed.update(table.name for table in type(obj).__mapper__.tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(orm_execute_state):
+    # ORM-enabled insert/update/delete statements bypass the flush.
+    if orm_execute_state.is_insert or orm_execute_state.is_update or (
+        orm_execute_state.is_delete
+    ):
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _changed_tables(orm_execute_state.session).update(
+                table.name for table in mapper.tables
+            )
@@ -0,0 +1,67 @@
+from io import BytesIO
+from typing import Dict, Tuple
+
+from PIL import Image, ImageOps
+
+# name: (width, height, crop). Cropped derivatives fill the box exactly;
+# the others fit inside it. Images are never upscaled.
+DERIVATIVE_SIZES = {
+    "thumbnail": (160, 160, True),
+    "card": (480, 320, True),
+    "hero": (1600, 900, False),
+}
+# format: (Pillow format, file extension, content type, save options)
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "webp", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": (
+        "JPEG",
+        "jpg",
+        "image/jpeg",
+        {"quality": 82, "optimize": True, "progressive": True},
+    ),
+}
+# Refuses decompression bombs before decoding them.
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+
+def _resize(image: Image.Image, width: int, height: int, crop: bool) -> Image.Image:
+    if crop:
+        scale = min(1.0, max(width / image.width, height / image.height))
+        box = (
+            min(width, round(image.width * scale)),
+            min(height, round(image.height * scale)),
+        )
+        return ImageOps.fit(image, box, Image.Resampling.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail((width, height), Image.Resampling.LANCZOS)
+    return resized
+
+
+def render_derivatives(photo: bytes) -> Dict[Tuple[str, str], bytes]:
+    """
+    Renders every size of DERIVATIVE_SIZES in every format of DERIVATIVE_FORMATS.
+    The EXIF orientation is applied and the metadata is dropped.
+
+    :param photo: The original photo.
+    :return: The encoded derivatives by (size name, format name).
+    :raises PIL.UnidentifiedImageError: If the photo is not a readable image.
+    """
+    with Image.open(BytesIO(photo)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode in ("RGBA", "LA", "P"):
+            # JPEG has no alpha channel: flatten transparency onto white.
+            image = image.convert("RGBA")
+            flattened = Image.new("RGB", image.size, "white")
+            flattened.paste(image, mask=image.getchannel("A"))
+            image = flattened
+        else:
+            image = image.convert("RGB")
+
+    derivatives = {}
+    for name, (width, height, crop) in DERIVATIVE_SIZES.items():
+        resized = _resize(image, width, height, crop)
+        for format_name, (pil_format, _, _, options) in DERIVATIVE_FORMATS.items():
+            buffer = BytesIO()
+            resized.save(buffer, pil_format, **options)
+            derivatives[name, format_name] = buffer.getvalue()
+    return derivatives
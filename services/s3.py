@@ -1,30 +1,131 @@
+from typing import Iterator, List, Optional
+
 import boto3
 from botocore.exceptions import ClientError
 from decouple import config
 from werkzeug.exceptions import BadRequest
 
 
+def bucket_url(bucket_name, region, endpoint_url=None) -> str:
+    """
+    :return: The URL that object keys of the bucket are appended to.
+    """
+    if endpoint_url:
+        return f"{endpoint_url.rstrip('/')}/{bucket_name}"
+    return f"https://{bucket_name}.s3.{region}.amazonaws.com"
+
+
 class S3Service:
     def __init__(self):
         self.aws_key = config("AWS_ACCESS_KEY")
         self.aws_secret = config("AWS_SECRET")
         self.region = config("AWS_REGION")
         self.bucket_name = config("AWS_BUCKET")
+        # Set to use an S3-compatible store instead of AWS, e.g. a local MinIO.
+        self.endpoint_url = config("AWS_S3_ENDPOINT_URL", default=None)
         self.s3 = boto3.client(
             "s3",
             aws_access_key_id=self.aws_key,
             aws_secret_access_key=self.aws_secret,
+            region_name=self.region,
+            endpoint_url=self.endpoint_url,
+        )
+
+    def object_url(self, key):
+        return f"{self.base_url}/{key}"
+
+    @property
+    def base_url(self):
+        return bucket_url(self.bucket_name, self.region, self.endpoint_url)
+
+    def key_from_url(self, url) -> Optional[str]:
+        """
+        :return: The key of an object URL built by object_url, or None if the
+                 URL points elsewhere.
+        """
+        prefix = f"{self.base_url}/"
+        return url[len(prefix):] if url.startswith(prefix) else None
+
+    def download(self, key) -> bytes:
+        return self.s3.get_object(Bucket=self.bucket_name, Key=key)["Body"].read()
+
+    def upload_bytes(self, data, key, content_type):
+        self.s3.put_object(
+            Bucket=self.bucket_name, Key=key, Body=data, ContentType=content_type
+        )
+
+    def delete_objects(self, keys: List[str]) -> None:
+        """
+        Deletes up to 1000 objects in one request.
+
+        :raises ClientError: If the request or the deletion of any key fails.
+        """
+        response = self.s3.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        if response.get("Errors"):
+            error = response["Errors"][0]
+            raise ClientError(
+                {"Error": {"Code": error["Code"], "Message": error["Message"]}},
+                "DeleteObjects",
+            )
+
+    def list_objects(self, prefix, page_size=1000) -> Iterator[List[dict]]:
+        """
+        Lists the objects under a prefix one page at a time, so that a large
+        bucket is never held in memory.
+
+        :return: Pages of object summaries with Key, Size and LastModified.
+        """
+        paginator = self.s3.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": page_size},
         )
+        for page in pages:
+            yield page.get("Contents", [])
 
-    def upload_photo(self, path, key, extension):
+    def upload_photo(self, photo, key, extension):
         try:
-            self.s3.upload_file(
-                path,
+            self.s3.upload_fileobj(
+                photo,
                 self.bucket_name,
                 key,
                 ExtraArgs={'ContentType': f'image/{extension}'}
             )
-            return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{key}"
+            return self.object_url(key)
         except ClientError:
             raise BadRequest("Unable to upload photo")
 
+    def create_photo_upload(self, key, extension, max_bytes, expires_in) -> dict:
+        """
+        Presigns a POST that lets a client upload one photo straight to the
+        bucket under the given key, with the photo's content type and at most
+        max_bytes.
+
+        :return: The URL to post to and the form fields to send with the file.
+        """
+        content_type = f"image/{extension}"
+        return self.s3.generate_presigned_post(
+            self.bucket_name,
+            key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
+        )
+
+    def head_photo(self, key) -> Optional[dict]:
+        """
+        :return: The metadata of the uploaded object, or None if it does not exist.
+        """
+        try:
+            return self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise BadRequest("Unable to verify the uploaded photo")
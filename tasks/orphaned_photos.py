@@ -0,0 +1,29 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from decouple import config
+
+from worker import celery
+
+logger = logging.getLogger(__name__)
+
+
+@celery.task
+def sweep_orphaned_photos(
+    grace_seconds: int = config("ORPHANED_PHOTO_GRACE_SECONDS", default=86400, cast=int),
+    page_size: int = config("ORPHANED_PHOTO_PAGE_SIZE", default=1000, cast=int),
+) -> None:
+    """
+    Deletes uploaded provider photos that no provider refers to.
+
+    :param grace_seconds: The age below which photos are kept, since their
+                          registration may still be in progress.
+    :param page_size: The number of objects listed and checked at a time.
+    """
+    from app import app
+    from managers.provider_manager import ProviderManager
+
+    uploaded_before = datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)
+    with app.app_context():
+        deleted = ProviderManager.sweep_orphaned_photos(uploaded_before, page_size)
+    logger.info(f"Deleted {deleted} orphaned provider photos")
@@ -0,0 +1,49 @@
+from botocore.exceptions import BotoCoreError, ClientError
+from decouple import config
+from sqlalchemy.exc import OperationalError
+
+from worker import celery
+
+
+@celery.task(
+    autoretry_for=(BotoCoreError, ClientError, OperationalError),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=5,
+)
+def generate_photo_derivatives(provider_id: int, photo_url: str) -> None:
+    """
+    Renders and stores the resized copies of a provider's photo. Safe to run
+    again: the derivative keys are derived from the photo's key, and a photo
+    that was replaced or already processed is skipped.
+
+    :param provider_id: The ID of the provider.
+    :param photo_url: The photo URL the provider had when the task was sent.
+    """
+    # Imported here: the app imports the managers, which send this task.
+    from app import app
+    from db import db
+    from managers.provider_manager import ProviderManager
+
+    with app.app_context():
+        ProviderManager.store_photo_derivatives(provider_id, photo_url)
+        db.session.commit()
+
+
+@celery.task
+def backfill_photo_derivatives(
+    limit: int = config("PHOTO_DERIVATIVES_BACKFILL_LIMIT", default=500, cast=int)
+) -> None:
+    """
+    Sends generate_photo_derivatives for providers whose photo has no
+    derivatives yet, e.g. created before the pipeline or while the broker was
+    unavailable.
+
+    :param limit: The largest number of providers handled per run.
+    """
+    from app import app
+    from managers.provider_manager import ProviderManager
+
+    with app.app_context():
+        for provider_id, photo_url in ProviderManager.photos_without_derivatives(limit):
+            generate_photo_derivatives.delay(provider_id, photo_url)
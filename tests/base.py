@@ -33,6 +33,7 @@ from config import create_app
 from db import db
 from managers.auth_manager import AuthManager
 from flask_testing import TestCase
+from sqlalchemy import event
 
 from models import UserModel
 
@@ -49,6 +50,28 @@ class BaseTestCase(TestCase):
     def tearDown(self):
         db.session.remove()
         db.drop_all()
+
+    def record_statements(self, engine=None, record=None) -> list:
+        """
+        Records every statement the engine executes from now until the end of
+        the test.
+
+        :param engine: The engine to listen on, db.engine by default.
+        :param record: Called with the connection, cursor and statement and
+                       returns what to record; the statement by default.
+        :return: The list the recorded values are appended to.
+        """
+        engine = engine if engine is not None else db.engine
+        recorded = []
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            recorded.append(
+                statement if record is None else record(conn, cursor, statement)
+            )
+
+        event.listen(engine, "before_cursor_execute", listener)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", listener)
+        return recorded
 #
 #     # from config import create_app
 #     # from db import db
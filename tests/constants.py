@@ -24,7 +24,11 @@ class Endpoints:
 
     # Service Provider Management API
     REGISTER_PROVIDER = ("/provider", "post")
+    PROVIDER_PHOTO_UPLOAD = ("/provider/photo", "post")
     PROVIDER_PROFILE = "/providers/profile"
+    NEARBY_PROVIDERS = ("/providers/nearby", "get")
+    SEARCH = ("/search", "get")
+    CATALOG_TREE = ("/catalog/tree", "get")
     EDIT_PROVIDER_PROFILE = ("/provider/<int:provider_id>/edit", "put")
     DEACTIVATE_PROVIDER = ("/provider/<int:provider_id>/deactivate", "put")
 
@@ -53,10 +57,13 @@ class Endpoints:
     REGISTER_WORKING_HOUR = ("/working_hours/register", "post")
     EDIT_WORKING_HOUR = ("/working_hours/<int:working_hours_id>/edit", "put")
     DEACTIVATE_WORKING_HOUR = ("/working_hours/<int:working_hours_id>/deactivate", "put")
+    BATCH_EDIT_WORKING_HOURS = ("/working_hours/batch/edit", "put")
+    BATCH_DEACTIVATE_WORKING_HOURS = ("/working_hours/batch/deactivate", "put")
 
     # Appointment Management API
     AVAILABLE_SLOTS = ("/appointments/available_slots/<int:staff_id>/<int:service_id>/<string:date>", "get")
     CUSTOMER_APPOINTMENT_BOOKING = ("/appointments", "post")
+    CUSTOMER_RECURRING_APPOINTMENT_BOOKING = ("/appointments/recurring", "post")
     CUSTOMER_APPOINTMENTS_INFO = ("/appointments/info", "get")
     CUSTOMER_APPOINTMENT_EDITING = ("/appointments/<int:appointment_id>/edit", "put")
     CUSTOMER_APPOINTMENT_CANCELLATION = ("/appointments/<int:appointment_id>/cancel", "delete")
@@ -64,6 +71,12 @@ class Endpoints:
     STAFF_APPOINTMENT_REJECTION = ("/appointments/<int:appointment_id>/reject", "put")
     STAFF_APPOINTMENT_NO_SHOW = ("/appointments/<int:appointment_id>/no_show", "put")
     STAFF_APPOINTMENT_COMPLETION = ("/appointments/<int:appointment_id>/complete", "put")
+    PROVIDER_APPOINTMENTS_EXPORT = ("/providers/<int:provider_id>/appointments/export", "get")
+
+    # Monitoring API
+    DATABASE_POOL_STATUS = ("/admin/db/pool", "get")
+    REQUEST_PROFILE = ("/admin/profiles/<string:profile_id>", "get")
+    METRICS = ("/metrics", "get")
 
 
 ENCODED_PICTURE = "iVBORw0KGgoAAAANSUhEUgAABKYAAAG9CAYAAAAvN34ZAAABU2lDQ1BJQ0MgUHJvZmlsZQAAGJVtkD1LQmEYhi/NEEroA6cIcoiisCgVDJrMQYIIsQ+qqePRVNDT4Xgi+gU1BNESDv2CpqA5a2hu6WNsK5ojbCg5PUcrtXrg4b24uXm43xucKLqedwEFzTQSsRnfyuqaz/1MJw66GMGrqEU9Eo/PiYXvt3Uq9+KVuRmzb40+HJZPvD0Dam43eHc++fbX3zIdqXRRlfdDdkjVDRMcg8LxbVO3WRavIaGE92zO1PnY5mSdT2uexURU+Eq4W80qKeFbYX+ySc80cSG/pX5lsNN70trSgp1Htp9lYgQIMSW9/O8L1XxRNtHZwSBHhiwmPiKi6ORJC8+ioTKOXzjAhH3T7vd3bw1Nc0P4AJxPDU0Jw9kj9Hoa2nBJvrwP5WldMZSfNh0VV3EjGKizpw/aLy3rxQL3OlSvLeu9ZFnVI2h7hYv5T6fbYGRE1reNAAAAVmVYSWZNTQAqAAAACAABh2kABAAAAAEAAAAaAAAAAAADkoYABwAAABIAAABEoAIABAAAAAEAAASmoAMABAAAAAEAAAG9AAAAAEFTQ0lJAAAAU2NyZWVuc2hvdBIDxf0AAAHXaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA2LjAuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOmV4aWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vZXhpZi8xLjAvIj4KICAgICAgICAgPGV4aWY6UGl4ZWxZRGltZW5zaW9uPjQ0NTwvZXhpZjpQaXhlbFlEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWERpbWVuc2lvbj4xMTkwPC9leGlmOlBpeGVsWERpbWVuc2lvbj4KICAgICAgICAgPGV4aWY6VXNlckNvbW1lbnQ+U2NyZWVuc2hvdDwvZXhpZjpVc2VyQ29tbWVudD4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CvgR1TsAAEAASURBVHgB7J0FnFXFF8cPsHR3LUuHgIACBiooCCISChICKmLwJ1QULEBAJZQOxUBCRFC6pCQlpLsbWbq74X9+w97n2+X11tv3fmc/b+97N+bO/d6Ze2fOnHMmUVhY2F2hkAAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJkEAcE0gcx+fj6UiABEiABEiABEiABEiABEiABEiABEiABEjAEKBiigWBBEiABEiABEiABEiABEiABEiABEiABEggXghQMRUv2HlSEiABEiABEiABEiABEiABEiABEiABEiCBkOTJk5MCCZAACZAACZAACZAACZAACZAACZAACZAACcQ5gZDr16/H+Ul5QhIgARLwlgCU6HxeeUuN+5MACZAACZAACZAACZAACZCAfxOgK59/3x/mjgRIgARIgARIgARIgARIgARIgARIgAQClgAVUwF7a3lhJEACJEACJEACJEACJEACJEACJEACJODfBKiY8u/7w9yRAAmQAAmQAAmQAAmQAAmQAAmQAAmQQMASoGIqYG8tL4wESIAESIAESIAESIAESIAESIAESIAE/JsAFVP+fX+YOxIgARIgARIgARIgARIgARIgARIgARIIWAJUTAXsreWFkQAJkAAJkAAJkAAJkAAJkAAJkAAJkIB/E6Biyr/vD3NHAiRAAiRAAiRAAiRAAiRAAiRAAiRAAgFLIMTZlQ0Y9IPkzJnL2eZI648ePSJt3/tfpHX8QQIkQAIkQAIkQAIkQAIkQAIkQAIkQAIkQAKuCDhVTI0eNVyavvqGdOzQXi5fvuwwjdSpU0v3Hn1k9K8jHG53tjJpsmRy88aN+zYnSZJEEiVKJHfv3jXLW7du2fYJCbmXVWsd0ogqd27fltv6wb6JEt8zBnN0Hvvt9mk42td+O7+TAAn4L4F+A76T3LnzuMzg4cOH5MO2rV3u425jWIGCclWfiSePH7PtimdXYv1ArOeQbaN+sbbfvXNHrGeYo+326/DdSsv+meXLc8r+eRn1eGyzzmN/fmfr7ffhdxIgARIgARIgARIgARIgARKILoFEYWFhd50lUr9hYymgnbDe3/SQO3duR9otceIk8tEnHWTfvr0y/o8xkba5+lGo6APy9gcfy9D+vWTPzu2Rdn2/05dy+eIF03HLmj2H9O78qW37p937yJHwf2XU94OkVLny0uStVrZt1pe1/yyVcb8ME6STK/ReB/XqlSuyf88umTdjihz+96DZ9d1Pu0hovnzWYbZlj08/lPPnztp+8wsJkID/EEiePLlcv3493jJU9rEnpEa9BpImbTqTh/Ur/5HfR/xkvtdt0kwefaqS+Q7F06H9e+WfRQtk49pVZl2z1m3lgQdLm+/HjhyW7ZvWm+3W8+bFRk3l8aermO32/yao0n/bxvXS8ZsBqty6p2w/d+aM7N25Tab+PtojHkVLPCjN3/3QluzVq1dk55bNMm7kUKPE/6xnX9m6Yb2MHzXMts8rb7bQ/JaRnwf2kX/1WigkQAIkQAIkQAIkQAIkQAIkEFsEnFpM4YQTx/9hlE/16je8T/mEddY+5ouH/5KnTGn2vKgKKHvJGRpmlEmTfhslz1R/wSihrO0ZMmaSjJkzy7oVy8yqPHkLyO1bt2XEt/3kzt071m5y9vRpQec1a/acgk7jP38vlBy5ckv1F+tJ1ZovysghA01HLJu6KG5YtUJWLVtsO/bOnbtUStlo8AsJkIA9gTLlH5V6rzYXKL+XzJstTzzzrDxWqbL5vXvHNsmZO1SOhh+SyWNGScZMmaViteflhZcbyY4tG43yKEeuUNm9fassXfCX5C9UWJ6s8pw+m0LNMwnnyaGWXkcPh8v0cb/Zn1aOaZr5ChczSqnp48ea3/mLFJVnX6ijFlvHZeHsGZH2d/QjT74CZvXwQX3l1u1bUrhYcXnm+Vqyb9cOWblkkWxZv1ZKPlRWpo1LIdevXZMqNWrLgw8/IhNG/UyllCOgXEcCJEACJEACJEACJEACJBCjBFwqpmAl9e2gfsZdb//ePbJmzb3R/3LlHpEnKjxl3PyiWlK5y12yZMnNLufOnJYnK1eTAtrJQmeutFpBXbt6VQ7s3W2UUOgAWpJPO3KQQwf3myU6gSdPHBN0CKNKkQdKSNKkIcYa66CmhU/Zx55UK4f0Zle44SRLnswcu3fnjqiH8zcJkAAJ3EegsiprTp88LhNH33NbXqeKbyimsqnie9/unbrMJVvWrZWD+/aYT578BeSRp56WpPq8S5kq9b1n2oqlsmPzRvPJqYqo/IWL2s6TI3dutVpap5ZQ9z+T8uTNqxard2Xz2tVGeX5YLUcrPvu8pEt/75lmS8TJl5xqPXpOlfY7t20xe4SEJJVn9NutCHfqlX8vkrKPPyUPq0UYLFarqNJrkSq8cI0UEiABEiABEiABEiABEiABEohtAi4VUzg54kv16tVdemgsqWavNzL5aaNuIR0iYk/VUWukxk1et+VzzG+/yNQpE22/o35JlvzeqDzWP1OjpqRJk1ZmTR4vRUuWVveSTWp5kNsckjlrNqla60XzPSx/QWMhBaUVJLtaGly5ctm2HetOqfXA+lX/qIvePeuAg3t3acctgyq8HhV0EudMnYDdJE++gmaZO0+YZIxIHytWL/1bzp09Y7bxHwmQQMIjULlKVUkb4WYXNfew0Fww/y+z2ttnVpg+U7KrleXCWdNtyaZOm9Z8R0y73HnzSYoUKY2rMOIyPVCqtHnu7FELqUt6XlhbQQ7tv6dYx/cL58+bOHr4njssr1Fepda8W888rN+7Y7tResGaFIoluP1lV0VYxWerG+X6uhXLsZtbya6K/Ju3bkpltZLKnDWrFCn+oBzYs9vmZgiFPxT4j6uiDc/MLevXyNzpk92myx1IgARIgARIgARIgARIgARIICYIuFVM4SRH1MUkZapUtvPhO9ZBLCUUlFPulFLYH9ZK165clUeeqKTLK5IyZWrjeoeYUH9pZ6iAWhHATS9ztuzmg2OgiDql1goIOJw1e3ZJlyGDusdcMx0sbIfcuX3PpS9XnnuxpVp/8rkkS5ZC7uoflFKL5sw0+0EhdeP6DZsCy6zUf8sXzre+ckkCJBDABLx9ZhUo9oChsX3LZhuVTFmymu+nNQA6FOeQ6i/Vlxp1G6iVVFJZs3ypzJw0zqwPzZtf4+bdNtagZoX+g2uyFV8qb4F7FqFp1aoTSiNLDh+8FxMPLn9pM2SUrv2+NQqsC2fPyagfvrVZkFr7O1oiHlbmLNnk7KmTJmZUpqxZJCRpUlmxeEGkIOzrVi6Xek2bqevePpn463BHSXEdCZAACZAACZAACZAACZAACcQKAY8UU+7OjI7ednUT2bVrp7tdNQZUCrly9bKUf7KirFIrJbiNlCpb3lgEIMjvE08/KyeOHZHvvvnKllanbwbKsQhFWN6CRcz6SaNHGmsC204RX6DEOrBnjyyeO1M7jPlNLJVEie4FDcYusB44oNZUwzTeCoUESCBwCFgWUZ5ckTfPrIwa4w6C55IlhdVlGBMrwI0PLnBXVGk+7pefBQqryjVqSeo0aeTypYtmd7jtnVLX42sadByC2UzD8heSzetWm9+5w8LM8YO//sL8tv+H+HoZVImFWFCIUVVa3ahLlCknFy+cs9/N6Xe4QSdOnEj+VCXZ1g1rzX5vt/1ILbNekvWrV9iOu6oWqBDEz4rPAPO2DPELCZAACZAACZAACZAACZBA0BD4T2MTzUv2RCmFU8CaANYCcIVBZ+vWzRtSTGer2qqzVEGgWDqus1ZZki1HTkmbPp0cOXTPeiBU3V5uaGwURzNFocOXOWt2jfGyS7ZperOnTpLdqjAr+/gTJrkUKVNJ1mw5bEou6xxckgAJBB8BT59ZsM68efOm3IyYETBDxoxSUGcX3bl1k8CVD8ru40fCdaa9DbJswV/GGqlIiVLGuhNU8Uw7dviQDfCzqhSC1dLq5UvMuhy58kR65tl21C/5C91TxG/buEEVWWtkwq8jVYl1UR6vWNl+N6ffQ9XN8LZakx7QmUktgTt10qTJrJ9mif0QxwoufhQSIAESIAESIAESIAESIAESiEsCXltMYda76Ag6RYjHsmTeHGNBcEs7fOm1o7fun2UmjotRQmlwX0vyFrzn5nLowD6zCrNXXdBYKwV0pip7Obhvt+TVThymVA//94Bt02adcaquuhkiTkwqVYYlCUmiiq3rUuSBkrZ9EH/mqN05bRv4hQRIIOgJ7Nm+TSpVqyEVdCa+PTrhQq36r6gb3E2dEW+mKtqTSTadBXTN8r9tnBD7qfLztXWmu/KybeM6o1iHddVjFZ/RgOdF1EL0UZk9ZYLsV2urkJAQwSyhu7dvifRMQkwobEf8Krg2W/H1YHW1a+sWgcWWJ5JL41NdunBelWO5JGPGzFK4REm11iogM8b/HulwE8dKJ6S4cN4zS6xIB/MHCZAACZAACZAACZAACZAACUSDgFeKqWI6zXirNm1tcaV8OW9StRSAxRMsCyC3tQN2+N+DRplUrsJTZp2lhMIPExNK9z+4d4/Zhg5WqtRp5M3325nf+AeLgK8+fk9Cw+6N+h9UVz5L4B5Yu2FTKV7mIbXOumVWY6p1e0G8lcljf7Vfxe8kQAIJjEC/Ad9JblVc28thtVT6sG1r+1Vef9+7a4dsWL1SqtZ8SV6o11BOnzgho4YMMlZQBYsWM1ag4foMs+T0yRNmW+EHiqvL3Xmz+tGnnpHzOrnCiaOHZcrYUcZaFBvyaHwqxN0rUeZh87HSwDNxUI+ukkOtsRBfz3IDxPZdagX68GMVjCJrlyq0XEn2nLmN4r/Fh5+a2Hrnz52ReTOmypL5cyIdhv2onI+EhD9IgARIgARIgARIgARIgATiiECisLCwu56c64/x0+S4Bvod8u0A2aFWAxQSIAESiEsCsNaMz/hHmLEuRcqUGmvqaFxeNs9FAiRAAiRAAiRAAiRAAiRAAgFNwGPFVNmy5WSLzkoVnx3DgL4TvDgSIAGXBOJbMeUyc9xIAiRAAiRAAiRAAiRAAiRAAiTgEwGPFVM+pc6DSIAESCCGCFAxFUMgmQwJkAAJkAAJkAAJkAAJkAAJ+BGBxH6UF2aFBEiABEiABEiABEiABEiABEiABEiABEggiAhQMRVEN5uXSgIkQAIkQAIkQAIkQAIkQAIkQAIkQAL+RICKKX+6G8wLCZAACZAACZAACZAACZAACZAACZAACQQRASqmguhm81JJgARIgARIgARIgARIgARIgARIgARIwJ8IUDHlT3eDeSEBEiABEiABEiABEiABEiABEiABEiCBICJAxVQQ3WxeKgmQAAmQAAmQAAmQAAmQAAmQAAmQAAn4E4EQTMFOIQESIIGEQIDPq4Rwl5hHEiABEiABEiABEiABEiABEvCcQEiyZMk83zuG97xx44bE5/lj+HKYnBLgPWUxIAHXBFhHXPPh1sAmwPIf2Pc3UK+O5TZQ7yyvK6YIsI7EFEmmE6gEUEeuX78eqJcXI9dFV74YwchESIAESIAESIAESIAESIAESIAESIAESIAEvCVAxZS3xLg/CZAACZAACZAACZAACZAACZAACZAACZBAjBCgYipGMDIREiABEiABEiABEiABEiABEiABEiABEiABbwlQMeUtMe5PAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiQQIwSomIoRjEyEBEiABEiABEiABEiABEiABEiABEiABEjAWwIh3h4QF/unzFZWspTuJCGpcthO17HOPtv3qF9Onz4lI4b/KDu2b4u6KU5+d+/ZV7Jn/y+vrk56/Pgx6fhZO1e7BOS2Yg8Ulzeat5DMmbN4dH3xfU89ymQQ7sSyHns3nXUk9tjGZMqsAzFJ87+0WP7/YxHb31iGY44wy23MsYzPlFgnYo8+60jssY3LlFlH4pJ28J7LLxVTUEqFr/5Grpw7YO5M8TqT5a3mTZzepXz5Ckir1u/Lxx+973QfbHjimWfkmerVZdQPP8i/+/c73ffTbt1kz44dMmH0aKf72G8YP26MNGjwinT7qrNcuXLFfpPte6pUqaTT51/K+HFjbeuC6UtzVUqNGDlCjh45Yi67T9/+MXJPLYZvv/++hCRNKt/36WOt8oslylylqlUlRYoUMnzIEDmwZ0+85qt67dry+NNPy+Cvv5ZTJ054nReWda+ReXxAbNcRjzOSgHas/9prkjs0VAb06BFnuWYdiB3U/l7+vW0XeEqpU8+vZeXSJfLXn396eki092MZjjZCWwL+Xm5tGfXyiyflsnb9+lK6fHn56uOPvUw9eru3bN9eLp4/L6OHDnWakLd5Y51wijLaGxJSHQnNm1daf/KJ7Zp/Hz5cNq5ZY/udUL6wjiSUO8V8RiXgl658sJSylFJRM+zo94ED+ySTB5Y4+QsVkmdfeEEyZ3FttfNk5crywIMPOjqVw3Ub1q+VlatWyFvvtJJEie5HinXYhn2wb0KSMg89JPhEV3B/LKWUJ2l5ek+ttB5+9FEpX6GC9dMvlq+1aCFfDRwoDz3yiOTTspc8efJ4z1fBokWlUrVqkip1ap/yEshl3ScgelBCqSOOrq99167yRd++jjZFe11JfW78+McfUq1mTZ/SatSsmXw/ZozLY8uUKydPqeI3LoV1IDLthFz+I1+J61/etgs8Lf/P1qophR54wPXJY3gry3DCfm7HcHFwmJwn5bJw8eLyVJUqDo+PzZWoi2Ufe8zlKbzNG+vE/TiD5dluf+WJEyeWdOnTS/acOeXxihUlW/bs9psTzHfWkbi5VTFVR+ImtwnjLPdrURJGvn3K5aqlS2WAWkMd2LvXp+NdHTRtyiSzufaLde/bzVpn7XPfDn66Ik9YmFR/vqb54DvFOwLlnnhCDu3bL/WffVZeU0ulnVu3epeAn+5tlWOrXNtn01pn7WO/LRC/J/Q6EpY/v+QvUiRWbk3atGmlaIkSksnNQICzk2fLkUOKlizpbLNZP238eBk6YIDLfWJjo1W+rfJufw5rnbWP/bZA+57Qy39s3g9Pyz/aJEvmz4/NrDhM2yqfVnm138laZ+1jvy0QvrPcur+L8VUu3edMZOR338nE337zZFev9rHKu1X+7Q+21ln72G8LxO/BWkfgTdO6SROZ4mZQzN/vOetI7N+hYK0jsU3WL135fLnozp0+cnoYrJ9guWLJ7u3b5eyZM9ZPafHhh/J8nTqSSjtS+3fvliQh3mO5e/eO/PzTEOOud/DAfptlVJmHysqjjzxm3PywT0KRjBkzysv1G0riJPd0l/g+cvjPcvbsWb+4hBovvSRN33nHjGacVJe0u3fuyLVr12x5+2Hs75InX15JoS6UF8+dk/WrV0vfL76QSxcvSufevaWIjvT9r1Ej8xsHvfvpp8aS6LNWrWS3unG6EnTm23bsaDrdIcmSyfHDh+XXH3+0uWJ8pR3lkmXKSNp06QR3fPKiRSa5TupuuHXjRqdJv9y0qTR56y3pouVx07p1kfb7Ththp/U6O3/wgbzdtq2xQsmYObNcunRJ/p47V/p99ZVtf3fbbTvqF5jrl3mkvDGJn/L77/abnH4PtLLu9ELdbPD3OvKQulg0f+89yVeggKTUenBO6+6wQYNk1pQp8ol2hh978knzzEuiI4RWGZ09bZr82K+fuXJXdQg7vPLGG9Lg9ddlnrogPf3cc4LyGH7ggDTTujlp4UJJHPEcbfL229JQrZ9Q916tVcsNVZF62ihsqsckV/dXjF5aedu1bZt8ovUTAmvE2g0bmu9nTp2S2VOnmu/4N3rGDPMMz5wtm+CYnLlymXTG/fKLjB0xwuznTR2xJWz3hXVAxN/Lf6mHH5a39XlZsHBhSaJu3oe0wzFU2wErlywR1A28B7Zs2GCe1ShrG9esle6ffWp7J0SnXeBJ+f9p3Dib0naaWhZuWb/elLBW7drJM88/LylSpjS/9+zaJcW1DbN9yxZpq/UIgvdfI61/2XPnlts3b5r3Sn99BxwJDzfbPfkXrGXYH8qtq/bqqOnTzbM6VAcD02gbAuV2iJbVtStWmNuaS12Xv9MwE0v1GYtynEOfbxf12drr88/ln7//Ns/lFxs31niemU1oiTX//CNffnSvfTx80iQ5/O+/8rm2ISxB2+KqtiPa6zMV4qxcYhusANFWggX4VQ1bceLoUay2ias6h53c5d2WkJMvXTVUQ0mt15At2kZaumCBbU93ebPt6OJLsNaJqEj8vY64Kmdff/+95NU2OgbETh4/Lte1X5AzTx5ZOGuW9O7SxVhBffzll3JA61WRYsW0j5NEtuqz92utP56Et3DV/kdfs5u+Yxboub7TOgtJo/1KWI5v37hJuun7xVXesX90n+2sI6AY++IPdST2rzJ+zuC9BiZ+8unwrJnTJ5XPmoRKqYKpZNPeK9Lzt6Ry+vzN+/Y9poqDUfqwKqKj9zVfflmSqTLBErwo66lCAAqpv0eNkso1aphOnLXdmyXiSw0e3E86dPhC3m3ztjn0zTf/Jz16dHEae8qb9ONyXyig+ve992CNy/N6ei40ypNqZ2P0zz8bqwqY3O7TBrwlFy+cl99028ljx+Thxx+X5198UU7pSwovi3XawKusDX/c91+0XECe1FhQp0+edKuUwr7vaKOuVNmysmD2HG2YHZHntZPQQjsTaBSi8z1drTiWaaMRirMb168LOsSQI4cOmaWzf5v15ZhBG5PlVWFgr5jKoh3swurqsUstruDeBOUVruF37WSXVlemWg0aCBqff8+b53a7dW68jHtprLUy2rBFzDVPlVLW8YFU1q1r8nbp73UEyp0C2oEYoaPLp7Rsw6X0zu3b5jL/0s7PRlXW1lUlEBSoVj04pIolS1zVIeyTUt1BM2rjr7rWLXSadmrH2bJw+kmVs3CZhmIA59qlgwG3tAPtiWzQfF3WjtIjWg+g8Pqxf39z2Hk7pTjOh9+V1TUbHTh7QR1CLDdYKOL4GRMmGNdsdPahmHJXh+zTcvU92OuAv5f/dl27SnodYJmu9//K5ctSs149o/CEYiqptgFQdvH8xPM6a46cUk1d6qpoGZmqCqPotgs8Kf8Tf/3VKJ8+6NxZUmvnxRIMkGXKmlVGDB4sDfR5H6qdqj9GjpTX/vc/8x47dPCgtPnsMzml77ZRGrcwi7qaPF+3riDe2kAvY60FYxmOr3IbkiKLZHmogyTPVEqun9kkIWd6yK1rp6zbbltmzJRJcuszbZ4q2M/rAGoNbbPimWUpphBLE2UXg6kb166VWZMnS95ChU0HG53eZq1bywktGyO1bVNCFUlo66CsDFGXbbRB4AKHNgU64YiBWbxUKRmv5csSZ+US2+u/+qqgYz5z4kQT0/M5zYPcvWsdKq7qHHZylXdbIi6+zNV3yfpVq0zbCnXbXtzlzX5fV9+DsU5E5eHvdcRVOUuvbnh4vo/V2FDNdCALbenV6i2DegDFVDIdhED9QVmcps96WGajbVBHB6oxcOdOXLX/t2/eLGdOn5Yn1NXUUkyZOJhanzF4DXGVdyhXo/tsZx1xdwdjZnt81ZGYyb1/p5KgFVOfNs4tq3dckk4/H5Q6T2YW/P7o+wP3EYd1FFw+mmbIcN82xJyCogpmj1AsQMPeQQND+yqIowTrBEvw3ZvYStZxXDonUFhHOXJrgMKpY8fKSG2YQ/5UxYy9fKSjfxUqVTKdcXSIMWqCYyAztFH1yptvCnyw0SFHkEyMPKND4omgIRd+8F/poaMfEDSQamkaUG7B4mTVsmVmPaxJcF57aw6zwck/dKRPaPkppNdXonRp+UbzhkYnRsFRRtEwhVLq1o0bEq6jnnkLFjQjq1evXpXn1FUQiinEj3K13Tp1B+3AFFBLgkG6RN3wRVjWfaEWh8ckSmROBgUulJqL5syxnXzdypXmew3t0MIyw1EZdVWHbAnpF4zcf9Opk/0qkx6UxRB0khylH+kAux97VcGMT5GIuDuOjoXlIT5QXjkSWMXCJB+KqYWzZ5tRSyh3IZ7WEUfpRl3HOhCViH/8flYHmPKqpeCOzVvM+xjv4SM6QFVCR7Tt40euWLLUWFEh1089W0UefOhh8x6IbrsAZdZd+Z+jnWwIFFNR5eKFC2bQBQNlFzTI8/BvvxVYHkKhUEKtcTGZCgbT8N6CwJr2USd1IWraUX+zDEclEju/s5T5TK6eXCknVnWQtPnrCH4fW+F4huZwVT72VKtsCN7zaBNElX2qfG+nZcJeWqtlFKz/pqr1szV5z4zly6W0DkpAEGD/SY0JVUetTYep4rOqxv+DpfkUteiwxFW5xDMUz1ZLAVq42ANSoEhhc6i7OodOuyWO8m5tc7Vcvnix2QyFbVRxlbeo+7r7zTrhjlDsbPekjrgrZ8jZUW0zo2/QWNvLO7XcndB+Hd77UPpagsFda9CruLa3S+rHE3HX/l+sHgxvqXcEBkLQ14DyF5bkeCe4y3t1eO5E89nOOuLJXeQ+/kwgQSumShdKLZ2HHZJrN+7ItKVn5M0XsnnNGi5d6NhDKQWZq6NUH9u5RXmdYIAcADPFZs3fsinZYLbtL658j2jspiRq8YPOqyUnj/83wxxG9Hr/9JOkV0XkscNH1N3totktmXbQLVmunel6OvqHzsMz2vhHw37MsGHWZpdLjG7v3LrNts/eCNe/bBosMbpyUDvTYfnyydP6EoXCoJSO6KfT67ig7ogwW2+lDc8bqphCEHNL0EGBhQkESjJX261jcmqHBi6rBezSsbZx6RkBf64juIKp2tnIoA0xWC29pVZ+O9SiCSOCllLK1VV6Uoes4/+JcFW1fvvDEspoWCtCYC1z+9YtCdFnBsTTOmJ25j+nBPy5/FuDEHiG2j8rd2qnGsodDBhADuzZbbu+q1pOUqa+N6gU3+2CO1peIbfVwhGueua7roMlQOYsWdVI5a5k0ZF+fCBw072p7wWKewLxVW6TZy4tJ9Z0UqvVa3LxwDTJUDSyUsk+58cjZi/GOrjePartFAxW2YcCsFf0WMdmzJTZlI3lds/k4+puB6tYCDrN6CQ/+tRTRjEFy+/tquD3xAUU9SaHths224UZOHo43KaYclfnrDxi6Sjv9tu9/e4ub96mF+z7+3Md8aSc3YqwDMfz86Y+N61nY1q1prLkX60HlsAgIVTb3Z6Iu/Y/ZoqEJXoV9CvUUr2AxvCcEOE14S7vsflsZx3x5O56vk981RHPc5hw9/RLxVT4glckpRyXuxIiN8T57GGb912R2k9mkqlLT5slfnsrCISOESSY9GNKUMwwAhPPYBeYKU4Y/4c0afq6QYHvWOerIKbC+XMnjUIpWQrn99ST9DdqwwgN8zyqgLIkU5bMNv/wV5o3l6zq3tBZO+NQ5qBBN1jdJnTKRGt3maBxFV7QEY3aDRoaU/YFM2fatrn7gg5Mluz/KUHRiYcg1k10BVZTmGHwwYfLmkZkBR1tQZwdWH9A4CqYQZVPCM7oSNxtt47pqq6HLzd91YzqQLEGdxeKdwT8uY7gSmBBhw/igbyg7qYvadyROur2aa+YQj1C+YoqntQh6xh0fBwJGoWQEB9i9uE45C2R1lmMctrHBMQ2b+SOxp/7z9nEfR3yJu1g3tefy78V+2b75k3yjcYOiSoY3ICgjDmSmGgXRLf8W/mycmgtz507a+rFdLXwdWRNaB3HpWMC8VVur5/ZLGnz1ZaL+6eaJX47k8zqymkJBrwQJ9NeKYVteNdHlQvnz5mygTaEpWyCSzXicFqyRi2oaqnFFOL0IQ4Pwlx4InD9QzgEtK0ssf/urs5Zx2DpKO/227397i5v3qYX7Pv7cx1xV84aqzeEvZhnvIPnfE4N42IJ6kHUdow1eJE6TRprN7P0pP2PibbgOlj76jXB/uPQ/1Bxl3e099HmiY1nO+uIuQUx9i+m60iMZSwAEvI7xVSGDGqp80YDKVSoiOzZs0tGjhgqV44tdIi6x+hw6dA0VN6rl0NWbLsk+O1IoClOpfFQMNoIgVk/lAkX1UQebh5w60I8FgSpgxVNTEkKNalOyHJIR+pmz5phLgHffRXc0wYNm0a6p+vXrfY1ORMk9qjGSoCrnqXIgVURHrwQLPFwR+wZjAw2UkVV1M43RiTRQYdSEq5v3sRY2qcWSnCneEsDS5vRRx3NRFmy7/D7enEY6URsqqIlS8hPA/qbmD0wUbfyt1ZdFjGa/4XGi4CZMOLswBwfL1WY7rvbbuULI0R9v/xCBo4cKW+q2TGuKWrD19rXk2VCL+ueXKOjffy1jiCvbT7+2FgVYsavPap8vK0KmqgTO6ADXkJdUxEHAcGXER8BdcOTOuSIh/06uLSiQ1Ve6yCsGzF6iFhTnsomzQ+ex29qPftLLVnPat4sBS1iAGEAIXHiJKauW8pha7urc3haR1yl4WhbMNYBfy3/K+CWry6k5TS+YFN154CLdfkKFUxMPctFytE9tNbFRLvAVflHW8N+tkoob1GGr0dY+Vn5cLRcpoMtGI1/sdErpuxjQA0uq7AE/F6DQ0dHgqUMx0e5PbW+u8aY6iiZSrSVqydWCH47E1hvNG/Txlhyw81oj76fPZG12qap88orZtANVnRo/yDm3jI7CyoMQpm4VdruhaLJ3o3PVbnEe2HPzp3q7vqQeV8k1/Y0wgFYEt06Z6Xjamk95zHEmEgtYPEbAw9wfXSVN1dputsWLHUiKgd/rSMxVc5gjPCChjLIpf0ETCDwj10dAQu4tLbRQP/wqIAS4qwOPCNelSft/8kaZgRu2I8/XUnwvLb6Ju7yHhPPdtaRqCU59n7HVB2JvRwmzJT9TjH1+htvybZtW+T7IQOl0tNVBL+/H+7YxQqBztt9t1+WffegWTq7BYin87AGfLSkh8aTgiAobp+uXWWRKqfwECmvo6h4UaNxaI1OWsd4uyxatJi88WYLm2LH2+P9Zf8N2jmMrji6pxPH/xfTwFH6+fIV0E6ycwukmTq7TFMNBttFG+KIkQBXPGv0G4Fi0SB7R2e3g0IKpvB4qegOkU6FNKCY2qYuTlBweSq/aLDwdhpEEQokyGUduRytroPWCKWVDvJzJ8o5rW3OljBxR4fqlpofQ9G1Y9NmCdXYWPCHh8AnPqu6bzxdtapU0s4IBME6x2qgd4i77WaniH94WX6r8dQ6K8O2GiPobY2T5YsESln35dpxjL/WEQQih2LnI52BBkHPD+7bZwtybl3rfI05UqZsOWnZvr2pKwgG2k/396QOWfUNM2I6kwUa1wpxFXpqvAcob2tFWKo4299+PdxOoESqpvHTMGkFFKeWpeAgnagCAw6WYCYrSDdVxkWt59Y+1tKbOmId424ZzHXAH8s/LOx+UOX9m+++a9xY4cqK8goFLcQqu5HKim631kORGhPtAmflH/GiYJVoCSbiwGf7pk2mg22td7SEFfBoDaQLZTJm14TAdRXWkdGRYCvDcV1uEej82D8fSP46/5ilq3t1TtsraF+g/QI3/lk6CGUJFDFGHLQtMOkKYm/WVMvYbhGBnDHgMCoi8DKOQ9nGRBUPaqD05fMX3Esr4r+rctlSLW7RZiqqA2Ot9TmLuoJYPpj9FOKuzmEfV3nHdleCwNDfRlieYD8oFPDch/VVTVVAu8qbq3RdbQu2OhGVhT/WEU/Kme06HNQRaxvc+9A2ghzcs9eh9SnaQxj4/UJnKka8wv+90kg8af+jP7FD2/KoY/ZWre7yHt1nO+uIdXfjbhkTdSTucpswzpSoRIkSkXvrcZhvxMKxnyEPpx787VD5qP27RtmAkYrefQbLe++1lKE//+IwZ281b2IUU0+0dm4W7fDAKCsRaDePjlLN12k+oys/D/9NTp06ISOG/Sg7d95rCEc3zYRyvKf39IO2LeWHnxzfU1zraVVKjRj+o+zYvs3ppWfXUY7S+uCHa599TAbrAIyIJE+e3BaM3FpvLWHy+47G34FyxgoUam3zZInZbeBWt1LNdmPaNN3d+dEpx1TRUKIi5gNeePbibrv9vtH5Hsxl3VducVlH4MaKETTM+IhRZW/FXR3yNj1/2j+m6gjrgHd3NS7LP3KGmcowyxlGur0ZgMCxMdkuQHoxLQism1qtwbdpJ8iX+m3lh2XYIuF8GRPlFu1VKKb2T33c6Ymmq6UpZtnFYFd+dcNeobNIetu+QNuojMaPQhydmI7nhIw/U726meHPWX2KTp1zCsbDDe7y5mEywjrhKan/9ourOmKd0ZdyhiDoUDSh3b9fJxBAH8EKGG6l68nSXft/tFp537p1W5q9WMdhcu7yHlPPdkcnZx1xRCVu1qGOeGIZHTe58c+z+J1i6v0PPpLt27bK4kXzjcXUA8VLyMD+vV3Sg8WUJdFVUFnpRGdZpszDsmPHNqNci046CfFYRy8mX+5pbF47Xgj1NEbTQxqHAQ2+xuoLbklvHVksrQofZzJ5zBif3SXQyUdQdmeCqaHrP/uss81+uT6Yy7qvNyQh1BFfr82T4/5QK6qMdjFUoh7TSa1crJkto27zx9+sA97dlYRe/mPzHeEdyZjbm2XYPcuYKrdQTFniSEFlKaa+UCvWYBF/rFOsE96XvriqI97n7L8j7BVTvgxI/5eS429vtG4tUFrBegkzA1ozhzve2/O1rCOes/LnPVFHqJhyfYf8zpXvlxE/a4ypt6V27bq2GFOuL+HeVn9QSFn53LBhnfWVSyXg6z2NLXiIR5W3YCHj1jF2+PBIp0FsEcxe5ky2qTuRr3JMYzT8MWKE08Mx82FCE5b1mLlj/lZHYuaqHKeCmCaI+edMorrEOtvPX9azDkT/TiSk8h+b74jok/QtBZZh37j5Wm4dKaSsHBxQl+uTTiaUsPYJtKU/1inWiZgpZbFRR6KTs0sXLuhsrHuNi2x00nF2bF61UE+u3j4TNNxATCmlcC7WEWfEuT7QCPidxVSgAQ6263E0YhJsDHi9JOCKAOuIKzrcFugEWP4D/Q4H5vWx3AbmfeVVxRwB1pGYY8mUApMA6ggtplzf2/vnCXe9P7eSAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAmQQIwQoGIqRjAyERIgARIgARIgARIgARIgARIgARIgARIgAW8JUDHlLTHuTwIkQAIkQAIkQAIkQAIkQAIkQAIkQAIkECMEQuDvGJ+SJk2a+Dw9z00CJEACJEACJEACJEACJEACJEACJEACsUbgaJBNbuEtyJD4DMIVGhoq4eHh3uaZ+/sxAd5TP745zJpfEGAd8YvbwEzEEwGW/3gCz9NGiwDLbbTw8eAgIMA6EgQ3mZcYLQKoIxTXBOjK55oPt5IACZAACZAACZAACZAACZAACZAACZAACcQSASqmYgkskyUBEiABEiABEiABEiABEiABEiABEiABEnBNgIop13y4lQRIgARIgARIgARIgARIgARIgARIgARIIJYIUDEVS2CZLAmQAAmQAAmQAAmQAAmQAAmQAAmQAAmQgGsCVEy55sOtJEACJEACJEACJEACJEACJEACJEACJEACsUSAiqlYAstkSYAESIAESIAESIAESIAESIAESIAESIAEXBPwWjGVPHlyyZQpk+TKlUsw7WGyZMlcn4FbA4ZA+gwZJF/BgpI2XbqAuSZeCAnENIF06dNLqtSpfUrW1bHJU6SQsHz5JKmPz9wkSZJI1uzZJVGiRA7zhvQzZMzocJsnK13lHcdnzppVQkJCPEmK+5CAUwKJEycWfLwVln9viXF/EiCBYCGANkveAgUkTdq0910ynrd4flofX56/9yXKFSSQAAlAB+KsnmRU3UhY/vySTPeh+E7A69ZdBlVO4Mbcvn3b97PyyARHYOSUKbJg40aZuGCBLNq8WboNHCjoyFJIgATuEYDC9ocxY2Thpk2yeMsW6dyrl8eKGHfHNnz9dVmybZtMXrxYluqyUbNmXmGvVrOmLNJ8zV61ynxKliljOx6NzA86dTLpz9+wQUZMniyZsmSxbXf3xV3eCxYpIjOWLZO5a9YYLnUbN3aXJLcHGQF0ilDGUU7+2b3b6bulWMmSsnLvXhkyerRXhFj+vcLFnUmABIKEAJRNg375Rf7eulUmLVxo3tFdeve2da7RPli9f7+s2rfP9pm/fn2Q0OFlksA9AhhU/ahrV1myfbupJ2jnP/bUU2Zjnrx55ffZs2We1ovJixaZtra3bXRy/o+A14qpS5cuyfHjx+XGjRv/pcJvAU9g+LffSs0nnpBK2jFo1aSJVKtVS157552Av25eIAl4SqBtx46SLWdOqVmhgnR8912p07ChvNy0qUeHuzoWI5htVXH07ddfy9MPPii9unSRj774QooWL+5R2jnVsrWH1t/v+/Y1eTuwZ48MHDnS1vB8rnZtqf/aa9JC89tUFVi5cueWjj16eJQ2dnKVdzR6+w8bJpvWrZOqZcvKBFUodOzZ0+O8e5wJ7pigCXw9ZIi8/Oqrsk0be7DCdmTVh4GQ7gMHyaULFxxudwaA5d8ZGa4nARIIdgJ41u7XwYAmL7wglUuXlvbarq/doMF97fuvPv5YXqxY0XyaaDuBQgLBROCNVq0EbeVB2jZGW7ZhtWpyUJW1ELRNZk6aJHVUUVWtXDn5behQ00Z/qHz5YEIUY9fqtWLq8uXLcufOnRjLABNKGAT+njdPjoaHy6WLF2X18uVy4uhRyeyFVUXCuErmkgR8IwAr0hp168oYVcIcPXzYuK0hpZdeecVtgu6OrVS1qjGh/2PUKLmonfIpv/8uZ06dkmr6krSX11u0kLGzZkndKOesrvtdPH9e/tBRURwPM2S47FmjPXW0Ebp0/nxZv3q1SS6LuvtV0peuvVsf3PSQ9piZM01erPO6yzsss3KHhcmwwYNNnuGKCAErCglYBHp37iwNtJzPnT7dWnXfsmW7drJ9y2ZZ/Ndf923DCpZ/h1i4kgRIgAScErh165b079ZNdqrF1Plz52ThnDmyS62y8xcuHOmYY0eOyBHtAxw6eFCOHDoUaRt/kEAgE8AA62vavh6sg8Ojf/5Zzp05I/tUmYu2PmTPzp0y6qefJPzff+X0yZPyqyqmIPkLFTJL/vOOgNeKKe+S596BRABuFA3UsqK/VkzEm5o0dmwgXR6vhQR8JpAxc2Zj6bFv1y7jY45O9ES1DsoToYhxlbC7Y8+dPWti6qRImdIkA5NiuD7l0Dh/9pI1Rw4polZUiOVkL6FqZrxnxw7jft1OFQDL1R3wilq+5lJLKgi271bzZCiZug0YKGOHDzcWKdnV+suSJHpOpF20RIlI8X3c5R3WKpB/1RWgxksvKZsCsnzRYoHpM4UELALo7Ny9e9f6ed+yTLnyUqt+femrloLOhOXfGRmuJwESIAHPCORUi+l82qFerW7V9jJYB8bgRg13v2eee85+E7+TQEATgBFGqjRppICGpZi9cqXM0k/r9u2dhrx4RL2L0J5Zp6EzKN4ToGLKe2ZBewRixVSuXl0ef/pp07k9qS6dFBIgAbFNCHDz5k35sn9/GdKnj2xcu9aY+ELh40qsyQScHbtGLRSvqqXqe59+KqUeflg+UJdBKKnSpc8QKdl5f86Ubz7/XJapj7u9QIl8RY+voPX2UX1h9v3yS7msiimsh0C5hO0tPvxQ9u/ZLWNHjDDrrXzhB7Yj7a/VpdDeYtbax1necQ7EI0RQyI9VqdDhvXfl1InjkkF/U0jAEwJQwn41oL/0UqXqWR2pdCYs/87IcD0JkAAJuCeAdkXP776TjWo9PX3CBHMAOthdtG1QV9sP/2vUSDD41vvHH80glfsUuQcJJHwC6SMmBXpOQ9h0ev99+aRlK3lW3VkdxZHCoOvn33wjP/brJwdUkUvxngAVU94zC9oj/lQf2v9p4GLEuSmhvuiwCqGQAAmIXFBXOQiCiN+4dk3G6ehiah1huXb1qly/ft0lInfH4vhWGqsKsSDQIEyryp4l6lp7+uSJSOluWLPanBdxeuwFZsd5dTZNBDTtrA1MKKXSaKB2mO1Dzp4+LVU0vkStl1+W7h06SMqUqcx6K1/4cT3imsb/+mukiS+sfZxdN6y9YAaNxu5vamkJdwEos3BOCgl4QqB5mzZmt+NHjgosp2AZlU7rQGmN5WAfi4rl3xOa3IcESIAE7ieAODnwhkgaklTaq9uSNcEVFFMzJk40LnxrVqyQbjpAhsGpilWq3J8I15BAABJACAwIwmGgDqCtgZhS8AKwb4PAQ2DouHHy14wZMkzjulJ8I+D13N0Y/YcriTVdKH4nTZpUEHuKEhwEYD2BOFOwwKCQAAmockeVP1Agwd3tZW2woeFWuFgx48Lmjo8nx27W2T7wgUDRM33JEvOStE+7UNGikitPHjNKA9c5S+D3/pIqlBH/Ci9VuOilTJXK+MNjn0MHDsgjTz4pH771llEYldfg7WiMHj92zEpCkmpA6sc18Clkqc7MaVlNucs74tJBUqRIKSM0wDUE7oDzNV4VhQQ8IYCG39UrV6RDj+5md7iawLUUAfob16ghiJECYfk3GPiPBEiABLwiAKVUX42LAyvslk0am1iyzhK4qRNf4ZmLfiCFBIKBAAZSoahF2bcEE8ChXQxdCLZBKTVMlVLwWOgZxbPAOoZLzwh4bTGVSjs0GdWsLWVEvJP0GhQXv9FZogQmgWwaDLmedmwR0wYBkRGMGbMTzNRp5SkkQAIiN1QpNWfqVBNk/G6EUqp6nToyTV9U7sSTY8s9/rhxh0NdhEtcBnW/mxol7RfVzB4z4MHc2F7m6ugNBAHToZBq3rq1XFBrqVURMSRgsg9FFGY7Q/1u1rKlscg6r9ZOlmBmQKSNj/2z3l3et27caAKlnjh21Lg11qxXzyjPZk2ZYiXNJQlIanXXy6dWfVbcNAToxweCgKMNNBi/9YFSc7PO8ojfllIK+7H8gwKFBEiABDwnAAVTP7WUekA9IXp37WpiVCJosxUfEusrVKokcGfC+vc++8zEo0SsSgoJBAMBDDrPnTbNzLSNkDZom8BaCl5EUEphsBdKqeMa3gYDwGH585u6gjAZFO8JeK3yPqudFXwowUMgRLXCb6o7RQed5h1yUi0pJo0ZI6PUrYhCAiRwj8CA7t1NA2+mBkaEomeWKm4naAB0T8TdsW+9+66U1/hQEFghtVAlFNzk7AXnhFhLaxtm0EGMiA5qYdLmk0/McW3ffNMo07DPHH3hInbVDzrbH0Z/4G4Hl75IEpE21kVN31Xe8dJu9/bbMlhNoP/WdDHK1LtLF3OOSOnzR1ATgMVeH53VxhLM/gh5RBuAKENRJWoZxHZrnbW0jmH5t0hwSQIkQAKRCcAt2pqhd9jEe3GlsAdiZDbX2XOzqet0r++/lxD1jIFc1pm5v9DAz9hOIYFgIdBPZ65EG2VcxKzAmDBovIbsgBQvVUqyqyU3PtZ2rB86YID8oDFnKd4RSBQWFuZ8Khzv0vJ671A1fQuPcPXw+mAeEOcEYE2RUke2j+kUmVEb/1ZmeE8tElwGKwGMksDk95I24ByJqzri7Fi4M8Fa6pZ20jEdrS+CkdEs2bLJCVUsW6549ukgyDQsqnxN31necQ6Tf23gnlGTaHtzaPvz83twEHBV/mOTAMt/bNIN/LTjq9wGPlleob8TQMgWvN/R7j914oTDwQJcA+uIv99J5i+6BGA5iLaEr+1k1hH3d8Briyn3SXKPQCUAC42oVhqBeq28LhLwlUB0Ans7OxYNQvuYT77kDW5Px44ccXooYsfh46s4yzvSM/k/etTXpHkcCUSbAMt/tBEyARIggSAkAFcmV22HIETCSw5SAvYhLoIUQaxfttcxpmI9RzwBCZAACZAACZAACZAACZAACZAACZAACZBAUBCgYioobjMvkgRIgARIgARIgARIgARIgARIgARIgAT8jwAVU/53T5gjEiABEiABEiABEiABEiABEiABEiABEggKAlRMBcVt5kWSAAmQAAmQAAmQAAmQAAmQAAmQAAmQgP8RoGLK/+4Jc0QCJEACJEACJEACJEACJEACJEACJEACQUEgUYUKFe4GxZXyIkmABEiABEiABEiABEiABEiABEiABEggjgmEh4fH8RkT1ulC4hNQaGioxOf5E9atShi55T1NGPeJuYw/Aqwj8ceeZ45/Aiz/8X8PmAPvCbDces+MRwQXAdaR4LrfvFrvCaCOUFwToCufaz7cSgIkQAIkQAIkQAIkQAIkQAIkQAIkQAIkEEsEqJiKJbBMlgRIgARIgARIgARIgARIgARIgARIgARIwDUBKqZc8+FWEiABEiABEiABEiABEiABEiABEiABEiCBWCJAxVQsgWWyJEACJEACJEACJEACJEACJEACJEACJEACrglQMeWaD7eSAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAnEEoEQX9JNnjy5hISEyK1bt+T69eu+JMFjSIAESIAESIAESIAESIAESIAESIAESIAEgpyAVxZTSZIkkezZs0vWrFklY8aMZonfSZMmDXKMwXX5iRIlksSJvSo6wQWIV0sCsUgAdc+X+ofnd1Z9XqP+OpLkKVJIBn2u+yrp0qeXVKlTOz08s743MKBBIQFfCWTPmVNQjn0Rln9fqPEYEiCBYCCAd3feAgUkTdq0910u2ht4flofX9of9yXKFSSQAAnAMMdZPcmYKZOE5c8vyXQfiu8EvNIuoENz584dOXfunJw8eVIuX75slFLptUNCCQ4CeGnN/OcfWb1/v88dhOAgxasMNgJo2DV8/XWZsWyZ/LN7t0DR46l4emyxkiVl5d69MmT0aE+TNvtVq1lTFm3aJLNXrTKfkmXK2I5HI/ODTp1kybZtMn/DBhkxebJkypLFtt3dl7Tp0skPY8bIQk1/8ZYt0rlXr0gKqIJFihgmc9esMdvrNm7sLkluDzIC7sp/1RdekHFz58rMFStk7tq18uHnnztVsDpCx/LviArXkQAJBDsBKJsG/fKL/L11q0xauNC8o7v07m3rXKN9gPb+qn37bJ/569cHOzZef5ARwKDqR127ypLt2009QXv3saeeMhTy5M0rv8+eLfO0XkxetMi0tRs1axZkhGLucr1STMF1DwqpS5cuGRe+s2fPyu3bt6mgiLn74fcptevcWVKkTOn3+WQGSSCuCXw9ZIi8/Oqrsk1fWMmSJfOq4+zJsVB0dR84SC5duOBV2jlDQ6XHt9/K9337Ss0KFeTAnj0ycORIW8Pzudq1pf5rr0mLhg2lqSqwcuXOLR179PAYX9uOHSWbWrIg7Y7vvit1NJ2XmzY1x6PR23/YMNm0bp1ULVtWJqhCrWPPnlK0eHGP0+eOgU/AVfnPmDmzdNWy+/f8+fJEsWLS/u23pclbb9kahe7osPy7I8TtJEACwUoABgf7dSCtiSr/K5cuLe3feUdqN2ggr+nSXr76+GN5sWJF82mi7QQKCQQTgTdatRK0lQdp2xht2YbVqslBVdZC0DafOWmS1FFFVbVy5eS3oUPloy++kIfKlw8mRDF2rV4ppqKeNVWqVEYpdfPmzaib+DsACTxZubKUfewx08ENwMvjJZFAtAj0VqVtg6pVZe706V6n48mxLdu1k+1bNsviv/5ymP7rLVrI2FmzpO4rr0TaXl1fphfPn5c/dFT0oiq1YIYMlz1rtKeONkKXaqd//erV5rgs6u5XSV+69m59cNND2mNmzow0EAGz5hp168oYVT4dPXxY4K4HeSkiD7DMyh0WJsMGD5Yzp05JWL58ZjuOoZCARcBV+U+TJo0ZDFm1dKlcu3rVKDkvX7wohYoWtQ43S5b/SDj4gwRIgATcEoDBQf9u3WSnWkydV2+YhXPmyC61ns5fuHCkY48dOSJHwsPl0MGDcuTQoUjb+IMEApkABlhf0/b14K+/ltE//yznzpyRfarMRZsXsmfnThn1008S/u+/clqNd35VxRQkf6FCZsl/3hHwWTEFiwC48OGhdl47PZTAJoBOKsx7v2jfXq6oCycYFLoSAABAAElEQVSFBEggMgE02O7evRt5pYe/3B1bplx5qVW/vvTVURhnkjVHDimilkiWcsjaL1TNjPfs2GGsW2HxuHzxYrmiVq+51JIKgu271TwZSqZuAwbK2OHDjUUW4vlYkkTNmJF20RIlIsW3gjUL3gX7du0yvvVQnk1Uq6g8EQooWKtA/lVXgBovvaT7FJDlixYLTJ8pJGARcFX+sW36+PECyzxY4nXt08dYbM+ZNs063CxZ/iPh4A8SIAES8JpATrWYzqcd6tUaksBeBo8aZcIIwN3vmeees9/E7yQQ0AQya2iLVDpAVkDDUsxeuVJm6ae19oWdhbx45IknTF9gnYbOoHhPwCfFFIKdZ9IgXxDLnc/7U/OIhETgs+7dZbHG+FirFZJCAiQQdwQQf+erAf2llyqVzupIjTOZ9+dM+UZj7yxTH3d7SZ8hg1EmV3j6aXlUX5h9v/xSLqtiCushUC5B2dziww9l/57dMnbECLMesaMswXak/bXGokKcQUusfWA1+2X//jJElQYbNQYQTJuh6MI54O6NoJAfq1Ktw3vvyqkTxyVDxPvDSodLEnBFAO6x6Cy9qu4lz6uCc6bGQUNIAXth+benwe8kQAIk4B0BhOno+d13slGtp6dPmGAOxmBbF20b1NX2w/8aNTKDUL1//NEMUnmXOvcmgYRJIH3EpEDP1aolnd5/Xz5p2UqeVXdWR3GkMOj6+TffyI/9+skBjQdL8Z6A11MkQSmVWTsy8Es+o52k69eve39WHpGgCFSoVEmq1Kgh7TS2Byw3LBPfMupLu1NNfi+pWwWFBEggdgg0b9PGJHz8yFFT/2AZkk4VPqW1/m1SJZBlpbVhzWrBJ6rA7Licxn+CxSNiQEEplUaVTjDbh5w9fVqqaHwJvFAbqAtf5iz33PEu2FnCXr92TcbpiGlUsfZB8PQbEfvAqgUuV3g3nNM4hDCDRmP3NzWBhrsAlFk4J4UEPCGQr2BB+eSrr+RDjSsFN1YoO6ctWWLM6UdoXDdLWP4tElySAAmQgHcEMJjUX9/RSUOSSht1W8KAEgTtixkTJ5rvsF6F21JFDVlQsUoV8z43G/iPBAKYAEJgQBAOY41OwAIxMaU0nipit1ptcHgIDB03Tv6aMUOGaVxXim8EvLKYQlR6KKXQ0cCMfPidWkfzEWuKErgEMIoCV53WH30kHXp0l5r16pmL/VT90i2XncC9el4ZCcQvAQwCXL1yxdQ91L9SDz1k4kQhQDmexZYg5k7FZ581LnXWOizh9456ithXeKnCRS+lPrOxHnLowAEprcEcu336qVEYFShS2Lxojx87ZrbjX1J110Pa+NhPFQ0LLiig4ObXWUdVYU1VWANUw3UPclRjUkBSpEgplhIB7oBo4FJIwBMCiGsIWRvRIIRCdaMG08eAib2w/NvT4HcSIAES8IwAlFJ9NS5OuvQZpGWTxi4Hm2/euGFCuKD/RyGBYCCAgVQoalH2Lbmh39EuttrDUEoNU6UUPBZ6RvEssI7h0jMCXium8DBCRymdjnpnVPM2fPCdErgEFug0mLCksD4IAAdpVL26bN+8OXAvnFdGAl4QgJIe1h05cuUyRyHIOD6eiKtjUd+suoflfA1Cvlk75viOGH+WvKhm9pgBD+bG9jJXR28gCD4OhVTz1q3lgnbuV0XEkIDJPkZ8MNsfYsk1a9lSlsybJ+fV2smSNGnTmrSRvr0y7IYqpeZMnWqCq9+NUEpVr1NHpukLGrJ140YTKPXEsaPGvQ9K7Vx58sisKVOspLkkATPA5azuHIwwh4fZfGqN8wAlanm1AFykruX2wvJvT4PfSYAESMA9AfTp+qml1AMPPii9u3Y1MSoRtNmKD4n1GASAOxPWv/fZZ8ZNH7EqKSQQDAQw+DpXY1pixumCGmcK7XrETP1TZ+KDwgqDvVBKHT9+3EwEFJY/v6krCJNB8Z6AVyrva+qqER4xAu79qXgECZAACQQugUeefFL66MwclmAGO8gj+hKzzOKtbVGX3h5rmQ7bp2Ots5bWNsyggxgRHdTCqs0nnxj3urZvvilQKkEQRLrUww/LD7//bkZ/4G7XvUMH6/B7S7ug7lHTH6Dx59Cwnanx57Btlsb/maAB0CG4brgAD1YT6L81XYwy9e7ShS4A96jyfwQBV+UfVn4oM1A8tdSAo1CwTtWyOnHMmEj8rHJpLa2NLP8WCS5JgARIIDIBhAWwZugdNvFeXCnsgViRzXX23GwaOqDX999LiIZxgWBGVEyChO0UEggWAv3UQwjt+3ERs2JjwqDxEeEtipcqJdl10gB8rO3gMnTAAPlBY69SvCOQKCws7K53h8Tc3qFq+kZFV8zx9IeUeE/94S4wD/5MIL7qCEZGs2TLJifURc8+gLnFCkHWYVGF6W59EYwOwdTZUcw5WNmigXtGTaLtzaF9OQ+PSdgEolP+UX4ts3pvKbD8e0uM+9sTiE65tU+H30kgoRHARCZ4v0Ppf+rECacDbawjCe3OMr/eEoDlINoSvraTWUfcE/fKYsp9ctyDBEiABEjAHwnA7e/YkSNOs4aZ9/DxVVwFNEeD9vjRo74mzeNIwBBAp8hXYfn3lRyPIwESCGYCcGVy1XYIZja89uAiYB/iIriuPO6u1qsYU3GXLZ6JBEiABEiABEiABEiABEiABEiABEiABEgg0AlQMRXod5jXRwIkQAIkQAIkQAIkQAIkQAIkQAIkQAJ+SoCKKT+9McwWCZAACZAACZAACZAACZAACZAACZAACQQ6ASqmAv0O8/pIgARIgARIgARIgARIgARIgARIgARIwE8JUDHlpzeG2SIBEiABEiABEiABEiABEiABEiABEiCBQCeQqEKFCncD/SJ5fSRAAiRAAiRAAiRAAiRAAiRAAiRAAiQQHwTCw8Pj47QJ5pwh8QkoNDRU4vP8CeYuJaCM8p4moJvFrMYLAdaReMHOk/oJAZZ/P7kRzIZXBFhuvcLFnYOQAOtIEN50XrJXBFBHKK4J0JXPNR9uJQESIAESIAESIAESIAESIAESIAESIAESiCUCVEzFElgmSwIkQAIkQAIkQAIkQAIkQAIkQAIkQAIk4JoAFVOu+XArCZAACZAACZAACZAACZAACZAACZAACZBALBGgYiqWwDJZEiABEiABEiABEiABEiABEiABEiABEiAB1wSomHLNh1tJgARIgARIgARIgARIgARIgARIgARIgARiiUCIL+kmT55cQkJC5NatW3L9+nVfkuAxJEACJEACJEACJEACJEACJEACJEACJEACQU7Aa4upnDlzStasWSVjxoxmmT17dkmaNGmQYwz8y0+cOLEkSZIk0ifwr5pXSALeEUiVOrXkLVBA0qRN692BEXunS59ekIYjSZ4ihYTlyydJkyVztNntOtTfrPq8TpQokcN9kX4Gfa77Kq7yjjQz63sDAxoUEogOAbyL8PFWWP69Jcb9SYAEgoWAq7ZL1Pa/L8/fYOHI6wxsAjDMcdbGz5gpk4Tlzy/JdB+K7wS8bt1dvXpVzpw5IydPnpSLFy8apVR67UxRApvAd7/+Kqv27Yv0yVewYGBfNK+OBDwkgE7voF9+kb+3bpVJCxfK4i1bpEvv3h6/oNKmSyc/jBkjCzdtMsd27tUrkhKn4euvy5Jt22Ty4sWyVJeNmjXzMGf3dqtWs6Ys0rRnr1plPiXLlLEdj0bmB506mfTnb9ggIyZPlkxZsti2u/viLu8FixSRGcuWydw1a8y11W3c2F2S3B5kBNApQhlHOfln926BktSRFCtZUlbu3StDRo92tNnpOpZ/p2i4gQRIIIgJuGu7oH2wev/+SG3/+evXBzExXnowEsCg6kddu8qS7dtNGx9t9ceeesqgyJM3r/w+e7bM03oxedEi09b2to0ejEydXbPXiqlz587JlStXjAvfpUuX5M6dOz6NXjrLENf7L4FJv/0mL1asaPsc/vdf/80sc0YCcUgAVkj7tUPd5IUXpHLp0tL+nXekdoMG8pouPZG2HTtKNrVGrVmhgnR8912p07ChvNy0qTkU1ldtVXH07ddfy9MPPii9unSRj774QooWL+5J0pIzNFR6fPutfN+3r0n/wJ49MnDkSJvS7LnataX+a69JCz1nU1Vg5cqdWzr26OFR2tjJVd7R6O0/bJhsWrdOqpYtKxNUodCxZ0+P8+5xJrhjgibw9ZAh8vKrr8o2bewlU4tAR1Z9UFZ1HzhILl244HC7MwAs/87IcD0JkECwE/C07fLVxx/b2v5NtJ1AIYFgIvBGq1aCtvIgbRujLduwWjU5qMYaELRNZk6aJHVUUVWtXDn5behQ00Z/qHz5YEIUY9fqtWIKZ06rHaVMarKWRUfV8VCDoooS+ATOqaXc0cOH5dDBg+Zz8+bNwL9oXiEJeEAA8fb6d+smO9Vi6rwq7xfOmSO71LIpf+HCbo+GaXCNunVljCpwUL/g8gZ56ZVXzLJS1arGhfaPUaPkonbKp/z+u5w5dUqq6UvSXl5v0ULGzpoldSOOs7ZV1/0unj8vf6hFF46HGTJc9qzRnjqqQFs6f76sX73aHJJF3f0q6UvX3q0PbnpIe8zMmSYvVtru8g7LrNxhYTJs8GCTZ7giQnC9FBKwCPTu3FkaaDmfO326teq+Zct27WT7ls2y+K+/7tuGFSz/DrFwJQmQAAk4JeBp2+XYkSNyJDzctP2PHDrkND1uIIFAI4AB1te0fT1YB4dH//yzoC+8Twei0V6H7Nm5U0b99JOEq7HGafUm+1UVU5D8hQqZJf95R8AnxRRM2jCqidhSeKjhQwl8As1atzZuFHDJefu99yJ1UAP/6nmFJOA5gZxqdZRPX0qr1TXJnWTMnNk8T/ft2mX809EBn6iWRXkilDjnzp41VqkpUqY0SeH5C9enHLlyRUo6a44cUkStqCzFlrUxVM2M9+zYIbdv35Z2qgBYru6AV9TaNZdaUkGwfbeaJ0PJ1G3AQBk7fLgZcMiuFlyWJNFzIu2iJUpEspB1l3dYq0D+VVeAGi+9pNdXQJYvWiwwfaaQgEUAgx137961ft63LFOuvNSqX1/6qqWgM2H5d0aG60mABEjAMwLO2i6DdWAMbtQIVfDMc895lhj3IoEAIJBZjXBSpUkjBTQsxeyVK2WWflq3b+805MUjTzxh2jPrNHQGxXsCPkWiPasdJQg6Mpm1U5VO46Ncu3bN+7PziARD4Hd1/en75VeqjEosVWrUkP9p5/mSxhgbO2JEgrkGZpQE4oIAFEg9v/tONqoF0vQJE9yeEjGaILBA/LJ/fxnSp4+xbKqnrnx4xq5ZvlyuXr4s7336qUz94w+p8eKLgnOkS58hUtrz/pxpFEBbNE6UvaTPkEGu6PEVnn5aHtUXZn21hqpQqZJgPQTKJWxv8eGHsn/PblOnX2neXKx8YR9s/+bzz83LFu7bllj7OMs7zgGFGIJCfqxKhRZqzQXfe1htUUjAEwJQwn41oL/0UqXqWR2pdCYs/87IcD0JkAAJuCfgqO2CAYMu2jbYqAPSGKxq9MYb0vvHH03YAliIU0gg0Amkj5gU6LlataTT+++rMc5t6dKnt2AoDe11e8Gg6+fffCM/9usnB1SRS/GegE+KKes0169fN50OzrRkEQncpb37xE51UXqycmWpXL06FVOBe8t5ZT4QgK95fzX1TRqSVNqo6S+UMu7kgrrZQRCA/IYq+MfpyCTiS13TiSbwjIW00t9w7UODcM0//8iSefMEllT2smHNasEnqsDsuJzGrkIwdsSvuqzWUmlUGQaXQ8jZ06elisbGwgu1gSqtMme550po5Qv7XI/IF77bi7WPs7wjjzCDhqLuN+WChiyUWTgnhQQ8IdC8TRuz2/EjRwWWU7CMSqcKz9Iay2HT2rU2SyuWf09och8SIAESuJ+As7YLFFMzJk40B8CyFW5LFdXtumKVKuZ9fn9KXEMCgUUAITAgCIexZsUK893ElNK4rIjdall7w0Ng6Lhx8teMGTJM47pSfCPglWIqpY7S4wPrKIyap9BOGJRSN27c8O3sPCrBEoArUIiP09Yn2ItmxknABQE07PqqbzksmVo2aWwsCl3sbtsEKxAooOAq97I29vBsLVysmLF+snbarLN94AOBomf6kiXmJWltx7JQ0aKSK08eM0oD1zlL4Pf+ks6EhxhWeKli1DNlqlTGHx77HDpwQB558kn58K23jMKovCqx8KI9fuyYlYQk1br+uE58AFm6YIHJI767y/tRjUkBSZEipYzQANcQuAPO13hVFBLwhADiWF7VOJYdenQ3u8PVBK6lCNDfWK13rVACLP+e0OQ+JEACJBCZgDdtl5va38MzlwYJkRnyV+ASwEAqBplR9i2B3gPtYsxaiW1QSg1TpdQynZWvpw4y23sWWMdw6RkBr2JM4QZAGWUFPk+lnRu4cFyI0CZ6dkruldAIIAhyzXr1JJsGRc6qn/o6e9JDjz4qi+fOTWiXwvySQKwQQCOtn1oEPaCz5vXu2tXEeULgQyvGkquT3lCl1JypU02A8rsRSqnqderINH3JWVLu8ceNOxzqIFziMqj73VS77djvxUaNzAx4MDe2l7k6egNBwHQopJprrLgLai21KiL+FdwNoYjCbGeo681atjQWWeftLLIwMyBm18MHijFL3OV968aNgkCpJ44dNTOX4DkC5dmsKVOsJLgkAUmt7nr5Cha0xU2Dq6fl7omAo7Dksz5Qam7WWR7x21JKASHLPwsSCZAACXhHwF3bBW0a4/qvbQO0ad777DMTYgCxKikkEAwEMHA8d9o0M1t2QY0zhbYJYqb+qTPxQSmFwV4opY4fP24GgMPy5zd1BWEyKN4T8Mpi6rLGGcEHyikoqSzLKe9PyyMSEgGMpnyknW24/0CgCYb1xeiImQcS0rUwryQQGwTgWmTNcjds4n9xpTaqq1FzD2agG9C9u1FszdSgilASzZo8WSZoAHRL3lIXvPIaHwoCK6QWqoSK6spnmRNbS+tYKIYQI6KDWpi0+eQTc1zbN98UKJUgc/SFW+rhh+UHne0Pz3W423Xv0ME6/N5S82RJ1PRd5R0v7XZvvy2D1QT6b00Xo0y9u3ShC4AFk0tDABZ7fXRWG0sw+yPkEW0AogxFlahlENutddbSOobl3yLBJQmQAAlEJuCu7ZJNXad7ff+9hOhkV5DLGlv2Cw38jLYNhQSChUA/nXUbbZRxEbMCY8Kg8Rp2A1K8VCnJrpbc+FjbsX7ogAHyg8aNpXhHIFFYWNh/PQ7vjo323qFq+hYe4eoR7cSYQKwSgJVEFp3GHqaLJ1QrbHVqo56U9zQqEf4mgcgEXNURjLDAXBgTC9gL3JlgLXVLO+mYjtYXwcholmzZ1HrpmEMzYwSZhkWVr+k7yzvyavKvDdwzahJtbw7ty3XwmIRNwFX5j80rY/mPTbqBn3Z8ldvAJ8sr9HcCmIQF73co/U+dOOFwsADXwDri73eS+YsuAQRCR1vC13Yy64j7O+CVxZT75LhHoBLAqLV9zJlAvU5eFwnEJwFnQcHRIIxu/YPb07EjR5xeHmbew8dXcZZ3pGfyf/Sor0nzOBKINgGW/2gjZAIkQAJBSACuTK7aDkGIhJccpATsQ1wEKYJYv2yvYkzFem54AhIgARIgARIgARIgARIgARIgARIgARIggaAhQMVU0NxqXigJkAAJkAAJkAAJkAAJkAAJkAAJkAAJ+BcBKqb8634wNyRAAiRAAiRAAiRAAiRAAiRAAiRAAiQQNASomAqaW80LJQESIAESIAESIAESIAESIAESIAESIAH/IkDFlH/dD+aGBEiABEiABEiABEiABEiABEiABEiABIKGQKIKFSrcDZqr5YWSAAmQAAmQAAmQAAmQAAmQAAmQAAmQQBwSCA8Pj8OzJbxThcQnoNDQUInP8ye82+X/OeY99f97xBzGLwHWkfjlz7PHLwGW//jlz7P7RoDl1jduPCp4CLCOBM+95pX6RgB1hOKaAF35XPPhVhIgARIgARIgARIgARIgARIgARIgARIggVgiQMVULIFlsiRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAAq4JUDHlmg+3kgAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJxBIBKqZiCSyTJQESIAESIAESIAESIAESIAESIAESIAEScE2AiinXfLiVBEiABEiABEiABEiABEiABEiABEiABEgglghESzGVOHFiSZIkSSxljcmSAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAkEMgGfFVPJkyeXHDlySM6cOamcCuQSEuXacN/zFiggadKmjbKFP0mABNJnyCD5ChaUtOnSxRoMDAjg461gECFr9uySKFEih4cmT5FCMmTM6HCbJyvTpU8vqVKndrpr5qxZJSQkxOl2biABdwSyR6O9wfLvji63kwAJBCsBvLudte0tIwQ8Q/Hxpf0RrFx53YFFwFUfOGOmTBKWP78k034yxXcC3vduIs6VQTtgzjo4vmeHR/orAXQoP+raVZZs3y6TFi6UhZs2yWNPPeWv2WW+SCDOCYycMkUWbNwoExcskEWbN0u3gQMFyh5PBI3Chq+/LjOWLZN/du92elyxkiVl5d69MmT0aE+Ste1TrWZNWaR1dvaqVeZTskwZ2zY0Mj/o1EmWbNsm8zdskBGTJ0umLFls2919gRLuhzFjzDNh8ZYt0rlXr0gKqIJFipjrmrtmjWB73caN3SXJ7UFGwF35r/rCCzJu7lyZuWKFzF27Vj78/HOv2h8s/0FWoHi5JEACHhGAomnQL7/I31u3mrY93tFdeve2da7RPli9f7+s2rfP9pm/fr1HaXMnEggUAq76wHny5pXfZ8+WeVovJi9aZNrajZo1C5RLj/Pr8EkxBaUUHmZXr16N8wzzhPFD4I1WreS52rVlUI8eUrVsWWlYrZoc1BcVhQRI4B6B4d9+KzWfeEIqqfKoVZMmUq1WLXntnXc8wvP1kCHy8quvyjZVHiVLlsxhpxtKru4DB8mlCxccbnd2opyhodJD8/Z9375Ss0IFObBnjwwcOdLW8ES9rv/aa9KiYUNpqgqsXLlzS0et555K244dJZtasiDtju++K3U0nZebNjWH4z3Rf9gw2bRunXluTFCFWseePaVo8eKeJs/9goCAq/KfMXNm6apl9+/58+WJYsWk/dtvS5O33vJ4YITlPwgKEC+RBEjAJwIwMNivg2FNVPlfuXRpaa9tltoNGtzXdvnq44/lxYoVzaeJthMoJBBMBFz1gdE2nzlpktRRY41q5crJb0OHykdffCEPlS8fTIhi7Fq9Vkyl0BuQWkf3L126JHfv3o2xjDAh/yWAzuVrLVrI4K+/ltE//yznzpyRffoiO3r4sP9mmjkjgTgm8Pe8eXI0PFwuXbwoq5cvlxNHj0pmDy2PenfuLA2qVpW506c7zXXLdu1k+5bNsvivvxzu87rW0bGzZkndV16JtL26Kp4unj8vf+io6EVVasFcHy57lsVjHW2ELtVO//rVq81xWdTdr5Iqnu3d+uCmh7THzJwZyXUbZs016taVMap8wvMA7nqQlyLyAMus3GFhMmzwYDlz6pSE5ctntuMYCglYBFyV/zRp0kiKlCll1dKlck0Hw6DkvKx1rFDRotbhZsnyHwkHf5AACZCAWwK3bt2S/t26yU61mDp/7pwsnDNHdqn1dP7ChSMde+zIETmi7ZtDBw/KkUOHIm3jDxIIZALu+sB7du6UUT/9JOH//iunT56UX1UxBclfqFAgY4m1a/NaMZVeOyg3b96UC9rBoQQHAXSuU2nnoIC65MxeuVJm6ad1+/ZeufsEByleZbATgKtdA7U+6q8KXMSbmjR2rEdI0NhzpegvU6681KpfX/rqKIwzyaox/4qoJZKlHLL2C1Uz4z07dsjt27elnSrAli9eLFd0YCGXWlJBsH23uuhCydRtwEAZO3y4schCPB9LkqgrL9IuWqJEpPgSsGaBhde+XbuMbz2UZxPVKipPhAIK1iqQf9UVoMZLL+k+BWT5osUC02cKCVgEXJV/bJs+frzAMg+WeF379JHr16/LnGnTrMPNkuU/Eg7+IAESIAGvCeRUi+l82qFerWEF7GXwqFEmjABCeTzz3HP2m/idBAKagLd94EfUcwLt+XUaOoPiPQGvItFCKZU0aVJjLZVO44pYgWxhQYWGIj6UwCOQPiIg8nPqmtTp/ffl1q3b0qVPb4G93BDtJFBIgATuEUA8pcrVq8vDjz0mC9Xn/OTx49FGg/g7Xw3oL71UqXRWrRWdybw/ZxoF0BaNE2UvUJBduXxZKjz9tDyqL8z6ag1VoVIlozjDflAuYXuLDz+U/Xt2y9gRI+SV5s0jBXDH9m80rg9etnfu3LElbwV5x2DFl/37m+cBrLLqqQIBii6cGwoxBIX8WJVqLdSSCr73sNqikICnBODiWk0t/15VNxNY4P2mil9YbdsLy789DX4nARIgAe8IwDK153ffyUa1np4+YYI5GO/8Lto22KgxIjFY1eiNN6T3jz8a1z9YWVFIINAJeNMHxqDr5998Iz/26ycHNB4sxXsCXimmEAQPnYyU+vCCWDMzQDGFhxcVU97fgIRwBDqaELgCrdHgsxDjT6uxZBC3BveeQgIkIPKn+pnjA2USgjXDgqiHWnpER5q3aWMOP37kqMByCpYh6VThU1p92TdpIGir/m1Ys1rwiSpwvS2n8Z8Q0BQxoC5rhz6NDizAbB9y9vRpqaLxJfBCbaBKq8xZ7rnjXVD3P0uuX7sm43TENKpY+yB4+o2IfWDVApcrvA/OnT1rXP/Q2IUyAQ1ZKLNwTgoJeEIAs1x+8tVX8qHGlYIbK5Sd05YsMS7lIzQ2myUs/xYJLkmABEjAOwKIkwNL76QhSaWNhgVAXw+C9sWMiRPNd1ivwm2pooYdqFilinmfmw38RwIBTMDTPjA8BIaOGyd/zZghwzSuK8U3Al658p3VTsZRjZtifa5cuWLOeuLECbmoMR8ogUkAnUi8pG7euGG7wBv6Pam68FjKSdsGfiEBEjAWSIgzBSul6AqCk17VZ22HHt3Np9RDDxmLIwQoh++7JYi5U/HZZ41LnbUOS/i9w7UO8augWMaoZ8pUqcx6bD904ICU1gkNun36qVEYFShS2DRGjx87hs1GUNeRNj72dR4WXFBAwc2vs46qwpqqsAaohuseBDG3IClSpBRLiQB3QDRwKSTgCYGyan0IWRsxKAKF6kaNMwWrP3th+benwe8kQAIk4BkBKKX6alycdOkzSMsmjU2cTGdHoh+AuFSWx4yz/bieBAKFgCd9YCilhqlSapnOytdTB2rtPQsChUNcXYdXiqm4yhTP418E0PGcq/E8MNsWXJXghoN4MbAMsUZV/CvHzA0JxC2BbBowvF7jxpIjVy4TNLySjihitruZkyd7lBFYncIyBMdDUMcsdzdMOgBLJuszX4OQb9aOOX6jgWjJi40amRnw4HJrL3N19AaC4ONQSDVv3VouaOd+VUQMCZjsY1QUs/0h4Hmzli1liQZyP68DEZakSZvWpI0Z9uyVYTf02TBn6lQTXP1uhFKqep06Mk1f0JCtGzeaQKknjh0VNH5r1qsnufLkkVlTplhJc0kCZkIVZ+X/YIQ5PFxAU2usQyhRy6sF4CK1SLQXln97GvxOAiRAAu4JQMHUTy2lHnjwQendtauJUYmgzVZ8SKw3rv/aNsD69z77zLjpI1YlhQSCgYC7PjAGe6GUOq6hOzARUFj+/KauIEwGxXsCXrnyRU0eFlT4UAKfQD+dtaOPzjowLmJGMARLHu/AtSfwSfAKSeB+AiFqUfSmutx16NnTbDyp1kaTxoyRURqLwRN55MknTf2y9sXsd5BHVEHlSPlrue9Z+2NprbOW1jbMoIMYER3UwqrNJ58Y97q2b74pUCpBEES61MMPyw+//26soeBu171DB+vwe0s7d92o6Q/o3t00bGfqpAjYNkuVcRM0ADoEeW/39tsyWN2A/9Z0YWnZu0sXugDco8r/EQRclX9Y+aHMQPHUUifdgIJ1qpbViVq/7MUql9bS2sbyb5HgkgRIgAQiE0BYAGuG3mET78WVwh4bNUxAc509N5uGDuj1/fcSovGFIZgR9Qt9DmM7hQSChYCrPnDxUqUku04agI/VRwaXoQMGyA8ae5XiHYFEYWFh8RYgKFRN38IjXD28yzb3ji8CCAKHERZMielIeE8dUeG6YCEAi6OUav107PBhm6Io6rXHVx1Bvc2SLZucUKWZIzNjxMWCRZWzuh31OqL+xugQzPwvOXDrhjsiGrhn1C3Y3iU4ahr8HfgEolP+UX4ts3pvSbH8e0uM+9sTiE65tU+H30kgoRHARCZ4v0Ppf0pDtzgaLMM1sY4ktDvL/HpLwF0f2F16rCPuCIlEy2LKffLcI9AI2Lv3BNq18XpIILoEEOwbH38UuP0dO3LEadYw8x4+voqrgOZo0B7X+IQUEogOAXSKfBWWf1/J8TgSIIFgJgBXJldth2Bmw2sPLgLsA8f+/WaMqdhnzDOQAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAk4IEDFlAMoXEUCJEACJEACJEACJEACJEACJEACJEACJBD7BKiYin3GPAMJkAAJkAAJkAAJkAAJkAAJkAAJkAAJkIADAlRMOYDCVSRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAArFPgIqp2GfMM5AACZAACZAACZAACZAACZAACZAACZAACTggkKhChQp3HaznKhIgARIgARIgARIgARIgARIgARIgARIggWgSCA8Pj2YKgX14SHwCCg0Nlfg8f2Df2vi5Ot7T+OHOsyYcAqwjCedeMacxT4DlP+aZMsXYJ8ByG/uMeYaETYB1JGHfP+Y+9gmgjlBcE6Arn2s+3EoCJEACJEACJEACJEACJEACJEACJEACJBBLBKiYiiWwTJYESIAESIAESIAESIAESIAESIAESIAESMA1ASqmXPPhVhIgARIgARIgARIgARIgARIgARIgARIggVgiQMVULIFlsiRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAAq4JUDHlmg+3kgAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJxBKBEG/TTZIkyX2H3L59+751XEECJEACJEACJEACJEACJEACJEACJEACJEACrgh4bTGVNWtWyZkzZ6RP6tSpXZ2D2wKAABSSUT+JE3tdfAKABC+BBP7P3nnAV1Fsf/wACb2EDiGEJuCzgUjRqOATAf8IIihFUEAsPIoNUBSUJk1CR0FFRH0IiBSlE+ABIirFQlGkSJFIAOm98z+/MRPvTW5PQsr9nc9nszc7u7Oz353ZnT1zzhnvBLJkySKBtI/8BQpIbjfP0xw5c0pk2bISmj279wK42APtt2jx4oKyuRLkH1awoKskn7Z5KjsyKKzvjpAQv8dCfDo3dwoeAmhXgbQt1v/gqSO8UhIgAf8IoN9Rpnx5yZsvX5ID8bx17P8H8vxNkik3kEAGJJAjRw637aRgoUISWa6cZNd9KIETCEizcPHiRTl27FjCcuHChcBLwCPTPYFyN9wg63btSrIs/O67dF92FpAErjcBdOzQNtbv3m06c76cP1/+/PLe1KmyYtMmWbVli/QZNsxJidOyXTtZ/euvMmfVKvlG163at/cl24R96jdqJCs178Xr1pnllqpVE9LQyXz5jTdM/st//lkmz5kjhYoUSUj39sNb2StUqiTz16yRmA0bzLU1a93aW5ZMDzIC+ChCHUc9+W7HDoGS1JXceMstsvb332X8lCmukt1uY/13i4YJJEACQUwACqexn3wiX//yi8xescK8o/tGRyd8XKN/gL6M4zfA8p9+CmJivPRgJIBB1Vf69ZPVW7eadoK++p333mtQlC5TRqYvXizLtF3MWbnS9LX97aMHI1N31xyQYuratWsCZdSZM2fMcvnyZXf5c3smIBC7d688Urt2wtK0Th05fPCgxMyfnwmujpdAAilLoHufPpIzVy6/Mn2pd28pppaojaKipPfzz0uTli3lsSeeMHlA0fWSKo7eGTpU7rv1VhnWt6+80r+/VL7pJp/OUTIiQga/845MGDHC5L9n504Z8/HHCR3PBg8/LM3btpWOes4nVIEVXqqU9B482Ke8sZOnsqPTO2rSJNn0449S7447ZKYqFHoPGeJz2X0uBHfM0ASGjh8vjz35pPyqnb3sahHoyqoPyqpBY8bK6ZMnXaa7A8D6744Mt5MACQQ7ATxrd+tgQJuHHpL7q1SRHs89Jw+3aCFtde0ob736asI3QBvtJ1BIIJgIPNW5s6CvPFb7xujLtqxfX/aqwQYEfZOFs2dLE1VU1a9eXT6bONH00W+vUSOYEKXYtQakmIIpW4kSJaSUfsAU0ZF1fHxQMi+BS5cuyT5VTtkFLjlF1CVozrRpmfeieWUkEACBe+6/X+64806jBPL1cDxPGzZrJlNVgRP355/G5Q3HNn38cZNFnXr1zDP2808/lVP6Uf7l9Oly9PBhqa8vSUdp17GjTFu0SJrFH2fTHtT9Tp04IZ/rqCiOh7k+XPbsaE8T7YR+s3y5/LR+vTkEbbuOvnQd3frgpoe8py5c6PS891Z2WGaVioyUSePGmTLDFRGC66WQgCUQrcrcFlrPY+bNs5uSrDt17y5bt2yWVUuXJknDBtZ/l1i4kQRIgATcEoBhwaiBA2WbWkydOH5cVixZItvVKrtcxYpOxxzYv1/2x8aa74D9+/Y5pfEfEsjMBKDjaKv963E6ODzlww/l+NGjskuVueivQ3Zu2yaffvCBxP7xhxz56y/5ryqmIPA2ovhPwG/F1Pnz5+W4PrywwKUvJ+KShIX5f2YekWEJtHrqKfnx++9lt1peUEiABP4mAEUOTOD79+ghZ9Wa1FcpWLiwsRLZtX278U/HB/gstSwqHa/EOa5u0zCnt1ZYMCmG61OJ8HCnUxTVwYJKakUFxbGjRKiZ8c7ffhNMUgFrrm/VHfDs6dMSrpZUEKTvUPNkKJkGjh4j0z76yFikFFcLLivZ9JzIu/LNNzvF9/FWdlirQP5QV4CGTZvq9ZWXb1euEpg+U0jAEsCgByyx3UnV6jWkcfPmMkItBd0J6787MtxOAiRAAr4RKKkGB2X1g3q9ulU7yjgdGIMbNdz9/t2ggWMSf5NApiZQWA1wcufNK+U1LMXitWtlkS5dtJ/vLuRFzbvvNv2ZHzV0BsV/An4rpqCQOq0fNVj+Us0gPnZCQ0P9PzOPyJAEiuvH7/3/938yQ19SFBIggX8IvD5okKyKiZEf9KXljyBGEwSWiQNGjZLxw4fLxh9+MObBUBZt+PZbOaeKrhdee01uq1ZNXla3Pyip8hdwHhBYtmChvP3mm7JGfdwdpYAOHEBRFnXffVJLX5gjBgyQM/r8xnYIlEtI79itmyqbd8i0yZPNdlsu/IN05D1UXQqvXr1q0vHH7uOu7DgH3hEICvmqKhV6vfC8HD50UML0fwoJ+EIASti3Ro+SYapUPaYjle6E9d8dGW4nARIgAe8E0K8Y8u67slGtp+fNnGkOwIBBX+0bNNP+w39atRIMoEW//74ZpPKeI/cggYxPoED8pEANGjeWN158UXp26iwPqDurqzhSGHR98+235f2RI2WPKnIp/hPwWzGV+BR4aLmKB5F4P/6fOQg8oi+mE2rBsdKNO0XmuEpeBQn4RyBK467VbdhQVv/vfwLrDmsGX1X9zV3NcuOY+0l1s4MgAPlFtUiF0jePjs6cP3fOxPJDPL/OGm8Kz1l0CPOpsmf1smVqMnzIMRv5ecN6cyzi9DgKzI7LVKhgrLn6aAcTSqm8qgyD2T7k2JEjUlfjSzR+7DEZ1KuX5MqV22y35cI/F+LL9cV//2sUTWYH/WP3cVd2WHvBDBqd3c/UBBruAlBm4ZwUEvCFQIeuXc1uB/fHmbYFy6j82gaqaNty7Huw/vtCk/uQAAmQQFICiJMzSt/RoSGh0kPdljCgBME33vxZs4wL3wb1lBioA2QYnKpdt27STLiFBDIhAYTAgCAcBtoA+hqIKQUvAMc+CDwEJs6YIUs1/vIkjetKCYyAX3N3w20vl2rU4c4HwW+4ldj/AysCj8ooBDAFJoIkz9HZwy6pGyeFBEjgbwIYacRIYpdXXjEb7AjLaxq7AcqgrZs3u0UFKxAon+Aq95h29tDpq3jjjcb9zR60WWf7wAKBomfe6tXmJWnTsb6hcmUJL13ajNLAdc4K/N6b6kx4iGGFlypc9HLlzm384bHPvj17pOY990i3Z54xCqMaGoAdndGDBw7YLCRUA1LfpRMgQL5R5Zu1mvJW9jiNSQHJmTOXTNYA1xC4Ay7XeFUUEvCFADp+586elV6DB5nd4WoC11IE6G+tymA7+Qrrvy80uQ8JkAAJOBOAUmqExsWBFXanNq3l9KlTzjs4/Ie+P565+PajkEAwEMBAKhS1jt+9CGWEfjHCbCANSqlJqpSCx8KQRJ4FwcAoJa/RL4sp3IDc+kFTWF0/sOA3Pqjg3kfJ/ATu04DIcPuZrcGXKSRAAv8Q+J9OFdtC24ddECQR0urBBz0qpbDPRX2GLvnqKxOg/Fq8UurBJk1krr7krFS/6y7jDldMA5PDJS5M2+FXDunYD9aMmAEP5saOYmfPRMB0KKQ6dOkiJ/WZvS4+hgRM9qGIwmxniJPVvlMnY5EFy0grsPpC3lgcJ7vwVvZfNm4UBEo9dCDOuCY2evRRozxb9OWXNmuuSUDyqLteWbXqs3HTEKAfCwRtybYrrKHU3KyzPOK3VUphP9Z/UKCQAAmQgO8EoGAaqZZS/9IZf6P79TMxKhG02caHxHZYhGOwDdtfeP11E48SsSopJBAMBKDniJk718yWXUHjTKFvAmupBWo1BaUUBnuhlDqos9VjADiyXDnTVvC9TPGfgF8q77M6aokbhLgnGMWExhCxRSjBQeDxDh2MNthaQQTHVfMqSSD1CYzW+FToHC7U+FRQEi2aM0dmagB0K888/7zU0PhQELS/jqqEgpuco+A4iF3bNCiGECOil1qYdO3Z0xz30tNPG4UY9lmiL1zErnpPFc4YfIC7HVz6nCQ+b2xLnL+nsuOl3f3ZZ2WcmkB/rfninRHdt685h1P+/CeoCcBib7jOamMFsz9CamoHEHUosSSug0i32+zaHsP6b0lwTQIkQALOBOAWbWfonTTr77hS2ANxLjvo7LnF1HV62IQJEhIfS/iMWlNhghekU0ggWAiMVO8H9FFmxIexwYRBX8THWr7pttukuFpyY7Hp4DJx9Gh5T+PGUvwjkCUyMtL9VDj+5eX33hFq+hYb7+rh98E8IF0S4D1Nl7eFhUpHBDy1EYywwFw4sSk9BgJgLXVZP9IxHW0ggpHRIsWKqfXSgQRXPMd8EGQaFlWB5u+u7DiHKb92cI+qSbSjObTj+fk7OAh4qv+pSYD1PzXpZv6806reZn6yvML0TgDGCHi/Q+l/+NAhl4MFuAa2kfR+J1m+5BKA5SD6EoH2k9lGvN8BvyymvGfHPUiABEiABAIl4C4oODqEjjGfAskfbk8H9u93eyhm3sMSqLgrO/Iz5Y+LCzRrHkcCySbA+p9shMyABEggCAnAU8ZT3yEIkfCSg5SAY4iLIEWQ6pftV4ypVC8NT0ACJEACJEACJEACJEACJEACJEACJEACJBA0BKiYCppbzQslARIgARIgARIgARIgARIgARIgARIggfRFgIqp9HU/WBoSIAESIAESIAESIAESIAESIAESIAESCBoCVEwFza3mhZIACZAACZAACZAACZAACZAACZAACZBA+iJAxVT6uh8sDQmQAAmQAAmQAAmQAAmQAAmQAAmQAAkEDYEsUVFR14LmanmhJEACJEACJEACJEACJEACJEACJEACJHAdCcTGxl7Hs2W8U4WkJaCIiAhJy/NnvNuV/kvMe5r+7xFLmLYE2EbSlj/PnrYEWP/Tlj/PHhgB1tvAuPGo4CHANhI895pXGhgBtBGKZwJ05fPMh6kkQAIkQAIkQAIkQAIkQAIkQAIkQAIkQAKpRICKqVQCy2xJgARIgARIgARIgARIgARIgARIgARIgAQ8E6BiyjMfppIACZAACZAACZAACZAACZAACZAACZAACaQSASqmUgkssyUBEiABEiABEiABEiABEiABEiABEiABEvBMgIopz3yYSgIkQAIkQAIkQAIkQAIkQAIkQAIkQAIkkEoEQgLNNzQ0VLJnzy6XL1+WCxcuBJoNjyMBEiABEiABEiABEiABEiABEiABEiABEghSAn5bTIWEhEixYsWkePHiUrBgQSlatKgUKFAgSPEF32UXLFRI8uTJE3wXzismAS8EsmbNKtmyZXNavBwSUDLOg8VfQdmK6nM7S5YsLg/NkTOnhOkzPVDJr++B3B6eDYX1XYH3B4UEAiVQvGRJ074COZ71PxBqPIYESCAYCODdXaZ8ecmbL1+Sy03ctwmk/5EkU24ggQxIIEeOHG7bCb6PI8uVk+y6DyVwAn5/3YSFhQmspc6dOydHjhyRY8eOyaVLlwIvAY/MEAQq3nijTPjsM4n54QdZ9vPPMmzCBClYuHCGKDsLSQLXg8C7//2vrNu1y2kpW6GCT6dGp7Blu3Yyf80a+W7HDoGSyJXceMstsvb332X8lCmukt1uq9+okazctEkWr1tnlluqVk3YF53Ml994Q1b/+qss17Y9ec4cKVSkSEK6tx/58ueX96ZOlRWa/6otW6TPsGFOCqgKlSqZ64rZsMGkN2vd2luWTA8yAt7qf72HHpIZMTGy8PvvzTuo25tvulWwukLH+u+KCreRAAkEOwEo7Md+8ol8/csvMnvFCvOO7hsdnfBxjf7B+t27nfo1y3/6Kdix8fqDjAAGVV/p109Wb91q2gn6u3fee6+hULpMGZm+eLEs03YxZ+VK09du1b59kBFKucv1SzGFBxi0hWfPnjVKqYsXL8qZM2fM/ylXJOaUHgm8qR+beEHVq1ZNmtapIzfddpu0fvrp9FhUlokE0ozAbFXePlK7dsLy5x9/+FSWoePHy2NPPim/6ssOLtKurJqgrBo0ZqycPnnSZbq7E5WMiJDB77wjE0aMkEZRUbJn504Z8/HHCR3PBg8/LM3btpWOLVvKE6rACi9VSnoPHuwuuyTbX+rdW4qpJQvy7v3889JE83nsiSfMfnhnjJo0STb9+KPUu+MOmakKtd5Dhkjlm25Kkg83BC8BT/UfAyD9tO5+vXy53K0DJD2efVbaPPNMQqfQGzXWf2+EmE4CJBCsBNDX2K2DYW1U+X9/lSrS47nn5OEWLaStrh3lrVdfTejXtNF+AoUEgonAU507C/rKY7VvjL5sy/r1Za8OREPQN184e7Y0UUVV/erV5bOJE+WV/v3l9ho1gglRil2rX4op+8EEzWF4eLiUKFHCuPLldDO6n2KlZEZpSgAvLrhQbFSLh+NqIXdg/37ZrtYVlW++OU3LxZOTQHojcPzoUYn780/Zt3evWXy1Jo3u00da1KsnMfPmub2kTt27y9Ytm2XV0qUu92nXsaNMW7RImj3+uFP6g/oyPXXihHyuo6KnVKkFc3247NnRnibaCf1GP/p/Wr/eHFdE3f3q6EvX0a0PbnrIe+rChU6uVBioaNismUxV5ROuG+56kKbxZYBlVqnISJk0bpwcPXxYIsuWNek4hkICloCn+p83b17JmSuXrPvmGzmvltpQcp45dUpuqFzZHm7WrP9OOPgPCZAACXglgDjBowYOlG1qMXXi+HFZsWSJ6d+Xq1jR6Vj0+/fHxpp+zf59+5zS+A8JZGYCGGBtq/3rcUOHypQPPxT083epMhd9XsjObdvk0w8+kFgdiD7y11/yX1VMQcrdcINZ849/BPxSTOHmQODKB0upU9o5xO98LnyS/SsG907PBK5duyYThg+Xxs2bCzr/nbp1k1qqGZ6mH6MUEiCBfwi079LFuNrBbe3ZF15wUuL8s1fSX1BkoZ25k6rVa5j2N0JHYdxJUR0oqKSWSFY5ZPeLUDPjnb/9JleuXJHuqgD7dtUqOXv6tISrJRUE6TvUPBlKpoGjx8i0jz4yFllQRlvJpoMRyBvKaMf4ErBmwYDFru3bjW89lGez1CqqdLwCCtYqkD/UFaBh06a6T3n5duUqgekzhQQsAU/1H2nzvvhCYJkHS7x++i7ChCtL5s61h5s1678TDv5DAiRAAn4TKKkW02X1g3q9hhVwlHGffmr6NnD3+3eDBo5J/E0CmZpAYQ1tkVsHyMprWIrFa9fKIl269OjhNuRFzbvvNv35HzV0BsV/An5For169ao5A1z4TugIPAQfJVjwsWLTTQL/ZCoCsfpxgA/b1upCAQu5zTpqvUdj3VBIgAT+JjBd3eNGDHhLlVFZpW7DhvIfVdKcVuX9tMmTk4UI8XfeGj1KhqlS6ZiO1LiTZQsWGgXQFo0T5SgFNC7gWR1IiLrvPqmlL8zmag0Vpe642A6BcgnpHVXhvHvnDlPexzt0EMSOsoL0tzWuD5Rnjs95uw8swwaMGiXjVWkAq6xHVYEARRfOgecGgkK+qkq1jmpJBd97WG1RSMBXAnBxra+Wf0+qewks8D7TUcvTqlx1FNZ/Rxr8TQIkQAL+EYBl6pB335WNaj09b+ZMczDe+X21bwCPCQxWtXrqKYl+/33j+gcrKwoJZHYCBeInBWrQuLG88eKLcvnyFek7PFowlIw+r6Ng0PXNt9+W90eO5DeyIxg/fvulmLJuKY4j+/gNVy9XMVH8KAd3TccEYCmHl9VCDYo8Rv1rYT0xcuKHggCJ/2Eg43R851i060nA0cVum7q63nP//XL/gw8mWzHVoWtXcxkH98cJLKdgGZJfFT5V1Jd9k05GYJ/HP29YL1gSC8yOq2v8J7RXxIA6ox/0eVXpBLN9yDGdxKKuxpfAC7WFKq0KF/nbHe9k/OAD9rlw/rzM0BHTxGL3QfD0i/H7wKoFLlewaoHrr31+QJmAjiyUWTgnhQR8IYAJBHq+9ZZ000ERtDEoO+euXm3M6SdrbDYrrP+WBNckQAIk4B8BxMkZpe/o0JBQ6aqeERhQgqB/MX/WLPMb1qtwW6qtYQdq161r3ucmgX9IIBMTwGArBOEwNugELBATU0rjqSJ2q+2Dw0Ng4owZsnT+fJmkcV0pgRHwy5UPiikssJDKo6P4WPAbFlT2IRZYMXhUeiaADwPM0rVWPwZgLXFJ7/f6Nd/IHXfdlRBAOT2Xn2UjgbQgAHe5EH0+Jleg9D+nE070GjzILLfdfruxOEKAcutejXMg5k7tBx4wLnWO54TfO1zrEL8KL1WMeubKndv4w2O/fXv2SBUN5jjwtdeMwqh8pYrmRXvwwIGEbEL1OpA3FkdXPlhwQQEFN78+OqqK5wNm8ITrHiROY1JAcubMJVaJAHdAdHApJOALgTvuvNPs9kN8hxAK1Y1qsQurP0dh/Xekwd8kQAIk4BsBKKVGaFyc/AXCpFOb1sbS292R6P8jLhViDVNIIBgIYCAVOg7UfSvQe6BfbPvDUEpNUqXUmpUrZYgO1Dp6FthjuPaNgF+KKWQJFz5oBwuqaRsWCOJNUTIvAQQ9hMXEo23aSJFixYxlxf9pvJhv1df8on6UUkgg2AkgUHijRx+VYho4vKguzXWGvdtr1ZJVOsW9LwIlPxTAJXRSCQhc3ay7GwIuwpLJLss1CDlcafE/OohWHmnVysyAB3NjR4nR0RsIgo9DIdVB42Cd1I/7dfExJGCyj2c6ZvvDdbTv1ElWL1smJ9TayUpejSOI2fWwOCrD0P6XfPWVCa5+LV4p9WCTJjJXX9CQXzZuFARKPXQgzsxcAkbhpUvLoi+/tFlzTQJmkMtd/d8b7zIOF9A8GucBStQaagG4MlHbYv1nRSIBEiAB/whAwTRSLaX+deutrb9a1wAAQABJREFUEt2vn4lRiaDNNj4kthvXf+0bYPsLr79u3PQRq5JCAsFAAIOvMRrTEjNOV9A4U+ibI2bqAp2JDworDPZCKXXw4EEzEVBkuXKmrSBMBsV/An6rvM+rguKAjqQjzpAZyVeXDUrmJgDXH7hRtPvPf0zQN1jNYRavd4YNy9wXzqsjAR8JYMTxFe3UwUUOgtESzFQ3JX52Dm/Z1LznHhmus3pYwex3kJr6AnRljWpNh+3+WNttdm3ToBhCjIheamHVtWdP41730tNPJyiVEUT6tmrV5L3p083oD9ztBvXqZQ//e62KKyuJ8x89aJDp2C7UgJBIW6QuvzM1ADoEZe/+7LMyTk2gv9Z8McoU3bcvXQAsTK4NAU/1H1Z+qDNQPHXSgKNQsH6ldXXW1KlO9Gy9tGubyPpvSXBNAiRAAs4EEBbAztA7adbfcaWwx0YNE9BBZ88tpqEDhk2YICE60RUEM6L21+cw0ikkECwERurMleijz4ifFRsTBn0RH97ipttuk+I6aQAWmw4uE0ePlvc09irFPwJZIiMj//ni8O/YZO8doaZvsfGuHsnOjBlcFwKYNh7aY1hQuRLeU1dUuC0YCMCSqEjRosa895COnLizJkyrNoKRUVg8HtKBBVdmxgiyDosqTHcbiGB0CKbOCPieWDCIgQ7uUTWJdjSHTrwf/8/8BJJT/1F/rVm9v6RY//0lxv0dCSSn3jrmw98kkNEIYCITvN+h9D986JDLwTJcE9tIRruzLK+/BBAIHX2JQPvJbCPeifttMeU9S+6RmQnYYMeZ+Rp5bSQQCAFYBznGZQokj9Q8Bm5/cMt1J5h5D0ug4imgOTq0B+PiAs2ax5GAIYCPokCF9T9QcjyOBEggmAlgMNpT3yGY2fDag4uAY4iL4Lry63e1fseYun5F45lIgARIgARIgARIgARIgARIgARIgARIgAQyMwEqpjLz3eW1kQAJkAAJkAAJkAAJkAAJkAAJkAAJkEA6JkDFVDq+OSwaCZAACZAACZAACZAACZAACZAACZAACWRmAlRMZea7y2sjARIgARIgARIgARIgARIgARIgARIggXRMgIqpdHxzWDQSIAESIAESIAESIAESIAESIAESIAESyMwEskRFRV3LzBfIayMBEiABEiABEiABEiABEiABEiABEiCBtCIQGxubVqfOEOcNSUtAERERkpbnzxB3KIMVkvc0g90wFve6E2Abue7IecJ0RID1Px3dDBbFZwKstz6j4o5BSoBtJEhvPC/bZwJoIxTPBOjK55kPU0mABEiABEiABEiABEiABEiABEiABEiABFKJABVTqQSW2ZIACZAACZAACZAACZAACZAACZAACZAACXgmQMWUZz5MJQESIAESIAESIAESIAESIAESIAESIAESSCUCVEylElhmSwIkQAIkQAIkQAIkQAIkQAIkQAIkQAIk4JkAFVOe+TCVBEiABEiABEiABEiABEiABEiABEiABEgglQiE+JtvtmzZXB5y5coVl9u5kQRIgARIgARIgARIgARIgARIgARIgARIgARcEfDLYipPnjxSsmTJJEvx4sVd5c1tmYwAlJIRkZGSJ2/eTHZlvBwSSDkCOXLkkDLly0vefPlSLtP4nAoXLSohIX6PJ5ij0X6L6rM6S5YsLsuVI2dOCStY0GWaLxvzFyggufUd4U6SU3Z3eXJ78BHImjWrYPFXWP/9Jcb9SYAEgoUA3t3u+i143uL5aZdAnr/BwpHXmbkJeOrfFyxUSCLLlZPs+g1ACZyAX727CxcuyLFjx5yWq1evyqVLlwIvAY/MEASqVq8hi9etk69Wr5ZVW7ZI/xEjJDR79gxRdhaSBK4HASiMXunXT1Zv3SqzV6yQFZs2yZ333uvTqdEpbNmuncxfs0a+27FDoCRylAqVKpm0mA0bTPtr1rq1Y7LX3/UbNZKVWh60YSy3VK2acAw6mS+/8Yas/vVXWf7zzzJ5zhwpVKRIQrq3H/ny55f3pk4114tnQ59hw5yUZ8ktu7fzMz3jE/BW/+0V3njLLbL2999l/JQpdpNPa9Z/nzBxJxIggSAjAGXT2E8+ka9/+cX0W/AO7xsdnfBxjf7B+t27Zd2uXQnL8p9+CjJKvNxgJ+Cpf1+6TBmZvnixLNN2MWflStPXbtW+fbAjC/j6/VJMXb58Wc6cOZOw4IGGh9bZs2cDLgAPzBgEXuzdS9bpR3O9O+6QZx5rLnUbNpRH/fw4zhhXylKSQGAEnurcWRo8/LCMHTzYtJOW9evLXu3M+SJDx4+Xx558Un5V5VF2Vfg6WjXhOTtq0iTZ9OOPJt+Z+lHee8gQqXzTTb5kLSUjImTwO+/IBFUmN4qKkj07d8qYjz9O6HiizM3btpWOLVvKE6rACi9VSnrrNfgqL/XuLcXUkhZ5937+eWmi+Tz2xBPm8OSW3dcycL+MTcBT/bdXBmXtoDFj5fTJk07tw6a7W7P+uyPD7SRAAsFOAH2N3ToY1uahh+T+KlWkx3PPycMtWkhbXTvKW6++Ko/Urm2WNtpPoJBAMBHw1L9H32Th7NnSRAei61evLp9NnCiv9O8vt9eoEUyIUuxa/VJMJT5rrly5xCqrEqfx/8xDILx0abmtWjWZpR/ERw8flp83rJevly2TxqqgopAACYgxcW/bsaOMGzpUpnz4oRw/elR2aWcv7s8/fcIT3aePtKhXT2LmzUuyP6ybSqkL7aRx40z7iyxb1uzTsFkzp33b6fmnLVokzR5/3Gn7g6p4OnXihHyuo6Kn9KMe5vpw2bPWXE20E/rN8uXy0/r15rgi6u5XR5Vqjm59cNND3lMXLjTXak8As2aUY6oqznCtcNeDNI0vg69lt/lxHZwEPNV/S6RT9+6ydctmWbV0qd3ktGb9d8LBf0iABEjAKwF8w40aOFC2qcXUiePHZcWSJbJdrafLVazodOyB/ftlf2ys7Nu7V/bv2+eUxn9IIDMTwACrp/79zm3b5NMPPpDYP/6QI3/9Jf9VxRSk3A03ZGYsqXZtASumcufOLaGhoQL3PkrmJnDm9GmBy2Zuh9hS+cPCJLx0ROa+cF4dCfhIoLC6vqF9lFeXu8Vr18oiXbr06OGzSxw6e9euXXN5Nlh8QP5Qc/qGTZuqD3t5+XblKoH5sKMULVFCKqkVlVUO2bQI3W/nb78JJqjorgqwb1etkrPapsPj80X6DnU/hJJp4OgxMu2jj4xFSnG1grKSTd0UkXflm292iu9TsHBhY+G1a/t241sP5QEU2KXjlWe+lt2eh+vgJOCp/oMIXMkbN28uI3QU0p2w/rsjw+0kQAIk4BuBkmoxXVY/qNerh4SjjPv0U+NGjTAF/27QwDGJv0kgUxPwt39f8+67TX/+Rw2bQfGfQGBRdPU8UEzhQ+rUqVP+n5VHZCgCJzSu2Hdffy0dunSR8+q2iZGUu9SkF/cfZsDuPqgz1EWysCSQDAIF4oOGN2jcWN548UW1JL0ifYdHC1RN44cPT0bOIgVUCQylEgIrvqof5h3VGgn+67B8cpRlCxYa5dUWjRPlKDj+rLpgR913n9TSF2ZztYaKqlPH5Iv9oFxCesdu3WT3zh0ybfJkebxDB0HsKCtIf/vNN01bh5Lait0HcQYHjBplrhVWWY+qKx8UXb6W3ebHNQkkJoD4U2+NHiXDVKl6TC0R3Qnrvzsy3E4CJEAC3gnkVC+YIe++KxvVenrezJnmAPTv+2rfYKPGt8RgVaunnpLo9983rn+wsqKQQGYn4E//HgPGb779trw/cqTs0XiYFP8JBKSYgqUUPjouXrxoXPn8Py2PyGgEhvTqZVyE+mmcGpjxwqqinvqkUymV0e4ky5saBKCMgcBdbsP335vfxudc4y0htlNy2slxVQzDlBgdxs/UTRCdQSiEjh05Ys5j/8DFFktigVthdY3/hICmiAEFC8i8ejzM9iHIp662ZbxQW6jSqnCRv93xTqr7n5UL58/LDB0xTSx2HwRPvxi/D+JLnT93zljT+lr2xPnyfxKwBDp07Wp+HtwfZyynYBkFi90qGsth0w8/JLQt1n9LjGsSIAES8I8A4uSM0v5FaEiodNWwABgMg6DvMn/WLPMblq1wW6qtYQdq161r+iImgX9IIBMT8LV/Dw+BiTNmyNL582WSxnWlBEYgIFe+vOqyAksZBEKnBAcBxI95Vy0/GqnFxXOtWhlLiO1bfwuOi+dVkoAXAlDuoCN3SZX1VqC4x8yVyZ1aOU7jOkBy5swlkzVIOgQudegkOsoNlStL7QceMC51jtvh9w7XOsSvgtIMo5651OIV2yH79uyRKjqpwcDXXjNKqvKVKprO6MEDBxKywXUgbyyO1wMLFrhzw82vj46qwpqq4o03GsstHOxr2RNOxB8kkIgA+hrn1FK31+BBZrnt9tuNtSAC9ENha4X135LgmgRIgAR8JwCl1AiNi5O/QJh0atNaTnvwhEEfB3GpMEsZhQSCgYAv/XsopSapUmqNzso3RAdqHT0LgoFRSl5jQIqpnPoQg+sGZ+NLyVuRvvPChzAaHlxzMBvfg488ogGPP0zfhWbpSOA6EYByJmbuXDMjXQWNMwU3O8SDWqAzddiRR09FyaPuSmUrVJAS4eFmNxxvXfV+2bjRWCkeOhAn6EA2evRRje9WWhZ9+aVTlo+owhiz98Gd0FFidPQGgokLoJCCS+5JtZbCLJsQmOxjVBSznSHgeftOnWS1Tm4AF14refPlM3kjf0dlwEW97iVffWWCq1+LV0o92KSJzNUXNMTXstvzcB2cBDzVf0woAEs+uyzXIPybdYZK/I8PJCus/5YE1yRAAiTgGwEomEaqpdS/br1Vovv1MzEqEbTZxofEduP6r30DbH/h9deNxwxiVVJIIBgIeOvfY7AXSqmDBw+aiYAiy5UzbQVhMij+EwhI5R0XF+f/mXhEhiaAF1PXnj3NNSBw8lCdIh5xpygkQAJ/ExipM9sM15k5ZsTPGoaA4l+4cH9zxavmPfeYY20aZr+D1FQFFRRb3Z99Vsapm+DX6sYHS6zovn2TmNFbd0G7tnnB9RYxInqphQnaMNzrXnr6aYFSCbJEFWqYdfO96dONNRRcBQep666TqOLKSuL8Rw8aZDq2CzXgO9IWzZkjMzUAOsTXstu8uQ5OAt7qf2Iqiesg0u02u7bHsP5bElyTAAmQgDMBuEXbGXonzfo7rhT22Khu0h10xt1i6jo9bMIECdEQLpAzak3VXyd2QTqFBIKFgKf+/U233SbFddIALLb/Dy4TR4+W9zT2KsU/AlkiIyP/+eLw79hk7x2hFjix8W4qyc6MGaQ6AQSAQ9D7g6qYdGemyHua6reBJ0jnBNBOMAqJaWNdSaBtBC5N6CQeVbdBR5dBV+dwtQ1lKlKsmBxSFz1X7RdBpmFR5a7crvJ03IbRIZTLlRtAcsvueB7+ztgEAq3/yb1q1v/kEgzu49Oq3gY3dV59eiCAmMJ4v0Ppf/jQIbdW4Gwj6eFusQypScBb/97budlGvBESCchiynu23CMzEoBrj6N7T2a8Rl4TCSSXQGq1EXQKoRQOVOD2dGD/freHY+Y9LIFK4mDsjvkkt+yOefE3CQRCgPU/EGo8hgRIINgJwJXJU98h2Pnw+oOHQGr174OHoPcrDSjGlPdsuQcJkAAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJeCZAxZRnPkwlARIgARIgARIgARIgARIgARIgARIgARJIJQJUTKUSWGZLAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiTgmQAVU575MJUESIAESIAESIAESIAESIAESIAESIAESCCVCFAxlUpgmS0JkAAJkAAJkAAJkAAJkAAJkAAJkAAJkIBnAlmioqKued6FqSRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAAoEQiI2NDeSwoDkmJC0BRURESFqeP2ju8nW8UN7T6wibp8qQBNhGMuRtY6FTiADrfwqBZDbXlQDr7XXFzZNlQAJsIxnwprHI15UA2gjFMwG68nnmw1QSIAESIAESIAESIAESIAESIAESIAESIIFUIkDFVCqBZbYkQAIkQAIkQAIkQAIkQAIkQAIkQAIkQAKeCVAx5ZkPU0mABEiABEiABEiABEiABEiABEiABEiABFKJABVTqQSW2ZIACZAACZAACZAACZAACZAACZAACZAACXgmQMWUZz5MJQESIAESIAESIAESIAESIAESIAESIAESSCUCASumcubMKTly5EilYjFbEiABEiABEiABEiABEiABEiABEiABEiCBzE7Ab8VU3rx5pUSJElKkSBEpWrSoFC9eXKCkogQHgcJ6z0NCQoLjYnmVJBAAgfwFCkjuPHkCONK3Q7JmzSpY/JVs2bJJUX1eZ8mSxeWhOfQ5HlawoMs0XzZ6u24+O3yhyH08EShesqSgHgcirP+BUOMxJEACwUAAfZYy5ctL3nz5klwu+ht4ftolkP5Hkky5gQQyIAEY5LhqJ+hXo38dWa6coC9NCZyA3183+eIfWocPH5ajR4+aB5XdFngxeGRaE8BLqWW7djJ/zRr5bseOJA2rQqVKJi1mwwZZtWWLNGvdOq2LzPOTQLoikC9/fnlv6lRZsWmTaSN9hg3zWYnrrf3ZC73xlltk7e+/y/gpU+wmn9b1GzWSlVquxevWmeWWqlUTjkMn8+U33pDVv/4qy3/+WSbPmSOFdODBV/F23Xx2+EoyePfzVv/rPfSQzIiJkYXffy8xP/wg3d58062C1RVF1n9XVLiNBEgg2AlA2TT2k0/k619+kdkrVpi+S9/oaMke7xGD/sH63btl3a5dCcvyn34Kdmy8/iAjAIOMV/r1k9Vbt5p2gn7+nffeayhgwAzfxuhfz1m5UlZu3ixtO3YMMkIpd7l+KabwgMJy5coVOX/+vJw9e9b8xjZKxiYwdPx4eezJJ+VXbWzZs2d36vTjxTVq0iTZ9OOPUu+OO2SmfhT3HjJEKt90U8a+aJaeBFKQwEu9e0sxfUE1ioqS3s8/L01atpTHnnjCpzN4an82A4zCDBozVk6fPOnUPm26u3XJiAgZ/M47MmHECFO2PTt3ypiPP07oeDZ4+GFp3ratdNTyPqEKrPBSpaT34MHuskuy3dN189mRBBc3uCDgqf4XLFxY+mnd/Xr5crn7xhulx7PPSptnnknoFLrIzmkT678TDv5DAiRAAgkEYOmxWwej26jy//4qVaTHc8/Jwy1aSFtdO8pbr74qj9SubZY22k+gkEAwEXiqc2dBX3ms9o3xHdyyfn3Zq8payJnTp6Vv9+5m+wO33y4TVLH7Yq9eUq1mzWBClGLX6pdG6erVq3Lu3DkJDQ2VwtpZhDsftIhQUlEyNoHoPn2kRb16EjNvXpILgXVFqchImTRunBxVS7nIsmXNPg2bNUuyLzeQQDASgHkv2sNUVeDG/fmnwG0N0vTxx33C4an92Qw66Ytv65bNsmrpUrvJad1OR2imLVokzRKd80F9mZ46cUI+11HRU6rUghkyXPbsaE8T7YR+ox/9P61fb/IroubIdfSl6+jWBzc95D114UInVypv181nh9Mt4j9uCHiq/wgfkDNXLln3zTdyXvsfGCA5c+qU3FC5slNurP9OOPgPCZAACXglcPnyZRk1cKBsU4upE8ePy4olS2S7Wk+Xq1jR6dgD+/fL/thY2bd3r+zft88pjf+QQGYmgAFWWECNGzpUpnz4oRxXb7FdqsxFXx9yWvsj36qlFL6Pj2na0gULzHYMqlH8J+CXYgrZw1oKYoOf4/9Lly6ZbfyTcQngZXPt2jWXF4ARZ8gfas7bsGlT9aEtr41wlZQuU8bl/txIAsFGAC8gWBru2r7d+JhDiTRLLQtLxytxvfHw1P5wbNXqNaRx8+Yyon9/t1kV1dh/ldSK0SrF7I4R2k53/vabeXZ3VwX0t6tWyVkd4QmPb9dI36HmyVAyDRw9RqZ99JGxyIJ5spVsOgCBvCvffLNTfCtv181nhyXItScCnuo/0uZ98YXAMg8WiP2GD5cLFy7IkrlznbJk/XfCwX9IgARIwG8CJdViuuwNN8h6DevhKOM+/dSEEYC7378bNHBM4m8SyNQECqsRTm4dICuvIW0Wr10ri3Tp0qNHkpAX99atK+07dZKRqryCNRX62hT/CfilmILWEKOXUEQdOHBADh48aM6YX2OrUDIvgQJhYeajtmChQvKqfhj3euF5OXzooITp/xQSIAERxFmC4Nk4YNQoGa8fzxs1Fg7c76DwSY4g/s5bo0fJMFUqYTTGnSxbsFDe1tg7a3TkxlHQfs+eOSNR990nte6+W0YMGGBMj7EdAuUS0jt26ya7d+6QaZMnm+32mvAP0pH3UI1FBctZK3Yfd9fNZ4clxXVyCMDFHB9LT6p7yf/p4MhCjYN2WpWrjsL670iDv0mABEjAPwKwTB3y7ruyUa2n582caQ7GgHVf7Rs00/7Df1q1MoNv0e+/bwap/Mude5NAxiRQIH5SoAaNG8sbL74oPTt1lgfUnbVV+/ZOF1StVi15oGFDM4iLwbTLNNpx4uPrP35NrwYrKfgj4yPEWk7hdy59mMG9D78pmY/A8WPHjPsOXlifqSYYJr/4ID125Ejmu1heEQkEQOCkuspBEET8oro2z9DRRVh3wPUI1h3JkQ5du5rDD+6PM5ZTsAzJr0qlKtWryyZVfllLx583rBcsiQVmx9U17hUCmiL2Ffzh82r7hdk+BO24rsaXgAVkC3XhK1zkbzdEe03Y50L8NeG3o9h93F03nx2OtPg7EAJlK1SQnm+9Jd00rhTcWKHsnLt6tTGnn6yxEa2w/lsSXJMACZCAfwQwiDZK+/ehIaHSVd2W7Dce+hfzZ80ymcF6dee2bVJbw37UVusQfAtQSCCzE0AIDAjCYWzQCVggC2fPNnFkEbvV9sHHxMdmRZiB6eoS++cff0jM/Plmf/7xnYBfFlPwRcYNgAUAlFF5dCQf7itQSFEp5Tv0jLZnnPqVQ3LmzCX2QwAuPXhJUUiABFS5o8ofKKDg7tZHRxdhVVRRAzXD/TW5gsGAczrRRK/Bg8xymwZXRJwoBCiHFasVvAxrP/CAcSW027CO1ZcjXAoRPw4vVbjo5cqd22xH+r49e6SKBnMc+NprRklVvlJF85w/qFaxVkL1OY+8sThOduHtuvnssAS5DpTAHXfeaQ79Ib5DCIXqRo0zFVWnjlOWrP9OOPgPCZAACfhEAEqpERMnSv4CYdKpTWsTM8fdgZcuXhR8CyK+MIUEgoEABm9N2CKt+1Yu6m/0ix37wzbtdw3pcUhjstWKn7XPbufaNwJ+Kabw4QXzeXwoIfh5QTVvwwdYYpN6307NvdITASgZMTJdIjzcFAsfvlggv2zcaIIdHjoQZ1yTGj36qISXLi2LvvzSpPMPCQQ7gYuIefPVVybI+LV4pdSDTZrI3BkzfELjqf0h4CIsmeyyXIOQb9YPc/yPDqKVR9TMHrNnwtzYUeyIDQIzQiHVoUsXOakf9+viY0jAZB8DDpjtDwHP4SO/etkyOaGWklby5stn8kb+jsowb9fNZ4clyLUnAp7q/97ffzeHwmw+j4YSgBK1hloAroyJccqS9d8JB/8hARIgAa8EoGBCTJx/3XqrRPfrZ2JUllO3aRsfEtsxCAB3Jmx/4fXXjXEC4+d4RcsdMgkB6D5iNKYlZtquoHGm8G2MeMsL1GoKCivEgK2jVoSFNBYVBn4RcqC4xmpbSmupgGqA3yrvE+qyggVWU/iYgdaQkvEJ1LznHhn+wQcJF4LZtyA1tQGi4XXXKbrHqRnj12q6i3se3bcvzXgTaPEHCYiMHjTIdPAWamBEPBsXaRycmRoA3Rfx1v4S54H8E4vdZtc2HTPoIEZEL7Ww6tqzp8C97qWnnxYolSAIIn1btWry3vTpZvQH5vmDdKpbJ3E4X+L8PV03nx1OFPmPGwKe6j+s/PC+geKpkwYchYL1K62rs6ZOdcrN1ku7toms/5YE1yRAAiTgTABhAewMvZNm/R1XCnsgRmYHnWm4mIYOGDZhgoRouBYIZkTtr89hpFNIIFgIjNSZK/GNPCN+VmxMGPSFhuyAhBUqKANGjpQ8OoALwayWY7W//b2GHKD4TyBLZGRk0i8c//MJ6IgInRUqNt5NLKAMeNB1JQBLObykjqpZI8x5XQnvqSsq3BZMBBBMHO0DU8i6krRqIxgZLVKsmBxSFz3HAOa2jAiyDouqI3/9ZTf5tfZ03b48O/w6GXfOsASSU/9Rf61Zvb8AWP/9Jcb9HQkkp9465sPfJJDRCMAQAe93KP0PHzqUEH8q8XWwjSQmwv8zGwFYDqIvkbifDE8CtBEI2og7YRtxR+af7X5bTP1zKH8FGwG8lA7GxQXbZfN6ScAvAul1UgC4/R1Qv3d3gpn3sAQqnq6bz45AqfI4RwKeOnyO+7n6zfrvigq3kQAJkIBnAnBl8tR38Hw0U0kg8xBwDHHheFXwDkhO/8Qxr2D/7VeMqWCHxesnARIgARIgARIgARIgARIgARIgARIgARJIOQJUTKUcS+ZEAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiTgBwEqpvyAxV1JgARIgARIgARIgARIgARIgARIgARIgARSjgAVUynHkjmRAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAn4QYCKKT9gcVcSIAESIAESIAESIAESIAESIAESIAESIIGUI5AlKirqWsplx5xIgARIgARIgARIgARIgARIgARIgARIgAQsgdjYWPuTaxcEQtISUEREhKTl+V3w4KZkEuA9TSZAHp7pCbCNZPpbzAv0QID13wMcJqVbAqy36fbWsGDphADbSDq5ESxGuiWANkLxTICufJ75MJUESIAESIAESIAESIAESIAESIAESIAESCCVCFAxlUpgmS0JkAAJkAAJkAAJkAAJkAAJkAAJkAAJkIBnAlRMeebDVBIgARIgARIgARIgARIgARIgARIgARIggVQiQMVUKoFltiRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAAp4JUDHlmQ9TSYAESIAESIAESIAESIAESIAESIAESIAEUolAQIqpbNmySZ48eSRHjhypVCxmSwIkQAIkQAIkQAIkQAIkQAIkQAIkQAIkkNkJ+K2Yyp8/v5QoUUIKFiwoRYsWleLFi0tISEhm58TrIwESIIFUJ5C/QAHJrUp/V5IjZ06JLFtWQrNnd5XsdRsGFIrq8zpLliwu90X+YfpcD1Q8lR15Ftb3Bd8VgdLlcZZA1qxZBYu/wvrvLzHuTwIkECwE0O8oU7685M2XL8kl43mL56ddAnn+JsmUG0ggAxKAQY6rdoJ+NfrXkeXKCfrSlMAJ+N27g6XU5cuX5fDhw3Ly5EnzoVFAP6YoGZsAXkot27WT+WvWyHc7diRpWMVLlpQXe/WSVZs3y8TPP8/YF8vSk0AqEPDWhjydMp8q/N+bOlVWbNokq7ZskT7DhjkpcdA2V//6q8xZtUq+0XWr9u09ZZckrX6jRrJS8168bp1ZbqlaNWEfdDJffuMNk//yn3+WyXPmSKEiRRLSvf3wVvYKlSqZ50rMhg3m2pq1bu0tS6YHGQFf286Nt9wia3//XcZPmeIXIdZ/v3BxZxIggSAhAGXT2E8+ka9/+UVmr1hh3tF9o6Mle7xHDPoH63fvlnW7diUsy3/6KUjo8DJJ4G8CGFR9pV8/Wb11q2kn6Kvfee+9JhHfx+jfon89Z+VKWanfyW07diS6AAn4pZiCUgoPsXPnzsn58+eNYgpKquwBjuAHWGYelgoEho4fL489+aT8qo0N99PRqgK/56nCquK//iW7du6UEN7vVLgDzDKjE/DUhrxd20u9e0sxfbk1ioqS3s8/L01atpTHnnjCHIYRzJdUcfTO0KFy3623yrC+feWV/v2l8k03ecvWpJeMiJDB77wjE0aMMPnv0TY85uOPEzqeDR5+WJq3bSsd9ZxPqAIrvFQp6T14sE95YydPZcf7YtSkSbLpxx+l3h13yExVKPQeMsTnsvtcCO6YoQn40nYwCjlozFg5rQNiju8nbxfO+u+NENNJgASClQCepbt1MLrNQw/J/VWqSI/nnpOHW7SQtrp2lLdefVUeqV3bLG20n0AhgWAi8FTnzoK+8ljtG6Mv27J+fdmrylrImdOnpW/37mb7A7ffLhNUsQtDjmo1awYTohS7Vr8UU1euXDEndjTjxEPN8f8UKxkzuq4Eovv0kRb16knMvHlJznvt2jV59N//lq6quNqm1hwUEiCBpAQ8taGke/+zBabBDZs1k6mqwIn780/j8obUpo8/bnaqo+0SCp7PP/1UTulH+ZfTp8tRtVitry9JR2mnIzTTFi2SZvHH2bQHdb9TJ07I5zoqiuNhhgyXPTva00Q7od8sXy4/rV9vDimi5sh19KXr6NYHNz3kPXXhQlMWm7e3ssMyq1RkpEwaN86UGa6IEFwvhQQsAV/aTift+G3dsllWLV1qD3Nas/474eA/JEACJOCVAIwLRg0cKNvUYurE8eOyYskS2a5W2eUqVnQ69sD+/bI/Nlb27d0r+/ftc0rjPySQmQmg/w0LqHE6ODzlww/l+NGjskuVueivQ06fOiXfqqUU+uXHNG3pggVme8HChc2af/wj4JdiClZSly5dkpw6cgn3vUKFChl3Eyqn/IOeHvfGywYKKHeCdAoJkIB7At7akLsj8fKCleKu7duNfzo+wGepZVHpeCXO8WPHjPI/Z65cJguYFMP1qUR4uFOWRTX2XyW1okIsJ0eJKFNGdv72m2BgobsqoL9Vd8CzOsITrpZUEKTvUPNkKJkGjh4j0z76yFikwDzZSjY9J/KufPPNTgMR3soOaxXIH+oK0LBpU72+8voCXyWl9ZwUErAEvLWdqtVrSOPmzWWEWgq6E9Z/d2S4nQRIgAR8I1BSLabL3nCDrFcvCUcZpwNjcKOGu9+/GzRwTOJvEsjUBApraIvcefNKeQ1LsXjtWlmkS5cePZKEvLi3bl1p36mTjFTlFayp0Nem+E/AL8UUsj+lmkF84MCtDx9TFy9elKtXr5rF/9PzCBIgARIIbgKI0QSB0n/AqFEyfvhw2fjDDybOG5RFG779Vs6dOSMvvPaa3Fatmrysbn9QUuUvEOYEbtmChfL2m2/KGh25cZQCYWFyVo+Puu8+qXX33TJiwABjeoztECiXkN6xWzfZvXOHTJs82Wy35cI/SEfeQ9WlEM97K3Yfd2XHOfC+KKiDGK+qUqHXC8/L4UMHJUz/p5CALwSghH1r9CgZpkpVjEa6E9Z/d2S4nQRIgAS8E0C/Ysi778pGtZ6eN3OmOQAD1n21b9BM+w//adXKDKBFv/++GaTyniP3IIGMT6BA/KRADRo3ljdefFF6duosD6g7a+JYr9Vq1ZIHGjY0g7jzvvhCLmufnuI/Ab+n0zt79qxgsYJZ+Rw/VOx2rkmABEiABLwTOKludhAEIL+oVqkzdGQS8aXOayy/CxcumLTO+j9c+9Ah3PDdd7J62TKBJZWj/LxhvWBJLDA7rq6xqxDQFPGr4A+fV5VhMNuHHDtyROpqfAlYMbVQF77CRf62uLLlwj4X4suF345i93FXdpQRZtDo7H6mo0hwF4AyC+ekkIAvBDp07Wp2O7g/TmA5Bcuo/KrwrFK9umxSBa619GX994Um9yEBEiCBpAQQw2+UvqNDQ0Klq7ot2dAteL7OnzXLHADL1p3btkltDS9QW61D8D6nkEBmJ4AQGBCEw9jw/ffm98LZs00sWMRutX2QMfGxWW+oXFmmq0vsn3/8ITHz55v9+cd3An4rpvJpIF48sKzVVGhoqLGi8v2U3JMESIAESMASgBUIFFBwlXtMO3tQ9Fe88Ubj/mb32ayz4GCBQNEzb/Vq85K06VjjZRheurTsUXN7uM5ZidWXY1OdCQ8xrPBShYterty5Bdsh+/bskZr33CPdnnnGKIxqqBILL9qDBw7YLCRUrWPv0sCnkG/+97+EwQhvZY/TmBSQnDlzyWSdYAECd8DlGq+KQgK+EECogHM6GNZr8CCzO1xN4FqKAP2tdXQSMVIgrP8GA/+QAAmQgF8EoJQaMXGiscLu1Ka1iZnjLoNL6iWDZy5CClBIIBgIYCAVOg/UfSvwFkO/GDG2rRLXpv2uYTkOaUy2WjprHxVTlorva79d+eBagthSRTWOSS41+4T11In4EX/fT8s90xsBuGaWrVAhIW4NAiRjsYLp45FeoGAhya0ftfjtGIPG7sc1CQQrAW9tyB2Xi6qUWvLVVyZA+bV4pdSDTZrI3BkzEg6pftddxh2umFqowiUuTN3vvnJIx46PqJk9ZsCDubGj2BcjAjNCIdWhSxc5qdZS6+JjSMBkH4oozHaGgOfwkYdF1gkHiyzMDIi8sUAxZsVb2X/ZuNEESj10IM64JjZ69FGjPFv05Zc2C65JwIQGcPf+QcBRWPLZBUrNzTrLI/63SikgZP1nRSIBEiAB/whAwYSYOP/SGX+j+/UzMSrLaYwpGx8S26Pq1NG+f0HB9hdef93Eo2T8HP84c++MSwADxzFz5xoLqQoaZwrfxoiZukCtpqCUgiU3JinCdzK+i5/UGS2L6wDaUlpLBXTT/VZ5H9aPGwQ/h5YQNyuxpjCgUvCgNCcAi4nhH3yQUA7MvgWpqQ0Q9/hpdado9dRTCemz1GoCsW86JpoBLGEH/iCBICPgrQ15wjF60CDTOVyoQRWhJFo0Z47M1ADoVp5RF7waGh8KAiukjqqESuzKZ82J7doeixl0ECOil1qYdO3Z0xz30tNPC5RKkCX6wkXsqvd0tj8812GeP0inunUSLZOVxPl7KjueHd2ffVbGqQn015ovRpmi+/alC4CFybUh4G/bSVwHkYndZtcWLeu/JcE1CZAACTgTgFu0naF30qy/40phD8S57KCz5xZT1+lhEyZIiHrHQM5onOH+GvgZ6RQSCBYCI3XmSnwjz4ifFRgTBn2hYTcgYYUKyoCRIyWPDuBCMKvlWO1vf6+eDRT/CWSJjIz854vD/+OTdUSEztgUG+/qkayMeHC6IcB7mm5uBQuSTgl4aiMIRA5zYUw/6yhwZ4K11GVV9Bz56y/HJJ9/Y2S0SLFickhd9FzFBUSQaVhUBZq/u7KjgKb82sE9qibRjubQPheeO2YaAp7qf2peJOt/atLN/HmnVb3N/GR5hemdADxl8H6H0v/woUNuDRLYRtL7nWT5kksAloPoSyTuJ8OTAG0EgjbiTthG3JH5Z7vfFlP/HMpfJEACJEACKUnAXVBwdAgdYz4Fck64PR1Qv3d3gpn3sAQq7sqO/Ez54+ICzZrHkUCyCbD+JxshMyABEghCAvCO8dR3CEIkvOQgJeAY4sIRAbwDPCmkHPflb88E/I4x5Tk7ppIACZAACZAACZAACZAACZAACZAACZAACZCAbwSomPKNE/ciARIgARIgARIgARIgARIgARIgARIgARJIYQJUTKUwUGZHAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiTgGwEqpnzjxL1IgARIgARIgARIgARIgARIgARIgARIgARSmAAVUykMlNmRAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAn4RiBLVFTUNd925V4kQAIkQAIkQAIkQAIkQAIkQAIkQAIkQAL+EIiNjfVn96DbNyQtAUVEREhanj/o7vZ1uGDe0+sAmafI0ATYRjL07WPhk0mA9T+ZAHl4mhBgvU0T7DxpBiLANpKBbhaLmiYE0EYongnQlc8zH6aSAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAmkEgEqplIJLLMlARIgARIgARIgARIgARIgARIgARIgARLwTICKKc98mEoCJEACJEACJEACJEACJEACJEACJEACJJBKBKiYSiWwzJYESIAESIAESIAESIAESIAESIAESIAESMAzASqmPPNhKgmQAAmQAAmQAAmQAAmQAAmQAAmQAAmQQCoRSDHFVI4cOQQLhQRIgARIgARIgARIgARIgARIgARIgARIgAR8IeBVMQVlU6FChSQ8PFwwzWH27Nmd8kV6iRIlpGjRomYpXry4hISEOO3DfzIHgYJaDyLLlZPsVEBmjhvKq0hxArnz5JEy5ctL3nz5Ujxvm2HWrFkFi7+SLVs2KarP5yxZsrg8NEfOnBJWsKDLNF825i9QQHD97qSwviP4bnBHh9t9IVC8ZElBPQ5EWP8DocZjSIAEgoGAp74L+ht4ftolkP5HMDDkNWZ+AtB5uOrjo1+N/jW+kdGXpgROwOvXTVhYmLGEunLlisuzFNCPETykjh49KmfOnJHQ0FDBNkrGIoCXUst27WT+mjXy3Y4dTg2rdJkyMn3xYln2008yZ+VKWblpk7Rq3z5jXSBLSwKpSAAdtrGffCJf//KLzF6xQlZt2SJ9o6N9VuJ6an+Oxb7xlltk7e+/y/gpUxw3e/1dv1Ej024Xr1snWG6pWjXhGDy/X37jDVn966+y/OefZfKcOVKoSJGEdG8/8uXPL+9NnSor9LmA6+4zbJiTAqpCpUrmuRKzYYNJb9a6tbcsmR5kBLzV/3oPPSQzYmJk4fffS8wPP0i3N990q2B1hY713xUVbiMBEgh2At76LugfrN+9W9bt2pWwLNdvAQoJBBMBDKq+0q+frN661fTx0d+98957DQIMmKF/i761+UbevFnaduwYTHhS9Fq9KqZOnz4tBw8elIsXLyY5MZRQsKA6f/68nD17NmEUP7FVVZIDuSHdERg6frw89uST8qs2Ntw/R6sKaH8Xzp4tTbQR1q9eXT6bOFFe6d9fbq9RI91dBwtEAmlBAO1ltyp02+gH9P1VqkiP556Th1u0kLa69kU8tT97PNrhoDFj5fTJk07t06a7W5dUS9fB77wjE0aMkEZRUbJn504Z8/HHCUqzBg8/LM3btpWOLVvKE6rACi9VSnoPHuwuuyTbX+rdW4rpixl5937+eWmi+Tz2xBNmP3R6R02aJJt+/FHq3XGHzFSFWu8hQ6TyTTclyYcbgpeAp/pfsHBh6ad19+vly+XuG2+UHs8+K22eeSahU+iNGuu/N0JMJwESCFYCvvZd3nr1VXmkdm2ztNF+AoUEgonAU507C/rKY7VvjL5sy/r1Za8qayFnVE/St3t3s/2B22+XCToo/WKvXlKtZs1gQpRi1+pVMQUrqKtXr7o8IRRTkMuXL0setbjJqR9OUGDRzNMlrnS9MbpPH2lRr57EzJuXpJw7t22TTz/4QGL/+EOO/PWX/FcVU5ByN9yQZF9uIIFgJIBn4KiBA2WbWkydOH5cVixZItvVAqlcxYo+4fDU/mwGnfTFt3XLZlm1dKnd5LRupyM00xYtkmaPP+60/UF9mZ46cUI+V4uuU6rUghkyXPbsaE8TVaB9ox/9P61fb44roubIdfSl6+jWBzc95D114UInVyqYNTds1kymqvIp7s8/Be56kKbxZYBlVqnISJk0bpwcPXxYIsuWNek4hkICloCn+p83b17JmSuXrPvmGzl/7pxRcp45dUpuqFzZHm7WrP9OOPgPCZAACXgl4Gvf5cD+/bI/Nlb27d0r+/ft85ovdyCBzEIAA6ywgBo3dKhM+fBDOa4eYrt0IBp9Xshp7Y98q95E6OMe07SlCxaY7RhUo/hPwKtiylOWVgF17do1ya/uHOe003jp0iUzmm+VVp6OZ1r6IYCXDe6jL1Lz7rvNvj+q2SKFBEggKYGSanVUVhW369U11hfx1v6qVq8hjZs3lxFqqehOimqsv0pqiWSVQ3a/CHXF3fnbbwJ37O6qgP521So5qyM84WpJBUH6DjVPhpJp4OgxMu2jj8wzHObJVrKpGTPyrnzzzU4DD3jxwsJy1/btxrceyrNZahVVOl4BBWsVyB/qCtCwaVPdp7y+wFcJ3IMpJGAJeKr/SJv3xRcCyzxY4vUbPlwuXLggS+bOtYebNeu/Ew7+QwIkQAJ+E3DXdxn36acmjABCFfy7QQO/8+UBJJBRCRTW0Ba5dYCsvIalWLx2rSzSpUuPHklCXtxbt66079RJRqryCtZU6GtT/CeQLMWUtaSCtRSUGid0VB5mofgNBRUl8xHAB+Wbb78t748cKXs01g2FBEjAmQCsO4a8+65sVAukeTNnOicG8B/i77w1epQMU6USRmPcybIFC+Vtjb2zRkduHKWAxgk8q5avUffdJ7VUqTxiwABjeoztECiXkN6xWzfZvXOHTJs82WxH7CgrSEfeQzUWlX3uI83ug+f9gFGjZLwqDTZqDCC4HULRhXNAIYaJE15VpVqvF56Xw4cOSpj+TyEBXwnAxRyK3ifVNfb/VMG5UOOgIcyAo7D+O9LgbxIgARLwj4Crvgu+5/pq36CZ9h/+06qVGYSKfv99M0jlX+7cmwQyJoEC8ZMCNWjcWN548UXp2amzPKDurIljLVerVUseaNjQDOJiMO0y9SAB3fBkTZ9nlU8wczt27Jj5AEGAMMcPl4BKxYPSJQFYP0ycMUOWzp8vkzRmDYUESMCZABQyo3S0JDQkVLqq6a+7SSOcj/L8X4euXc0OB/fHCSynYBmSXxU+VTTe2yZVAllLx583rBcsiQVmx9U1/hOCsSMGFPzh86rSCS6HkGNHjkhdjY0FpXMLdeErXORvd7yTOtBg5YLGEZyhI6aJxe6D4OkX4/eBVQtcrmDVclzfC3g/QFH3mXKBqyOUWTgnhQR8IVC2QgXp+dZb0k3jSsGNFcrOuatXG3P6yRob0QrrvyXBNQmQAAn4R8Bd3wX9i/mzZpnMYL2K0B61NexHbbUOwfucQgKZnQBCYEAQDmODTsACMXGXNZ4qYrfaPviY+NisCDMwXcN5/Knhb2L0e5niHwGvFlMY9YZFlHXbs//jNFBMYbE3BbEg4MLnKlC6f8Xi3umNAJRSk1QpBWuMIYmsJtJbWVkeEkgLAujYjdD4a/kLhEmnNq2N33lKlANWqOd0colegweZ5TYNrog4UQhQDqWPFbwMaz/wgHGps9uwRmw4uNYhfhxeqnDRy5U7t9mO9H179kgVDeY48LXXjMKofKWK5pl+8MABJBsJVXc95I3FvguQAAsuKKDg5tdHR1UxKFFRA1TDdQ8SpzEpIDlz5hKrRIA7IDq4FBLwhcAdd95pdvshvkMIhepGDaYfVaeO0+Gs/044+A8JkAAJ+ETAn77LJY0jjLhUMEKgkEAwEMBAKgaZUfetQM+BfrFjf9im/a6hLQ5pTLZa8bP22e1c+0bAq2Iqt37AFFQztlzqngIpoEFw8b/9IDqunUR8jBRS14wwHcnEAwsufZSMRQDKR4xMlwgPNwXHhy8WCD5koZTC7IwIchxZrpwJfM7AbgYP/5CA6aTBr/xft94q0f36mThPmBzAxljyhshT+0PARVgy2WW5BiHfrB/m+B/PWyuPqJk9ZsCDubGj2BEbBGaEQqpDly5yUp/b6+LjX8HdEIMLmO0PAc/hI7962TI5odZOVvLmy2fyRv722Y+0i4j189VXJrj6tXil1INNmshcfV5Aftm40QRKPXQgzrj3NXr0UQkvXVoWffmlSecfEgABT/V/b7zLOMzm8+jgF5SoNdQCcGVMjBM81n8nHPyHBEiABLwSgILJU98FfRoMAsCdCX2aF15/3bjpM36OV7TcIZMQwOBrjMa0xIzTFTTOFL6NETN1gc5WD4UVPBnqqBVhIY1Fhe9lhBwornFm4V1E8Z+AV5U3XPSwuBPcsAM6so4Z+fBxg/8pGY9AzXvukeE6854VzL4FqakN8KbbbjONDA1thsOMYBNHj5b3NK4MhQSCnQBc6+wsd5Nm/RNXCvGWOvgwA52n9ufKHdBaqTpyt9vs2qZhBh3EiOilFlZde/Y07nUvPf20USphHwSRvq1aNXlv+nQz+gPz/EE61a2T6LPdSuL8Rw8aZDq2CzUgJNIWafyfmRoAHYKyd3/2WRmnJtBfa74YZYru25cuABYm14aAp/oPKz/UGSieOmnAUShYv9K6OmvqVCd6tl7atU1k/bckuCYBEiABZwLe+i7FNHTAsAkTJCR+FnbMiNpfn8Po21BIIFgIjNRZt/GNbL+BMWHQF/HhLcIKFZQBGnc5jw7gQjAj91jtb3+vIQco/hPIEhkZ+c8Xh//HJ+uICHUPi4139UhWRjw43RDgPU03t4IFSacE0qqNYGS0SLFickgHElzFAUSQdVhUHfnrr4DIwYISps6YOjexwB0RHdyjahLtaA6deD/+n/kJJKf+o/5as3p/SbH++0uM+zsSSE69dcyHv0kgoxFACBe836H0P3zokNvYmWwjGe3Osrz+EoDlIPoSifvJ8CSwXkRoI+6EbcQdmX+2e7WY+mdX/iIBEiABEsioBOD2d0D93t0JZt7DEqh4CmiODu3BuLhAs+ZxJGAIeOrweUPE+u+NENNJgARIICkB4xnjoe+Q9AhuIYHMScAxxIXjFcI7IDn9E8e8gv231xhTwQ6I108CJEACJEACJEACJEACJEACJEACJEACJJA6BKiYSh2uzJUESIAESIAESIAESIAESIAESIAESIAESMALASqmvABiMgmQAAmQAAmQAAmQAAmQAAmQAAmQAAmQQOoQoGIqdbgyVxIgARIgARIgARIgARIgARIgARIgARIgAS8EqJjyAojJJEACJEACJEACJEACJEACJEACJEACJEACqUMgS1RU1LXUyZq5kgAJkAAJkAAJkAAJkAAJkAAJkAAJkEBwE4iNjQ1uAF6uPiQtAUVEREhant8LGyYHQID3NABoPCSoCLCNBNXt5sUmIsD6nwgI/80QBFhvM8RtYiHTkADbSBrC56kzBAG0EYpnAnTl88yHqSRAAiRAAiRAAiRAAiRAAiRAAiRAAiRAAqlEgIqpVALLbEmABEiABEiABEiABEiABEiABEiABEiABDwToGLKMx+mkgAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJpBIBKqZSCSyzJQESIAESIAESIAESIAESIAESIAESIAES8EyAiinPfJhKAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiSQSgSomEolsMyWBEiABEiABEiABEiABEiABEiABEiABEjAMwGviqkcOXJIoUKFJDw8XDDNYfbs2Z1y9JbutDP/ybAEsmTJIkWLF5fIcuUkR86cGfY6WHASSE0CBcLCpGyFCpIvf/6ATpO/QAHJnSePy2PR7iLLlpXQRM9glzu72JgtWzbThtGWXQnyDytY0FWST9s8lR0ZFC5aVEJCQnzKizuRgDsCWbNmFSz+Cuu/v8S4PwmQQLAQQL+jTPnykjdfviSXjOctnp92CeT5myRTbiCBDEgAOg9X7YTfyCl3M7327sL0Qws34sqVKy7P6i3d5UHcmO4I4KXUsl07mb9mjXy3Y4eT8ql4yZISs2GDLF63TuasXCkrN2+Wth07prtrYIFIIC0JfPzll/K/jRtl1v/+Z9rIwDFjnNqRp7JBkfXe1KmyYtMmWbVli/QZNsxJiYO2ufrXX2XOqlXyja5btW/vKbskafUbNZKVmjfaMJZbqlZN2AedzJffeMPkv/znn2XynDlSqEiRhHRvP7yVvUKlSua5gmcIrq1Z69besmR6kBHw9P5xRHHjLbfI2t9/l/FTpjhu9vqb9d8rIu5AAiQQhASgbBr7ySfy9S+/yOwVK8w7um90tGTX7z4I+gfrd++Wdbt2JSzLf/opCEnxkoOZAAZVX+nXT1Zv3WraCfrqd957r0HCb+SUrRleFVOnT5+WgwcPysWLF12e2Vu6y4O4Md0RGDp+vDz25JPyqzY2WMU5WlWc0TrQt3t3qXfHHfLA7bfLBH1pvdirl1SrWTPdXQcLRAJpReCjd96RRnffLXX047lzmzZSv3Fjafvccz4V56XevaWYKoAbRUVJ7+efl8i4uIgAADukSURBVCYtW8pjTzxhjsUI5kuqOHpn6FC579ZbZVjfvvJK//5S+aabfMq7pFq6DtayTRgxwuS/Z+dOGfPxxwkdzwYPPyzN27aVjnrOJ1SBFV6qlPQePNinvLGTp7Kj0ztq0iTZ9OOP5vkxUxUKvYcM8bnsPheCO2ZoAp7eP/bCYNE3aMxYOX3ypNP7yaa7W7P+uyPD7SRAAsFOAH393ToY3eahh+T+KlWkh/ZZHm7RIknf5a1XX5VHatc2SxvtJ1BIIJgIPNW5s6CvPFb7xvgWblm/vuxVZS2E38gpWxO8KqbOnDkjV69edXtWb+luD2RCuiIQ3aePtKhXT2LmzUtSrtOnTsm3ail19PBhOXb0qCxdsMDsU7Bw4ST7cgMJBCuBr5ctk7jYWEF7Wf/tt3IoLk4K+2B5BIvUhs2ayVRV4MT9+adxeQPDpo8/blDW0XYJBc/nn34qp/Sj/Mvp001brK8vSUdpp1aM0xYtkmbxx9m0B3W/UydOyOc6KorjYYYMlz072tNEO6HfLF8uP61fbw4poi67dfSl6+jWBzc95D114UJTFpu3t7LDMqtUZKRMGjfOlBmuiBBcL4UELAFP7x+7TycdHNm6ZbOsWrrUbnJas/474eA/JEACJOCVwOXLl2XUwIGyTS2mThw/LiuWLJHtapVdrmJFp2MP7N8v+7V/s2/vXtm/b59TGv8hgcxMAP1veAmN08HhKR9+KMf1O3iXKnPRX4fwGzll775XxVTKno65pVcCeNlcu3bNY/HurVtX2nfqJCO1YUJT/K26FVFIgAT+IQBXoxZqfTRK2wjiTc2eNu2fRDe/oOCFleKu7dtNDDd8gM9Sy6LS8Uqc48eOGXP6nLlymRxgUgzXpxIa989RipYoIZXUigqxnBwlokwZ2fnbb8Ydu7sqoNFuz6oVZLhaUkGQvkPNk6FkGjh6jEz76CNjkQLzZCvZ9JzIu/LNNzvF9/FWdlirQP5QV4CGTZvq9ZVXJfcqKa3npJCAJeDt/VO1eg1p3Ly5jFBLQXfC+u+ODLeTAAmQgG8ESqrFdNkbbpD1GtbDUcbpwBjcqOHu9+8GDRyT+JsEMjUBDDDnzptXymtYisVr18oiXbr06JEk5AW/kVOmGlAxlTIcgyKXarVqyQMNG5oP1HlffCGXL10KiuvmRZKArwQQT+n+Bx+Uu+67zyiA/lI3aG9iA6Vf0vY0YNQoGT98uGz84QcTnwrKog1qfXVOLVdfeO01ua1aNXlZ3f6gpMpfIMwp62ULFsrbb74pa9S60VGgIDurx0dpmWqpq+GIAQOM6TG2Q6BcQnrHbt1k984dMm3yZLPdlgv/IB15D1WXQkcLWruPu7LjHIhPWFAn0HhVlQq9XnheDh86KGH6P4UEfCEAJexbo0fJMFWqwmLXnbD+uyPD7SRAAiTgnQD6FUPefVc2qvX0vJkzzQEYsO6rfYNm2n/4T6tWZgAt+v33zSCV9xy5BwlkfAIF4icFaqDhOd548UXp2amzPKDurIljvfIbOWXuNadIShmOQZHLmPi4MzdUrizT1dz3zz/+kJj584Pi2nmRJOALgQWzZwsWfEzPiIkRWD8NVkWSJzmpbnYQBCC/eP68zNCRScSXOn/unFy4cMGkddb/4dqHDuGG776T1eo2CEsqR/l5w3rBklhgdlxdY1choCniV8EfPq8GW4fZPuTYkSNSV+NLwIqphbrwFS7yt8WVLRf2uRBfLvx2FLuPu7KjjDCDRmf3M7Uig7sAlFk4J4UEfCHQoWtXs9vB/XECyylYRuVXhWeV6tVlkypwraUv678vNLkPCZAACSQlgBh+sPQODQmVruq2ZCe8wvN1/qxZ5gBYtu7ctk1qa3iB2upBgfc5hQQyOwGEwIAgHMaG7783vxdqPx+xYBG71fZB+I1s0CT7j1fFFEbs4TpipwfF/6GhoYLYUhBv6ckuITNIdwR+V5ejQ+pvXktnJKBiKt3dHhYoHRCAhRHiTMFKyZvACgQKKLjKPaadPVgkVbzxRuP+Zo/drLPgYIFA0TNv9WrzkrTpWENhHF66tOxRc3u4zlmJVQVyU50JDzGs8FKFi16u3LkF2yH79uyRmvfcI92eecYojGqoEgsv2oMHDtgsJFRdDe/SwKeQb3TWQWs15a3siLkFyZkzl0zWCRYgcAdcrvGqKCTgCwEE5z139qz0GjzI7A5XE7iWIkB/a7XgRYwUCOu/wcA/JEACJOAXASilRkycaKywO7VpbWLmuMvgkk6EhWcuvgspJBAMBDCQCkUt6r4VTAiHfjF0I1aJa9P4jWxJBLbO6u2w3PoBU1DN2HLFxzcpoEFw8T8+jiDe0r3lz/T0QSCPWniUrVAhIW4NAiRjgWCUGgGYMYU8Pmqf1Fk7iuvHwVJaS6WPm8dSpDmBYhow/FFV/iDuE4KGo71gBo+Fc+Z4LdtFVUot+eorE6D8WrxS6sEmTWTujBkJx1a/6y7jDofzwCUuTN3vvnJIx46PqJk9ZsCDubGjWOUxJi+AQqpDly5yUq2l1sXHkIDJPhRRmO0MZUccOVhknXCwyMLMgMgbi3324xzeyv7Lxo0mUOqhA3HGNbHRo48a5dmiL790LCJ/BzkBT+8fBByFJZ9doNTcrLM84n+rlAI+1v8gr0S8fBIgAb8JQMGEuLH/0hl/o/v1MzEqy2mMKRsfEtuj6tQRuDNh+wuvv24MEhhj1m/UPCCDEsDAcczcucZCCuE68G2MmKnwjoBSit/IKXtjvaq8j+nHCRZ34i3d3XHcnr4IwGJi+AcfJBQKs29BamIGr0IFZcDIkZJHP04hmLEDU2Z+r1YbFBIgAZEQHTl5Wl2Oeg0ZYnD8pdZGs6dOlU/V9c4XGT1okOkcLtSgilASLVKF1kwNgG7lGXXBq6HxoSCwQuqoSqjErnzWnNiu7bGYQQcxInppm+3as6c57qWnnzZKJeyzRF+4iF31ns72h9EfmOcP6tXLHv73WstkJXH+nsqOl3b3Z5+VcWoC/bXmi1Gm6L596QJgYXJtCHh6/yQejcQBieug47bEaaz/BjH/kAAJkEASAnCLtjP0Tpr1d1wp7IQ4lx109txi6jo9bMIECVFPGcgZnXW4vwZ+RjqFBIKFwEiduRLfyDPiZwXGhEFfaNgNCL+RU7YWZImMjPzniyNl8/aaW4TO2BQb7+rhdWfukKYEYCWBIMmQw4cOuS0L76lbNEwIAgKwOMql1ocHdBrZxB/I9vI9tRG0MZgLY/pZR4E7E6ylLqui58hffzkm+fwbI6NFihWTQ6o0s654jgcjLhYsqgLN313ZcQ5Tfu3gHlWTaEdzaMfz83dwEPBU/1OTAOt/atLN/HmnVb3N/GR5hemdAEK24P2OPg36/64GC3ANbCPp/U6yfMklAMtB9CUS95P5jZxcsv8c79Vi6p9d+SuYCeBF5EkhFcxseO0kYAnAiimxJZNN82XtLig4OoSOMZ98ySvxPnB7OqCx4dwJ4mJhCVTclR35mfLHxQWaNY8jgWQTYP1PNkJmQAIkEIQE4Mrkqe8QhEh4yUFKwDHEhSMCfiM70kjeb68xppKXPY8mARIgARIgARIgARIgARIgARIgARIgARIgAdcEqJhyzYVbSYAESIAESIAESIAESIAESIAESIAESIAEUpkAFVOpDJjZkwAJkAAJkAAJkAAJkAAJkAAJkAAJkAAJuCZAxZRrLtxKAiRAAiRAAiRAAiRAAiRAAiRAAiRAAiSQygSomEplwMyeBEiABEiABEiABEiABEiABEiABEiABEjANYEsUVFR11wncSsJkAAJkAAJkAAJkAAJkAAJkAAJkAAJkEByCMTGxibn8Ex/bEhaAoqIiJC0PH+mv7tpcIG8p2kAnafMUATYRjLU7WJhU5gA638KA2V214UA6+11wcyTZGACbCMZ+Oax6NeFANoIxTMBuvJ55sNUEiABEiABEiABEiABEiABEiABEiABEiCBVCJAxVQqgWW2JEACJEACJEACJEACJEACJEACJEACJEACnglQMeWZD1NJgARIgARIgARIgARIgARIgARIgARIgARSiQAVU6kEltmSAAmQAAmQAAmQAAmQAAmQAAmQAAmQAAl4JkDFlGc+TCUBEiABEiABEiABEiABEiABEiABEiABEkglAiEpkW+OHDkkJCRELl++LBcuXEiJLJkHCZAACZAACZAACZAACZAACZAACZAACZBAJifg1WIKSqdChQpJeHi4YJrD7NmzJyDJli2bFC9eXIoWLSoFCxY0a/wfGhqasA9/ZD4CWbNmFSwUEiAB1wSyZMmSam0k0PaH53VRfT6jbK4kR86cEqbP8UAlf4ECkjtPHreHF9b3BAYwKCQQKIHiJUsK6nEgwvofCDUeQwIkEAwE8O4uU7685M2XL8nlos+B56dd2P9PgogbgoQAdCKu2gn61ehfR5YrJ+hLUwIn4FW7EBYWJrgRV65cSXIW3IirV6/K8ePH5f/buxN4q8b9j+O/KCppLkqSQv6Gi6TcUK4pl4hQhEyXbuZrVihDuKWikCnhunFTQpNKt5KxMmROKUOalUYqbv/f93HWsc/p7Om0j9M5+/O8Xvvss/ca9lrvvdZez/qt3/OspUuX2tq1a0NQqoqfoFBKloAOSh3OO89GvfmmvT17dtwda+/99rN3v/rKHn722ZK1giwtAn+QgCp2Y95+26bPm5fySXRR73/HtWljkz/6yF6dNi089jvwwFwNVTL/ccstNvWzz2zihx/a4BEjrHrNmrnDk/2zY+XK9siQITbJ5z/lk0/stl698gSgGu21V/hdGT9jRhjermPHZLNkeJYJJNv+jz3xRBs6fryNeecdG//ee3bNrbfGDbAWRMf2X5AK7yGAQLYLKNjU/+mn7fVPP7UXJ00Kx+juvXvbdn7ep6L6geoy0+bOzX1M/OCDbGdj/bNMQBdVr+/Rw6Z+/nnYT1TfPfSII4KCLpipfqv69YjJk23yxx9bp86ds0woc6ubNDC1Zs0aW7x4sW3YsGGzT1XTPQWkNI6a8K1YsSIEsPRDRylZAvc+/LCdfu659pnvbMqKKyirQlHgng/0tzWrVhU4vGStMUuLQNEIXHvbbVa+QoW0Zl6U+18dz3S9+8EHbWCfPtamRQv7es4ce+Cpp3Irnq1PPtnO6NTJOnfoYOd4AKvuLrtYt7vvTnn5r+7WzWr7gVnz7nbFFdbW53P6OeeE6XUs6DdokH30/vt27MEH2zAPaHe75x5rvM8+Kc+fEUu/QKLtv1qNGtbDt93XJ060w/be2667+GI7+29/y60UJtNh+08mxHAEEMhWAdX15/nF6LM9+H/UAQfYdZdcYie3b2+d/Dm23HnDDXZKy5bhcbbXEygIZJPABZdeaqor9/e6seqyHY47zr7xYK3KWo+BdL/22vD+MQcdZAM9sHtV167WpFmzbCLK2LomDUwpC0pZUamUihUrhgyBjRs3pjI642xFAr39ZLr9scfa+JEj4y5VF9/xPv/kY5syYULccRiAQDYLHH7UUXbwoYeGIFA6DpnY/87zKzTPjR1r7c46K89HH+8H09UrV9p//Kroag8qKw1ZTfaiqz1tvRL6hp/0fzB9epiupqcjt/KDbmyzPjXT07yHjBmTJwtM2bQntGtnQzz4tPD7703N9VROzVkGZWbtUr++DRowwJYvW2b1GzQIwzUNBYFIINH2X6lSpRDonfbGG/bzTz+FIOfa1attj8aNo8nDM9t/Hg5eIIAAAkkFlGDQ7667bJZnTK301i+Txo2zLz17evc998wz7aIFC2zB/Pn23Tff2ILvvsszjBcIlGYBXWBVBtSAe++1Z594wn5cvtzmejBXdV6VNV4fecszpVTHXeHDJoweHd7XRTVK+gJJA1OpzlJZNmrCpx+5lX4SRClZAjrYbNq0Ke5CH9j0EDvpjDOsz+23xx2HAQhks4ACOUqBv/2662ydB/TTKZnY/2rtvLPt5ZlIUXAo+vx6u+1mc774ImSzKpvrrSlTbJ1f4anrmVQqGj7b05MVZLrr/gfsuSefDBmRSk+Oyraexqx5N9533zx9Z+nAq9/+uV9+GdrWK3g93LOids0JQClbReVbbwpwwqmn+jgN/QA+xXb1z6QgEAkk2v41bOQLL5gy85SJ1+O++0KG9rhXXokmD89s/3k4eIEAAgikLVDHM6Yb7LGHTfduPWLLgGeeCd14qLnfX1q3jh3E/wiUaoEa3rVFRb9A1tC7pXj13XdtrD8u83p+/i4vjjj6aDu/Sxfr68ErZVOprk1JXyAjgSl1dq4O0lWi5nzpLwpTbK0C6v/jzvv7WS8/qVU0mIIAApsL3Nyzp03xfnDe84NWJkuq+99ro8fYP73vnTf9yk1sqeL9BCpQ1uLII635YYdZnzvuCKnHel9FwSUN73zNNTZvzmx7bvDg8L76joqKhmve93pfVLEZtNE4ypK9o18/e9iDBjO9DyA1+1WgS5+h/gmr+fHhBg9qd73yClu2ZLFVzTleRPPnGYFEAmpirpOlc715yV89wDnG+0FTFwKxhe0/VoP/EUAAgfQE1AXBPQ89ZDM9e3rksGFhYl2w7u51g3Zef/j7mWeGi1C9H300XKRKb+6MjUDJFKiSc1Og1iedZLdcdZXd2OVSO8abs555/vl5VqhJ8+Z2zAknhIu4upj2C63H8vik+mKLb5GkoFQNP7FRO+XlHrRQX1OU0iVw4eWXhxVavGChKXNKV6Yr+wnnAU2b2kd+Epoo06p0SbA2CBQs0KJVKzvaD0jXev832keiNPgDfR+Z5WnxSvUtbEl1//twxnTTI39R2nFT7/9J2VzqA0rt4St50Elp+yorfvjBjvb+JZTF1N6b8NWo+VtzvFUxma/rf/7ZhvoV0/wlGkedp2/IGUdZLWpypWPBj97voNKgVdn9t19FUnMBBbP0mRQEUhFo0KiR3XjnnXaN9yulZuQKdr4ydWpIpx/sfSNGhe0/kuAZAQQQSE9AF5P6+TG6XNlydrk3W4pueKX6/ajhw8PMlL06Z9Ysa+ndfrT07BAdzykIlHYBdYGhou4wZvgNWFTGvPhi6E9VfbdG58AP5PTNqm4Gnvcmsd9/+62NHzUqjM+f1AWSZkzpqvcOnjET3R40eq2PUC/1CkrpxEN9Uem1xlVfU5TSI6Cg40/r1lnXu3uGx5+8czf1U6MOkvXdUxDIdgFdaVRztsuuvz7sI21OOy2Q3OR9N0TN2gprlOr+p4Nhy2OOCU3qYj9rvh8ctQzqP04HVTXRq+C/0Xpf5buvv7YDvDPHu266KQSMGu61ZzjQLl60KHc25by5nuatR3Qs0EBlUCoApWZ+t/lVVWVT7ekdVKvpnspC75NCpXz5ChYFEdQcUBVcCgKpCKjPNpX3ciqECqjO9M70FQyOLWz/sRr8jwACCKQmoKBUn8cft8pVqlqXszsmvJC20W+EpS5bdL5HQSAbBHQhVYFabftR0Q3hVC+OrQ9Hw77yc4El3idb85y79kXv85yaQNLAlIJM1TyNrULOXabUj5ReKyChHyY9dOJU2a+C63099D+lZAkooKgr0zvXrRsWXIEnPVTU4ZsyKaLHRO8E+WM/MdBrHaAoCGS7wH9ffTV3/9B+oX1G5czjj7fP/daxyUom9r9TPM1ed8BTunFsia7YqGNGBaQuvOwyW+Un99Ny+pBQyr6u+Ohum+onS23kp772mq30bKeoVNpxxzBvzT82GL3Bg1LjXn45dK6+KScodXzbtvbK0KFh0k9nzgwdpS5ZtDA071PAru6uu9rYl16KZs0zAuGCVrzjzzdffRWElDa/g/fzoCDqIZ4BONmbzcYWtv9YDf5HAAEEkgvoHE594vzf/vtb7x49Qh+Vu3uz6ah/SL2viwBqzqT3r7z55tBMn/5zktsyRukQ0MXX8d6npe443cj7mdK5sfpMHe1ZUwpYqZVEK88iVJ9TuvCrLgd28r7aJpAtVagNIGnIW31G6VFQ0RcyP+eKeEHDea/kCDQ7/HC777HHchdYd99SaeY7YJTSmzvQ/4lSF2Pf438EECicQCb2v2ifjJ6jJdEddNRHRFfPcLz8xhtD87qrL7rIFFRSUSfSf2rSxB55/vlw9Ufp+T39Vrd5SsyNEfLP/37vW0sV2zHet5aGjfX+f4Z5B+gq+u1Q88YBngL9us9XV5l6d+9OE4A8uLxItP0ry0/bjAJPXbzDUQVYX/ZtdfiQIXngou0yeo4Gsv1HEjwjgAACeQXULUd0h95Bw3/rV0pjqK/IC/3uubW9645eAwdaWe+2RUV3RNUNXjScgkC2CPT11g86Rx6ac1d63TDohZzuLapWr2Z39O1rO/gFXBXd1bK/17ff8S4HKOkLlKlfv/6m9CfLzBT1/I5NBLYyY7m1zIXvdGv5JliOrVWguPYRXRmtWbu2LfEmerEdmEdO6mRdGVU/LF0avZXWszpRV6pzQf1pKatWFdzlnhIdmw6d1gcwcqkQ2JLtX9tvlFafLgbbf7pijB8rsCXbbex8+B+BkiagLlx0fFfQf9mSJQVerNY6sY+UtG+W5U1XQJmDqkvkryerJYH2ERXtI/EK+0g8md/fT5ox9fuo/IcAAgggUFIF1Ox2kbd7j1d05z09ClsSdWiuCu3ihQsLO2umQyAIJKrwJSNi+08mxHAEEEBgcwE1ZUpUd9h8Ct5BoHQKxHZxEbuGah2wJfWT2Hll+/9J+5jKdiDWHwEEEEAAAQQQQAABBBBAAAEEEECgaAQITBWNK3NFAAEEEEAAAQQQQAABBBBAAAEEEEgiQGAqCRCDEUAAAQQQQAABBBBAAAEEEEAAAQSKRoDAVNG4MlcEEEAAAQQQQAABBBBAAAEEEEAAgSQCBKaSADEYAQQQQAABBBBAAAEEEEAAAQQQQKBoBMq0aNFiU9HMmrkigAACCCCAAAIIIIAAAggggAAC2S0wf/787AZIsvZlixOoXr16Vpyfn8SGwYUQ4DstBBqTZJUA+0hWfd2sbD4Btv98ILwsEQJstyXia2Ihi1GAfaQY8fnoEiGgfYSSWICmfIl9GIoAAggggAACCCCAAAIIIIAAAgggUEQCBKaKCJbZIoAAAggggAACCCCAAAIIIIAAAggkFiAwldiHoQgggAACCCCAAAIIIIAAAggggAACRSRAYKqIYJktAggggAACCCCAAAIIIIAAAggggEBiAQJTiX0YigACCCCAAAIIIIAAAggggAACCCBQRAJlMzHf7bff3sqWLWu//PKLrV+/PhOzZB4IIIAAAggggAACCCCAAAIIIIAAAqVcIGnGlIJO1atXt7p165puc7jddtvlIalTp47VqlXLqlWrFp532mknK1euXJ5xeFHyBbbZZhvbdtttcx96TUEAgd8F8u8j2l/SLZWrVLGKO+xQ4GTbly9v9Rs0sHL5foMLHLmAN7U8tfz3uUyZMgUMNdP8q/rveGFLomXXPGv4cUIXMCgIbImA9rPCHH/Y/rdEnWkRQKA0C6jesVvDhlZpxx03W838dZvC/P5uNlPeQKAECigmUtB+onq16tf1d9891KVL4KptNYucNLpQtWpV0xfx66+/FrjQP/30ky1fvtyWLl1qq1evDkGpKn5yRSlZAjoodTjvPBv15pv29uzZeXYsHYSmz5tn0+bOzX1M/OCDkrWCLC0CRSzw0L/+lbt/RPtKg0aNUvrUHStXtkeGDLFJH31kUz75xG7r1StPEEf75tTPPrMRU6bYG/585vnnpzTfaKTj2rSxyT7vV6dNC4/9DjwwGhRO8v9xyy1h/hM//NAGjxhh1WvWzB2e7J9ky95or73C78r4GTPCurXr2DHZLBmeZQKJjj+xFHvvt5+9+9VX9vCzz8a+nfR/tv+kRIyAAAJZKKCAff+nn7bXP/3UXpw0KRyju/fubdv5eZ8K9f8s3ChY5c0EdFH1+h49bOrnn4f9RHX1Q484Ioy3kyfoqH6r+vWIyZNt8scfW6fOnTebB2+kJpA0MLVmzRpbvHixbdiwocA5/vjjj7Zu3brQhE/j/u9//yvU1cwCZ86bf5jAvQ8/bKefe6595jubsuIKyqq484Yb7JSWLcPjbD/RpSCAQF6BF//979x9RPvK999+m3eEOK+u7tbNavvBrU2LFtbtiiusbYcOdvo554SxdQXzag8cPXjvvXbk/vtbr+7d7frbb7fG++wTZ255367jma53P/igDezTJ8z/6zlz7IGnnsqteLY++WQ7o1Mn6+yfeY7v13V32cW63X133pkkeJVo2VXp7TdokH30/vt27MEH2zAPKHS7556Ulz3BxzKoFAmkcvxRRl/PB/rbmlWrCjw+xeNg+48nw/sIIJDtAqrrz/OL0WefeKIddcABdt0ll9jJ7dtbJ3+OLdT/YzX4P9sELrj0UlNdub/XjVWX7XDccfaNJ2uorPXYR/drrw3vH3PQQTbQA7tXde1qTZo1yzamjKxv0sDU2rVrQ7Ap0aft6CdOau5X06+y60dOgSpKyRLofdtt1v7YY238yJFxF3zRggW2YP58++6bb2zBd9/FHY8BCGSrwI+ePbrw++/DPqL9ZOPGjUkplJF6Qrt2NsQDOJpWTd5UTj3rrPDcyvdLBXj+88wzttpPyl96/nlbvmyZHecHydhynl+heW7sWGuXM1007Hgfb/XKlfYfvyqq6ZWGrCZ70dWetl4JfWPiRPtg+vQwSU1PR27lB93YZn1qpqd5DxkzJixLNO9ky67MrF3q17dBAwaEZVZTRBWtLwWBSCCV408Xr/h9/snHNmXChGiyPM9s/3k4eIEAAggkFVDfwP3uustmecbUSk80mDRunH3pWdm777lnnmmp/+fh4EUWCaj+rQyoAX5x+NknnjDV8+d6MFf1dZU13lrsLc+UUr18hQ+bMHp0eL9ajRrhmT/pCSQNTKUyO6W4KctGfUvpR04PSskS0En0pk2bEi70AD8xVjMKpfv+pXXrhOMyEIFsFDj/ssvCPqK03ouvvDJPECeehw5e+v2c++WXoX26TsCHe2bRrjlBnB9XrAhZqOUrVAiz0O+tmj7t7P3+xZZaO+9se3kWVRTYiobV2203m/PFF6E59rUegH7LmwOu8ys8dT2TSkXDZ3t6soJMd93/gD335JPhAoPSk6OyrX+m5t14333zZMQmW3Zlq6h8602BTzj1VF+/hn4An2K7+mdSEIgEkh1/Dmx6iJ10xhnWxzMF4xW2/3gyvI8AAgikJlDHM6Yb7LGHTfduPWIL9f9YDf7PJoEannRTsVIla+jdUrz67rs21h+XXXfdZl1eHHH00XZ+ly7W14NXyqZSXZuSvkBGAlMr/MRp0aJFoZ8pRRYre38plNIjoIBV92uusXZHHml/P/PMcALd+9FHw0lq6VlL1gSBLRN43pvHnXX8X63jX/8aspr+7gGm9t5ELllRH00qyq66o18/e/i++2zme++Fft4ULJrx1lv2k2euXnnTTfanJk3sH97sT0GqylWq5pn1a6PH2D9vvdXe9Cs3saWK9xO4zqdv4ftv88MOsz533BFSj/W+ioJLGt7Z9/F5c2bbc4MHh/ej5dILDde87/UmhWquHZVonHjLrs9Q/4TVPKP2Bg8qdL3yClu2ZLFV9dcUBFIRUBD2zvv7WS8PqupqZLzC9h9PhvcRQACB5AKqV9zz0EM207OnRw4bFiag/p/cjTFKt0CVnJsCtT7pJLvlqqvsxi6X2jHe7UX+vl6bNG9ux5xwQriIO/KFF+yXFFpMlG65wq1dRm+RtH79+nASwp2XCvdlbK1T6cA0avjwsHi6sj1n1ixr6c2LWnp0WOm/FAQQsDxNjGZ5KvzhRx1lRx1/fG6gJ57RKm9mp6IOyDf8/LMN9cxE9S/1s99YQr+pKpf6azXtU0B4xttv29TXXjNlUsWWD2dMNz3yF6UdN/W+q9ShqfqvUnv4Sh4MU9q+yooffrCjvX8JZTG19yZ8NWr+1pQwWi6Nsz5nufR/bInGibfsWkZdrFBl999+FUm/Fwpm6TMpCKQicOHll4fRFi9YaMqcUmZUZQ94HtC0qX3kAdwo05ftPxVNxkEAAQQ2F1Affv38GF2ubDm73JstRTe8ov6/uRXvZJeAusBQUXcYM955J/w/5sUXQ1+w6rs1qoM8kNM36x6NG9vz3iRWfcyOHzUqjM+f1AWSBqZ0xV6Bpuj2oHqtJnvqe6qCR9f1+NlPWnQVvbz/sGnceB2lp75YjLk1C2z0jvDVXJMA5Nb8LbFsxS2g5nJlvYlesqIsEAWg1FTudA/26rd0z733Ds3fomk/9rtg6qGiQM/IqVPDQTIarmcdDOvuuqt97c1t1XQuKvP94Hiq3wlPfVjpoKomehUqVjS9r/Ld119bs8MPt2v+9rcQMDrEg1g60C72LNiolPP1+LN35q7yxn//m5s1lWzZF3qfdCrly1ewwX6DBRU1B5zo/VVREEhFQP1W/uT9Vna9u2cYXU1N1LRUHfR39KuTUdcBbP+paDIOAgggkFdAQak+jz8esrC7nN0x9JmTd4zfX1H//92C/7JDQBdSFajVth8VxTlUL1ZsJAriRsO+8m45lnifzM39rn0EpiKV1J+TNuWr6Ccw1TyNTQEolSreCa5e6+RIX4iCUVHH5xpXTTpW5UQXU18MxixugR28uYRubR/1W6MOkvVQ+T+/E1iLVq1M6Yy7e9vzK2++OfRHQ/vZ4v7W+PytRUAdhbc57TSr7R2H1/LHGX6Hy4M8rXfK+PFJF3GDB6XGvfxy6KB8U05Q6vi2be2VoUNzp2365z+H5nCav5rEVfXmdy/HDNeIp3gzW90BT+nGsSU6MKpjRgWkLvR+sFZ5ttS0nD4klLKvQJTudqb1UBt5ZWStjMnI0p0BNW899NsflWTL/unMmeFGCUsWLQxNE2Wk4NnYl16KZsEzApbo+KMOR5XJFz0U1PzY7/Ko11FQSoRs/2xICCCAQHoCusCsPnFUz+/do0foo1L1/Kh/SOr/6XkydukT0IXj8a+8EjKkGnk/Uzo3Vp+poz1rSkEpZXLrJkXVvS8qXfg91+9ouZNfQJtAtlShNoakGVPqP0qPgoqypvRQcEpBqihzqqBxeW/rFlDGxH2PPZa7kLr7lkoz3wFre9OJXgMHWlnPlFNZ63cguN07flM/OBQEELAQdLneK3VqIqeirCdlKD3rVyFTKff37Bkqh2O8U0UFicaOGGHDvAP0qPzNm+Ad4v1DqSgLqbMHofI35YvSiaPnaFrdQVN9xHX1DJPLb7wxTHf1RReZgkoq4/yAq76rHvG7/el3XM3tevqtbvMUX6ao5J9/omXXQfvaiy+2AZ4C/brPV1eZenfvThPgCJPnIJDo+JP/aqQmyL8Nxr6XfxjbfyDmDwIIILCZgJpFR3foHTT8t36lNJLq9xf63XOp/29GxhtZKNDX71ypc+ShOXcF1g2DXvBuN1SqVq9md/Ttazv4BVwV3dWyv9e33/GWDZT0BcrUr1//9zOO9Kffoinq+R2b5uc09diiGTFxkQuoCac6SValf9mSJZulLkYLwHcaSfCcbQLKJKpZq1ZI712yeHFu4Ce/Q6J9RPuY0oV1+9nYouZMypb6xQM9PyxdGjso5f91ZbRm7dq2xJvoxXZgHs1AnUwro6qw84+37Jp/WH4PcC/3lOjYdOjos3nOHoFE239RKrD9F6Vu6Z93cW23pV+WNdzaBaj/b+3fEMv3Rwmo5ZDqEvnryar/qw6sonPkeIXjSDyZ399PmjH1+6j8l80CSmVc5G1mKQggULCAMjti+2UqeKzE78brFFwB4S2dt5o9JdqHdec9PQpb4i275heWf+HCws6a6RDYYgG2/y0mZAYIIJCFAtT/s/BLZ5ULFIjt4iJ2BNX/EwWkYsfl/8QCSfuYSjw5QxFAAAEEEEAAAQQQQAABBBBAAAEEECicAIGpwrkxFQIIIIAAAggggAACCCCAAAIIIIDAFgoQmNpCQCZHAAEEEEAAAQQQQAABBBBAAAEEECicAIGpwrkxFQIIIIAAAggggAACCCCAAAIIIIDAFgoQmNpCQCZHAAEEEEAAAQQQQAABBBBAAAEEECicQJkWLVpsKtykTIUAAggggAACCCCAAAIIIIAAAgggkEhg/vz5iQZn/bCyxQlUr149K87Pz/pvvwgA+E6LAJVZlioB9pFS9XWyMmkKsP2nCcboW4UA2+1W8TWwEFuxAPvIVvzlsGhbhYD2EUpiAZryJfZhKAIIIIAAAggggAACCCCAAAIIIIBAEQkQmCoiWGaLAAIIIIAAAggggAACCCCAAAIIIJBYgMBUYh+GIoAAAggggAACCCCAAAIIIIAAAggUkQCBqSKCZbYIIIAAAggggAACCCCAAAIIIIAAAokFCEwl9mEoAggggAACCCCAAAIIIIAAAggggEARCWQ0MLXNNtvYtttuW0SLymwRQAABBBBAAAEEEEAAAQQQQAABBEqTQNLA1Pbbb2/Vq1e3unXrmm5zuN122xW4/hpv5513tjp16hCcKlCodLy5Y+XKVn/33W07/74pCCCwuYB+C3dr2NAq7bjj5gML+U6ZMmWs1k47hX1v+/LlCzUXXTTQPDSvgormW7VatYIGpfRe5SpVrOIOO8Qdt0atWla2bNm4wxmAQEEC2l617eZ/xNuOC5qH3mP7jyfD+wggkO0COnbHq7dESQfRb7BeUxDIRoF49ftM1NGz0bOgdU7661K1alXTF/Hrr78WNH3uexov3Ypi7sT8U+wCOih1OO88G/Xmm/b27NmW/+S3Wo0a9uhzz9nkjz+2EZMn238//NCqbMFJbLGvMAuAQIYFFHS5vkcPm/r55/bipEk26aOP7NAjjkjpUxLtfzt5sH/8jBn26rRpYd/TPtipc+eU5huNdFybNjbZl0fz0GO/Aw+MBpkqmf+45Rab+tlnNtH368EjRlj1mjVzhyf7R8HqR4YMCes75ZNP7LZevfIEoBrttVf4XdE6aHi7jh2TzZLhWSaQaPtvd9ZZNm3u3M0e2s5SLWz/qUoxHgIIZJOAgk39n37aXv/001Bv0TG6e+/euRefVT+YPm9ent/fiR98kE1ErCsCoU4br36fiTo6xL8LJA1MrVmzxhYvXmwbNmz4fap8/ykopR+3n376Kd8QXpYUgXsffthOP/dc+8xPXpUVlz/I2HvgwBCIuvmyy+zI/fe3y8/tZD/zfZeUr5fl/AMELrj0Umt98snW/+677diDD7YOxx1n3/gJdSol0f631n+Du197bZjnMQcdZAO90nhV167WpFmzVGZtdTzT9e4HH7SBffpYmxYt7Os5c+yBp57KrXhqmc/o1Mk6d+hg53gAq+4uu1g3X4dUy9XdulltD55p3t2uuMLa+nxOP+ecMLmOC/0GDbKP3n8/LP+wZ5+1bvfcY4332SfV2TNeFggk2v7HjRxpp7Rsmfu4pH37IDJ5/PiUZNj+U2JiJAQQyEIB1fXn+cXos0880Y464AC77pJL7GT/je3kz7HlzhtuyP0NPtvrCRQEskkgUf1+S+vo2eSYyromDUytXbvW/ve//8WdV3lv/rGDZ9sogLVp06a44zFg6xbofdtt1v7YY228nwTkL4333dcOat7cbvj7323i2LG2etUq+3DGdFv/88/5R+U1AlkpoACMspgG3HuvPfvEE/bj8uU21yt7C7//PiWPRPvfmtWr7S3PUly+bJmt8PlOGD06zFNZjLHlPP/853z/VIZJbDneA0+rV660//hVUe27StdXk70om6utV0LfmDjRPpg+PUxW05v7tfKgWmyzPjXT07yHjBkTLkJE81c27Qnt2tkQDz5pXdVcT+XUnGVQZtYu9evboAEDwvLXb9AgDNc0FAQigWTb/3fffGPR4yAPyC5bssTe9KzE2ML2H6vB/wgggEBygV9++cX63XWXzfKMqZU//miTxo2zLz17evc998wz8aIFC2zB/Pnhd3jBd9/lGcYLBEqzQLL6fap19NJslMl1SxqYSvZhVfyEZePGjbbKT3goJVdAlf54gcXdvE+ptX5yrIwqNQfSCaqa/dFfTMn9vlnyzArU8KZvFStVsobebO3Vd9+1sf647LrrUm4Sl2j/i5b0iKOPtvO7dLG+HvhSJtZbU6ZEg8JzLe/jby/PRIqCQ9HAervtZnO++CI0x77WA9Cabp1fSKjrmVQqGj7bmx8qyHTX/Q/Yc08+GTImlZ4clW29maLmrSB1bP8SCo4pw3Lul1+G/q+6eGbXcM+K2jUnAKVsFZVvvSnACaee6uM09CDbFNvVP5OCQCSQyvavccuVK2ft/dgz7F//Mp1QxRa2/1gN/kcAAQTSF6jjGdMN9tjDpnu3HrFlwDPP2LtffRWa+/2ldevYQfyPQKkWSLV+n6yOXqqRMrhyW9QTrYJSqigqW6qy9zMSBSqUQbV+/frwyOCyMqtiEtDJ5w7ekbMOVhe0O81236OR9fQMCJ0cvzN1ajEtFR+LwNYjEPW31vqkk+yWq67yk+Zfrft9vU05pA/fd19GFrSJZy0e8uc/hwDRg//8p/3iFwRiy2ujx4QA0CfeT1RsqeJNrdd55muLI4+05ocdZmd4NlSLVq1M76to/9bwztdcY/PmzLbnBg+2sy680NR3VFQ0/J+33hqC17EZtNE4ujhxR79+YV2VlXWaN+VToEufof4Jq/kNNG64/Xbr7JlUZ55/fsjaiubNMwKpCrTyrF5tr68MHbrZJGz/m5HwBgIIIJCyQPkKFeyehx6ymZ49PXLYsDCdLlh397rBTO8jUherzrzgAuv96KOh6Z+yrCgIlHaBVOv3yeropd0pU+u3RYEpXTnXSUcF/zFTia6kKzClHzMFpyglX0DpvSqD+ve3ObO+CI8zPHvqOD8JJzBV8r9f1mDLBRSMUVFzuRnvvBP+H/Pii6G/JfXtFC8bMYyY4p8Hcvp92qNxY3ve0+2///ZbGz9qVO7Ual6rR/6iZoVNvf8ndWiqPqDUHr6SB52i/XrFDz/Y0d6/hLKY2nvQqkbN35rjrfLmf1FRs92hfsU0f4nGUefpG3LGUf9S6n9Ov/8/rlgRmv6psvtvz/RSRVbBLH0mBYF0BTpedJFN8b6lFi9atNmkbP+bkfAGAgggkJKAbnjUz4/R5cqWs8u9W4Dohlequ4waPjzMQ5mtc2bNspZ+gaClZ3ATmEqJlpFKuECq9ftkdfQSzvCHLX7Spny66q1AUxR0il5rCVf4ScfChQtzH+vWrQsLvsT7f1jtTb8opUNgsbctV4ntAH+jN6NQEx4KAgj4b6EHWlSR2xhzkwjtL+V8H4l+OzPl9JU3m1vi+2TzfHf8U8Cq5THHhCZ1sZ813wNYalqn/uMUNNNVzwoVK5reV/nu66/tAO+s/a6bbgrr0XCvPUMgLfbkX+uheesRuz7q80oBKDXzu82vqiqbas+99w6ZW5r3Qu+TQqV8+Qo22G+woKLmgKrgUhBIR0Db1QFNm9oL3oyvoML2X5AK7yGAAAKJBRSU6vP441a5SlXrcnZHU5858YrqOGpGHbWQiTce7yNQWgTSrd/Hq6OXFo+iXo+kgamKfgJTzTvKjbKi1HxPr9UZGKX0CCj42KBRI9u5bt2wUuogWQ8V3VFrqV+hPufii0P/NQd7k6Kmhx5qY156KQznDwLZLqDgzPhXXgkZUo28nyntO+pTabRnTUVXHhMZJdr/Dmx6iKkJU3Xvx0pBpXP9bjk7eT8QE2KypTTvU848M9wBT80JY0uUVaXO0xWQutDvrLnKsyCn5fQhoZR9XRVd41lf6vBc/VhNfe01W+kXHqJSyZvy6u56esT+9m/w9R738suhc/VNOUGp49u2zW1q9enMmaaOUpcsWmiq/LY57TSru+uuNpbfjoiWZxdItP1HQO39zpHalma8/Xb0Vp5ntv88HLxAAAEEkgoowKR+K//P77bdu0ePUMff3bvtiPqH1Puh6b/XDfT+lTffHJrp5+/jMukHMQICJVQgWf0+1Tp6CV39P3yxkzblU1aUHqmUdMZNZX6M88cJNDv8cLvvscdyP1B331Jp5ifYOrG+xoNSSvMd7+3MVSb68OlvvRX+5w8CCJj19TvbaB8aOmFC4FCH4i8U0PytIKtE+1/V6tXsjr59Qz9vmlZ3zOnvzfryN6ONmgtGz9Hn6GRefUR09Wkuv/HG0Lzuam8SpaCSyjgPqP2pSRN75PnnQzaU0vN7du0aTf7bsweuopJ//vf37BkqtmO8w3cNGztihA3zDtBV9Ntxrf92DPAmjq/7fJVF1rt7d5oARJg8B4FE27+2ITX/PPH0022gN0eNF+iNtsvoOaJl+48keEYAAQTyClT2fiCjO/QOGv5bv1IaY+Z779mFfvfc2n5TlV4DB1pZ709YRTdCut1v7KLhFASyRSBR/T7VOnq2WG3pepapX7/+72ccWzq3NKev53dsmp/T1CPNSRm9GATKlCljtf1W8mqyGbW5zb8YfKf5RXidbQLqKFFXIX9YurTAVS/MPqIsJXX6rLLMm0oXpmiZatau7dlLi0KTu/zzqOhZk8qoirfc+cfP/1rLpzT/gpoBhN8Or+Au9yaPsc0d88+D16VfoDDbfyZU2P4zoZi98yiu7TZ7xVnzrUVAXbjo+K6gv+of8S4OsI9sLd8Yy1FUAvHq96nW0dlHkn8zSTOmks+CMbJFQAel2H5nsmW9WU8E0hGIbQKXznSJxlVFsLABqWi+6hdiUU5/cdF7sc+6854ehS2JOjQPvx3eHyEFgeISYPsvLnk+FwEESrKAmjIlqjuU5HVj2RFIRyBe/T4TdfR0lqM0j5u0j6nSvPKsGwIIIIAAAggggAACCCCAAAIIIIBA8QkQmCo+ez4ZAQQQQAABBBBAAAEEEEAAAQQQyGoBAlNZ/fWz8ggggAACCCCAAAIIIIAAAggggEDxCRCYKj57PhkBBBBAAAEEEEAAAQQQQAABBBDIagECU1n99bPyCCCAAAIIIIAAAggggAACCCCAQPEJlGnRosWm4vt4PhkBBBBAAAEEEEAAAQQQQAABBBAovQLz588vvSuXgTUrC1AGFJkFAggggAACCCCAAAIIIIAAAggggEDaAjTlS5uMCRBAAAEEEEAAAQQQQAABBBBAAAEEMiFAYCoTiswDAQQQQAABBBBAAAEEEEAAAQQQQCBtAQJTaZMxAQIIIIAAAggggAACCCCAAAIIIIBAJgQITGVCkXkggAACCCCAAAIIIIAAAggggAACCKQtQGAqbTImQAABBBBAAAEEEEAAAQQQQAABBBDIhACBqUwoMg8EEEAAAQQQQAABBBBAAAEEEEAAgbQFCEylTcYECCCAAAIIIIAAAggggAACCCCAAAKZECAwlQlF5oEAAggggAACCCCAAAIIIIAAAgggkLYAgam0yZgAAQQQQAABBBBAAAEEEEAAAQQQQCATAgSmMqHIPBBAAAEEEEAAAQQQQAABBBBAAAEE0hYgMJU2GRMggAACCCCAAAIIIIAAAggggAACCGRCgMBUJhSZBwIIIIAAAggggAACCCCAAAIIIIBA2gIEptImYwIEEEAAAQQQQAABBBBAAAEEEEAAgUwIEJjKhCLzQAABBBBAAAEEEEAAAQQQQAABBBBIW4DAVNpkTIAAAggggAACCCCAAAIIIIAAAgggkAkBAlOZUGQeCCCAAAIIIIAAAggggAACCCCAAAJpCxCYSpuMCRBAAAEEEEAAAQQQQAABBBBAAAEEMiFAYCoTiswDAQQQQAABBBBAAAEEEEAAAQQQQCBtAQJTaZMxAQIIIIAAAggggAACCCCAAAIIIIBAJgQITGVCkXkggAACCCCAAAIIIIAAAggggAACCKQtQGAqbTImQAABBBBAAAEEEEAAAQQQQAABBBDIhACBqUwoMg8EEEAAAQQQQAABBBBAAAEEEEAAgbQFCEylTcYECCCAAAIIIIAAAggggAACCCCAAAKZECAwlQlF5oEAAggggAACCCCAAAIIIIAAAgggkLYAgam0yZgAAQQQQAABBBBAAAEEEEAAAQQQQCATAgSmMqHIPBBAAAEEEEAAAQQQQAABBBBAAAEE0hYgMJU2GRMggAACCCCAAAIIIIAAAggggAACCGRCgMBUJhSZBwIIIIAAAggggAACCCCAAAIIIIBA2gIEptImYwIEEEAAAQQQQAABBBBAAAEEEEAAgUwIEJjKhCLzQAABBBBAAAEEEEAAAQQQQAABBBBIW4DAVNpkTIAAAggggAACCCCAAAIIIIAAAgggkAkBAlOZUGQeCCCAAAIIIIAAAggggAACCCCAAAJpCxCYSpuMCRBAAAEEEEAAAQQQQAABBBBAAAEEMiFAYCoTiswDAQQQQAABBBBAAAEEEEAAAQQQQCBtAQJTaZMxAQIIIIAAAggggAACCCCAAAIIIIBAJgT+H702VgHhntPPAAAAAElFTkSuQmCC"
\ No newline at end of file
@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from db import db
+from managers.appointment_manager import AppointmentManager
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    OwnerFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    UserFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestAppointmentExport(BaseTestCase):
+    URL = Endpoints.PROVIDER_APPOINTMENTS_EXPORT[0]
+
+    def setUp(self):
+        super().setUp()
+        self.provider = ServiceProviderFactory(id=1000)
+        other_provider = ServiceProviderFactory(id=1001)
+        self.owner = OwnerFactory()
+        self.owner.owned_companies.append(self.provider)
+        self.headers = {"Authorization": f"Bearer {generate_token(self.owner)}"}
+
+        service = ServiceFactory(id=1000, service_provider_id=self.provider.id)
+        other_service = ServiceFactory(id=1001, service_provider_id=other_provider.id)
+        customer = UserFactory()
+        for i in range(5):
+            AppointmentFactory(
+                id=1000 + i,
+                service_id=service.id,
+                staff_id=service.staff_id,
+                customer_id=customer.id,
+                appointment_time=datetime(2030, 1, 7, 9 + i),
+            )
+        AppointmentFactory(
+            id=1010,
+            service_id=other_service.id,
+            staff_id=other_service.staff_id,
+            customer_id=customer.id,
+            appointment_time=datetime(2030, 1, 7, 9),
+        )
+        # The export reads over its own connection, which only sees committed rows.
+        db.session.commit()
+
+    def url(self, provider_id, export_format=None):
+        url = self.URL.replace("<int:provider_id>", str(provider_id))
+        return f"{url}?format={export_format}" if export_format else url
+
+    def test_ndjson_export_streams_provider_appointments(self):
+        resp = self.client.get(self.url(self.provider.id), headers=self.headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.is_streamed)
+        self.assertEqual(resp.mimetype, "application/x-ndjson")
+        rows = [json.loads(line) for line in resp.data.decode().splitlines()]
+        self.assertEqual([row["id"] for row in rows], list(range(1000, 1005)))
+        self.assertEqual(rows[0]["appointment_time"], "2030-01-07T09:00:00")
+        self.assertEqual(rows[0]["service_id"], 1000)
+        self.assertIn("customer_email", rows[0])
+
+    def test_csv_export(self):
+        resp = self.client.get(self.url(self.provider.id, "csv"), headers=self.headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.mimetype, "text/csv")
+        self.assertIn("attachment", resp.headers["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(resp.data.decode())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1]["id"], "1004")
+
+    def test_export_reads_through_server_side_cursor_in_batches(self):
+        cursors = self.record_statements(
+            record=lambda conn, cursor, statement: cursor.name
+        )
+
+        batches = list(
+            AppointmentManager.export_provider_appointments(
+                self.provider.id, self.owner, batch_size=2
+            )
+        )
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        # psycopg2 named cursors are server-side cursors.
+        self.assertTrue(any(name for name in cursors))
+
+    def test_other_provider_is_forbidden(self):
+        resp = self.client.get(self.url(1001), headers=self.headers)
+
+        self.assertEqual(resp.status_code, 403)
+
+    def test_unknown_format_is_rejected(self):
+        resp = self.client.get(self.url(self.provider.id, "xml"), headers=self.headers)
+
+        self.assertEqual(resp.status_code, 400)
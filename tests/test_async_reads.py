@@ -0,0 +1,124 @@
+from datetime import datetime, time
+
+from starlette.testclient import TestClient
+
+from app import app
+from asgi import create_asgi_app
+from db import db
+from services.cache import working_hours_cache
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    ApproverFactory,
+    CategoryFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+    UserFactory,
+    WorkingHourFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestAsyncReads(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        working_hours_cache.clear()
+        for i in range(3):
+            CategoryFactory(id=1000 + i, name=f"category-{i}")
+        provider = ServiceProviderFactory(id=1000)
+        self.staff = StaffFactory(id=1000, service_provider_id=provider.id)
+        self.service = ServiceFactory(
+            id=1000, service_provider_id=provider.id, staff_id=self.staff.id, duration=60
+        )
+        WorkingHourFactory(
+            provider_id=provider.id,
+            employee_id=self.staff.id,
+            day_of_week=0,
+            start_time=time(9),
+            end_time=time(13),
+        )
+        customer = UserFactory(id=1001)
+        AppointmentFactory(
+            id=1000,
+            service_id=self.service.id,
+            staff_id=self.staff.id,
+            customer_id=customer.id,
+            appointment_time=datetime(2030, 1, 7, 10),
+        )
+        self.approver_headers = {
+            "Authorization": f"Bearer {generate_token(ApproverFactory())}"
+        }
+        self.client_headers = {"Authorization": f"Bearer {generate_token(customer)}"}
+        # The async views read over their own connections.
+        db.session.commit()
+
+        self.asgi = TestClient(create_asgi_app(app, async_reads=True))
+        self.asgi.__enter__()
+
+    def tearDown(self):
+        self.asgi.__exit__(None, None, None)
+        working_hours_cache.clear()
+        super().tearDown()
+
+    def test_catalog_matches_the_flask_response(self):
+        for url in (
+            Endpoints.CATEGORY_PROFILE,
+            f"{Endpoints.CATEGORY_PROFILE}/1001",
+            Endpoints.PROVIDER_PROFILE,
+            f"{Endpoints.PROVIDER_PROFILE}/active",
+        ):
+            expected = self.client.get(url, headers=self.approver_headers)
+            resp = self.asgi.get(url, headers=self.approver_headers)
+
+            self.assertEqual(resp.status_code, 200, url)
+            self.assertEqual(resp.json(), expected.json, url)
+            self.assertEqual(resp.headers["ETag"], expected.headers["ETag"], url)
+
+    def test_conditional_get(self):
+        resp = self.asgi.get(Endpoints.CATEGORY_PROFILE, headers=self.approver_headers)
+        resp = self.asgi.get(
+            Endpoints.CATEGORY_PROFILE,
+            headers={**self.approver_headers, "If-None-Match": resp.headers["ETag"]},
+        )
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.content, b"")
+
+    def test_available_slots_match_the_flask_response(self):
+        url = (
+            Endpoints.AVAILABLE_SLOTS[0]
+            .replace("<int:staff_id>", str(self.staff.id))
+            .replace("<int:service_id>", str(self.service.id))
+            .replace("<string:date>", "2030-01-07")
+        )
+
+        expected = self.client.get(url, headers=self.client_headers)
+        resp = self.asgi.get(url, headers=self.client_headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), expected.json)
+        self.assertEqual(
+            [slot["start_time"] for slot in resp.json()["available_slots"]],
+            ["2030-01-07T09:00:00", "2030-01-07T11:00:00", "2030-01-07T12:00:00"],
+        )
+
+    def test_authentication_and_roles(self):
+        resp = self.asgi.get(Endpoints.CATEGORY_PROFILE)
+        self.assertEqual(resp.status_code, 401)
+
+        resp = self.asgi.get(Endpoints.CATEGORY_PROFILE, headers=self.client_headers)
+        self.assertEqual(resp.status_code, 403)
+        self.assertIn("message", resp.json())
+
+    def test_writes_are_served_by_the_flask_app(self):
+        resp = self.asgi.post(
+            Endpoints.REGISTER_CATEGORY[0],
+            headers=self.approver_headers,
+            json={"name": "category-new"},
+        )
+        self.assertEqual(resp.status_code, 201)
+
+        resp = self.asgi.get(Endpoints.CATEGORY_PROFILE, headers=self.approver_headers)
+        self.assertIn("category-new", [category["name"] for category in resp.json()])
@@ -0,0 +1,49 @@
+from werkzeug.exceptions import NotFound
+
+from db import db
+from managers.category_manager import CategoryManager
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import ApproverFactory, CategoryFactory
+from tests.helpers import generate_token
+
+
+class TestGetById(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.statements = self.record_statements()
+
+    def test_repeated_lookup_uses_identity_map(self):
+        category_id = CategoryFactory(id=1000).id
+        db.session.expunge_all()
+        self.statements.clear()
+
+        first = CategoryManager.get_by_id(category_id)
+        second = CategoryManager.get_by_id(category_id)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_missing_record_raises_not_found(self):
+        with self.assertRaises(NotFound):
+            CategoryManager.get_by_id(1000)
+
+    def test_inactive_record(self):
+        category = CategoryFactory(id=1000, is_active=False)
+
+        with self.assertRaises(NotFound):
+            CategoryManager.get_by_id(category.id)
+        self.assertIs(CategoryManager.get_by_id(category.id, active_only=False), category)
+
+    def test_edit_and_deactivate_missing_record_return_404(self):
+        headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        edit_url = Endpoints.EDIT_CATEGORY_PROFILE[0].replace("<int:category_id>", "1000")
+        deactivate_url = Endpoints.DEACTIVATE_CATEGORY[0].replace(
+            "<int:category_id>", "1000"
+        )
+
+        resp = self.client.put(edit_url, headers=headers, json={"name": "Hair"})
+        self.assertEqual(resp.status_code, 404)
+
+        resp = self.client.put(deactivate_url, headers=headers)
+        self.assertEqual(resp.status_code, 404)
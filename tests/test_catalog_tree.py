@@ -0,0 +1,228 @@
+from config import TestingConfig, create_app
+from db import db
+from models import ServiceModel, ServiceProviderModel
+from services.cache import response_cache
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    ApproverFactory,
+    CategoryFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    SubCategoryFactory,
+    UserFactory,
+)
+from tests.helpers import generate_token
+
+
+class CatalogTreeConfig(TestingConfig):
+    # TestingConfig reads both flags from the environment.
+    FAST_SERIALIZATION = False
+    RESPONSE_CACHE = False
+
+
+class ResponseCacheConfig(CatalogTreeConfig):
+    RESPONSE_CACHE = True
+
+
+class CatalogTreeTestCase(BaseTestCase):
+    URL = Endpoints.CATALOG_TREE[0]
+
+    def create_app(self):
+        return create_app(CatalogTreeConfig)
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(UserFactory())}"}
+        CategoryFactory(id=1, name="Hair")
+        CategoryFactory(id=2, name="Nails")
+        CategoryFactory(id=3, name="Closed", is_active=False)
+        CategoryFactory(id=4, name="Spa")
+        SubCategoryFactory(id=1, name="Haircut", category_id=1)
+        SubCategoryFactory(id=2, name="Coloring", category_id=1, is_active=False)
+        SubCategoryFactory(id=3, name="Manicure", category_id=2)
+        SubCategoryFactory(id=4, name="Styling", category_id=1)
+        ServiceProviderFactory(id=1)
+        ServiceProviderFactory(id=2)
+        for service_id, subcategory_id, is_active in (
+            (1, 1, True),
+            (2, 1, False),
+            (3, 3, True),
+            (4, 2, True),
+            (5, 1, True),
+        ):
+            ServiceFactory(
+                id=service_id,
+                name=f"Service {service_id}",
+                price=50,
+                service_subcategory_id=subcategory_id,
+                service_provider_id=1,
+                is_active=is_active,
+            )
+        # Each commit starts a new transaction, so updated_on moves forward.
+        db.session.commit()
+
+        self.statements = self.record_statements()
+
+    def get(self, etag=None):
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        return self.client.get(self.URL, headers=headers)
+
+    @staticmethod
+    def service_ids(resp):
+        return [
+            service["id"]
+            for category in resp.json["categories"]
+            for subcategory in category["subcategories"]
+            for service in subcategory["services"]
+        ]
+
+
+class TestCatalogTree(CatalogTreeTestCase):
+    def test_active_tree(self):
+        resp = self.get()
+
+        self.assertEqual(resp.status_code, 200)
+        service = {"name": "Service 1", "price": 50.0, "duration": 30, "provider_id": 1}
+        self.assertEqual(
+            resp.json["categories"],
+            [
+                {
+                    "id": 1,
+                    "name": "Hair",
+                    "subcategories": [
+                        {
+                            "id": 1,
+                            "name": "Haircut",
+                            "services": [
+                                {"id": 1, **service},
+                                {"id": 5, **service, "name": "Service 5"},
+                            ],
+                        },
+                        {"id": 4, "name": "Styling", "services": []},
+                    ],
+                },
+                {
+                    "id": 2,
+                    "name": "Nails",
+                    "subcategories": [
+                        {
+                            "id": 3,
+                            "name": "Manicure",
+                            "services": [{"id": 3, **service, "name": "Service 3"}],
+                        }
+                    ],
+                },
+                {"id": 4, "name": "Spa", "subcategories": []},
+            ],
+        )
+
+    def test_one_query(self):
+        self.statements.clear()
+        resp = self.get()
+
+        self.assertEqual(resp.status_code, 200)
+        # The token lookup, the version and the tree.
+        self.assertEqual(len(self.statements), 3)
+
+        self.statements.clear()
+        resp = self.get(resp.headers["ETag"])
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.data, b"")
+        self.assertEqual(len(self.statements), 2)
+
+    def test_catalog_writes_change_etag(self):
+        approver = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        db.session.commit()
+        etag = self.get().headers["ETag"]
+
+        resp = self.client.put(
+            Endpoints.EDIT_CATEGORY_PROFILE[0].replace("<int:category_id>", "2"),
+            headers=approver,
+            json={"name": "Nail Care"},
+        )
+        self.assertEqual(resp.status_code, 200)
+        resp = self.get(etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json["categories"][1]["name"], "Nail Care")
+
+        etag = resp.headers["ETag"]
+        ServiceFactory(id=6, service_subcategory_id=3, service_provider_id=1)
+        db.session.commit()
+        resp = self.get(etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.service_ids(resp), [1, 5, 3, 6])
+
+        etag = resp.headers["ETag"]
+        db.session.get(ServiceModel, 1).is_active = False
+        db.session.commit()
+        resp = self.get(etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.service_ids(resp), [5, 3, 6])
+
+    def test_deactivated_provider_drops_its_services(self):
+        ServiceFactory(id=6, service_subcategory_id=3, service_provider_id=2)
+        db.session.commit()
+        etag = self.get().headers["ETag"]
+
+        approver = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        resp = self.client.put(
+            Endpoints.DEACTIVATE_PROVIDER[0].replace("<int:provider_id>", "1"),
+            headers=approver,
+        )
+        self.assertEqual(resp.status_code, 200)
+        db.session.commit()
+        resp = self.get(etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.service_ids(resp), [6])
+
+    def test_login_required(self):
+        self.headers = {}
+
+        self.assertEqual(self.get().status_code, 401)
+
+
+class TestCachedCatalogTree(CatalogTreeTestCase):
+    def create_app(self):
+        return create_app(ResponseCacheConfig)
+
+    def setUp(self):
+        super().setUp()
+        response_cache.clear()
+
+    def tearDown(self):
+        response_cache.clear()
+        super().tearDown()
+
+    def test_hit_skips_catalog_queries(self):
+        first = self.get()
+        self.statements.clear()
+        second = self.get()
+
+        self.assertEqual(second.json, first.json)
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+        # Only the token's user lookup reaches the database.
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(self.get(first.headers["ETag"]).status_code, 304)
+
+    def test_committed_catalog_writes_invalidate(self):
+        etag = self.get().headers["ETag"]
+
+        db.session.get(ServiceModel, 5).is_active = False
+        db.session.commit()
+        resp = self.get(etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.service_ids(resp), [1, 3])
+
+    def test_committed_provider_changes_invalidate(self):
+        self.get()
+
+        db.session.get(ServiceProviderModel, 1).is_active = False
+        db.session.commit()
+
+        self.assertEqual(self.service_ids(self.get()), [])
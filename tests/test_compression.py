@@ -0,0 +1,100 @@
+import gzip
+import json
+from datetime import datetime
+
+import brotli
+
+from db import db
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    ApproverFactory,
+    CategoryFactory,
+    OwnerFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    UserFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestResponseCompression(BaseTestCase):
+    URL = Endpoints.CATEGORY_PROFILE
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        for i in range(40):
+            CategoryFactory(id=1000 + i, name=f"category-{i}")
+
+    def get(self, url=URL, **headers):
+        return self.client.get(url, headers={**self.headers, **headers})
+
+    def test_gzip_above_threshold(self):
+        plain = self.get()
+        resp = self.get(**{"Accept-Encoding": "gzip"})
+
+        self.assertEqual(resp.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", resp.headers["Vary"])
+        self.assertLess(len(resp.data), len(plain.data))
+        self.assertEqual(json.loads(gzip.decompress(resp.data)), plain.json)
+        self.assertEqual(resp.headers["Content-Length"], str(len(resp.data)))
+
+    def test_brotli_preferred_on_equal_quality(self):
+        plain = self.get()
+        resp = self.get(**{"Accept-Encoding": "gzip, deflate, br"})
+
+        self.assertEqual(resp.headers["Content-Encoding"], "br")
+        self.assertEqual(json.loads(brotli.decompress(resp.data)), plain.json)
+
+    def test_client_quality_values_are_respected(self):
+        resp = self.get(**{"Accept-Encoding": "br;q=0.5, gzip"})
+
+        self.assertEqual(resp.headers["Content-Encoding"], "gzip")
+
+    def test_small_and_unaccepted_responses_are_sent_as_is(self):
+        resp = self.get(f"{self.URL}/inactive", **{"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", resp.headers)
+        self.assertIn("Accept-Encoding", resp.headers["Vary"])
+
+        resp = self.get()
+        self.assertNotIn("Content-Encoding", resp.headers)
+
+    def test_compressed_etag_still_validates(self):
+        resp = self.get(**{"Accept-Encoding": "gzip"})
+        etag = resp.headers["ETag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        resp = self.get(**{"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.data, b"")
+
+    def test_streamed_response_is_compressed_chunk_by_chunk(self):
+        provider = ServiceProviderFactory(id=1000)
+        owner = OwnerFactory()
+        owner.owned_companies.append(provider)
+        service = ServiceFactory(id=1000, service_provider_id=provider.id)
+        customer = UserFactory()
+        for i in range(5):
+            AppointmentFactory(
+                id=1000 + i,
+                service_id=service.id,
+                staff_id=service.staff_id,
+                customer_id=customer.id,
+                appointment_time=datetime(2030, 1, 7, 9 + i),
+            )
+        headers = {"Authorization": f"Bearer {generate_token(owner)}"}
+        db.session.commit()
+        url = Endpoints.PROVIDER_APPOINTMENTS_EXPORT[0].replace(
+            "<int:provider_id>", str(provider.id)
+        )
+
+        plain = self.client.get(url, headers=headers)
+        resp = self.client.get(url, headers={**headers, "Accept-Encoding": "gzip"})
+
+        self.assertTrue(resp.is_streamed)
+        self.assertEqual(resp.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", resp.headers)
+        self.assertEqual(gzip.decompress(resp.data), plain.data)
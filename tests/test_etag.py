@@ -0,0 +1,110 @@
+from config import TestingConfig, create_app
+from db import db
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    ApproverFactory,
+    CategoryFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+    SubCategoryFactory,
+)
+from tests.helpers import generate_token
+
+
+class ConditionalGetConfig(TestingConfig):
+    # Pinned so the results do not depend on the environment: factory writes are
+    # only flushed, which never invalidates the response cache.
+    FAST_SERIALIZATION = False
+    RESPONSE_CACHE = False
+
+
+class TestConditionalGet(BaseTestCase):
+    def create_app(self):
+        return create_app(ConditionalGetConfig)
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        self.category = CategoryFactory(id=1000, name="Hair")
+        SubCategoryFactory(id=1000, name="Haircut", category_id=self.category.id)
+        self.provider = ServiceProviderFactory(id=1000)
+        StaffFactory(service_provider_id=self.provider.id)
+        ServiceFactory(id=1000, service_provider_id=self.provider.id)
+        # Each commit starts a new transaction, so updated_on moves forward.
+        db.session.commit()
+
+        self.statements = self.record_statements()
+
+    def get(self, url, etag=None):
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        return self.client.get(url, headers=headers)
+
+    def test_matching_etag_returns_304_without_loading_rows(self):
+        for url in (
+            Endpoints.CATEGORY_PROFILE,
+            Endpoints.SUBCATEGORY_PROFILE,
+            Endpoints.SERVICE_PROFILE,
+            Endpoints.PROVIDER_PROFILE,
+        ):
+            with self.subTest(url=url):
+                resp = self.get(url)
+                etag = resp.headers["ETag"]
+                self.assertEqual(resp.status_code, 200)
+                self.assertTrue(resp.json)
+                self.assertFalse(etag.startswith("W/"))
+
+                self.statements.clear()
+                resp = self.get(url, etag)
+
+                self.assertEqual(resp.status_code, 304)
+                self.assertEqual(resp.data, b"")
+                self.assertEqual(resp.headers["ETag"], etag)
+                # The token lookup and the aggregate query only.
+                self.assertEqual(len(self.statements), 2)
+
+    def test_etag_depends_on_filters(self):
+        etag = self.get(Endpoints.CATEGORY_PROFILE).headers["ETag"]
+        resp = self.get(f"{Endpoints.CATEGORY_PROFILE}?status=inactive", etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json, [])
+
+    def test_update_changes_etag(self):
+        etag = self.get(Endpoints.CATEGORY_PROFILE).headers["ETag"]
+
+        resp = self.client.put(
+            Endpoints.EDIT_CATEGORY_PROFILE[0].replace(
+                "<int:category_id>", str(self.category.id)
+            ),
+            headers=self.headers,
+            json={"name": "Nails"},
+        )
+        self.assertEqual(resp.status_code, 200)
+        resp = self.get(Endpoints.CATEGORY_PROFILE, etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers["ETag"], etag)
+        self.assertIn("Nails", [category["name"] for category in resp.json])
+
+    def test_new_record_changes_etag(self):
+        resp = self.get(Endpoints.CATEGORY_PROFILE)
+        count, etag = len(resp.json), resp.headers["ETag"]
+
+        CategoryFactory(id=1001, name="Nails")
+        resp = self.get(Endpoints.CATEGORY_PROFILE, etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), count + 1)
+
+    def test_nested_employee_changes_provider_etag(self):
+        etag = self.get(Endpoints.PROVIDER_PROFILE).headers["ETag"]
+
+        StaffFactory(service_provider_id=self.provider.id)
+        resp = self.get(Endpoints.PROVIDER_PROFILE, etag)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json["providers"][0]["employees"]), 2)
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+
+from werkzeug.exceptions import NotFound
+
+from managers.appointment_manager import AppointmentManager
+from managers.service_manager import ServiceManager
+from managers.working_hours_manager import WorkingHoursManager
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    ApproverFactory,
+    ServiceFactory,
+    UserFactory,
+    WorkingHourFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestHotQueries(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = ServiceFactory(id=1000)
+        self.customer = UserFactory()
+        self.start = datetime(2030, 1, 7, 10, 0)
+        AppointmentFactory(
+            id=1000,
+            service_id=self.service.id,
+            staff_id=self.service.staff_id,
+            customer_id=self.customer.id,
+            appointment_time=self.start,
+        )
+
+    def test_is_slot_booked_detects_overlaps_only(self):
+        staff_id = self.service.staff_id
+        cases = {
+            self.start: True,
+            self.start + timedelta(minutes=29): True,
+            self.start - timedelta(minutes=29): True,
+            self.start + timedelta(minutes=30): False,
+            self.start - timedelta(minutes=30): False,
+        }
+        for appointment_time, booked in cases.items():
+            with self.subTest(appointment_time=appointment_time):
+                self.assertEqual(
+                    AppointmentManager.is_slot_booked(staff_id, appointment_time, 30),
+                    booked,
+                )
+
+        self.assertFalse(
+            AppointmentManager.is_slot_booked(staff_id + 1000, self.start, 30)
+        )
+
+    def test_get_service_duration(self):
+        self.assertEqual(ServiceManager.get_service_duration(self.service.id), 30)
+        with self.assertRaises(NotFound):
+            ServiceManager.get_service_duration(self.service.id + 1)
+
+    def test_get_working_hours_by_provider_and_staff(self):
+        hours = WorkingHourFactory()
+        WorkingHourFactory()
+
+        by_provider = WorkingHoursManager.get_working_hours(
+            provider_id=hours.provider_id
+        )
+        by_staff = WorkingHoursManager.get_working_hours(staff_id=hours.employee_id)
+
+        self.assertEqual([item.id for item in by_provider], [hours.id])
+        self.assertEqual([item.id for item in by_staff], [hours.id])
+        self.assertEqual(len(WorkingHoursManager.get_working_hours()), 2)
+
+    def test_inactive_user_token_is_rejected(self):
+        approver = ApproverFactory()
+        token = generate_token(approver)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        resp = self.client.get(Endpoints.CATEGORY_PROFILE, headers=headers)
+        self.assertEqual(resp.status_code, 200)
+
+        approver.is_active = False
+        resp = self.client.get(Endpoints.CATEGORY_PROFILE, headers=headers)
+        self.assertEqual(resp.status_code, 401)
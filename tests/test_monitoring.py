@@ -0,0 +1,178 @@
+import os
+import pstats
+import tempfile
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import AdminFactory, ApproverFactory
+from tests.helpers import generate_token
+from utils.profiling import PROFILE_ID_HEADER, profile_path
+
+
+class TestDatabasePoolStatus(BaseTestCase):
+    URL = Endpoints.DATABASE_POOL_STATUS[0]
+
+    def test_admin_can_view_pool_status(self):
+        admin = AdminFactory()
+        token = generate_token(admin)
+
+        resp = self.client.get(self.URL, headers={"Authorization": f"Bearer {token}"})
+
+        self.assertEqual(resp.status_code, 200)
+        pool = resp.json["pools"]["default"]
+        self.assertEqual(pool["pool_class"], "InstrumentedQueuePool")
+        for key in ("size", "checked_out", "overflow", "checkouts", "wait_seconds_avg"):
+            self.assertIn(key, pool)
+        self.assertGreaterEqual(pool["checked_out"], 1)
+
+    def test_non_admin_cannot_view_pool_status(self):
+        approver = ApproverFactory()
+        token = generate_token(approver)
+
+        resp = self.client.get(self.URL, headers={"Authorization": f"Bearer {token}"})
+
+        self.assertEqual(resp.status_code, 403)
+
+
+class TestMetrics(BaseTestCase):
+    URL = Endpoints.METRICS[0]
+
+    def sample(self, name, **labels):
+        resp = self.client.get(self.URL)
+        self.assertEqual(resp.status_code, 200)
+        for family in text_string_to_metric_families(resp.data.decode()):
+            for sample in family.samples:
+                if sample.name == name and sample.labels == labels:
+                    return sample.value
+        return 0
+
+    def test_requests_are_counted_per_resource(self):
+        headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        labels = {"resource": "categoryprofile", "method": "GET"}
+        ok_before = self.sample("http_requests_total", status="200", **labels)
+        unauthorized_before = self.sample("http_requests_total", status="401", **labels)
+        count_before = self.sample("http_request_duration_seconds_count", **labels)
+
+        for _ in range(3):
+            self.client.get(Endpoints.CATEGORY_PROFILE, headers=headers)
+        self.client.get(Endpoints.CATEGORY_PROFILE)
+
+        self.assertEqual(
+            self.sample("http_requests_total", status="200", **labels) - ok_before, 3
+        )
+        self.assertEqual(
+            self.sample("http_requests_total", status="401", **labels)
+            - unauthorized_before,
+            1,
+        )
+        self.assertEqual(
+            self.sample("http_request_duration_seconds_count", **labels) - count_before,
+            4,
+        )
+        self.assertEqual(self.sample("http_requests_in_progress", **labels), 0)
+
+    def test_pool_and_cache_gauges(self):
+        resp = self.client.get(self.URL)
+
+        self.assertTrue(resp.content_type.startswith("text/plain"))
+        body = resp.data.decode()
+        self.assertIn('db_pool_connections{engine="default",state="checked_out"}', body)
+        self.assertIn('db_pool_checkouts_total{engine="default",result="ok"}', body)
+        self.assertIn('cache_entries{cache="response"}', body)
+        self.assertIn('cache_lookups_total{cache="working_hours",result="miss"}', body)
+
+    def test_metrics_requests_are_not_recorded(self):
+        self.client.get(self.URL)
+
+        self.assertEqual(
+            self.sample("http_requests_total", resource="metrics", method="GET", status="200"),
+            0,
+        )
+
+    def test_only_allowed_networks_can_scrape(self):
+        resp = self.client.get(self.URL, environ_base={"REMOTE_ADDR": "203.0.113.5"})
+
+        self.assertEqual(resp.status_code, 403)
+
+
+class TestRequestProfiling(BaseTestCase):
+    URL = Endpoints.CATEGORY_PROFILE
+
+    def setUp(self):
+        super().setUp()
+        self.admin_headers = {"Authorization": f"Bearer {generate_token(AdminFactory())}"}
+        self.profile_ids = []
+
+    def tearDown(self):
+        for profile_id in self.profile_ids:
+            for extension in ("json", "prof"):
+                if os.path.exists(profile_path(profile_id, extension)):
+                    os.remove(profile_path(profile_id, extension))
+        super().tearDown()
+
+    def profile(self, url, headers):
+        resp = self.client.get(url, headers={**headers, "X-Profile": "1"})
+        if PROFILE_ID_HEADER in resp.headers:
+            self.profile_ids.append(resp.headers[PROFILE_ID_HEADER])
+        return resp
+
+    def report_url(self, profile_id):
+        return Endpoints.REQUEST_PROFILE[0].replace("<string:profile_id>", profile_id)
+
+    def test_admin_request_is_profiled_with_its_sql(self):
+        url = Endpoints.DATABASE_POOL_STATUS[0]
+        resp = self.profile(url, self.admin_headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("db;dur=", resp.headers["Server-Timing"])
+
+        report = self.client.get(
+            self.report_url(resp.headers[PROFILE_ID_HEADER]), headers=self.admin_headers
+        )
+        self.assertEqual(report.status_code, 200)
+        self.assertEqual(report.json["path"], url)
+        self.assertEqual(report.json["status"], 200)
+        self.assertTrue(report.json["functions"])
+        self.assertTrue(
+            any("FROM users" in query["statement"] for query in report.json["sql"])
+        )
+
+    def test_pstats_dump(self):
+        resp = self.profile(Endpoints.DATABASE_POOL_STATUS[0], self.admin_headers)
+        self.assertEqual(resp.status_code, 200)
+
+        report = self.client.get(
+            self.report_url(resp.headers[PROFILE_ID_HEADER]) + "?format=prof",
+            headers=self.admin_headers,
+        )
+        self.assertEqual(report.status_code, 200)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(report.data)
+            f.flush()
+            self.assertTrue(pstats.Stats(f.name).stats)
+
+    def test_requests_without_the_header_are_not_profiled(self):
+        resp = self.client.get(
+            Endpoints.DATABASE_POOL_STATUS[0], headers=self.admin_headers
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn(PROFILE_ID_HEADER, resp.headers)
+
+    def test_only_admins_can_profile(self):
+        headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+
+        resp = self.profile(self.URL, headers)
+
+        self.assertEqual(resp.status_code, 403)
+        self.assertNotIn(PROFILE_ID_HEADER, resp.headers)
+        self.assertEqual(self.profile(self.URL, {}).status_code, 401)
+
+    def test_unknown_profiles(self):
+        for profile_id in ("0" * 32, "..%2F..%2Fapp"):
+            resp = self.client.get(
+                self.report_url(profile_id), headers=self.admin_headers
+            )
+            self.assertEqual(resp.status_code, 404)
@@ -0,0 +1,169 @@
+import random
+from unittest import TestCase
+
+from db import db
+from managers.provider_manager import ProviderManager
+from models import ServiceProviderModel
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import ApproverFactory, ServiceProviderFactory, UserFactory
+from tests.helpers import generate_token
+from utils.geo import bounding_box, covering_cells, distance_km, encode
+
+SOFIA = (42.6977, 23.3219)
+
+
+class TestGeohash(TestCase):
+    def test_encode(self):
+        self.assertEqual(encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(encode(*SOFIA, 4), "sx8d")
+
+    def test_covering_cells_contain_every_point_of_the_box(self):
+        generator = random.Random(7)
+        for latitude, longitude, radius in (
+            (*SOFIA, 5),
+            (*SOFIA, 50),
+            (0.0, 179.95, 20),
+            (-33.86, 151.2, 0.5),
+        ):
+            box = bounding_box(latitude, longitude, radius)
+            cells = covering_cells(box)
+            self.assertLessEqual(len(cells), 16)
+            min_latitude, min_longitude, max_latitude, max_longitude = box
+            if min_longitude > max_longitude:
+                max_longitude += 360
+            for _ in range(500):
+                point_longitude = generator.uniform(min_longitude, max_longitude)
+                point = (
+                    generator.uniform(min_latitude, max_latitude),
+                    point_longitude - 360 if point_longitude > 180 else point_longitude,
+                )
+                self.assertTrue(encode(*point).startswith(tuple(cells)), point)
+
+    def test_distance(self):
+        self.assertAlmostEqual(distance_km(*SOFIA, 42.1354, 24.7453), 132.5, places=1)
+
+
+class TestNearbyProviders(BaseTestCase):
+    URL = Endpoints.NEARBY_PROVIDERS[0]
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(UserFactory())}"}
+        for provider_id, latitude, longitude in (
+            (1, 42.7040, 23.3219),  # 0.7 km
+            (2, 42.6977, 23.3700),  # 3.9 km
+            (3, 42.6052, 23.0378),  # 25.4 km
+            (4, 42.1354, 24.7453),  # 132.5 km
+        ):
+            ServiceProviderFactory(id=provider_id, latitude=latitude, longitude=longitude)
+        ServiceProviderFactory(id=5, latitude=42.6980, longitude=23.3220, is_active=False)
+        ServiceProviderFactory(id=6, latitude=None, longitude=None)
+
+    def search(self, **args):
+        return self.client.get(self.URL, headers=self.headers, query_string=args)
+
+    def ids(self, resp):
+        self.assertEqual(resp.status_code, 200, resp.json)
+        return [provider["id"] for provider in resp.json["providers"]]
+
+    def test_radius_sorted_by_distance(self):
+        resp = self.search(latitude=SOFIA[0], longitude=SOFIA[1], radius=30)
+
+        self.assertEqual(self.ids(resp), [1, 2, 3])
+        self.assertFalse(resp.json["has_more"])
+        nearest = resp.json["providers"][0]
+        self.assertAlmostEqual(
+            nearest["distance"], distance_km(*SOFIA, 42.7040, 23.3219), places=6
+        )
+        self.assertEqual(nearest["latitude"], 42.7040)
+
+    def test_default_radius(self):
+        resp = self.search(latitude=SOFIA[0], longitude=SOFIA[1])
+
+        self.assertEqual(self.ids(resp), [1, 2])
+
+    def test_pagination(self):
+        resp = self.search(
+            latitude=SOFIA[0], longitude=SOFIA[1], radius=30, page=2, per_page=2
+        )
+
+        self.assertEqual(self.ids(resp), [3])
+        self.assertEqual(
+            (resp.json["page"], resp.json["per_page"], resp.json["has_more"]),
+            (2, 2, False),
+        )
+
+        # Found by the first widening of the search, which stops there.
+        resp = self.search(latitude=SOFIA[0], longitude=SOFIA[1], radius=30, per_page=1)
+        self.assertEqual(self.ids(resp), [1])
+        self.assertTrue(resp.json["has_more"])
+
+    def test_bounding_box(self):
+        box = {
+            "min_latitude": 42.6,
+            "min_longitude": 23.0,
+            "max_latitude": 42.7,
+            "max_longitude": 23.4,
+        }
+
+        # Sorted from the center of the box without a location.
+        resp = self.search(**box)
+        self.assertEqual(sorted(self.ids(resp)), [2, 3])
+        distances = [provider["distance"] for provider in resp.json["providers"]]
+        self.assertEqual(distances, sorted(distances))
+        self.assertAlmostEqual(
+            distances[0], distance_km(42.65, 23.2, 42.6052, 23.0378), places=6
+        )
+        self.assertEqual(
+            self.ids(self.search(latitude=42.6052, longitude=23.0378, **box)), [3, 2]
+        )
+        self.assertEqual(
+            self.ids(
+                self.search(latitude=42.6052, longitude=23.0378, radius=10, **box)
+            ),
+            [3],
+        )
+
+    def test_box_across_the_antimeridian(self):
+        ServiceProviderFactory(id=7, latitude=-16.5, longitude=179.9)
+        ServiceProviderFactory(id=8, latitude=-16.5, longitude=-179.8)
+        ServiceProviderFactory(id=9, latitude=-16.5, longitude=178.0)
+
+        resp = self.search(latitude=-16.5, longitude=179.95, radius=40)
+        self.assertEqual(self.ids(resp), [7, 8])
+
+        resp = self.search(
+            min_latitude=-16.7,
+            min_longitude=179.7,
+            max_latitude=-16.3,
+            max_longitude=-179.7,
+        )
+        self.assertEqual(sorted(self.ids(resp)), [7, 8])
+
+    def test_geohash_follows_the_coordinates(self):
+        ProviderManager.update(4, {"latitude": 42.6990, "longitude": 23.3250})
+        self.assertEqual(
+            db.session.get(ServiceProviderModel, 4).geohash, encode(42.6990, 23.3250)
+        )
+
+        resp = self.search(latitude=SOFIA[0], longitude=SOFIA[1], radius=1)
+        self.assertEqual(self.ids(resp), [4, 1])
+
+    def test_invalid_queries(self):
+        for args in (
+            {},
+            {"latitude": SOFIA[0]},
+            {"latitude": SOFIA[0], "longitude": SOFIA[1], "radius": 500},
+            {"latitude": SOFIA[0], "longitude": SOFIA[1], "per_page": 1000},
+            {"min_latitude": 42, "min_longitude": 23, "max_latitude": 43},
+            {"min_latitude": 40, "min_longitude": 20, "max_latitude": 45, "max_longitude": 25},
+        ):
+            self.assertEqual(self.search(**args).status_code, 400, args)
+
+    def test_clients_only(self):
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+
+        resp = self.search(latitude=SOFIA[0], longitude=SOFIA[1])
+
+        self.assertEqual(resp.status_code, 403)
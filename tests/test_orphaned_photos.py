@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from moto import mock_aws
+
+from db import db
+from managers import provider_manager
+from managers.provider_manager import ProviderManager
+from models import ProviderRegistrationState, ServiceProviderModel
+from services.s3 import S3Service
+from tests.base import BaseTestCase
+from tests.constants import ENCODED_PICTURE, Endpoints
+from tests.factories import ApproverFactory, InquiryFactory, ServiceProviderFactory
+from tests.helpers import generate_token
+
+
+class TestOrphanedPhotos(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.aws = mock_aws()
+        self.aws.start()
+        self.s3_client = patch.object(provider_manager.s3, "s3", S3Service().s3)
+        self.s3_client.start()
+        self.s3 = provider_manager.s3
+        self.s3.s3.create_bucket(
+            Bucket=self.s3.bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": self.s3.region},
+        )
+
+    def tearDown(self):
+        self.s3_client.stop()
+        self.aws.stop()
+        super().tearDown()
+
+    def keys(self):
+        return sorted(
+            obj["Key"] for page in self.s3.list_objects("") for obj in page
+        )
+
+    def register(self):
+        inquiry = InquiryFactory(status=ProviderRegistrationState.APPROVED)
+        token = generate_token(ApproverFactory())
+        resp = self.client.post(
+            Endpoints.REGISTER_PROVIDER[0],
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "company_name": "Delux Ltd",
+                "trade_name": "Delux Beauty Center",
+                "uic": "1234567877",
+                "photo": ENCODED_PICTURE,
+                "photo_extension": "png",
+                "inquiry_id": inquiry.id,
+                "country": "BG",
+                "city": "Sofia",
+                "street": "Ivan Vazov",
+                "street_number": "17A",
+                "postal_code": "1000",
+            },
+        )
+        self.assertEqual(resp.status_code, 201)
+
+    def test_rolled_back_registration_deletes_its_photo(self):
+        self.register()
+        self.assertEqual(len(self.keys()), 1)
+
+        db.session.rollback()
+
+        self.assertEqual(self.keys(), [])
+
+    def test_committed_registration_keeps_its_photo(self):
+        self.register()
+        db.session.commit()
+        db.session.rollback()
+
+        provider = ServiceProviderModel.query.one()
+        self.assertEqual(self.keys(), [self.s3.key_from_url(provider.photo_url)])
+
+    def test_sweeper_deletes_unreferenced_photos_page_by_page(self):
+        for name in ("used", "orphan-1", "orphan-2", "orphan-3"):
+            self.s3.upload_bytes(b"photo", f"providers/{name}.png", "image/png")
+        self.s3.upload_bytes(b"report", "reports/2024.csv", "text/csv")
+        ServiceProviderFactory(photo_url=self.s3.object_url("providers/used.png"))
+
+        recent = datetime.now(timezone.utc) - timedelta(hours=1)
+        self.assertEqual(ProviderManager.sweep_orphaned_photos(recent, page_size=2), 0)
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        with patch.object(
+            self.s3, "delete_objects", wraps=self.s3.delete_objects
+        ) as delete:
+            deleted = ProviderManager.sweep_orphaned_photos(later, page_size=2)
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(delete.call_count, 2)
+        self.assertEqual(self.keys(), ["providers/used.png", "reports/2024.csv"])
+
+    def test_sweeper_matches_photos_stored_under_another_endpoint(self):
+        for name in ("aws", "minio", "orphan"):
+            self.s3.upload_bytes(b"photo", f"providers/{name}.png", "image/png")
+        ServiceProviderFactory(photo_url=self.s3.object_url("providers/aws.png"))
+        ServiceProviderFactory(
+            photo_url=f"http://minio:9000/{self.s3.bucket_name}/providers/minio.png"
+        )
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        with patch.object(self.s3, "endpoint_url", "https://cdn.example.com"):
+            deleted = ProviderManager.sweep_orphaned_photos(later)
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(self.keys(), ["providers/aws.png", "providers/minio.png"])
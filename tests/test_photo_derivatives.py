@@ -0,0 +1,193 @@
+import json
+import uuid
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from moto import mock_aws
+from PIL import Image
+
+from db import db
+from managers import provider_manager
+from managers.provider_manager import ProviderManager
+from models import ProviderRegistrationState, ServiceProviderModel
+from schemas.response.provider_response_schema import ProviderResponseSchema
+from services.images import render_derivatives
+from services.s3 import S3Service
+from tasks.photo_derivatives import generate_photo_derivatives
+from tests.base import BaseTestCase
+from tests.constants import ENCODED_PICTURE, Endpoints
+from tests.factories import ApproverFactory, InquiryFactory, ServiceProviderFactory
+from tests.helpers import generate_token
+
+
+def encode_image(size, mode="RGB", image_format="JPEG") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, "red").save(buffer, image_format)
+    return buffer.getvalue()
+
+
+class TestRenderDerivatives(TestCase):
+    def test_sizes_and_formats(self):
+        derivatives = render_derivatives(encode_image((2400, 1600)))
+
+        expected = {
+            "thumbnail": (160, 160),
+            "card": (480, 320),
+            "hero": (1350, 900),
+        }
+        for (size, format_name), body in derivatives.items():
+            with Image.open(BytesIO(body)) as image:
+                self.assertEqual(image.size, expected[size], size)
+                self.assertEqual(
+                    image.format, {"webp": "WEBP", "jpeg": "JPEG"}[format_name]
+                )
+        self.assertEqual(len(derivatives), 6)
+
+    def test_small_photos_are_not_upscaled(self):
+        derivatives = render_derivatives(encode_image((100, 60)))
+
+        for body in derivatives.values():
+            with Image.open(BytesIO(body)) as image:
+                self.assertEqual(image.size, (100, 60))
+
+    def test_transparency_is_flattened(self):
+        photo = encode_image((400, 400), mode="RGBA", image_format="PNG")
+
+        with Image.open(BytesIO(render_derivatives(photo)["card", "jpeg"])) as image:
+            self.assertEqual(image.mode, "RGB")
+
+
+class TestPhotoDerivativePipeline(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.aws = mock_aws()
+        self.aws.start()
+        self.s3_client = patch.object(provider_manager.s3, "s3", S3Service().s3)
+        self.s3_client.start()
+        self.s3 = provider_manager.s3
+        self.s3.s3.create_bucket(
+            Bucket=self.s3.bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": self.s3.region},
+        )
+        self.key = f"providers/{uuid.uuid4()}.jpg"
+        self.s3.upload_bytes(encode_image((1200, 800)), self.key, "image/jpeg")
+        self.photo_url = self.s3.object_url(self.key)
+        ServiceProviderFactory(id=1000, photo_url=self.photo_url)
+        # The task reads through its own app context and session.
+        db.session.commit()
+
+    def tearDown(self):
+        self.s3_client.stop()
+        self.aws.stop()
+        super().tearDown()
+
+    def provider(self) -> ServiceProviderModel:
+        db.session.expire_all()
+        return db.session.get(ServiceProviderModel, 1000)
+
+    def test_task_stores_the_derivatives(self):
+        generate_photo_derivatives.apply(args=(1000, self.photo_url)).get()
+
+        derivatives = self.provider().photo_derivatives
+        self.assertEqual(derivatives["source"], self.photo_url)
+        stem = self.key.rsplit(".", 1)[0]
+        self.assertEqual(
+            derivatives["sizes"]["card"],
+            {
+                "webp": f"derivatives/{stem}/card.webp",
+                "jpeg": f"derivatives/{stem}/card.jpg",
+            },
+        )
+        head = self.s3.head_photo(derivatives["sizes"]["hero"]["webp"])
+        self.assertEqual(head["ContentType"], "image/webp")
+
+        dumped = ProviderResponseSchema().dump(self.provider())["photo_derivatives"]
+        self.assertEqual(
+            dumped["thumbnail"]["jpeg"],
+            self.s3.object_url(f"derivatives/{stem}/thumbnail.jpg"),
+        )
+        self.assertEqual(ProviderManager.photos_without_derivatives(10), [])
+
+    def test_retries_are_idempotent(self):
+        ProviderManager.store_photo_derivatives(1000, self.photo_url)
+        db.session.commit()
+
+        with patch.object(self.s3, "upload_bytes") as upload:
+            ProviderManager.store_photo_derivatives(1000, self.photo_url)
+        upload.assert_not_called()
+
+    def test_replaced_photos_are_skipped(self):
+        ProviderManager.store_photo_derivatives(1000, "https://example.com/old.jpg")
+
+        self.assertIsNone(self.provider().photo_derivatives)
+        self.assertEqual(
+            [tuple(row) for row in ProviderManager.photos_without_derivatives(10)],
+            [(1000, self.photo_url)],
+        )
+
+    def test_photos_outside_the_bucket_and_unreadable_photos(self):
+        ServiceProviderFactory(id=1001, photo_url="https://example.com/photo.jpg")
+        self.s3.upload_bytes(b"not an image", self.key, "image/jpeg")
+
+        for provider_id in (1000, 1001):
+            url = db.session.get(ServiceProviderModel, provider_id).photo_url
+            ProviderManager.store_photo_derivatives(provider_id, url)
+
+        self.assertEqual(self.provider().photo_derivatives["sizes"], {})
+        self.assertIsNone(
+            ProviderResponseSchema().dump(self.provider())["photo_derivatives"]
+        )
+        self.assertEqual(ProviderManager.photos_without_derivatives(10), [])
+
+
+class TestPhotoDerivativeEnqueueing(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app.config["PHOTO_DERIVATIVES"] = True
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+
+    def register(self, uic):
+        inquiry = InquiryFactory(status=ProviderRegistrationState.APPROVED)
+        data = {
+            "company_name": "Delux Ltd",
+            "trade_name": "Delux Beauty Center",
+            "uic": uic,
+            "photo": ENCODED_PICTURE,
+            "photo_extension": "png",
+            "inquiry_id": inquiry.id,
+            "country": "BG",
+            "city": "Sofia",
+            "street": "Ivan Vazov",
+            "street_number": "17A",
+            "postal_code": "1000",
+        }
+        resp = self.client.post(
+            Endpoints.REGISTER_PROVIDER[0],
+            headers=self.headers,
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+        # The test app does not commit at teardown.
+        db.session.commit()
+        return resp
+
+    @patch.object(S3Service, "upload_photo", return_value="https://mock-s3-url.com/p.png")
+    def test_task_is_sent_after_commit(self, _):
+        with patch.object(generate_photo_derivatives, "apply_async") as send:
+            resp = self.register("1234567877")
+
+        self.assertEqual(resp.status_code, 201)
+        provider = ServiceProviderModel.query.one()
+        send.assert_called_once_with((provider.id, provider.photo_url), retry=False)
+
+    @patch.object(S3Service, "upload_photo", return_value="https://mock-s3-url.com/p.png")
+    def test_no_task_for_failed_registrations(self, _):
+        ServiceProviderFactory(uic="1234567877")
+        db.session.commit()
+
+        with patch.object(generate_photo_derivatives, "apply_async") as send:
+            resp = self.register("1234567877")
+
+        self.assertEqual(resp.status_code, 409)
+        send.assert_not_called()
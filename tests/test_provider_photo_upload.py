@@ -0,0 +1,121 @@
+import base64
+from unittest.mock import patch
+
+import requests
+from moto import mock_aws
+
+from managers import provider_manager
+from models import ProviderRegistrationState, ServiceProviderModel
+from services.s3 import S3Service
+from tests.base import BaseTestCase
+from tests.constants import ENCODED_PICTURE, Endpoints
+from tests.factories import ApproverFactory, InquiryFactory
+from tests.helpers import generate_token
+
+PROVIDER_DATA = {
+    "company_name": "Delux Ltd",
+    "trade_name": "Delux Beauty Center",
+    "uic": "1234567877",
+    "country": "BG",
+    "district": "Sofia",
+    "city": "Sofia",
+    "neighborhood": "Ivan Vazov",
+    "street": "Ivan Vazov",
+    "street_number": "17A",
+    "postal_code": "1000",
+    "latitude": 45.7262305,
+    "longitude": 21.3010148,
+}
+
+
+class TestPresignedPhotoUpload(BaseTestCase):
+    URL = Endpoints.PROVIDER_PHOTO_UPLOAD[0]
+
+    def setUp(self):
+        super().setUp()
+        # moto stands in for S3, including uploads posted to presigned URLs.
+        self.aws = mock_aws()
+        self.aws.start()
+        self.s3_client = patch.object(provider_manager.s3, "s3", S3Service().s3)
+        self.s3_client.start()
+        provider_manager.s3.s3.create_bucket(
+            Bucket=provider_manager.s3.bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": provider_manager.s3.region},
+        )
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+
+    def tearDown(self):
+        self.s3_client.stop()
+        self.aws.stop()
+        super().tearDown()
+
+    def issue_upload(self, extension="png"):
+        resp = self.client.post(
+            self.URL, headers=self.headers, json={"photo_extension": extension}
+        )
+        self.assertEqual(resp.status_code, 201)
+        return resp.json
+
+    def upload(self, photo: bytes) -> str:
+        upload = self.issue_upload()
+        resp = requests.post(
+            upload["url"], data=upload["fields"], files={"file": ("photo.png", photo)}
+        )
+        self.assertEqual(resp.status_code, 204)
+        return upload["key"]
+
+    def register(self, **photo):
+        inquiry = InquiryFactory(status=ProviderRegistrationState.APPROVED)
+        return self.client.post(
+            Endpoints.REGISTER_PROVIDER[0],
+            headers=self.headers,
+            json={**PROVIDER_DATA, "inquiry_id": inquiry.id, **photo},
+        )
+
+    def test_register_with_an_uploaded_photo(self):
+        upload = self.issue_upload()
+        self.assertRegex(upload["key"], r"^providers/[0-9a-f-]{36}\.png$")
+        self.assertEqual(upload["fields"]["Content-Type"], "image/png")
+
+        key = self.upload(base64.b64decode(ENCODED_PICTURE))
+        resp = self.register(photo_key=key)
+
+        self.assertEqual(resp.status_code, 201)
+        provider = ServiceProviderModel.query.one()
+        self.assertEqual(provider.photo_url, provider_manager.s3.object_url(key))
+
+    def test_photo_must_be_uploaded(self):
+        resp = self.register(photo_key=self.issue_upload()["key"])
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(ServiceProviderModel.query.count(), 0)
+
+    def test_oversized_upload_is_rejected(self):
+        key = self.upload(b"x" * 2048)
+
+        with patch.object(provider_manager, "PHOTO_MAX_BYTES", 1024):
+            resp = self.register(photo_key=key)
+
+        self.assertEqual(resp.status_code, 413)
+
+    def test_only_issued_keys_are_accepted(self):
+        resp = self.register(photo_key="invoices/2024.pdf")
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("photo_key", resp.json["message"])
+
+    def test_photo_and_key_are_exclusive(self):
+        key = self.upload(base64.b64decode(ENCODED_PICTURE))
+
+        resp = self.register(photo_key=key, photo=ENCODED_PICTURE, photo_extension="png")
+        self.assertEqual(resp.status_code, 400)
+
+        resp = self.register()
+        self.assertEqual(resp.status_code, 400)
+
+    def test_unsupported_extension(self):
+        resp = self.client.post(
+            self.URL, headers=self.headers, json={"photo_extension": "exe"}
+        )
+
+        self.assertEqual(resp.status_code, 400)
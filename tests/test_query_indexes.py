@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from db import db
+from models import (
+    AppointmentModel,
+    InquiryModel,
+    ProviderRegistrationState,
+    ServiceCategoryModel,
+    ServiceModel,
+    ServiceProviderModel,
+    ServiceSubcategoryModel,
+    UserModel,
+    WorkingHoursModel,
+)
+from tests.base import BaseTestCase
+
+# Large enough, and with few enough active rows on the soft-delete tables, that
+# the planner picks these indexes on cost rather than because it has to.
+SEED_SQL = (
+    """
+    INSERT INTO service_providers (id, company_name, trade_name, uic, photo_url,
+        country, city, street, street_number, postal_code, is_active)
+    SELECT n, 'Company ' || n, 'Trade ' || n, 'UIC' || n, '', 'BG', 'Sofia',
+        'Street', '1', '1000', n % 50 = 0
+    FROM generate_series(1, 10000) AS n
+    """,
+    """
+    INSERT INTO users (id, email, first_name, last_name, phone, password, role,
+        service_provider_id, is_active)
+    SELECT n, 'user' || n || '@example.com', 'First', 'Last', '08' || n, 'x',
+        CASE WHEN n <= 1000 THEN 'STAFF'::roletype ELSE 'CLIENT'::roletype END,
+        CASE WHEN n <= 1000 THEN n % 200 + 1 END, n % 50 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    INSERT INTO categories (id, name, is_active)
+    SELECT n, 'Category ' || n, n % 50 = 0 FROM generate_series(1, 10000) AS n
+    """,
+    """
+    INSERT INTO subcategories (id, name, category_id, is_active)
+    SELECT n, 'Subcategory ' || n, n % 500 + 1, n % 50 = 0
+    FROM generate_series(1, 10000) AS n
+    """,
+    """
+    INSERT INTO services (id, name, duration, price, service_subcategory_id,
+        service_provider_id, staff_id, is_active)
+    SELECT n, 'Service ' || n, 30, 50, n % 2000 + 1, n % 200 + 1, n % 1000 + 1,
+        n % 50 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    INSERT INTO working_hours (day_of_week, start_time, end_time, provider_id,
+        employee_id, is_active)
+    SELECT d, '09:00', '17:00', e % 200 + 1, e, e % 50 = 0
+    FROM generate_series(1, 1000) AS e, generate_series(0, 6) AS d
+    """,
+    """
+    INSERT INTO appointments (service_id, staff_id, customer_id, appointment_time,
+        status)
+    SELECT n % 5000 + 1, n % 1000 + 1, 1001 + n % 4000,
+        TIMESTAMP '2030-01-01 09:00' + (n % 365) * INTERVAL '1 day'
+            + (n % 16) * INTERVAL '30 minutes',
+        'pending'
+    FROM generate_series(1, 20000) AS n
+    """,
+    """
+    INSERT INTO inquiries (salon_name, city, email, first_name, last_name, phone,
+        status)
+    SELECT 'Salon ' || n, 'Sofia', 'inquiry' || n || '@example.com', 'First',
+        'Last', '09' || n,
+        CASE WHEN n % 50 = 0 THEN 'PENDING'::providerregistrationstate
+             ELSE 'APPROVED'::providerregistrationstate END
+    FROM generate_series(1, 5000) AS n
+    """,
+)
+
+
+class TestQueryIndexes(BaseTestCase):
+    """
+    Runs EXPLAIN for the query shapes the managers issue and checks that none of
+    them falls back to a sequential scan of the filtered table.
+    """
+
+    def setUp(self):
+        super().setUp()
+        for statement in SEED_SQL:
+            db.session.execute(text(statement))
+        db.session.execute(text("ANALYZE"))
+
+    def _plan(self, statement) -> dict:
+        compiled = statement.compile(
+            dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+        )
+        result = db.session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        return result.scalar()[0]["Plan"]
+
+    @classmethod
+    def _scans(cls, plan: dict):
+        yield plan
+        for child in plan.get("Plans", []):
+            yield from cls._scans(child)
+
+    def assert_uses_index(self, statement, table: str, index_name: str):
+        scans = [
+            node
+            for node in self._scans(self._plan(statement))
+            if node.get("Relation Name") == table or "Index Name" in node
+        ]
+
+        self.assertFalse(
+            [node for node in scans if node["Node Type"] == "Seq Scan"],
+            f"Sequential scan on {table}",
+        )
+        self.assertIn(index_name, [node.get("Index Name") for node in scans])
+
+    def test_appointments_by_staff_and_time(self):
+        day = datetime(2030, 3, 1)
+        statement = db.select(AppointmentModel).filter(
+            AppointmentModel.staff_id == 42,
+            AppointmentModel.appointment_time >= day,
+            AppointmentModel.appointment_time < day + timedelta(days=1),
+        )
+
+        self.assert_uses_index(
+            statement, "appointments", "ix_appointments_staff_id_appointment_time"
+        )
+
+    def test_appointments_by_customer(self):
+        statement = db.select(AppointmentModel).filter_by(customer_id=1500)
+
+        self.assert_uses_index(statement, "appointments", "ix_appointments_customer_id")
+
+    def test_working_hours_by_employee_and_day(self):
+        statement = db.select(WorkingHoursModel).filter_by(
+            employee_id=42, day_of_week=2
+        )
+
+        self.assert_uses_index(
+            statement, "working_hours", "ix_working_hours_employee_id_day_of_week"
+        )
+
+    def test_active_working_hours_by_employee_and_day(self):
+        statement = db.select(WorkingHoursModel).filter_by(
+            employee_id=50, day_of_week=2, is_active=True
+        )
+
+        self.assert_uses_index(
+            statement, "working_hours", "uq_working_hours_employee_day_start"
+        )
+
+    def test_services_by_provider(self):
+        statement = db.select(ServiceModel).filter_by(service_provider_id=7)
+
+        self.assert_uses_index(statement, "services", "ix_services_service_provider_id")
+
+    def test_services_by_subcategory(self):
+        statement = db.select(ServiceModel).filter_by(service_subcategory_id=7)
+
+        self.assert_uses_index(
+            statement, "services", "ix_services_service_subcategory_id"
+        )
+
+    def test_users_by_provider(self):
+        statement = db.select(UserModel).filter_by(service_provider_id=7)
+
+        self.assert_uses_index(statement, "users", "ix_users_service_provider_id")
+
+    def test_inquiries_by_status(self):
+        statement = db.select(InquiryModel).filter_by(
+            status=ProviderRegistrationState.PENDING
+        )
+
+        self.assert_uses_index(statement, "inquiries", "ix_inquiries_status")
+
+    def test_active_records(self):
+        models = (
+            ServiceCategoryModel,
+            ServiceSubcategoryModel,
+            ServiceModel,
+            ServiceProviderModel,
+            UserModel,
+            WorkingHoursModel,
+        )
+        for model in models:
+            with self.subTest(table=model.__tablename__):
+                statement = db.select(model).filter(model.is_active == True)
+
+                self.assert_uses_index(
+                    statement,
+                    model.__tablename__,
+                    f"ix_{model.__tablename__}_active",
+                )
@@ -0,0 +1,68 @@
+import os
+from unittest.mock import patch
+
+from db import db
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import ApproverFactory, CategoryFactory
+from tests.helpers import generate_token
+from utils import db_routing
+
+
+class TestReadOnlyRequests(BaseTestCase):
+    URL_CATEGORIES = Endpoints.CATEGORY_PROFILE
+    URL_REGISTER_CATEGORY = Endpoints.REGISTER_CATEGORY[0]
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        CategoryFactory(id=1000)
+        # Read requests only switch to a read-only session when no transaction
+        # is open yet.
+        db.session.commit()
+        db.session.remove()
+
+        self.connections = self.record_statements(record=self._connection_mode)
+
+    @staticmethod
+    def _connection_mode(conn, cursor, statement):
+        dbapi_connection = conn.connection.dbapi_connection
+        return dbapi_connection.readonly, dbapi_connection.autocommit
+
+    def test_get_runs_in_read_only_transaction(self):
+        resp = self.client.get(self.URL_CATEGORIES, headers=self.headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), 1)
+        self.assertTrue(self.connections)
+        self.assertTrue(all(readonly for readonly, _ in self.connections))
+        # The session is closed at teardown instead of being committed.
+        self.assertFalse(db.session().in_transaction())
+
+    def test_get_in_autocommit_mode(self):
+        with patch.object(db_routing, "READ_ONLY_MODE", "autocommit"):
+            resp = self.client.get(self.URL_CATEGORIES, headers=self.headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(all(autocommit for _, autocommit in self.connections))
+
+    def test_writes_keep_read_write_transaction(self):
+        self.client.get(self.URL_CATEGORIES, headers=self.headers)
+        self.connections.clear()
+
+        resp = self.client.post(
+            self.URL_REGISTER_CATEGORY, headers=self.headers, json={"name": "Massage"}
+        )
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertTrue(self.connections)
+        self.assertFalse(any(readonly for readonly, _ in self.connections))
+
+    def test_autocommit_is_rejected_behind_pgbouncer(self):
+        env = {"DB_READ_ONLY_MODE": "autocommit", "DB_PGBOUNCER": "True"}
+        with patch.dict(os.environ, env):
+            with self.assertRaises(ValueError):
+                db_routing.read_only_mode()
+
+            with patch.dict(os.environ, {"DB_STATEMENT_TIMEOUT_MS": "0"}):
+                self.assertEqual(db_routing.read_only_mode(), "autocommit")
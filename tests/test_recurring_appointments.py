@@ -0,0 +1,153 @@
+from datetime import datetime, time
+from unittest.mock import patch
+
+from db import db
+from models import AppointmentModel
+from services.cache import working_hours_cache
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+    UserFactory,
+    WorkingHourFactory,
+)
+from tests.helpers import generate_token
+
+
+@patch("services.ses.SESService.send_email")
+class TestRecurringAppointmentBooking(BaseTestCase):
+    URL = Endpoints.CUSTOMER_RECURRING_APPOINTMENT_BOOKING[0]
+    # 2030-01-07 is a Monday.
+    FIRST = datetime(2030, 1, 7, 10)
+
+    def setUp(self):
+        super().setUp()
+        working_hours_cache.clear()
+        provider = ServiceProviderFactory(id=1000)
+        self.staff = StaffFactory(id=1000)
+        self.service = ServiceFactory(
+            id=1000,
+            service_provider_id=provider.id,
+            staff_id=self.staff.id,
+            duration=60,
+        )
+        WorkingHourFactory(
+            provider_id=provider.id,
+            employee_id=self.staff.id,
+            day_of_week=0,
+            start_time=time(9),
+            end_time=time(17),
+        )
+        self.customer = UserFactory(id=1001)
+        AppointmentFactory(
+            id=1000,
+            service_id=self.service.id,
+            staff_id=self.staff.id,
+            customer_id=self.customer.id,
+            appointment_time=datetime(2030, 1, 14, 10, 30),
+        )
+        self.headers = {"Authorization": f"Bearer {generate_token(self.customer)}"}
+
+        self.statements = self.record_statements()
+
+    def tearDown(self):
+        working_hours_cache.clear()
+        super().tearDown()
+
+    def _post(self, **payload):
+        return self.client.post(
+            self.URL,
+            headers=self.headers,
+            json={"service_id": self.service.id, "staff_id": self.staff.id, **payload},
+        )
+
+    def _count(self) -> int:
+        return db.session.execute(
+            db.select(db.func.count(AppointmentModel.id))
+        ).scalar_one()
+
+    def test_series_is_booked_with_one_insert_and_one_email(self, mock_send_email):
+        resp = self._post(
+            appointment_time=datetime(2030, 1, 7, 12).isoformat(), occurrences=4
+        )
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(
+            [item["appointment_time"] for item in resp.json["appointments"]],
+            [f"2030-01-{day:02d}T12:00:00" for day in (7, 14, 21, 28)],
+        )
+        self.assertEqual(resp.json["conflicts"], [])
+        inserts = [
+            statement
+            for statement in self.statements
+            if statement.startswith("INSERT INTO appointments")
+        ]
+        self.assertEqual(len(inserts), 1)
+        working_hours_reads = [
+            statement
+            for statement in self.statements
+            if statement.startswith("SELECT") and "FROM working_hours" in statement
+        ]
+        self.assertEqual(len(working_hours_reads), 1)
+        mock_send_email.assert_called_once()
+
+    def test_conflict_lists_failed_dates_and_books_nothing(self, mock_send_email):
+        resp = self._post(appointment_time=self.FIRST.isoformat(), occurrences=3)
+
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(
+            resp.json["conflicts"],
+            [
+                {
+                    "appointment_time": "2030-01-14T10:00:00",
+                    "reason": "The time slot is already booked.",
+                }
+            ],
+        )
+        self.assertEqual(self._count(), 1)
+        mock_send_email.assert_not_called()
+
+    def test_skip_conflicts_books_the_free_occurrences(self, mock_send_email):
+        resp = self._post(
+            appointment_times=[
+                self.FIRST.isoformat(),
+                datetime(2030, 1, 14, 10).isoformat(),
+                datetime(2030, 1, 15, 10).isoformat(),
+                datetime(2030, 1, 21, 10, 30).isoformat(),
+                datetime(2030, 1, 21, 10).isoformat(),
+            ],
+            skip_conflicts=True,
+        )
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(
+            [item["appointment_time"] for item in resp.json["appointments"]],
+            ["2030-01-07T10:00:00", "2030-01-21T10:00:00"],
+        )
+        conflicts = resp.json["conflicts"]
+        self.assertEqual(
+            {item["appointment_time"]: item["reason"] for item in conflicts},
+            {
+                "2030-01-14T10:00:00": "The time slot is already booked.",
+                "2030-01-15T10:00:00": "Outside of working hours.",
+                "2030-01-21T10:30:00": "Overlaps another requested time.",
+            },
+        )
+        self.assertEqual(self._count(), 3)
+        mock_send_email.assert_called_once()
+
+    def test_series_and_list_are_exclusive(self, mock_send_email):
+        resp = self._post(
+            appointment_time=self.FIRST.isoformat(),
+            occurrences=2,
+            appointment_times=[self.FIRST.isoformat()],
+        )
+
+        self.assertEqual(resp.status_code, 400)
+
+        resp = self._post(appointment_time=self.FIRST.isoformat())
+
+        self.assertEqual(resp.status_code, 400)
@@ -0,0 +1,76 @@
+from config import TestingConfig, create_app
+from db import db
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import ApproverFactory, CategoryFactory
+from tests.helpers import generate_token
+from utils.db_routing import REPLICA_BIND_KEY, sticky_primary
+
+
+class ReplicaTestingConfig(TestingConfig):
+    # The test database is registered a second time as the replica bind.
+    SQLALCHEMY_BINDS = {REPLICA_BIND_KEY: TestingConfig.SQLALCHEMY_DATABASE_URI}
+
+
+class TestReplicaRouting(BaseTestCase):
+    URL_CATEGORIES = Endpoints.CATEGORY_PROFILE
+    URL_REGISTER_CATEGORY = Endpoints.REGISTER_CATEGORY[0]
+
+    def create_app(self):
+        return create_app(ReplicaTestingConfig)
+
+    def setUp(self):
+        super().setUp()
+        self.token = generate_token(ApproverFactory())
+        self.other_token = generate_token(ApproverFactory())
+        CategoryFactory(id=1000)
+        # The replica has its own connection, so the seed data must be committed.
+        db.session.commit()
+        db.session.remove()
+
+        self.replica_statements = self.record_statements(db.engines[REPLICA_BIND_KEY])
+
+    def tearDown(self):
+        sticky_primary._last_write.clear()
+        super().tearDown()
+        # Registering the bind also adds an (empty) metadata for it to the shared
+        # extension, which other test apps without the bind must not see.
+        db.metadatas.pop(REPLICA_BIND_KEY, None)
+
+    @staticmethod
+    def _headers(token):
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_get_requests_read_from_replica(self):
+        resp = self.client.get(self.URL_CATEGORIES, headers=self._headers(self.token))
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), 1)
+        self.assertTrue(self.replica_statements)
+        self.assertTrue(
+            all(statement.lstrip().startswith("SELECT") for statement in self.replica_statements)
+        )
+
+    def test_writes_stick_to_primary(self):
+        headers = self._headers(self.token)
+
+        resp = self.client.post(
+            self.URL_REGISTER_CATEGORY, headers=headers, json={"name": "Massage"}
+        )
+        self.assertEqual(resp.status_code, 201)
+        self.assertFalse(self.replica_statements)
+        db.session.commit()
+        db.session.remove()
+
+        # The writer reads its own write from the primary ...
+        resp = self.client.get(self.URL_CATEGORIES, headers=headers)
+        self.assertEqual(len(resp.json), 2)
+        self.assertFalse(self.replica_statements)
+        db.session.remove()
+
+        # ... while other clients keep using the replica.
+        resp = self.client.get(
+            self.URL_CATEGORIES, headers=self._headers(self.other_token)
+        )
+        self.assertEqual(len(resp.json), 2)
+        self.assertTrue(self.replica_statements)
@@ -0,0 +1,160 @@
+import threading
+import time
+from unittest.mock import patch
+
+from config import TestingConfig, create_app
+from db import db
+from services.cache import ResponseCache, response_cache
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    ApproverFactory,
+    CategoryFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+)
+from tests.helpers import generate_token
+
+
+class ResponseCacheConfig(TestingConfig):
+    FAST_SERIALIZATION = False
+    RESPONSE_CACHE = True
+
+
+class TestResponseCache(BaseTestCase):
+    def test_entries_are_evicted_least_recently_used_first(self):
+        cache = ResponseCache(max_entries=2)
+        cache.get_or_set("a", ["categories"], lambda: 1)
+        cache.get_or_set("b", ["categories"], lambda: 2)
+        cache.get_or_set("a", ["categories"], lambda: None)
+        cache.get_or_set("c", ["categories"], lambda: 3)
+
+        self.assertEqual(cache.get_or_set("a", ["categories"], lambda: None), 1)
+        self.assertEqual(cache.get_or_set("b", ["categories"], lambda: 4), 4)
+
+    def test_entries_expire(self):
+        cache = ResponseCache(ttl_seconds=60)
+        cache.get_or_set("a", ["categories"], lambda: 1)
+
+        with patch("services.cache.time.monotonic", return_value=time.monotonic() + 61):
+            self.assertEqual(cache.get_or_set("a", ["categories"], lambda: 2), 2)
+
+    def test_local_only_entries_expire_after_local_ttl(self):
+        cache = ResponseCache(ttl_seconds=300, local_ttl_seconds=5)
+        cache.get_or_set("a", ["categories"], lambda: 1)
+
+        with patch("services.cache.time.monotonic", return_value=time.monotonic() + 6):
+            self.assertEqual(cache.get_or_set("a", ["categories"], lambda: 2), 2)
+
+    def test_invalidate_drops_dependent_entries_only(self):
+        cache = ResponseCache()
+        cache.get_or_set("categories", ["categories"], lambda: 1)
+        cache.get_or_set("providers", ["service_providers", "users"], lambda: 1)
+
+        cache.invalidate(["users"])
+
+        self.assertEqual(cache.get_or_set("categories", ["categories"], lambda: 2), 1)
+        self.assertEqual(
+            cache.get_or_set("providers", ["service_providers", "users"], lambda: 2), 2
+        )
+
+    def test_concurrent_misses_compute_once(self):
+        cache = ResponseCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.get_or_set("a", ["categories"], compute)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 8)
+
+
+class TestCachedCatalogEndpoints(BaseTestCase):
+    def create_app(self):
+        return create_app(ResponseCacheConfig)
+
+    def setUp(self):
+        super().setUp()
+        response_cache.clear()
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        self.category = CategoryFactory(id=1000, name="Hair")
+        self.provider = ServiceProviderFactory(id=1000)
+        StaffFactory(service_provider_id=self.provider.id)
+        db.session.commit()
+
+        self.statements = self.record_statements()
+
+    def tearDown(self):
+        response_cache.clear()
+        super().tearDown()
+
+    def test_hit_skips_catalog_queries(self):
+        first = self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+        self.statements.clear()
+        second = self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json, first.json)
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+        # Only the token's user lookup reaches the database.
+        self.assertEqual(len(self.statements), 1)
+
+        resp = self.client.get(
+            Endpoints.CATEGORY_PROFILE,
+            headers={**self.headers, "If-None-Match": first.headers["ETag"]},
+        )
+        self.assertEqual(resp.status_code, 304)
+
+    def test_query_args_are_part_of_the_key(self):
+        self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+        resp = self.client.get(
+            f"{Endpoints.CATEGORY_PROFILE}?status=inactive", headers=self.headers
+        )
+
+        self.assertEqual(resp.json, [])
+
+    def test_committed_update_invalidates(self):
+        self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+
+        db.session.get(type(self.category), 1000).name = "Nails"
+        db.session.commit()
+        resp = self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+
+        self.assertIn("Nails", [category["name"] for category in resp.json])
+
+    def test_rolled_back_change_keeps_entries(self):
+        self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+
+        db.session.get(type(self.category), 1000).name = "Nails"
+        db.session.flush()
+        db.session.rollback()
+        self.statements.clear()
+        self.client.get(Endpoints.CATEGORY_PROFILE, headers=self.headers)
+
+        self.assertEqual(len(self.statements), 1)
+
+    def test_nested_table_change_invalidates_providers(self):
+        resp = self.client.get(Endpoints.PROVIDER_PROFILE, headers=self.headers)
+        self.assertEqual(len(resp.json["providers"][0]["employees"]), 1)
+
+        StaffFactory(service_provider_id=self.provider.id)
+        db.session.commit()
+        resp = self.client.get(Endpoints.PROVIDER_PROFILE, headers=self.headers)
+
+        self.assertEqual(len(resp.json["providers"][0]["employees"]), 2)
@@ -0,0 +1,157 @@
+from unittest import TestCase
+
+from managers.category_manager import CategoryManager
+from managers.search_manager import SearchManager, prefix_query
+from managers.service_manager import ServiceManager
+from managers.subcategory_manager import SubCategoryManager
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    CategoryFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    SubCategoryFactory,
+    UserFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestPrefixQuery(TestCase):
+    def test_every_word_is_a_prefix(self):
+        self.assertEqual(prefix_query("Hair cu"), "'hair':* & 'cu':*")
+
+    def test_operators_and_quotes_are_dropped(self):
+        self.assertEqual(prefix_query("o'neil & (spa)|!"), "'o':* & 'neil':* & 'spa':*")
+        self.assertEqual(prefix_query("nail_art"), "'nail':* & 'art':*")
+        self.assertIsNone(prefix_query(" !*& "))
+
+
+class TestCatalogSearch(BaseTestCase):
+    URL = Endpoints.SEARCH[0]
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(UserFactory())}"}
+        CategoryFactory(id=1, name="Hair Care")
+        CategoryFactory(id=2, name="Nails")
+        SubCategoryFactory(id=1, name="Haircut", category_id=1)
+        SubCategoryFactory(id=2, name="Coloring", category_id=1)
+        SubCategoryFactory(id=3, name="Manicure", category_id=2)
+        SubCategoryFactory(id=4, name="Hair Removal", category_id=2, is_active=False)
+        ServiceProviderFactory(
+            id=1, trade_name="Hairmony Studio", company_name="Bliss Ltd"
+        )
+        ServiceProviderFactory(
+            id=2, trade_name="Bliss Salon", company_name="Hairline Ltd"
+        )
+        ServiceProviderFactory(
+            id=3, trade_name="Hair Closed", company_name="Closed Ltd", is_active=False
+        )
+        for service_id, name, subcategory_id, provider_id, is_active in (
+            (1, "Haircut Men", 1, 1, True),
+            (2, "Blowout", 1, 2, True),
+            (3, "Root Color", 2, 1, True),
+            (4, "Gel Polish", 3, 2, True),
+            (5, "Hair Mask", 1, 1, False),
+            (6, "Hair Gloss", 1, 3, True),
+        ):
+            ServiceFactory(
+                id=service_id,
+                name=name,
+                service_subcategory_id=subcategory_id,
+                service_provider_id=provider_id,
+                is_active=is_active,
+            )
+
+    def search(self, **args):
+        return self.client.get(self.URL, headers=self.headers, query_string=args)
+
+    @staticmethod
+    def ids(results, name):
+        return [row.id for row in results[name]]
+
+    def test_prefixes_ranked_by_the_name_they_match(self):
+        results = SearchManager.search("hai", 5)
+
+        # The trade name weighs more than the company name, and the service
+        # name more than its subcategory and then its category.
+        self.assertEqual(self.ids(results, "providers"), [1, 2])
+        self.assertEqual(self.ids(results, "services"), [1, 2, 3])
+        self.assertEqual(self.ids(results, "categories"), [1])
+        self.assertEqual(self.ids(results, "subcategories"), [1])
+
+    def test_every_word_must_match(self):
+        results = SearchManager.search("hair m", 5)
+
+        self.assertEqual(self.ids(results, "services"), [1])
+        self.assertEqual(self.ids(results, "providers"), [])
+        self.assertEqual(SearchManager.search("?!", 5)["services"], [])
+
+    def test_inactive_subcategories_and_categories_are_excluded(self):
+        SubCategoryManager.update(2, {"is_active": False})
+        CategoryManager.update(2, {"is_active": False})
+
+        self.assertEqual(self.ids(SearchManager.search("hai", 5), "services"), [1, 2])
+        results = SearchManager.search("manic", 5)
+        self.assertEqual(self.ids(results, "services"), [])
+        self.assertEqual(self.ids(results, "subcategories"), [])
+
+    def test_limit(self):
+        self.assertEqual(self.ids(SearchManager.search("h", 2), "services"), [1, 2])
+
+    def test_renames_reindex_the_services(self):
+        SubCategoryManager.update(2, {"name": "Balayage"})
+        self.assertEqual(self.ids(SearchManager.search("balay", 5), "services"), [3])
+
+        CategoryManager.update(1, {"name": "Styling"})
+        self.assertEqual(
+            self.ids(SearchManager.search("styl", 5), "services"), [1, 2, 3]
+        )
+        self.assertEqual(self.ids(SearchManager.search("hair care", 5), "services"), [])
+
+        SubCategoryManager.update(3, {"category_id": 1})
+        ServiceManager.update(2, {"name": "Brushing", "service_subcategory_id": 3})
+        self.assertEqual(
+            self.ids(SearchManager.search("styl", 5), "services"), [1, 2, 3, 4]
+        )
+        self.assertEqual(
+            self.ids(SearchManager.search("manic brush", 5), "services"), [2]
+        )
+
+    def test_response(self):
+        resp = self.search(q="Haircut", limit=1)
+
+        self.assertEqual(resp.status_code, 200, resp.json)
+        self.assertEqual(
+            resp.json["services"],
+            [
+                {
+                    "id": 1,
+                    "name": "Haircut Men",
+                    "price": resp.json["services"][0]["price"],
+                    "duration": 30,
+                    "subcategory_id": 1,
+                    "provider_id": 1,
+                    "provider_trade_name": "Hairmony Studio",
+                }
+            ],
+        )
+        self.assertEqual(
+            resp.json["subcategories"], [{"id": 1, "name": "Haircut", "category_id": 1}]
+        )
+        self.assertEqual(resp.json["categories"], [])
+        self.assertEqual(resp.json["providers"], [])
+
+    def test_invalid_queries(self):
+        for args in (
+            {},
+            {"q": ""},
+            {"q": "hair", "limit": 0},
+            {"q": "hair", "limit": 21},
+        ):
+            self.assertEqual(self.search(**args).status_code, 400, args)
+
+    def test_login_required(self):
+        self.headers = {}
+
+        self.assertEqual(self.search(q="hair").status_code, 401)
@@ -0,0 +1,136 @@
+from datetime import datetime
+
+from config import TestingConfig, create_app
+from db import db
+from managers.appointment_manager import AppointmentManager
+from managers.category_manager import CategoryManager
+from managers.inquiry_manager import InquiryManager
+from managers.provider_manager import ProviderManager
+from managers.service_manager import ServiceManager
+from managers.subcategory_manager import SubCategoryManager
+from schemas.response.appointment_response_schema import (
+    CustomerAppointmentResponseSchema,
+)
+from schemas.response.category_response_schema import CategoryResponseSchema
+from schemas.response.inquiry_response_schema import InquiryResponseSchema
+from schemas.response.provider_response_schema import ProviderResponseSchema
+from schemas.response.service_response_schema import ServiceResponseSchema
+from schemas.response.subcategory_response_schema import SubCategoryResponseSchema
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    AppointmentFactory,
+    ApproverFactory,
+    CategoryFactory,
+    InquiryFactory,
+    OwnerFactory,
+    ServiceFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+    SubCategoryFactory,
+    UserFactory,
+)
+from tests.helpers import generate_token
+from utils.serializers import get_projection
+
+
+class FastSerializationConfig(TestingConfig):
+    FAST_SERIALIZATION = True
+
+
+class TestRowProjectionParity(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        providers = [ServiceProviderFactory(id=1000 + i) for i in range(3)]
+        for provider in providers[:2]:
+            StaffFactory(service_provider_id=provider.id)
+            StaffFactory(service_provider_id=provider.id, is_active=False)
+        providers[0].owners.extend([OwnerFactory(), OwnerFactory()])
+        providers[2].is_active = False
+
+        for i in range(3):
+            category = CategoryFactory(id=1000 + i, name=f"category-{i}")
+            SubCategoryFactory(
+                id=1000 + i,
+                name=f"subcategory-{i}",
+                category_id=category.id,
+                is_active=bool(i % 2),
+            )
+            service = ServiceFactory(id=1000 + i, service_provider_id=providers[0].id)
+            AppointmentFactory(
+                id=1000 + i,
+                service_id=service.id,
+                staff_id=service.staff_id,
+                customer_id=UserFactory().id,
+                appointment_time=datetime(2030, 1, 7, 10 + i),
+            )
+        InquiryFactory(id=1000)
+        InquiryFactory(id=1001, status="PENDING")
+        db.session.flush()
+
+    def assert_parity(self, statement, schema_cls):
+        model = statement.column_descriptions[0]["entity"]
+        expected = schema_cls().dump(
+            db.session.execute(statement).scalars().all(), many=True
+        )
+        db.session.expire_all()
+
+        projected = get_projection(schema_cls, model).execute(statement)
+
+        self.assertTrue(expected)
+        self.assertEqual(projected, expected)
+
+    def test_categories(self):
+        self.assert_parity(CategoryManager.records_statement(), CategoryResponseSchema)
+        self.assert_parity(
+            CategoryManager.records_statement(status="active"), CategoryResponseSchema
+        )
+
+    def test_subcategories(self):
+        self.assert_parity(
+            SubCategoryManager.records_statement(), SubCategoryResponseSchema
+        )
+        self.assert_parity(
+            SubCategoryManager.records_statement(status="inactive"),
+            SubCategoryResponseSchema,
+        )
+
+    def test_services(self):
+        self.assert_parity(ServiceManager.records_statement(), ServiceResponseSchema)
+
+    def test_providers_with_nested_users(self):
+        self.assert_parity(ProviderManager.records_statement(), ProviderResponseSchema)
+        self.assert_parity(
+            ProviderManager.records_statement(record_id=1000), ProviderResponseSchema
+        )
+
+    def test_inquiries(self):
+        self.assert_parity(InquiryManager.inquiries_statement(), InquiryResponseSchema)
+        self.assert_parity(
+            InquiryManager.inquiries_statement("pending"), InquiryResponseSchema
+        )
+
+    def test_appointments(self):
+        self.assert_parity(
+            AppointmentManager.appointments_statement(),
+            CustomerAppointmentResponseSchema,
+        )
+
+
+class TestFastSerializationEndpoints(BaseTestCase):
+    def create_app(self):
+        return create_app(FastSerializationConfig)
+
+    def test_list_endpoint_output_matches_marshmallow(self):
+        provider = ServiceProviderFactory(id=1000)
+        StaffFactory(service_provider_id=provider.id)
+        headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        url = Endpoints.PROVIDER_PROFILE
+
+        resp = self.client.get(url, headers=headers)
+        self.app.config["FAST_SERIALIZATION"] = False
+        expected = self.client.get(url, headers=headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json, expected.json)
+        self.assertEqual(len(resp.json["providers"][0]["employees"]), 1)
@@ -1,14 +1,20 @@
+import base64
 import json
 import os
-from unittest.mock import patch
+from unittest import TestCase
+from unittest.mock import ANY, patch
 
-from constants import TEMP_FILE_FOLDER
-from models import ServiceProviderModel, ProviderRegistrationState
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+
+from constants import PHOTO_UPLOAD_PREFIX, TEMP_FILE_FOLDER
+from db import db
+from models import InquiryModel, ServiceProviderModel, ProviderRegistrationState
 from services.s3 import S3Service
 from tests.base import BaseTestCase
 from tests.constants import ENCODED_PICTURE, Endpoints
 from tests.factories import InquiryFactory, ApproverFactory
 from tests.helpers import generate_token, mock_uuid
+from utils.helpers import DECODE_CHUNK_CHARS, decode_photo
 
 
 class TestProviderRegistration(BaseTestCase):
@@ -17,6 +23,8 @@ class TestProviderRegistration(BaseTestCase):
     @patch("uuid.uuid4", mock_uuid)
     @patch.object(S3Service, "upload_photo", return_value="https://mock-s3-url.com/photo.jpg")
     def test_create_service_provider(self, mocked_upload):
+        # The photo buffer is closed after the upload: read it during the call.
+        mocked_upload.side_effect = self.read_upload
         approver_user = ApproverFactory()
         token = generate_token(approver_user)
 
@@ -56,8 +64,7 @@ class TestProviderRegistration(BaseTestCase):
         self.assertEqual(resp.json["message"].strip(), "Service Provider created successfully")
 
         uuid_value = mock_uuid()
-        name = f"{uuid_value}.{data['photo_extension']}"
-        path = os.path.join(TEMP_FILE_FOLDER, name)
+        name = f"{PHOTO_UPLOAD_PREFIX}{uuid_value}.{data['photo_extension']}"
 
         # Verify that the service provider was created
         providers = ServiceProviderModel.query.all()
@@ -66,7 +73,114 @@ class TestProviderRegistration(BaseTestCase):
         self.assertEqual(provider.company_name, data["company_name"])
         self.assertEqual(provider.trade_name, data["trade_name"])
         self.assertEqual(provider.uic, data["uic"])
-        self.assertEqual(provider.photo_url, mocked_upload.return_value)
+        self.assertEqual(provider.photo_url, S3Service().object_url(name))
         self.assertEqual(provider.inquiry.id, inquiry.id)
 
-        mocked_upload.assert_called_once_with(path, name, data['photo_extension'])
+        mocked_upload.assert_called_once_with(ANY, name, data['photo_extension'])
+        self.assertEqual(self.uploaded, base64.b64decode(ENCODED_PICTURE))
+        self.assertFalse(os.path.exists(os.path.join(TEMP_FILE_FOLDER, name)))
+
+    def read_upload(self, photo, key, extension):
+        self.uploaded = photo.read()
+        return "https://mock-s3-url.com/photo.jpg"
+
+    def register(self, inquiry, uic="1234567877"):
+        data = {
+            "company_name": "Delux Ltd",
+            "trade_name": "Delux Beauty Center",
+            "uic": uic,
+            "photo": ENCODED_PICTURE,
+            "photo_extension": "png",
+            "inquiry_id": inquiry.id,
+            "country": "BG",
+            "city": "Sofia",
+            "street": "Ivan Vazov",
+            "street_number": "17A",
+            "postal_code": "1000",
+        }
+        token = generate_token(ApproverFactory())
+        return self.client.post(
+            self.URL, json=data, headers={"Authorization": f"Bearer {token}"}
+        )
+
+    @patch.object(S3Service, "upload_photo")
+    def test_unapproved_inquiry_is_rejected_before_uploading(self, mocked_upload):
+        resp = self.register(InquiryFactory(status=ProviderRegistrationState.PENDING))
+
+        self.assertEqual(resp.status_code, 403)
+        mocked_upload.assert_not_called()
+
+    @patch.object(S3Service, "upload_photo")
+    def test_duplicate_is_rejected_before_uploading(self, mocked_upload):
+        approved = ProviderRegistrationState.APPROVED
+        self.assertEqual(self.register(InquiryFactory(status=approved)).status_code, 201)
+        mocked_upload.reset_mock()
+
+        resp = self.register(InquiryFactory(status=approved))
+
+        self.assertEqual(resp.status_code, 409)
+        mocked_upload.assert_not_called()
+        self.assertEqual(ServiceProviderModel.query.count(), 1)
+
+    @patch.object(S3Service, "upload_photo", side_effect=BadRequest("Unable to upload photo"))
+    def test_failed_upload_rolls_back_the_insert(self, _):
+        inquiry = InquiryFactory(status=ProviderRegistrationState.APPROVED)
+
+        resp = self.register(inquiry)
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(ServiceProviderModel.query.count(), 0)
+        # Only the savepoint was rolled back.
+        self.assertIsNotNone(db.session.get(InquiryModel, inquiry.id))
+
+
+class TestDecodePhoto(TestCase):
+    def test_decodes_in_chunks(self):
+        photo = os.urandom(3 * DECODE_CHUNK_CHARS + 5)
+        encoded = base64.b64encode(photo).decode()
+        # MIME-style line breaks shift the chunks off the 4-character grid.
+        wrapped = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+
+        for value in (encoded, wrapped):
+            with decode_photo(value) as decoded:
+                self.assertEqual(decoded.read(), photo)
+
+    def test_invalid_encoding(self):
+        for value in ("not base64!", "QUJD=", ""):
+            with self.assertRaises(BadRequest):
+                decode_photo(value)
+
+    def test_size_cap(self):
+        encoded = base64.b64encode(b"x" * 1000).decode()
+
+        with decode_photo(encoded, max_bytes=1000) as decoded:
+            self.assertEqual(len(decoded.read()), 1000)
+        with self.assertRaises(RequestEntityTooLarge):
+            decode_photo(encoded, max_bytes=999)
+        with self.assertRaises(RequestEntityTooLarge):
+            decode_photo(encoded, max_bytes=500)
+
+    def test_size_cap_ignores_line_breaks(self):
+        photo = os.urandom(9900)
+        encoded = base64.b64encode(photo).decode()
+        wrapped = "\r\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+
+        with decode_photo(wrapped, max_bytes=10000) as decoded:
+            self.assertEqual(decoded.read(), photo)
+        with self.assertRaises(RequestEntityTooLarge):
+            decode_photo(wrapped, max_bytes=9899)
+
+
+class TestS3PhotoUpload(TestCase):
+    def test_uploads_the_buffer(self):
+        service = S3Service()
+
+        with patch.object(service.s3, "upload_fileobj") as upload, decode_photo(
+            ENCODED_PICTURE
+        ) as photo:
+            url = service.upload_photo(photo, "key.png", "png")
+
+        upload.assert_called_once_with(
+            photo, service.bucket_name, "key.png", ExtraArgs={"ContentType": "image/png"}
+        )
+        self.assertTrue(url.endswith("/key.png"))
@@ -0,0 +1,43 @@
+from db import db
+from tests.base import BaseTestCase
+from utils.transactions import on_commit, on_rollback
+
+
+class TestTransactionCallbacks(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        db.session.begin()
+
+    def register(self, name):
+        on_commit(db.session, lambda: self.calls.append(f"{name} committed"))
+        on_rollback(db.session, lambda: self.calls.append(f"{name} rolled back"))
+
+    def test_savepoints_wait_for_the_transaction(self):
+        self.register("a")
+        savepoint = db.session.begin_nested()
+        self.register("b")
+        savepoint.commit()
+        db.session.begin_nested().rollback()
+
+        self.assertEqual(self.calls, [])
+
+        db.session.commit()
+
+        self.assertEqual(self.calls, ["a committed", "b committed"])
+
+    def test_rollback(self):
+        self.register("a")
+        db.session.rollback()
+        db.session.commit()
+
+        self.assertEqual(self.calls, ["a rolled back"])
+
+    def test_failing_callback_does_not_skip_the_others(self):
+        on_commit(db.session, lambda: 1 / 0)
+        self.register("a")
+
+        with self.assertLogs("utils.transactions", "ERROR"):
+            db.session.commit()
+
+        self.assertEqual(self.calls, ["a committed"])
@@ -0,0 +1,61 @@
+from datetime import time
+
+from werkzeug.exceptions import BadRequest
+
+from schemas.request.working_hour_request_schema import WorkingHourBaseSchema
+from tests.base import BaseTestCase
+from utils.decorators import validate_schema
+
+PAYLOAD = {
+    "day_of_week": 0,
+    "start_time": "09:00:00",
+    "end_time": "17:00:00",
+    "provider_id": 1,
+    "employee_id": 2,
+}
+
+
+class CountingSchema(WorkingHourBaseSchema):
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        CountingSchema.instances += 1
+
+
+class TestValidateSchema(BaseTestCase):
+    def call(self, view, payload):
+        with self.app.test_request_context(json=payload):
+            return view()
+
+    def test_view_receives_deserialized_data(self):
+        view = validate_schema(WorkingHourBaseSchema)(lambda data: data)
+
+        data = self.call(view, PAYLOAD)
+
+        self.assertEqual(data["start_time"], time(9))
+        self.assertEqual(data["end_time"], time(17))
+
+    def test_schema_is_instantiated_once(self):
+        CountingSchema.instances = 0
+        view = validate_schema(CountingSchema)(lambda data: data)
+
+        for _ in range(3):
+            self.call(view, PAYLOAD)
+
+        self.assertEqual(CountingSchema.instances, 1)
+
+    def test_invalid_payload(self):
+        view = validate_schema(WorkingHourBaseSchema)(lambda data: data)
+
+        with self.assertRaises(BadRequest) as ctx:
+            self.call(view, {**PAYLOAD, "start_time": "nine"})
+
+        self.assertIn("Invalid payload", ctx.exception.description)
+        self.assertIn("start_time", ctx.exception.description)
+
+    def test_missing_payload(self):
+        view = validate_schema(WorkingHourBaseSchema)(lambda data: data)
+
+        with self.app.test_request_context(), self.assertRaises(BadRequest):
+            view()
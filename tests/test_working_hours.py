@@ -0,0 +1,321 @@
+from datetime import datetime, time
+
+from marshmallow import ValidationError
+
+from config import TestingConfig, create_app
+from db import db
+from managers.working_hours_manager import WorkingHoursManager
+from models import WorkingHoursModel
+from schemas.request.appointment_request_schema import (
+    CustomerAppointmentRequestSchema,
+)
+from services.cache import working_hours_cache
+from tests.base import BaseTestCase
+from tests.constants import Endpoints
+from tests.factories import (
+    ApproverFactory,
+    ServiceProviderFactory,
+    StaffFactory,
+    WorkingHourFactory,
+)
+from tests.helpers import generate_token
+
+
+class TestWorkingHoursBatch(BaseTestCase):
+    URL_REGISTER = Endpoints.REGISTER_WORKING_HOUR[0]
+    URL_BATCH_EDIT = Endpoints.BATCH_EDIT_WORKING_HOURS[0]
+    URL_BATCH_DEACTIVATE = Endpoints.BATCH_DEACTIVATE_WORKING_HOURS[0]
+
+    def setUp(self):
+        super().setUp()
+        self.headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        self.provider_id = ServiceProviderFactory(id=1000).id
+        # Faker names collide too often for 40 unique emails.
+        self.employee_ids = [
+            StaffFactory(email=f"staff_{i}@example.com").id for i in range(40)
+        ]
+
+        self.statements = self.record_statements()
+
+    def _payload(self, employee_ids, days=range(7), start="09:00", end="17:00"):
+        return {
+            "provider_id": self.provider_id,
+            "employees": [
+                {
+                    "employee_id": employee_id,
+                    "working_hours": [
+                        {
+                            "day_of_week": day,
+                            "start_time": start,
+                            "end_time": end,
+                            "provider_id": self.provider_id,
+                            "employee_id": employee_id,
+                        }
+                        for day in days
+                    ],
+                }
+                for employee_id in employee_ids
+            ],
+        }
+
+    def _count(self, **filters) -> int:
+        return len(
+            db.session.execute(db.select(WorkingHoursModel).filter_by(**filters))
+            .scalars()
+            .all()
+        )
+
+    def test_batch_create_uses_single_insert(self):
+        resp = self.client.post(
+            self.URL_REGISTER, headers=self.headers, json=self._payload(self.employee_ids)
+        )
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(len(resp.json["working_hour_ids"]), 280)
+        self.assertEqual(self._count(), 280)
+        inserts = [s for s in self.statements if s.lstrip().startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+
+    def test_batch_create_replaces_same_start(self):
+        employee_ids = self.employee_ids[:2]
+        self.client.post(
+            self.URL_REGISTER, headers=self.headers, json=self._payload(employee_ids)
+        )
+
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload(employee_ids, end="18:00"),
+        )
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(self._count(), 14)
+        self.assertEqual(self._count(end_time="18:00"), 14)
+
+    def test_batch_create_rejects_overlaps(self):
+        employee_id = self.employee_ids[0]
+        self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload([employee_id], days=[0]),
+        )
+
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload([employee_id], days=[0], start="16:00", end="20:00"),
+        )
+
+        self.assertEqual(resp.status_code, 409)
+        self.assertIn("Overlapping working hours", resp.json["message"])
+        self.assertEqual(self._count(), 1)
+
+    def test_batch_edit_and_deactivate(self):
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload(self.employee_ids[:3], days=[0]),
+        )
+        ids = resp.json["working_hour_ids"]
+
+        resp = self.client.put(
+            self.URL_BATCH_EDIT,
+            headers=self.headers,
+            json={"working_hours": [{"id": i, "end_time": "12:00"} for i in ids]},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self._count(end_time="12:00"), 3)
+
+        resp = self.client.put(
+            self.URL_BATCH_DEACTIVATE,
+            headers=self.headers,
+            json={"working_hour_ids": ids},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self._count(is_active=False), 3)
+
+        resp = self.client.put(
+            self.URL_BATCH_DEACTIVATE,
+            headers=self.headers,
+            json={"working_hour_ids": ids},
+        )
+        self.assertEqual(resp.status_code, 404)
+
+    def test_deactivated_entry_does_not_block_its_start(self):
+        employee_id = self.employee_ids[0]
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload([employee_id], days=[0, 1]),
+        )
+        monday, tuesday = resp.json["working_hour_ids"]
+        self.client.put(
+            self.URL_BATCH_DEACTIVATE,
+            headers=self.headers,
+            json={"working_hour_ids": [monday]},
+        )
+
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload([employee_id], days=[0], end="12:00"),
+        )
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(self._count(day_of_week=0, is_active=False), 1)
+        self.assertEqual(self._count(day_of_week=0, is_active=True), 1)
+
+        self.client.put(
+            self.URL_BATCH_DEACTIVATE,
+            headers=self.headers,
+            json={"working_hour_ids": resp.json["working_hour_ids"]},
+        )
+        resp = self.client.put(
+            self.URL_BATCH_EDIT,
+            headers=self.headers,
+            json={"working_hours": [{"id": tuesday, "day_of_week": 0}]},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self._count(day_of_week=0, is_active=False), 2)
+
+    def test_batch_edit_rejects_reassignment(self):
+        resp = self.client.post(
+            self.URL_REGISTER,
+            headers=self.headers,
+            json=self._payload(self.employee_ids[:1], days=[0]),
+        )
+        ids = resp.json["working_hour_ids"]
+
+        resp = self.client.put(
+            self.URL_BATCH_EDIT,
+            headers=self.headers,
+            json={
+                "working_hours": [
+                    {
+                        "id": ids[0],
+                        "end_time": "12:00",
+                        "employee_id": self.employee_ids[1],
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(
+            self._count(employee_id=self.employee_ids[0], end_time="17:00"), 1
+        )
+
+
+class WorkingHoursCacheConfig(TestingConfig):
+    WORKING_HOURS_CACHE = True
+
+
+class TestWorkingHoursCache(BaseTestCase):
+    # 2030-01-07 is a Monday.
+    MONDAY = datetime(2030, 1, 7)
+
+    def create_app(self):
+        return create_app(WorkingHoursCacheConfig)
+
+    def setUp(self):
+        super().setUp()
+        working_hours_cache.clear()
+        self.provider_id = ServiceProviderFactory(id=1000).id
+        self.staff_id = StaffFactory(id=1000).id
+        self.hours = WorkingHourFactory(
+            id=1000,
+            provider_id=self.provider_id,
+            employee_id=self.staff_id,
+            day_of_week=0,
+            start_time=time(9),
+            end_time=time(17),
+        )
+        db.session.commit()
+
+        self.statements = self.record_statements()
+
+    def tearDown(self):
+        working_hours_cache.clear()
+        super().tearDown()
+
+    def _load(self, hour: int) -> dict:
+        return CustomerAppointmentRequestSchema().load(
+            {
+                "service_id": 1,
+                "staff_id": self.staff_id,
+                "appointment_time": self.MONDAY.replace(hour=hour).isoformat(),
+            }
+        )
+
+    def test_validation_reads_working_hours_once(self):
+        self._load(10)
+        self._load(11)
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("day_of_week", self.statements[0])
+
+    def test_disabled_cache_reads_every_time(self):
+        self.app.config["WORKING_HOURS_CACHE"] = False
+
+        self._load(10)
+        self._load(11)
+
+        self.assertEqual(len(self.statements), 2)
+
+    def test_outside_working_hours_or_weekday_is_rejected(self):
+        with self.assertRaises(ValidationError) as ctx:
+            self._load(18)
+        self.assertEqual(
+            ctx.exception.messages["appointment_time"],
+            ["Appointment time is outside of working hours."],
+        )
+
+        self.assertFalse(
+            WorkingHoursManager.is_within_working_hours(
+                self.staff_id, self.MONDAY.replace(day=8, hour=10)
+            )
+        )
+
+    def test_day_without_working_hours_is_rejected(self):
+        with self.assertRaises(ValidationError) as ctx:
+            CustomerAppointmentRequestSchema().load(
+                {
+                    "service_id": 1,
+                    "staff_id": self.staff_id,
+                    "appointment_time": self.MONDAY.replace(day=8, hour=10).isoformat(),
+                }
+            )
+        self.assertEqual(
+            ctx.exception.messages["appointment_time"],
+            ["This staff member has no working hours defined."],
+        )
+
+    def test_committed_change_invalidates(self):
+        self._load(16)
+
+        db.session.get(WorkingHoursModel, 1000).end_time = time(12)
+        db.session.commit()
+
+        with self.assertRaises(ValidationError):
+            self._load(16)
+
+    def test_uncommitted_change_is_read_from_the_database(self):
+        WorkingHoursManager.get_day_intervals(self.staff_id, 0)
+
+        db.session.get(WorkingHoursModel, 1000).end_time = time(12)
+        db.session.flush()
+
+        self.assertEqual(
+            WorkingHoursManager.get_day_intervals(self.staff_id, 0),
+            [(time(9), time(12))],
+        )
+
+    def test_employee_profile(self):
+        headers = {"Authorization": f"Bearer {generate_token(ApproverFactory())}"}
+        url = Endpoints.WORKING_HOUR_PROFILE_EMPLOYEE.replace(
+            "<int:employee_id>", str(self.staff_id)
+        )
+
+        resp = self.client.get(url, headers=headers)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([entry["id"] for entry in resp.json], [1000])
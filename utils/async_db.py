@@ -0,0 +1,40 @@
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from utils.db_pool import build_async_engine_options, init_statement_timeout
+from utils.db_routing import READ_ONLY_EXECUTION_OPTIONS, READ_ONLY_MODE
+
+
+def create_async_read_engine(database_uri: str) -> AsyncEngine:
+    """
+    Creates the asyncpg engine of the ASGI read path for the database the Flask
+    app writes to. The models are shared: ORM statements built for the sync
+    session run unchanged on it.
+
+    :param database_uri: The SQLALCHEMY_DATABASE_URI of the Flask app.
+    :return: The async engine; dispose it on shutdown.
+    """
+    url = make_url(database_uri).set(drivername="postgresql+asyncpg")
+    engine = create_async_engine(url, **build_async_engine_options())
+    init_statement_timeout(engine.sync_engine)
+    return engine
+
+
+def async_read_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Builds the session factory of the ASGI read path. Like read requests of the
+    Flask app (DB_READ_ONLY_MODE), its sessions open read-only or autocommit
+    transactions.
+
+    :param engine: The engine from create_async_read_engine.
+    :return: A factory of AsyncSession objects.
+    """
+    options = READ_ONLY_EXECUTION_OPTIONS[READ_ONLY_MODE]
+    if options:
+        engine = engine.execution_options(**options)
+    return async_sessionmaker(engine, expire_on_commit=False)
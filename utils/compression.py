@@ -0,0 +1,114 @@
+import gzip
+import zlib
+from typing import Iterable, Iterator
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+}
+
+
+def _is_compressible(mimetype: str) -> bool:
+    return mimetype in COMPRESSIBLE_MIMETYPES or mimetype.startswith("text/")
+
+
+def _gzip_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        # Sync flush so every chunk reaches the client when it is produced.
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _brotli_stream(chunks: Iterable[bytes], quality: int) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, level)
+
+
+def _brotli(data: bytes, quality: int) -> bytes:
+    return brotli.compress(data, quality=quality)
+
+
+# In order of preference when the client accepts several with equal quality.
+ENCODERS = {}
+if brotli is not None:
+    ENCODERS["br"] = (_brotli, _brotli_stream)
+ENCODERS["gzip"] = (_gzip, _gzip_stream)
+
+
+def init_compression(app) -> None:
+    """
+    Compresses responses with brotli or gzip, whichever the client prefers in
+    Accept-Encoding (brotli on ties, when installed).
+
+    Complete bodies are compressed only from COMPRESSION_MIN_SIZE bytes on;
+    smaller ones gain little and cost CPU. Streamed responses are compressed
+    chunk by chunk as they are generated.
+
+    :param app: The Flask application.
+    """
+    min_size = app.config.get("COMPRESSION_MIN_SIZE", 1024)
+    levels = {
+        "gzip": app.config.get("COMPRESSION_GZIP_LEVEL", 6),
+        "br": app.config.get("COMPRESSION_BROTLI_QUALITY", 4),
+    }
+
+    @app.after_request
+    def compress_response(response):
+        if (
+            request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or not _is_compressible(response.mimetype or "")
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(list(ENCODERS))
+        if encoding is None:
+            return response
+
+        compress, compress_stream = ENCODERS[encoding]
+        if response.is_streamed:
+            body = response.response
+            response.response = compress_stream(
+                response.iter_encoded(), levels[encoding]
+            )
+            if hasattr(body, "close"):
+                # Releases what the original generator holds, e.g. a cursor.
+                response.call_on_close(body.close)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(compress(data, levels[encoding]))
+
+        response.headers["Content-Encoding"] = encoding
+        # The encoded bytes differ from the identity ones, so a strong
+        # validator of the uncompressed body only holds weakly.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,182 @@
+import threading
+import time
+
+from decouple import config
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolWaitStats:
+    """
+    Thread-safe accumulator for the time callers spend waiting on a pool checkout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.total_wait, 6),
+                "wait_seconds_avg": round(self.total_wait / attempts, 6)
+                if attempts
+                else 0.0,
+                "wait_seconds_max": round(self.max_wait, 6),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long each checkout waits for a free connection.
+
+    The measured time includes opening a new connection when the pool has not
+    reached its size yet, so it reflects the full latency a request pays
+    before it can talk to the database.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def build_engine_options() -> dict:
+    """
+    Builds SQLALCHEMY_ENGINE_OPTIONS from environment variables.
+
+    With DB_PGBOUNCER enabled the statement timeout is applied per transaction
+    with SET LOCAL, because PgBouncer in transaction pooling mode rejects the
+    ``options`` startup parameter and a session-level SET would leak to other
+    clients sharing the server connection. psycopg2 never uses server-side
+    prepared statements, so no further changes are needed for PgBouncer.
+
+    :return: A dictionary of keyword arguments for ``create_engine``.
+    """
+    statement_timeout = config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)
+    pgbouncer = config("DB_PGBOUNCER", default=False, cast=bool)
+
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config("DB_POOL_SIZE", default=5, cast=int),
+        "max_overflow": config("DB_MAX_OVERFLOW", default=10, cast=int),
+        "pool_timeout": config("DB_POOL_TIMEOUT", default=30, cast=int),
+        "pool_recycle": config("DB_POOL_RECYCLE", default=1800, cast=int),
+        "pool_pre_ping": config("DB_POOL_PRE_PING", default=True, cast=bool),
+        "connect_args": {},
+    }
+
+    if statement_timeout and not pgbouncer:
+        options["connect_args"]["options"] = f"-c statement_timeout={statement_timeout}"
+
+    return options
+
+
+def build_async_engine_options() -> dict:
+    """
+    Builds the ``create_async_engine`` keyword arguments of the asyncpg engine
+    used by the ASGI read path. The pool is sized separately (ASYNC_DB_*): one
+    event loop multiplexes many requests over few connections.
+
+    asyncpg takes the statement timeout as a server setting. Behind PgBouncer
+    the timeout is set per transaction as for the sync engine (see
+    init_statement_timeout) and asyncpg's prepared statement caches are
+    disabled, since transaction pooling may run each statement on a different
+    server connection.
+
+    :return: A dictionary of keyword arguments for ``create_async_engine``.
+    """
+    statement_timeout = config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)
+    pgbouncer = config("DB_PGBOUNCER", default=False, cast=bool)
+
+    options = {
+        "pool_size": config("ASYNC_DB_POOL_SIZE", default=10, cast=int),
+        "max_overflow": config("ASYNC_DB_MAX_OVERFLOW", default=10, cast=int),
+        "pool_timeout": config("DB_POOL_TIMEOUT", default=30, cast=int),
+        "pool_recycle": config("DB_POOL_RECYCLE", default=1800, cast=int),
+        "pool_pre_ping": config("DB_POOL_PRE_PING", default=True, cast=bool),
+        "connect_args": {},
+    }
+
+    if statement_timeout and not pgbouncer:
+        options["connect_args"]["server_settings"] = {
+            "statement_timeout": str(statement_timeout)
+        }
+    if pgbouncer:
+        options["connect_args"].update(
+            {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        )
+
+    return options
+
+
+def init_statement_timeout(engine) -> None:
+    """
+    Registers a per-transaction statement timeout on the engine when running
+    behind PgBouncer. Without PgBouncer the timeout is a connection startup
+    option and nothing needs to be registered.
+
+    :param engine: The SQLAlchemy engine to configure.
+    """
+    statement_timeout = config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)
+    pgbouncer = config("DB_PGBOUNCER", default=False, cast=bool)
+
+    if not (pgbouncer and statement_timeout):
+        return
+
+    @event.listens_for(engine, "begin")
+    def set_local_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {statement_timeout}")
+
+
+def get_pool_status(engine) -> dict:
+    """
+    Collects the current pool usage for the given engine.
+
+    :param engine: The SQLAlchemy engine whose pool to inspect.
+    :return: A dictionary with the pool size, checked out and overflow
+             connections, and checkout wait statistics when available.
+    """
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+            }
+        )
+
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.wait_stats.snapshot())
+
+    return status
@@ -0,0 +1,213 @@
+import hashlib
+import threading
+import time
+
+from decouple import config
+from flask import request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, event
+
+REPLICA_BIND_KEY = "replica"
+READ_METHODS = {"GET", "HEAD"}
+
+# How read requests talk to the database:
+#   readonly   - BEGIN READ ONLY transactions, no COMMIT at teardown
+#   autocommit - no transaction at all, each statement sees its own snapshot
+#   off        - the same read-write transaction and commit as writes
+READ_ONLY_EXECUTION_OPTIONS = {
+    "readonly": {"postgresql_readonly": True},
+    "autocommit": {"isolation_level": "AUTOCOMMIT"},
+    "off": None,
+}
+
+
+def read_only_mode() -> str:
+    """
+    Reads and validates DB_READ_ONLY_MODE.
+
+    Behind PgBouncer the statement timeout is set with SET LOCAL when a
+    transaction begins (utils.db_pool.init_statement_timeout). Autocommit
+    reads have no transaction, and transaction pooling may run each of their
+    statements on another server connection, so they would run without a
+    timeout; that combination is rejected.
+
+    :return: The mode, one of READ_ONLY_EXECUTION_OPTIONS.
+    :raises ValueError: If the mode is unknown, or is autocommit behind
+                        PgBouncer with a statement timeout.
+    """
+    mode = config("DB_READ_ONLY_MODE", default="readonly")
+    if mode not in READ_ONLY_EXECUTION_OPTIONS:
+        modes = ", ".join(READ_ONLY_EXECUTION_OPTIONS)
+        raise ValueError(f"DB_READ_ONLY_MODE must be one of {modes}.")
+    if (
+        mode == "autocommit"
+        and config("DB_PGBOUNCER", default=False, cast=bool)
+        and config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)
+    ):
+        raise ValueError(
+            "DB_READ_ONLY_MODE=autocommit cannot be combined with DB_PGBOUNCER: "
+            "the statement timeout needs a transaction. Use readonly instead."
+        )
+    return mode
+
+
+READ_ONLY_MODE = read_only_mode()
+
+
+class StickyPrimaryRegistry:
+    """
+    Remembers which clients wrote recently so their next reads stay on the
+    primary until the replica has had time to catch up (read-your-writes).
+    The registry is per worker process.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 10000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._last_write = {}
+
+    def mark_write(self, client_key: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._last_write) >= self.max_entries:
+                self._prune(now)
+            self._last_write[client_key] = now
+
+    def is_sticky(self, client_key: str) -> bool:
+        last_write = self._last_write.get(client_key)
+        return (
+            last_write is not None
+            and time.monotonic() - last_write < self.window_seconds
+        )
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key
+            for key, last_write in self._last_write.items()
+            if now - last_write >= self.window_seconds
+        ]
+        for key in expired:
+            del self._last_write[key]
+        if len(self._last_write) >= self.max_entries:
+            self._last_write.clear()
+
+
+sticky_primary = StickyPrimaryRegistry(
+    config("DB_REPLICA_STICKY_SECONDS", default=5, cast=float)
+)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends SELECT statements to the read replica when the current
+    request allowed it and the session has not written anything yet. Flushes,
+    DML statements and every query after the first write use the primary.
+
+    Sessions of read requests connect through a variant of the engine that
+    opens read-only (or autocommit) connections; the variant shares the
+    engine's pool and the connection settings are reset when it is returned.
+    """
+
+    _read_only_engines = {}
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = None
+        if (
+            bind is None
+            and self.info.get("use_replica")
+            and not self.info.get("wrote")
+            and not self._flushing
+            and isinstance(clause, Select)
+        ):
+            engine = self._db.engines.get(REPLICA_BIND_KEY)
+
+        if engine is None:
+            engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+        read_only_mode = self.info.get("read_only")
+        if read_only_mode:
+            return self._read_only_engine(engine, read_only_mode)
+
+        return engine
+
+    @classmethod
+    def _read_only_engine(cls, engine, mode: str):
+        key = (engine, mode)
+        if key not in cls._read_only_engines:
+            cls._read_only_engines[key] = engine.execution_options(
+                **READ_ONLY_EXECUTION_OPTIONS[mode]
+            )
+        return cls._read_only_engines[key]
+
+
+def is_read_only(session) -> bool:
+    """
+    Tells whether the session belongs to a read request that runs without a
+    read-write transaction, so there is nothing to commit.
+
+    :param session: The SQLAlchemy session of the current request.
+    :return: True for read-only or autocommit sessions.
+    """
+    return bool(session.info.get("read_only"))
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_as_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_dml_as_write(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
+
+def _client_key() -> str:
+    """
+    Identifies the caller for the sticky-primary window: the bearer token when
+    present, otherwise the remote address.
+    """
+    identity = request.headers.get("Authorization") or request.remote_addr or ""
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def init_db_routing(app, db) -> None:
+    """
+    Registers the request hooks that run read requests without a read-write
+    transaction and route them to the replica.
+
+    :param app: The Flask application.
+    :param db: The Flask-SQLAlchemy extension whose session to route.
+    """
+
+    @app.before_request
+    def route_read_requests():
+        session = db.session()
+        # A session that already holds a transaction (e.g. shared in tests)
+        # keeps its connection as is.
+        is_read = request.method in READ_METHODS and not session.in_transaction()
+
+        if is_read and READ_ONLY_EXECUTION_OPTIONS[READ_ONLY_MODE]:
+            session.info["read_only"] = READ_ONLY_MODE
+
+        if REPLICA_BIND_KEY not in db.engines:
+            return
+
+        client_key = _client_key()
+        session.info["client_key"] = client_key
+        session.info["use_replica"] = is_read and not sticky_primary.is_sticky(
+            client_key
+        )
+
+    @app.teardown_request
+    def remember_writes(exception=None):
+        session = db.session()
+        client_key = session.info.pop("client_key", None)
+        session.info.pop("use_replica", None)
+        if session.info.pop("read_only", None):
+            # Ends the read-only transaction (or releases the autocommit
+            # connection) so the next request starts from a clean session.
+            session.close()
+        if client_key and session.info.get("wrote"):
+            sticky_primary.mark_write(client_key)
@@ -1,6 +1,7 @@
 from functools import wraps
 
 from flask import request
+from marshmallow import ValidationError
 from werkzeug.exceptions import BadRequest
 from werkzeug.exceptions import Forbidden, Unauthorized
 
@@ -37,28 +38,57 @@ def permission_required(*required_roles):
 
 def validate_schema(schema_name):
     """
-    Decorator to validate incoming request data against a Marshmallow schema.
-    :param schema_name: The schema class to validate against.
+    Decorator to validate and deserialize incoming request data with a Marshmallow schema.
+    The schema is instantiated once per decorated view and the payload is loaded once
+    per request; the deserialized data is passed to the view as the ``data`` keyword
+    argument.
+    :param schema_name: The schema class to load the payload with.
     :raises BadRequest: If the request payload is missing, not JSON, or does not match the schema.
     """
+    # Schemas hold no per-request state, so one instance serves every request.
+    schema = schema_name()
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            schema = schema_name()
             try:
-                data = request.get_json()
-                if data is None:
-                    raise BadRequest("Request payload is missing or not JSON")
+                payload = request.get_json()
             except Exception as e:
                 raise BadRequest(f"Invalid JSON format: {e}")
+            if payload is None:
+                raise BadRequest("Request payload is missing or not JSON")
 
-            errors = schema.validate(data)
+            try:
+                data = schema.load(payload)
+            except ValidationError as e:
+                raise BadRequest(f"Invalid payload: {e.messages}")
 
-            if errors:
-                raise BadRequest(f"Invalid payload: {errors}")
+            return func(*args, data=data, **kwargs)
 
-            return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def validate_query(schema_name):
+    """
+    Decorator to validate and deserialize the query string of a request with a
+    Marshmallow schema; the counterpart of validate_schema for GET views. The
+    deserialized arguments are passed to the view as the ``data`` keyword argument.
+    :param schema_name: The schema class to load the query arguments with.
+    :raises BadRequest: If the query arguments do not match the schema.
+    """
+    schema = schema_name()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                data = schema.load(request.args.to_dict())
+            except ValidationError as e:
+                raise BadRequest(f"Invalid query: {e.messages}")
+
+            return func(*args, data=data, **kwargs)
 
         return wrapper
 
@@ -128,3 +158,4 @@ def make_optional(schema_cls):
         if field.required:
             field.required = False
     return schema_cls
+
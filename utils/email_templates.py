@@ -1,5 +1,6 @@
 class EmailTemplates:
     SUBJECT_APPOINTMENT_BOOKED = "You have a new appointment booked"
+    SUBJECT_RECURRING_APPOINTMENTS_BOOKED = "You have new recurring appointments booked"
     SUBJECT_APPOINTMENT_CONFIRMED = "Your Appointment Has Been Confirmed"
     SUBJECT_APPOINTMENT_UPDATED = "Your Appointment Has Been Updated"
     SUBJECT_APPOINTMENT_REJECTED = "Appointment Rejection"
@@ -17,6 +18,19 @@ class EmailTemplates:
     Your Service Team
     """
 
+    CONTENT_RECURRING_APPOINTMENTS_NOTIFIED = """
+    Dear {employee_name},
+    You have new appointments booked!
+    Appointment Details:
+    - Client Name: {client_name}
+    - Service: {service_name}
+    - Dates & Times:
+{appointment_times}
+    Please make sure to prepare for these appointments.
+    Regards,
+    Your Service Team
+    """
+
     CONTENT_APPOINTMENT_CONFIRMED = """
     Dear {first_name},
 
@@ -0,0 +1,125 @@
+import hashlib
+from typing import Any, Callable, Iterable, Optional, Type
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from marshmallow import Schema
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+from werkzeug.http import quote_etag
+
+from db import db
+from services.cache import response_cache
+from utils.serializers import get_projection, serialize
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def collection_etag(
+    statement: Select, schema_cls: Type[Schema], session: Optional[Session] = None
+) -> str:
+    """
+    Computes a strong ETag for the serialized result of a select statement from
+    one aggregate query: the row count and ``max(updated_on)`` of the selected
+    records and of every nested list the schema outputs. No rows are loaded.
+
+    :param statement: A ``select(Model)`` statement, e.g. from a manager.
+    :param schema_cls: The marshmallow response schema class.
+    :param session: The session to query with, ``db.session`` by default.
+    :return: The unquoted entity tag.
+    """
+    model = statement.column_descriptions[0]["entity"]
+    version = (session or db.session).execute(
+        get_projection(schema_cls, model).version_statement(statement)
+    ).one()
+    return version_etag(schema_cls, version)
+
+
+def version_etag(schema_cls: Type[Schema], version: tuple) -> str:
+    """
+    :param schema_cls: The marshmallow response schema class.
+    :param version: Values that change whenever the response does, e.g. row
+                    counts and ``max(updated_on)``.
+    :return: The unquoted entity tag of a response in that version.
+    """
+    # orjson and the stdlib encoder produce different bytes for the same data.
+    fast = bool(current_app.config.get("FAST_SERIALIZATION"))
+    key = f"{schema_cls.__name__}:{fast}:{tuple(version)!r}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def response_cache_key(schema_cls: Type[Schema]) -> str:
+    """
+    :return: The response cache key of the current request: its path, sorted
+             query arguments, the response schema and the JSON encoder.
+    """
+    args = urlencode(sorted(request.args.items(multi=True)))
+    fast = bool(current_app.config.get("FAST_SERIALIZATION"))
+    return f"{request.path}?{args}:{schema_cls.__name__}:{fast}"
+
+
+def serialize_conditional(
+    statement: Select, schema_cls: Type[Schema], envelope: Optional[str] = None
+):
+    """
+    Answers a conditional GET for a list endpoint. When the request's
+    If-None-Match matches the current ETag, a bodiless 304 response is returned
+    without loading or serializing rows; otherwise the records are serialized
+    and returned with the ETag.
+
+    With RESPONSE_CACHE enabled, the ETag and the serialized records come from
+    the response cache, so repeated reads skip the database and marshmallow
+    until one of the tables they are read from changes.
+
+    :param statement: A ``select(Model)`` statement, e.g. from a manager.
+    :param schema_cls: The marshmallow response schema class.
+    :param envelope: Optional key to wrap the serialized list in.
+    :return: A 304 response, or a flask_restful (body, status, headers) tuple.
+    """
+
+    def dump():
+        data = serialize(statement, schema_cls)
+        return {envelope: data} if envelope else data
+
+    model = statement.column_descriptions[0]["entity"]
+    return conditional_response(
+        schema_cls,
+        get_projection(schema_cls, model).tables,
+        lambda: collection_etag(statement, schema_cls),
+        dump,
+    )
+
+
+def conditional_response(
+    schema_cls: Type[Schema],
+    tables: Iterable[str],
+    etag: Callable[[], str],
+    dump: Callable[[], Any],
+):
+    """
+    Answers a conditional GET from an ETag that is cheaper to compute than the
+    body: a bodiless 304 response when the request's If-None-Match matches it,
+    otherwise the dumped body with the ETag. With RESPONSE_CACHE enabled, both
+    come from the response cache until one of the tables changes.
+
+    :param schema_cls: The response schema class, part of the cache key.
+    :param tables: The names of the tables the body is read from.
+    :param etag: Computes the unquoted ETag of the current data.
+    :param dump: Loads and serializes the body.
+    :return: A 304 response, or a flask_restful (body, status, headers) tuple.
+    """
+    if current_app.config.get("RESPONSE_CACHE"):
+        etag, data = response_cache.get_or_set(
+            response_cache_key(schema_cls), tables, lambda: (etag(), dump())
+        )
+    else:
+        etag, data = etag(), None
+    headers = {"ETag": quote_etag(etag), "Cache-Control": CACHE_CONTROL}
+
+    # Weak comparison: compressed responses carry the ETag as a weak validator.
+    if request.if_none_match.contains_weak(etag):
+        return current_app.response_class(status=304, headers=headers)
+
+    if data is None:
+        data = dump()
+    return data, 200, headers
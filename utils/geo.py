@@ -0,0 +1,156 @@
+"""
+Geohashes for proximity queries without PostGIS.
+
+A geohash interleaves the bits of a longitude and a latitude into a base32
+string. Points that share a prefix lie in the same cell, so the points in a
+cell are one range scan of a B-tree index over the hashes, and an area is
+covered by scanning the handful of cells that overlap it.
+"""
+import math
+from typing import List, Tuple
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 12
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# (min_latitude, min_longitude, max_latitude, max_longitude). A box crossing
+# the antimeridian has min_longitude > max_longitude.
+BoundingBox = Tuple[float, float, float, float]
+
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    :return: The geohash of the point with the given number of characters.
+    """
+    ranges = {True: [-180.0, 180.0], False: [-90.0, 90.0]}
+    chars = []
+    value = bit_count = 0
+    is_longitude = True
+    while len(chars) < precision:
+        bounds = ranges[is_longitude]
+        middle = (bounds[0] + bounds[1]) / 2
+        coordinate = longitude if is_longitude else latitude
+        if coordinate >= middle:
+            value = value * 2 + 1
+            bounds[0] = middle
+        else:
+            value *= 2
+            bounds[1] = middle
+        is_longitude = not is_longitude
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[value])
+            value = bit_count = 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """
+    :return: The height and width in degrees of the cells of a precision.
+    """
+    bits = 5 * precision
+    return 180 / 2 ** (bits // 2), 360 / 2 ** ((bits + 1) // 2)
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> BoundingBox:
+    """
+    :return: The smallest box containing every point within radius_km of the
+             given point. Near a pole it spans every longitude.
+    """
+    delta_latitude = radius_km / KM_PER_DEGREE
+    min_latitude = latitude - delta_latitude
+    max_latitude = latitude + delta_latitude
+    if min_latitude <= -90 or max_latitude >= 90:
+        return max(min_latitude, -90.0), -180.0, min(max_latitude, 90.0), 180.0
+
+    ratio = math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude))
+    if ratio >= 1:
+        return min_latitude, -180.0, max_latitude, 180.0
+    delta_longitude = math.degrees(math.asin(ratio))
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+    if max_longitude - min_longitude >= 360:
+        return min_latitude, -180.0, max_latitude, 180.0
+    if min_longitude < -180:
+        min_longitude += 360
+    if max_longitude > 180:
+        max_longitude -= 360
+    return min_latitude, min_longitude, max_latitude, max_longitude
+
+
+def longitude_ranges(box: BoundingBox) -> List[Tuple[float, float]]:
+    """
+    :return: The longitude intervals of the box, two if it crosses the antimeridian.
+    """
+    _, min_longitude, _, max_longitude = box
+    if min_longitude <= max_longitude:
+        return [(min_longitude, max_longitude)]
+    return [(min_longitude, 180.0), (-180.0, max_longitude)]
+
+
+def box_size_km(box: BoundingBox) -> Tuple[float, float]:
+    """
+    :return: The height of the box and its width along its widest parallel.
+    """
+    min_latitude, _, max_latitude, _ = box
+    widest = 0.0 if min_latitude <= 0 <= max_latitude else min(
+        abs(min_latitude), abs(max_latitude)
+    )
+    degrees = sum(high - low for low, high in longitude_ranges(box))
+    return (
+        (max_latitude - min_latitude) * KM_PER_DEGREE,
+        degrees * KM_PER_DEGREE * math.cos(math.radians(widest)),
+    )
+
+
+def _indexes(low: float, high: float, origin: float, step: float, count: int) -> range:
+    first = max(0, math.floor((low - origin) / step))
+    last = min(count - 1, math.floor((high - origin) / step))
+    return range(first, last + 1)
+
+
+def covering_cells(box: BoundingBox, max_cells: int = 16) -> List[str]:
+    """
+    Selects the finest precision at which at most max_cells cells cover the
+    box, so that the scanned area stays close to the box.
+
+    :return: The geohashes of the cells overlapping the box.
+    """
+    min_latitude, _, max_latitude, _ = box
+    ranges = longitude_ranges(box)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size(precision)
+        rows = _indexes(min_latitude, max_latitude, -90, height, round(180 / height))
+        columns = [
+            _indexes(low, high, -180, width, round(360 / width)) for low, high in ranges
+        ]
+        if precision == 1 or len(rows) * sum(map(len, columns)) <= max_cells:
+            break
+
+    return sorted(
+        {
+            encode(
+                -90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision
+            )
+            for row in rows
+            for indexes in columns
+            for column in indexes
+        }
+    )
+
+
+def distance_km(
+    latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+    """
+    :return: The great-circle distance between two points (haversine formula).
+    """
+    phi, other_phi = math.radians(latitude), math.radians(other_latitude)
+    a = (
+        math.sin((other_phi - phi) / 2) ** 2
+        + math.cos(phi)
+        * math.cos(other_phi)
+        * math.sin(math.radians(other_longitude - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
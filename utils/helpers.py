@@ -1,11 +1,66 @@
 import base64
+import binascii
+from tempfile import SpooledTemporaryFile
 
-from werkzeug.exceptions import BadRequest
+from decouple import config
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
 
+PHOTO_MAX_BYTES = config("PHOTO_MAX_BYTES", default=10 * 1024 * 1024, cast=int)
+# Decoded photos up to this size stay in memory; larger ones spill to an
+# anonymous temporary file that is removed when the buffer is closed.
+PHOTO_SPOOL_MAX_MEMORY = config(
+    "PHOTO_SPOOL_MAX_MEMORY", default=5 * 1024 * 1024, cast=int
+)
+# Characters of base64 decoded at a time (a multiple of 4).
+DECODE_CHUNK_CHARS = 64 * 1024
 
-def decode_photo(path, encoded_string):
-    with open(path, "wb") as f:
-        try:
-            f.write(base64.b64decode(encoded_string.encode("utf-8")))
-        except Exception as ex:
+
+def decode_photo(
+    encoded_string: str, max_bytes: int = PHOTO_MAX_BYTES
+) -> SpooledTemporaryFile:
+    """
+    Decodes a base64 photo chunk by chunk into a spooled buffer, so neither a
+    second full copy of the encoded string nor a file on disk is needed.
+    Line breaks in the encoding are allowed.
+
+    :param encoded_string: The base64 encoded photo.
+    :param max_bytes: The largest decoded photo accepted.
+    :return: The decoded photo, positioned at the start. Close it when done.
+    :raises BadRequest: If the string is not valid base64.
+    :raises RequestEntityTooLarge: If the decoded photo exceeds max_bytes.
+    """
+    too_large = RequestEntityTooLarge(
+        f"The photo must not be larger than {max_bytes} bytes."
+    )
+    # Rejects an oversized photo before decoding any of it. Line breaks do not
+    # encode data, so they are left out of the estimate.
+    line_breaks = encoded_string.count("\n") + encoded_string.count("\r")
+    if (len(encoded_string) - line_breaks) // 4 * 3 - 2 > max_bytes:
+        raise too_large
+
+    buffer = SpooledTemporaryFile(max_size=PHOTO_SPOOL_MAX_MEMORY)
+    size = 0
+    carry = ""
+    try:
+        for start in range(0, len(encoded_string), DECODE_CHUNK_CHARS):
+            chunk = carry + "".join(
+                encoded_string[start : start + DECODE_CHUNK_CHARS].split()
+            )
+            usable = len(chunk) - len(chunk) % 4
+            carry = chunk[usable:]
+            decoded = base64.b64decode(chunk[:usable], validate=True)
+            size += len(decoded)
+            if size > max_bytes:
+                raise too_large
+            buffer.write(decoded)
+        if carry or not size:
             raise BadRequest("Invalid photo encoding")
+    except (binascii.Error, ValueError):
+        buffer.close()
+        raise BadRequest("Invalid photo encoding")
+    except Exception:
+        buffer.close()
+        raise
+
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,225 @@
+import ipaddress
+import logging
+import os
+import time
+import weakref
+
+from decouple import config
+from flask import g, request
+
+from db import db
+from services.cache import response_cache, working_hours_cache
+from utils.db_pool import get_pool_status
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENDPOINT = "metrics"
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+ALLOWED_NETWORKS = tuple(
+    ipaddress.ip_network(network.strip())
+    for network in config(
+        "METRICS_ALLOWED_NETWORKS", default="127.0.0.0/8,::1/128"
+    ).split(",")
+    if network.strip()
+)
+SAMPLE_SECONDS = config("METRICS_SAMPLE_SECONDS", default=5, cast=float)
+
+CACHES = {"response": response_cache, "working_hours": working_hours_cache}
+
+if prometheus_client is not None:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    REQUEST_LATENCY = Histogram(
+        "http_request_duration_seconds",
+        "Time from the start of a request until its response is ready.",
+        ["resource", "method"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    )
+    REQUESTS = Counter(
+        "http_requests", "Requests by response status.", ["resource", "method", "status"]
+    )
+    REQUESTS_IN_PROGRESS = Gauge(
+        "http_requests_in_progress",
+        "Requests being handled.",
+        ["resource", "method"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_CONNECTIONS = Gauge(
+        "db_pool_connections",
+        "Connections of the database pool by state.",
+        ["engine", "state"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_CHECKOUTS = Counter(
+        "db_pool_checkouts",
+        "Connection checkouts that succeeded (ok) or timed out (timeout).",
+        ["engine", "result"],
+    )
+    DB_POOL_CHECKOUT_WAIT = Counter(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled connection.",
+        ["engine"],
+    )
+    CACHE_LOOKUPS = Counter(
+        "cache_lookups", "Cache lookups by result (hit or miss).", ["cache", "result"]
+    )
+    CACHE_ENTRIES = Gauge(
+        "cache_entries",
+        "Entries held in the local tier of the cache.",
+        ["cache"],
+        multiprocess_mode="livesum",
+    )
+
+
+class ResourceSampler:
+    """
+    Copies the database pool and cache statistics of this worker into the
+    metrics, at most once per ``interval`` seconds so that requests do not pay
+    for it. The sources keep running totals; the counters are advanced by the
+    difference since the previous sample.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_sample = 0.0
+        self._pool_totals = weakref.WeakKeyDictionary()
+        self._cache_totals = {}
+
+    def maybe_sample(self) -> None:
+        now = time.monotonic()
+        if now < self._next_sample:
+            return
+        self._next_sample = now + self.interval
+        self.sample()
+
+    def sample(self) -> None:
+        for bind_key, engine in db.engines.items():
+            self._sample_pool(bind_key or "default", engine)
+        for name, cache in CACHES.items():
+            self._sample_cache(name, cache)
+
+    def _sample_pool(self, name: str, engine) -> None:
+        status = get_pool_status(engine)
+        for state in ("checked_out", "checked_in", "overflow"):
+            if state in status:
+                DB_POOL_CONNECTIONS.labels(name, state).set(status[state])
+
+        if "checkouts" not in status:
+            return
+        totals = (status["checkouts"], status["timeouts"], status["wait_seconds_total"])
+        # Keyed by pool: a disposed engine starts its statistics from zero.
+        previous = self._pool_totals.get(engine.pool, (0, 0, 0.0))
+        self._pool_totals[engine.pool] = totals
+        DB_POOL_CHECKOUTS.labels(name, "ok").inc(max(totals[0] - previous[0], 0))
+        DB_POOL_CHECKOUTS.labels(name, "timeout").inc(max(totals[1] - previous[1], 0))
+        DB_POOL_CHECKOUT_WAIT.labels(name).inc(max(totals[2] - previous[2], 0))
+
+    def _sample_cache(self, name: str, cache) -> None:
+        stats = cache.stats()
+        previous = self._cache_totals.get(name, (0, 0))
+        self._cache_totals[name] = (stats["hits"], stats["misses"])
+        CACHE_ENTRIES.labels(name).set(stats["entries"])
+        CACHE_LOOKUPS.labels(name, "hit").inc(max(stats["hits"] - previous[0], 0))
+        CACHE_LOOKUPS.labels(name, "miss").inc(max(stats["misses"] - previous[1], 0))
+
+
+def init_metrics(app) -> None:
+    """
+    Records latency, status and in-flight metrics per flask_restful resource
+    (the endpoint name) and method, and samples the database pools and caches,
+    for the /metrics endpoint.
+
+    The latency covers the view and the after_request handlers registered
+    after this call (e.g. compression), not the streaming of a response body.
+    With PROMETHEUS_MULTIPROC_DIR set, every worker writes its values to that
+    directory and /metrics reports the sum over all workers.
+
+    :param app: The Flask application.
+    """
+    if prometheus_client is None:
+        logger.warning("METRICS is enabled but prometheus_client is not installed.")
+        return
+
+    sampler = ResourceSampler(SAMPLE_SECONDS)
+    app.extensions["metrics_sampler"] = sampler
+
+    @app.before_request
+    def start_request_metrics():
+        if request.endpoint == METRICS_ENDPOINT:
+            return
+        # Unmatched URLs share one label instead of one per path.
+        labels = (request.endpoint or "unmatched", request.method)
+        REQUESTS_IN_PROGRESS.labels(*labels).inc()
+        g.metrics_labels = labels
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        labels = g.get("metrics_labels")
+        if labels is not None:
+            REQUEST_LATENCY.labels(*labels).observe(
+                time.perf_counter() - g.metrics_start
+            )
+            REQUESTS.labels(*labels, str(response.status_code)).inc()
+        return response
+
+    @app.teardown_request
+    def finish_request_metrics(exception=None):
+        labels = g.pop("metrics_labels", None)
+        if labels is not None:
+            REQUESTS_IN_PROGRESS.labels(*labels).dec()
+
+    @app.teardown_appcontext
+    def sample_resources(exception=None):
+        # Runs after the session was removed, so the request's connection is
+        # back in the pool.
+        sampler.maybe_sample()
+
+
+def is_allowed_scraper(remote_addr: str) -> bool:
+    """
+    :param remote_addr: The address of the client requesting the metrics.
+    :return: True if the address is within METRICS_ALLOWED_NETWORKS.
+    """
+    try:
+        address = ipaddress.ip_address(remote_addr or "")
+    except ValueError:
+        return False
+    return any(address in network for network in ALLOWED_NETWORKS)
+
+
+def render_metrics(app) -> tuple:
+    """
+    Renders the metrics in the Prometheus text format, of all workers when
+    PROMETHEUS_MULTIPROC_DIR is set and of this process otherwise.
+
+    :param app: The Flask application, whose current statistics are sampled first.
+    :return: The exposition body and its content type.
+    """
+    sampler = app.extensions.get("metrics_sampler")
+    if sampler is not None:
+        sampler.sample()
+
+    if MULTIPROCESS_DIR:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """
+    Drops the live gauges of an exited worker from the multiprocess directory.
+    Call it from the ``child_exit`` hook of gunicorn.
+
+    :param pid: The process ID of the worker.
+    """
+    if prometheus_client is not None and MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(pid)
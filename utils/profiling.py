@@ -0,0 +1,196 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from decouple import config
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from werkzeug.exceptions import Conflict, Forbidden, NotFound
+
+from constants import ROOT_DIR, TEMP_FILE_FOLDER
+from managers.auth_manager import verify_token
+from models import RoleType
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_DIR = config("PROFILE_DIR", default=os.path.join(TEMP_FILE_FOLDER, "profiles"))
+PROFILE_MAX_FILES = config("PROFILE_MAX_FILES", default=100, cast=int)
+PROFILE_TOP_FUNCTIONS = config("PROFILE_TOP_FUNCTIONS", default=50, cast=int)
+PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+MAX_STATEMENT_LENGTH = 2000
+
+# The SQL timeline of the request being profiled in the current context; None
+# for every other request.
+_sql_timeline: ContextVar[Optional[list]] = ContextVar("sql_timeline", default=None)
+_listeners_lock = threading.Lock()
+_listeners_registered = False
+# One profiled request per worker at a time: from Python 3.12 on, cProfile
+# cannot run in two threads at once.
+_profiler_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timeline = _sql_timeline.get()
+    if timeline is not None:
+        conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timeline = _sql_timeline.get()
+    if timeline is None or not conn.info.get("profile_query_start"):
+        return
+    start = conn.info["profile_query_start"].pop()
+    timeline.append(
+        {
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "executemany": executemany,
+            "start_ms": round((start - g.profile_start) * 1000, 3),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+    )
+
+
+def _register_sql_listeners() -> None:
+    # Registered on the first profiled request, so a worker that never
+    # profiles does not run them at all.
+    global _listeners_registered
+    with _listeners_lock:
+        if not _listeners_registered:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _listeners_registered = True
+
+
+def _function_name(file_name: str, line: int, function: str) -> str:
+    if file_name.startswith(ROOT_DIR):
+        file_name = os.path.relpath(file_name, ROOT_DIR)
+    return f"{file_name}:{line}({function})"
+
+
+def summarize_profile(profiler: cProfile.Profile, limit: int) -> list:
+    """
+    :param profiler: A finished profiler.
+    :param limit: The number of functions to return.
+    :return: The functions with the highest cumulative time, with call counts
+             and their own (total) and cumulative time in milliseconds.
+    """
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": _function_name(*key),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_ms": round(total_time * 1000, 3),
+            "cumulative_ms": round(cumulative_time * 1000, 3),
+        }
+        for key, (primitive_calls, calls, total_time, cumulative_time, _) in rows
+    ]
+
+
+def _prune_profiles() -> None:
+    summaries = sorted(
+        (entry for entry in os.scandir(PROFILE_DIR) if entry.name.endswith(".json")),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in summaries[: max(len(summaries) - PROFILE_MAX_FILES, 0)]:
+        profile_id = entry.name[: -len(".json")]
+        for path in (entry.path, profile_path(profile_id, "prof")):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def profile_path(profile_id: str, extension: str) -> str:
+    """
+    :param profile_id: The ID returned in the X-Profile-Id header.
+    :param extension: ``json`` for the summary, ``prof`` for the pstats dump.
+    :return: The path of the stored profile file.
+    :raises NotFound: If the ID is malformed.
+    """
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        raise NotFound(f"Profile {profile_id} not found.")
+    return os.path.join(PROFILE_DIR, f"{profile_id}.{extension}")
+
+
+def init_profiling(app) -> None:
+    """
+    Profiles single requests on demand: an admin sends ``X-Profile: 1`` and
+    the request runs under cProfile with its SQL statements timed. The
+    summary (slowest functions and the SQL timeline) and the pstats dump are
+    stored in PROFILE_DIR under the ID returned in the X-Profile-Id header.
+
+    A request without the header costs one header lookup.
+
+    :param app: The Flask application.
+    """
+
+    @app.before_request
+    def start_profiling():
+        if not request.headers.get(PROFILE_HEADER):
+            return
+
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        user = verify_token(token if scheme.lower() == "bearer" else "")
+        if user.role != RoleType.ADMIN:
+            raise Forbidden("You do not have permissions to access this resource")
+        if not _profiler_lock.acquire(blocking=False):
+            raise Conflict("Another request is being profiled by this worker.")
+
+        _register_sql_listeners()
+        g.profile_token = _sql_timeline.set([])
+        g.profiler = cProfile.Profile()
+        g.profile_start = time.perf_counter()
+        g.profiler.enable()
+
+    @app.after_request
+    def store_profile(response):
+        profiler = g.pop("profiler", None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        duration = time.perf_counter() - g.profile_start
+        timeline = _sql_timeline.get()
+        _sql_timeline.reset(g.pop("profile_token"))
+        _profiler_lock.release()
+
+        profile_id = uuid.uuid4().hex
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        profiler.dump_stats(profile_path(profile_id, "prof"))
+        summary = {
+            "id": profile_id,
+            "method": request.method,
+            "path": request.full_path.rstrip("?"),
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "sql_duration_ms": round(sum(q["duration_ms"] for q in timeline), 3),
+            "functions": summarize_profile(profiler, PROFILE_TOP_FUNCTIONS),
+            "sql": timeline,
+        }
+        with open(profile_path(profile_id, "json"), "w") as f:
+            json.dump(summary, f)
+        _prune_profiles()
+
+        response.headers[PROFILE_ID_HEADER] = profile_id
+        response.headers["Server-Timing"] = (
+            f"app;dur={summary['duration_ms']}, db;dur={summary['sql_duration_ms']}"
+        )
+        return response
+
+    @app.teardown_request
+    def stop_profiling(exception=None):
+        # The response was not finalized (after_request did not run).
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+            _sql_timeline.reset(g.pop("profile_token"))
+            _profiler_lock.release()
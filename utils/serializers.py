@@ -0,0 +1,307 @@
+from collections import defaultdict
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import cache
+from typing import Any, Dict, List, Optional, Type
+
+from flask import current_app, make_response
+from flask.json.provider import JSONProvider
+from marshmallow import Schema, fields
+from sqlalchemy import Select, bindparam, func, inspect
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, Session
+
+from db import db
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _isoformat(value) -> str:
+    return value.isoformat()
+
+
+# Converters equivalent to the marshmallow fields' _serialize for their default
+# options; anything else goes through the field itself.
+FAST_CONVERTERS = {
+    fields.Integer: int,
+    fields.Float: float,
+    fields.String: str,
+    fields.Email: str,
+    fields.URL: str,
+    fields.DateTime: _isoformat,
+    fields.Time: _isoformat,
+    fields.Date: _isoformat,
+}
+
+
+def _converter(field: fields.Field):
+    field_type = type(field)
+    fast = FAST_CONVERTERS.get(field_type)
+    if fast is not None:
+        if isinstance(field, fields.Number) and field.as_string:
+            fast = None
+        elif isinstance(field, (fields.DateTime, fields.Date, fields.Time)) and (
+            field.format not in (None, "iso")
+        ):
+            fast = None
+    if fast is not None:
+        return fast
+
+    def serialize(value):
+        return field._serialize(value, field.name, None)
+
+    return serialize
+
+
+def _nested_schema(field: fields.Field) -> Optional[Type[Schema]]:
+    if isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
+        return type(field.inner.schema)
+    if isinstance(field, fields.Nested) and field.many:
+        return type(field.schema)
+    return None
+
+
+class RowProjection:
+    """
+    Precompiled equivalent of ``schema.dump(objects, many=True)`` for a model:
+    selects only the columns the schema outputs and converts Core rows straight
+    to dictionaries, without loading ORM objects.
+
+    The output follows the marshmallow contract: attributes missing on the model
+    are left out, values are converted as the schema fields would, and nested
+    one-to-many or many-to-many lists are loaded with one extra query each.
+    """
+
+    def __init__(self, schema_cls: Type[Schema], model):
+        mapper = inspect(model)
+        self.model = model
+        self.primary_key = mapper.primary_key[0]
+        self.columns = []
+        self.plan = []
+        self.nested = []
+
+        for name, field in schema_cls._declared_fields.items():
+            if field.load_only:
+                continue
+            key = field.data_key or name
+            attribute = field.attribute or name
+            prop = mapper.attrs.get(attribute)
+
+            if prop is None:
+                # marshmallow skips attributes the object does not have.
+                if hasattr(model, attribute):
+                    raise ValueError(
+                        f"{schema_cls.__name__}.{name} is not a mapped attribute."
+                    )
+                continue
+
+            if isinstance(prop, ColumnProperty):
+                self.plan.append((key, len(self.columns), _converter(field)))
+                self.columns.append(prop.columns[0])
+            elif isinstance(prop, RelationshipProperty) and _nested_schema(field):
+                self.nested.append(
+                    (key, prop, get_projection(_nested_schema(field), prop.mapper.class_))
+                )
+            else:
+                raise ValueError(
+                    f"{schema_cls.__name__}.{name} cannot be projected from rows."
+                )
+
+        self.key_index = len(self.columns)
+        self.columns.append(self.primary_key)
+        # Every table the dumped output is read from.
+        tables = {mapper.local_table.name}
+        for _, prop, projection in self.nested:
+            tables.update(projection.tables)
+            if prop.secondary is not None:
+                tables.add(prop.secondary.name)
+        self.tables = frozenset(tables)
+        self._nested_statements = {
+            key: self._nested_statement(prop, projection)
+            for key, prop, projection in self.nested
+        }
+
+    @staticmethod
+    def _nested_select(prop: RelationshipProperty, *columns) -> tuple:
+        """
+        :return: A select of the columns from the related table (joined to the
+                 association table for many-to-many) and the parent key column.
+        """
+        if prop.secondary is None:
+            [(_, parent_key)] = prop.local_remote_pairs
+            return db.select(*columns), parent_key
+
+        [(_, parent_key)] = prop.synchronize_pairs
+        [(target_key, secondary_key)] = prop.secondary_synchronize_pairs
+        statement = db.select(*columns).join_from(
+            prop.mapper.local_table, prop.secondary, target_key == secondary_key
+        )
+        return statement, parent_key
+
+    @classmethod
+    def _nested_statement(cls, prop: RelationshipProperty, projection: "RowProjection"):
+        statement, parent_key = cls._nested_select(prop, *projection.columns)
+        return (
+            statement.add_columns(parent_key)
+            .where(parent_key.in_(bindparam("parent_ids", expanding=True)))
+            .order_by(projection.primary_key)
+        )
+
+    def version_statement(self, statement: Select) -> Select:
+        """
+        Builds a single-row aggregate query describing the version of what
+        ``execute`` would return for the statement: the row count and
+        ``max(updated_on)`` of the records and of each nested list.
+
+        :param statement: A ``select(Model)`` statement, e.g. from a manager.
+        :return: A select returning one row of counts and timestamps.
+        """
+        statement = statement.order_by(None)
+        aggregates = [
+            statement.with_only_columns(func.count(self.primary_key)),
+            statement.with_only_columns(func.max(self.model.updated_on)),
+        ]
+        parent_ids = statement.with_only_columns(self.primary_key)
+        for _, prop, projection in self.nested:
+            nested, parent_key = self._nested_select(prop)
+            nested = nested.where(parent_key.in_(parent_ids))
+            aggregates += [
+                nested.add_columns(func.count(parent_key)),
+                nested.add_columns(func.max(projection.model.updated_on)),
+            ]
+        return db.select(*(aggregate.scalar_subquery() for aggregate in aggregates))
+
+    def execute(
+        self,
+        statement: Select,
+        params: Optional[dict] = None,
+        session: Optional[Session] = None,
+    ) -> List[dict]:
+        """
+        Runs an ORM select of the model with only the projected columns and
+        dumps the rows. The WHERE, ORDER BY and LIMIT clauses are kept.
+
+        :param statement: A ``select(Model)`` statement, e.g. from a manager.
+        :param params: Bound parameter values for the statement.
+        :param session: The session to query with, ``db.session`` by default.
+        :return: A list of dictionaries as the schema would dump them.
+        """
+        session = session or db.session
+        rows = session.execute(
+            statement.with_only_columns(*self.columns), params
+        ).all()
+        return self.dump(rows, session)
+
+    def dump(self, rows, session: Optional[Session] = None) -> List[dict]:
+        plan = self.plan
+        items = [
+            {
+                key: None if row[index] is None else convert(row[index])
+                for key, index, convert in plan
+            }
+            for row in rows
+        ]
+
+        if self.nested and rows:
+            parent_ids = [row[self.key_index] for row in rows]
+            for key, prop, projection in self.nested:
+                children = defaultdict(list)
+                nested_rows = (session or db.session).execute(
+                    self._nested_statements[key], {"parent_ids": parent_ids}
+                ).all()
+                nested_items = projection.dump(nested_rows, session)
+                for nested_row, child in zip(nested_rows, nested_items):
+                    children[nested_row[-1]].append(child)
+                for item, parent_id in zip(items, parent_ids):
+                    item[key] = children.get(parent_id, [])
+
+        return items
+
+
+@cache
+def get_projection(schema_cls: Type[Schema], model) -> RowProjection:
+    """
+    Builds (once) the row projection of a response schema for a model.
+
+    :param schema_cls: The marshmallow response schema class.
+    :param model: The mapped model class the schema dumps.
+    :return: The cached RowProjection.
+    """
+    return RowProjection(schema_cls, model)
+
+
+def serialize(
+    statement: Select,
+    schema_cls: Type[Schema],
+    params: Optional[dict] = None,
+    session: Optional[Session] = None,
+) -> List[dict]:
+    """
+    Executes an ORM select and dumps the result with the given response schema,
+    through a row projection when FAST_SERIALIZATION is enabled.
+
+    :param statement: A ``select(Model)`` statement.
+    :param schema_cls: The marshmallow response schema class.
+    :param params: Bound parameter values for the statement.
+    :param session: The session to query with, ``db.session`` by default.
+    :return: A list of serialized records.
+    """
+    session = session or db.session
+    if current_app.config.get("FAST_SERIALIZATION"):
+        model = statement.column_descriptions[0]["entity"]
+        return get_projection(schema_cls, model).execute(statement, params, session)
+
+    records = session.execute(statement, params).scalars().all()
+    return schema_cls().dump(records, many=True)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return current_app.response_class(
+            orjson.dumps(obj, default=_default), mimetype="application/json"
+        )
+
+
+def output_orjson(data: Any, code: int, headers: Optional[Dict] = None):
+    """
+    flask_restful representation for application/json using orjson.
+    """
+    response = make_response(orjson.dumps(data, default=_default) + b"\n", code)
+    response.headers.extend(headers or {})
+    return response
+
+
+def init_fast_json(app, api) -> None:
+    """
+    Switches the app and the flask_restful API to orjson when it is installed.
+
+    :param app: The Flask application.
+    :param api: The flask_restful API of the application.
+    """
+    if orjson is None:
+        app.logger.warning("FAST_SERIALIZATION is enabled but orjson is not installed.")
+        return
+
+    app.json = OrjsonProvider(app)
+    api.representations["application/json"] = output_orjson
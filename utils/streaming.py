@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from typing import Iterable, Iterator, Sequence
+
+EXPORT_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunks(columns: Sequence[str], batches: Iterable[Sequence]) -> Iterator[str]:
+    """
+    Encodes batches of rows as newline-delimited JSON, one chunk per batch.
+
+    :param columns: The keys of each JSON object, in row order.
+    :param batches: An iterable of row batches, e.g. ``Result.partitions()``.
+    :return: An iterator of text chunks.
+    """
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_plain, row)))) + "\n" for row in rows
+        )
+
+
+def csv_chunks(columns: Sequence[str], batches: Iterable[Sequence]) -> Iterator[str]:
+    """
+    Encodes batches of rows as CSV, starting with the header line so the first
+    chunk is sent before the query returns anything.
+
+    :param columns: The header line.
+    :param batches: An iterable of row batches, e.g. ``Result.partitions()``.
+    :return: An iterator of text chunks.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(map(_plain, row) for row in rows)
+        yield buffer.getvalue()
+
+
+EXPORT_ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+}
@@ -0,0 +1,59 @@
+import logging
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def on_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Runs the callback once the session's transaction commits; it is dropped if
+    the transaction rolls back. Savepoints do not count: the callback waits for
+    the enclosing transaction.
+
+    :param session: The session whose transaction to wait for.
+    :param callback: Called without arguments.
+    """
+    _callbacks(session).append((True, callback))
+
+
+def on_rollback(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Runs the callback if the session's transaction rolls back; it is dropped
+    if the transaction commits. Rolling back a savepoint does not run it.
+
+    :param session: The session whose transaction to wait for.
+    :param callback: Called without arguments.
+    """
+    _callbacks(session).append((False, callback))
+
+
+def _callbacks(session: Session) -> list:
+    return session.info.setdefault("transaction_callbacks", [])
+
+
+def _run_callbacks(session: Session, committed: bool) -> None:
+    for on_committed, callback in session.info.pop("transaction_callbacks", ()):
+        if on_committed != committed:
+            continue
+        try:
+            callback()
+        except Exception:
+            # The transaction has ended already; the remaining callbacks run.
+            logger.exception(f"Transaction callback {callback} failed")
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    # Releasing a savepoint also fires after_commit; wait for the transaction.
+    if not session.in_nested_transaction():
+        _run_callbacks(session, committed=True)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _after_rollback(session, previous_transaction):
+    # Rolling back a savepoint keeps the changes of the enclosing transaction.
+    if previous_transaction.parent is None:
+        _run_callbacks(session, committed=False)
@@ -0,0 +1,62 @@
+"""
+Celery application running the background tasks off the request path.
+
+    celery -A worker worker --concurrency 4
+    celery -A worker beat
+"""
+import logging
+from functools import partial
+
+from celery import Celery
+from decouple import config
+
+from utils.transactions import on_commit
+
+logger = logging.getLogger(__name__)
+
+celery = Celery(
+    "appointments",
+    broker=config("CELERY_BROKER_URL", default="redis://localhost:6379/1"),
+    include=["tasks.orphaned_photos", "tasks.photo_derivatives"],
+)
+celery.conf.update(
+    # A task lost with its worker is delivered again; tasks are idempotent.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    task_ignore_result=True,
+    task_always_eager=config("CELERY_TASK_ALWAYS_EAGER", default=False, cast=bool),
+    beat_schedule={
+        "backfill-photo-derivatives": {
+            "task": "tasks.photo_derivatives.backfill_photo_derivatives",
+            "schedule": config(
+                "PHOTO_DERIVATIVES_BACKFILL_SECONDS", default=3600, cast=float
+            ),
+        },
+        "sweep-orphaned-photos": {
+            "task": "tasks.orphaned_photos.sweep_orphaned_photos",
+            "schedule": config("ORPHANED_PHOTO_SWEEP_SECONDS", default=86400, cast=float),
+        },
+    },
+)
+
+
+def enqueue_after_commit(session, task, *args) -> None:
+    """
+    Sends the task once the session's transaction commits, so the worker sees
+    the committed rows; nothing is sent if the transaction rolls back.
+
+    :param session: The session whose commit to wait for.
+    :param task: The Celery task.
+    :param args: The task's arguments.
+    """
+    on_commit(session, partial(_send_task, task, args))
+
+
+def _send_task(task, args) -> None:
+    try:
+        task.apply_async(args, retry=False)
+    except Exception as e:
+        # The committed request must not fail because the broker is down;
+        # the periodic backfill picks up what was not sent.
+        logger.error(f"Failed to enqueue {task.name}{args}: {e}")